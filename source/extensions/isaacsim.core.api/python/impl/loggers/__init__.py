@@ -12,4 +12,5 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from isaacsim.core.api.loggers.columnar_log import ColumnarLogReader, ColumnarLogWriter, is_columnar_log
 from isaacsim.core.api.loggers.data_logger import DataLogger
@@ -0,0 +1,439 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import bisect
+import json
+import os
+import struct
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from isaacsim.core.utils.types import DataFrame
+
+# File layout: the magic string followed by records. Each record is a 4-byte tag, the size of its JSON header
+# (uint64) and the header itself. Chunk records ("CHNK") are followed by the raw bytes of their columns, and the
+# index record ("INDX"), written when the log is closed, lists the chunks so that they can be located without
+# scanning the file. The file then ends with the offset of the index record (uint64) and the magic string.
+_MAGIC = b"ISAACLOG"
+_CHUNK_TAG = b"CHNK"
+_INDEX_TAG = b"INDX"
+_RECORD_PREFIX = struct.Struct("<4sQ")
+_TRAILER = struct.Struct("<Q8s")
+
+
+def is_columnar_log(log_path: str) -> bool:
+    """Check whether a file is a columnar log (written by :class:`ColumnarLogWriter`).
+
+    Args:
+        log_path (str): path of the file.
+
+    Returns:
+        bool: True if the file starts with the columnar log magic string.
+    """
+    with open(log_path, "rb") as log_file:
+        return log_file.read(len(_MAGIC)) == _MAGIC
+
+
+def _to_builtin(value, key: str):
+    """Convert a data value to plain Python values (NumPy arrays and scalars included), as written to JSON."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item, key) for item in value]
+    if isinstance(value, dict):
+        return {str(k): _to_builtin(item, key) for k, item in value.items()}
+    raise TypeError(
+        f"Unsupported type {type(value).__name__} for the data '{key}' (expected JSON-like or NumPy values)"
+    )
+
+
+def _is_dtype_preserved(values: list, array: np.ndarray) -> bool:
+    # booleans stored as integers, or integers stored as floats, would not be read back with their type
+    if array.dtype.kind == "f":
+        excluded_types = (bool, int)
+    elif array.dtype.kind in "iu":
+        excluded_types = (bool,)
+    else:
+        return True
+    items = np.empty(array.shape, dtype=object)
+    items[...] = values
+    return not any(isinstance(item, excluded_types) for item in items.flat)
+
+
+def _encode_column(values: list) -> Tuple[dict, bytes]:
+    """Encode the values of a column: numeric (or boolean) values of a fixed shape and type are stored as a raw
+    array, other values (strings, dictionaries, ragged lists, mixed integers and floats...) as JSON."""
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = None
+    if array is not None and array.dtype.kind in "biuf" and _is_dtype_preserved(values, array):
+        array = np.ascontiguousarray(array)
+        return {"encoding": "raw", "dtype": array.dtype.str, "shape": list(array.shape[1:])}, array.tobytes()
+    return {"encoding": "json"}, json.dumps(values).encode("utf-8")
+
+
+def _decode_column(spec: dict, buffer: bytes, num_frames: int) -> list:
+    if spec["encoding"] == "raw":
+        array = np.frombuffer(buffer, dtype=np.dtype(spec["dtype"])).reshape(num_frames, *spec["shape"])
+        # plain Python values, as read back from the JSON export
+        return array.tolist()
+    return json.loads(buffer.decode("utf-8"))
+
+
+class ColumnarLogWriter:
+    """Stream data frames to a chunked, columnar log file.
+
+    Frames are buffered until a chunk is full, then each data key of the chunk is written as a column (a raw array
+    for numeric values of a fixed shape and type, JSON otherwise). Only one chunk is kept in memory. The chunk index
+    is written when the log is closed, but a log that was not closed (e.g.: the process was killed) can still be read
+    up to its last complete chunk.
+
+    The data values must be JSON-like values (``None``, booleans, numbers, strings, lists, tuples and dictionaries),
+    NumPy arrays or NumPy scalars. They are read back as plain Python values (NumPy arrays as lists).
+
+    Args:
+        log_path (str): path of the log file.
+        chunk_size (int, optional): number of frames per chunk. Defaults to 256.
+        append (bool, optional): append the frames to an existing log file instead of overwriting it.
+                                 Defaults to False.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.core.api.loggers import ColumnarLogWriter
+        >>> from isaacsim.core.utils.types import DataFrame
+        >>>
+        >>> writer = ColumnarLogWriter("/tmp/log.bin")
+        >>> for i in range(1000):
+        ...     writer.append(DataFrame(current_time_step=i, current_time=i / 60.0, data={"position": [i, 0.0, 0.0]}))
+        >>> writer.close()
+    """
+
+    def __init__(self, log_path: str, chunk_size: int = 256, append: bool = False) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be positive, got {chunk_size}")
+        self._log_path = log_path
+        self._chunk_size = int(chunk_size)
+        self._pending = []
+        self._chunks = []
+        self._num_frames = 0
+        if append and os.path.exists(log_path):
+            # keep the complete chunks, and overwrite the index (written again when the log is closed)
+            reader = ColumnarLogReader(log_path)
+            self._chunks = reader.chunks
+            self._num_frames = len(reader)
+            end_offset = reader._get_end_offset()
+            reader.close()
+            self._file = open(log_path, "r+b")
+            self._file.truncate(end_offset)
+            self._file.seek(end_offset)
+        else:
+            self._file = open(log_path, "wb")
+            self._file.write(_MAGIC)
+
+    @property
+    def log_path(self) -> str:
+        """Path of the log file."""
+        return self._log_path
+
+    @property
+    def num_frames(self) -> int:
+        """Number of frames appended (written or pending)."""
+        return self._num_frames
+
+    @property
+    def num_written_frames(self) -> int:
+        """Number of frames written to the file."""
+        return self._num_frames - len(self._pending)
+
+    @property
+    def chunks(self) -> List[dict]:
+        """Index of the chunks written to the file."""
+        return self._chunks
+
+    @property
+    def is_closed(self) -> bool:
+        """True if the log was closed."""
+        return self._file is None
+
+    def get_pending_data_frame(self, index: int) -> DataFrame:
+        """Get a frame that was appended but not written yet.
+
+        Args:
+            index (int): index of the frame in the log (at least :attr:`num_written_frames`).
+
+        Returns:
+            DataFrame: the frame.
+        """
+        return self._pending[index - self.num_written_frames]
+
+    def find_pending_time_step(self, time_step: int) -> int:
+        """Find the first frame recorded at a time step among the frames not written yet.
+
+        Args:
+            time_step (int): time step.
+
+        Returns:
+            int: index of the frame in the log, -1 if no pending frame was recorded at the time step.
+        """
+        for index, data_frame in enumerate(self._pending):
+            if data_frame.current_time_step == time_step:
+                return self.num_written_frames + index
+        return -1
+
+    def append(self, data_frame: DataFrame) -> None:
+        """Append a frame, writing the pending chunk if it is full.
+
+        Args:
+            data_frame (DataFrame): frame to append.
+
+        Raises:
+            TypeError: if a data value is not a JSON-like or NumPy value.
+        """
+        if self._file is None:
+            raise RuntimeError(f"The log {self._log_path} is closed")
+        # convert (and validate) the values now, rather than when the chunk is written
+        data_frame = DataFrame(
+            current_time_step=int(data_frame.current_time_step),
+            current_time=float(data_frame.current_time),
+            data={key: _to_builtin(value, key) for key, value in data_frame.data.items()},
+        )
+        # chunks are homogeneous: a frame with different data keys starts a new chunk
+        if self._pending and self._pending[0].data.keys() != data_frame.data.keys():
+            self.flush()
+        self._pending.append(data_frame)
+        self._num_frames += 1
+        if len(self._pending) >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending frames as a (possibly partial) chunk."""
+        if self._file is None or not self._pending:
+            return
+        frames, self._pending = self._pending, []
+        time_steps = np.array([frame.current_time_step for frame in frames], dtype=np.int64)
+        columns, buffers = [], []
+        offset = 0
+        for name, values in [
+            (None, time_steps),
+            (None, [frame.current_time for frame in frames]),
+            *[(key, [frame.data[key] for frame in frames]) for key in frames[0].data.keys()],
+        ]:
+            spec, buffer = _encode_column(values)
+            spec.update(name=name, offset=offset, size=len(buffer))
+            columns.append(spec)
+            buffers.append(buffer)
+            offset += len(buffer)
+        header = {
+            "num_frames": len(frames),
+            "time_step_range": [int(time_steps.min()), int(time_steps.max())],
+            "columns": columns,
+        }
+        chunk_offset = self._write_record(_CHUNK_TAG, header)
+        for buffer in buffers:
+            self._file.write(buffer)
+        self._file.flush()
+        self._chunks.append(
+            {"offset": chunk_offset, "num_frames": len(frames), "time_step_range": header["time_step_range"]}
+        )
+
+    def close(self) -> None:
+        """Write the pending frames and the chunk index, and close the file."""
+        if self._file is None:
+            return
+        self.flush()
+        index_offset = self._write_record(_INDEX_TAG, {"chunks": self._chunks})
+        self._file.write(_TRAILER.pack(index_offset, _MAGIC))
+        self._file.close()
+        self._file = None
+
+    def _write_record(self, tag: bytes, header: dict) -> int:
+        offset = self._file.tell()
+        encoded = json.dumps(header).encode("utf-8")
+        self._file.write(_RECORD_PREFIX.pack(tag, len(encoded)))
+        self._file.write(encoded)
+        return offset
+
+
+class ColumnarLogReader:
+    """Random-access reader of a columnar log file (written by :class:`ColumnarLogWriter`).
+
+    Chunks are read on demand and the last few decoded chunks are cached, so reading a log sequentially or around a
+    time step only keeps a bounded number of frames in memory.
+
+    Args:
+        log_path (str): path of the log file.
+        chunks (Optional[List[dict]], optional): index of the chunks. Defaults to None (read from the file, or
+                                                 rebuilt by scanning the chunks if the log was not closed).
+        cache_size (int, optional): number of decoded chunks kept in memory. Defaults to 2.
+    """
+
+    def __init__(self, log_path: str, chunks: Optional[List[dict]] = None, cache_size: int = 2) -> None:
+        self._log_path = log_path
+        self._file = open(log_path, "rb")
+        if self._file.read(len(_MAGIC)) != _MAGIC:
+            self._file.close()
+            raise ValueError(f"{log_path} is not a columnar log")
+        self._cache = OrderedDict()
+        self._cache_size = max(int(cache_size), 1)
+        self._chunks = []
+        self._starts = []
+        self.update_index(self._read_index() if chunks is None else chunks)
+
+    def __len__(self) -> int:
+        return self._num_frames
+
+    @property
+    def log_path(self) -> str:
+        """Path of the log file."""
+        return self._log_path
+
+    @property
+    def chunks(self) -> List[dict]:
+        """Index of the chunks."""
+        return list(self._chunks)
+
+    def update_index(self, chunks: List[dict]) -> None:
+        """Update the index of the chunks (e.g.: to read a log while it is written).
+
+        Args:
+            chunks (List[dict]): index of the chunks (see :attr:`ColumnarLogWriter.chunks`).
+        """
+        self._chunks = list(chunks)
+        self._starts = []
+        self._num_frames = 0
+        for chunk in self._chunks:
+            self._starts.append(self._num_frames)
+            self._num_frames += chunk["num_frames"]
+
+    def get_data_frame(self, data_frame_index: int) -> DataFrame:
+        """Get a frame.
+
+        Args:
+            data_frame_index (int): index of the frame (negative indices count from the end).
+
+        Returns:
+            DataFrame: the frame.
+        """
+        if data_frame_index < 0:
+            data_frame_index += self._num_frames
+        if not 0 <= data_frame_index < self._num_frames:
+            raise IndexError(f"Data frame index {data_frame_index} out of range ({self._num_frames} frames)")
+        chunk_index = bisect.bisect_right(self._starts, data_frame_index) - 1
+        time_steps, times, data = self._read_chunk(chunk_index)
+        index = data_frame_index - self._starts[chunk_index]
+        return DataFrame(
+            current_time_step=time_steps[index],
+            current_time=times[index],
+            data={key: values[index] for key, values in data.items()},
+        )
+
+    def find_time_step(self, time_step: int) -> int:
+        """Find the first frame recorded at a time step.
+
+        Args:
+            time_step (int): time step.
+
+        Returns:
+            int: index of the frame, -1 if no frame was recorded at the time step.
+        """
+        for chunk_index, chunk in enumerate(self._chunks):
+            first, last = chunk["time_step_range"]
+            if first <= time_step <= last:
+                time_steps = self._read_chunk(chunk_index)[0]
+                if time_step in time_steps:
+                    return self._starts[chunk_index] + time_steps.index(time_step)
+        return -1
+
+    def iter_data_frames(self) -> Iterator[DataFrame]:
+        """Iterate over the frames, in order."""
+        for index in range(self._num_frames):
+            yield self.get_data_frame(index)
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._cache.clear()
+
+    def _read_chunk(self, chunk_index: int) -> Tuple[list, list, dict]:
+        if chunk_index in self._cache:
+            self._cache.move_to_end(chunk_index)
+            return self._cache[chunk_index]
+        tag, header, payload_offset = self._read_record(self._chunks[chunk_index]["offset"])
+        num_frames = header["num_frames"]
+        self._file.seek(payload_offset)
+        payload = self._file.read(sum(spec["size"] for spec in header["columns"]))
+        columns = [
+            _decode_column(spec, payload[spec["offset"] : spec["offset"] + spec["size"]], num_frames)
+            for spec in header["columns"]
+        ]
+        data = {spec["name"]: values for spec, values in zip(header["columns"][2:], columns[2:])}
+        chunk = (columns[0], columns[1], data)
+        self._cache[chunk_index] = chunk
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return chunk
+
+    def _read_record(self, offset: int) -> Tuple[bytes, dict, int]:
+        self._file.seek(offset)
+        prefix = self._file.read(_RECORD_PREFIX.size)
+        if len(prefix) < _RECORD_PREFIX.size:
+            return None, None, None
+        tag, header_size = _RECORD_PREFIX.unpack(prefix)
+        encoded = self._file.read(header_size)
+        if len(encoded) < header_size:
+            return None, None, None
+        return tag, json.loads(encoded.decode("utf-8")), offset + _RECORD_PREFIX.size + header_size
+
+    def _get_end_offset(self) -> int:
+        # offset of the end of the last chunk
+        if not self._chunks:
+            return len(_MAGIC)
+        tag, header, payload_offset = self._read_record(self._chunks[-1]["offset"])
+        return payload_offset + sum(spec["size"] for spec in header["columns"])
+
+    def _read_index(self) -> List[dict]:
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size >= len(_MAGIC) + _TRAILER.size:
+            self._file.seek(file_size - _TRAILER.size)
+            index_offset, magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+            if magic == _MAGIC:
+                tag, header, _ = self._read_record(index_offset)
+                if tag == _INDEX_TAG:
+                    return header["chunks"]
+        # the log was not closed: scan the chunks
+        chunks = []
+        offset = len(_MAGIC)
+        while offset < file_size:
+            tag, header, payload_offset = self._read_record(offset)
+            if tag != _CHUNK_TAG:
+                break
+            payload_size = sum(spec["size"] for spec in header["columns"])
+            if payload_offset + payload_size > file_size:
+                # truncated chunk (the log was not closed)
+                break
+            chunks.append(
+                {"offset": offset, "num_frames": header["num_frames"], "time_step_range": header["time_step_range"]}
+            )
+            offset = payload_offset + payload_size
+        return chunks
@@ -13,20 +13,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
-from typing import Callable, Dict, List
+import os
+from typing import Callable, Dict, List, Optional
 
+from isaacsim.core.api.loggers.columnar_log import ColumnarLogReader, ColumnarLogWriter, is_columnar_log
 from isaacsim.core.api.scenes.scene import Scene
 from isaacsim.core.api.tasks.base_task import BaseTask
 from isaacsim.core.utils.types import DataFrame
 
 
 class DataLogger:
-    """This class takes care of collecting data as well as reading already saved data in order to replay it for instance."""
+    """This class takes care of collecting data as well as reading already saved data in order to replay it for instance.
+
+    By default, the data frames are kept in memory. For long recordings, :meth:`start_streaming` streams them to a
+    columnar log file instead (see :class:`ColumnarLogWriter`), keeping the memory used bounded. Columnar logs are
+    loaded with :meth:`load` for random-access replay, and :meth:`save` exports the data frames to JSON.
+    """
 
     def __init__(self) -> None:
         self._pause = True
         self._data_frames = []
         self._data_frame_logging_func = None
+        self._writer = None
+        self._reader = None
+        self._chunk_size = 256
 
     def add_data(self, data: dict, current_time_step: float, current_time: float) -> None:
         """Adds data to the log
@@ -35,8 +45,19 @@ class DataLogger:
             data (dict): Dictionary representing the data to be logged at this time index.
             current_time_step (float): time step corresponding to the data collected.
             current_time (float): time in seconds corresponding to the data collected.
+
+        Raises:
+            TypeError: if the data frames are streamed to a columnar log file and a value of the data is not a JSON-like
+                       or NumPy value.
         """
-        self._data_frames.append(DataFrame(current_time_step=current_time_step, current_time=current_time, data=data))
+        data_frame = DataFrame(current_time_step=current_time_step, current_time=current_time, data=data)
+        if self._writer is None and self._reader is not None:
+            # resume recording by appending to the columnar log file the data frames are read from
+            self._start_writer(self._reader.log_path, append=True)
+        if self._writer is not None:
+            self._writer.append(data_frame)
+            return
+        self._data_frames.append(data_frame)
         return
 
     def get_num_of_data_frames(self) -> int:
@@ -45,6 +66,10 @@ class DataLogger:
         Returns:
             int: the number of data frames collected/ retrieved in the data logger.
         """
+        if self._writer is not None:
+            return self._writer.num_frames
+        if self._reader is not None:
+            return len(self._reader)
         return len(self._data_frames)
 
     def pause(self) -> None:
@@ -64,10 +89,65 @@ class DataLogger:
         """
         return not self._pause
 
+    def is_streaming(self) -> bool:
+        """
+        Returns:
+            bool: True if the data frames are streamed to a columnar log file. False otherwise.
+        """
+        return self._writer is not None
+
+    def start_streaming(self, log_path: str, chunk_size: int = 256) -> None:
+        """Streams the data frames to a columnar log file instead of keeping them in memory.
+
+        The data frames already collected are written first (appended, if they are read from this columnar log
+        file). Only the frames of the chunk being filled are kept in memory, and the frames already written are read
+        back from the file when retrieved.
+
+        Args:
+            log_path (str): path of the columnar log file (overwritten if it exists, unless the data frames are read
+                            from it).
+            chunk_size (int, optional): number of data frames written at once. Defaults to 256.
+        """
+        self._chunk_size = chunk_size
+        if self._writer is not None:
+            # the data frames streamed so far are read back from their columnar log file
+            self.stop_streaming()
+        if self._reader is not None:
+            reader, self._reader = self._reader, None
+            if os.path.abspath(reader.log_path) == os.path.abspath(log_path):
+                reader.close()
+                self._start_writer(log_path, append=True)
+                return
+            # copy the data frames chunk by chunk (the reader only keeps a few chunks in memory)
+            self._start_writer(log_path)
+            for data_frame in reader.iter_data_frames():
+                self._writer.append(data_frame)
+            reader.close()
+            return
+        data_frames, self._data_frames = self._data_frames, []
+        self._start_writer(log_path)
+        for data_frame in data_frames:
+            self._writer.append(data_frame)
+        return
+
+    def stop_streaming(self) -> None:
+        """Writes the remaining data frames to the columnar log file and closes it.
+
+        The data frames stay available (read back from the file). Data collected afterwards is appended to the
+        columnar log file.
+        """
+        if self._writer is None:
+            return
+        log_path = self._writer.log_path
+        self._close_stream()
+        self._reader = ColumnarLogReader(log_path)
+        return
+
     def reset(self) -> None:
-        """Clears the data in the logger."""
+        """Clears the data in the logger (and closes the columnar log file, if any)."""
         self._pause = True
         self._data_frames = []
+        self._close_stream()
         return
 
     def get_data_frame(self, data_frame_index: int) -> DataFrame:
@@ -79,8 +159,44 @@ class DataLogger:
         Returns:
             DataFrame: Data Frame collected/ retrieved at the specified data frame index.
         """
+        if self._writer is not None:
+            if data_frame_index < 0:
+                data_frame_index += self._writer.num_frames
+            if data_frame_index >= self._writer.num_written_frames:
+                return self._writer.get_pending_data_frame(data_frame_index)
+            return self._get_stream_reader().get_data_frame(data_frame_index)
+        if self._reader is not None:
+            return self._reader.get_data_frame(data_frame_index)
         return self._data_frames[data_frame_index]
 
+    def get_data_frame_at_time_step(self, time_step: int) -> Optional[DataFrame]:
+        """
+
+        Args:
+            time_step (int): time step of the data frame to retrieve.
+
+        Returns:
+            Optional[DataFrame]: First Data Frame collected/ retrieved at the specified time step. None if there is no
+                                 data frame at this time step.
+        """
+        if self.get_num_of_data_frames() == 0:
+            return None
+        if self._writer is not None:
+            # search the data frames written to the file, then the ones of the chunk being filled
+            if self._writer.num_written_frames:
+                index = self._get_stream_reader().find_time_step(time_step)
+                if index >= 0:
+                    return self._reader.get_data_frame(index)
+            index = self._writer.find_pending_time_step(time_step)
+            return self._writer.get_pending_data_frame(index) if index >= 0 else None
+        if self._reader is not None:
+            index = self._reader.find_time_step(time_step)
+            return self._reader.get_data_frame(index) if index >= 0 else None
+        for data_frame in self._data_frames:
+            if data_frame.current_time_step == time_step:
+                return data_frame
+        return None
+
     def add_data_frame_logging_func(self, func: Callable[[List[BaseTask], Scene], Dict]) -> None:
         """
 
@@ -98,27 +214,63 @@ class DataLogger:
         """
         Saves the current data in the logger to a json file
 
+        .. note::
+
+            The data frames are written one by one, so a streamed recording is exported without loading it in memory.
+
         Args:
             log_path (str): path of the json file to be used to save the data.
         """
-        data = {}
-        data["Isaac Sim Data"] = [data_frame.get_dict() for data_frame in self._data_frames]
+        if self._writer is not None and self._writer.log_path == log_path:
+            raise ValueError(f"Cannot export the data to the columnar log file being streamed to ({log_path})")
         with open(log_path, "w") as outfile:
-            json.dump(data, outfile)
+            outfile.write('{"Isaac Sim Data": [')
+            for index in range(self.get_num_of_data_frames()):
+                if index:
+                    outfile.write(", ")
+                outfile.write(json.dumps(self.get_data_frame(index).get_dict()))
+            outfile.write("]}")
         return
 
     def load(self, log_path: str) -> None:
         """Loads data from a json file to read back a previous saved data or to resume recording data from another time step.
 
+        Columnar log files (see :meth:`start_streaming`) are not loaded in memory: the data frames are read from the
+        file when retrieved.
+
         Args:
-            log_path (str): path of the json file to be used to load the data.
+            log_path (str): path of the json (or columnar log) file to be used to load the data.
         """
         self._pause = True
         self._data_frames = []
         self._data_frame_logging_func = None
+        self._close_stream()
+        if is_columnar_log(log_path):
+            self._reader = ColumnarLogReader(log_path)
+            return
         with open(log_path) as json_file:
             json_data = json.load(json_file)
             data_frames = json_data["Isaac Sim Data"]
             data_frames = [DataFrame.init_from_dict(dict_representation=data_frame) for data_frame in data_frames]
             self._data_frames = data_frames
         return
+
+    def _start_writer(self, log_path: str, append: bool = False) -> None:
+        self._close_stream()
+        self._writer = ColumnarLogWriter(log_path, chunk_size=self._chunk_size, append=append)
+
+    def _get_stream_reader(self) -> ColumnarLogReader:
+        # reader of the data frames already written to the columnar log file being streamed to
+        if self._reader is None:
+            self._reader = ColumnarLogReader(self._writer.log_path, chunks=self._writer.chunks)
+        elif len(self._reader) != self._writer.num_written_frames:
+            self._reader.update_index(self._writer.chunks)
+        return self._reader
+
+    def _close_stream(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
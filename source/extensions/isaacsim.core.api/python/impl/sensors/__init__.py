@@ -14,3 +14,4 @@
 # limitations under the License.
 from isaacsim.core.api.sensors.base_sensor import BaseSensor
 from isaacsim.core.api.sensors.rigid_contact_view import RigidContactView
+from isaacsim.core.api.sensors.sensor_history import SensorHistory
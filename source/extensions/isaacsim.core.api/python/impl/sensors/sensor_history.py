@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+
+
+def _nlerp(
+    start: Union[np.ndarray, torch.Tensor],
+    end: Union[np.ndarray, torch.Tensor],
+    weights: Union[np.ndarray, torch.Tensor],
+) -> Union[np.ndarray, torch.Tensor]:
+    """Blend quaternions (along the last dimension) along the shortest arc and renormalize them."""
+    # q and -q are the same rotation: flip the end quaternions on the opposite hemisphere
+    if isinstance(start, torch.Tensor):
+        end = torch.where((start * end).sum(dim=-1, keepdim=True) < 0, -end, end)
+        blended = start + (end - start) * weights
+        norm = torch.linalg.norm(blended, dim=-1, keepdim=True)
+        return blended / torch.where(norm > 0, norm, torch.ones_like(norm))
+    end = np.where(np.sum(start * end, axis=-1, keepdims=True) < 0, -end, end)
+    blended = start + (end - start) * weights
+    norm = np.linalg.norm(blended, axis=-1, keepdims=True)
+    return blended / np.where(norm > 0, norm, 1.0)
+
+
+class SensorHistory(object):
+    """Fixed-capacity history of the last readings of a sensor (or of a batch of sensors), with monotonic timestamps.
+
+    The readings are stored in preallocated circular buffers. Each buffer holds two copies of the ring, one after
+    the other, so the last ``n`` readings are always contiguous in memory. As a result, windowed and strided reads
+    return views (oldest reading first) instead of copies.
+
+    Timestamps must increase monotonically. Appending a reading with the same timestamp as the latest one replaces
+    it. Appending a reading with an earlier timestamp (e.g.: after a simulation reset) clears the history first.
+
+    Args:
+        capacity (int): maximum number of readings kept.
+        fields (Dict[str, Tuple[Sequence[int], Union[np.dtype, type]]]): shape and dtype of a reading of each field.
+                                                                         Example: {"lin_acc": ((3,), np.float32)}.
+        device (Optional[str], optional): torch device of the buffers (e.g.: "cuda:0"). Defaults to None (NumPy
+                                          buffers on host memory).
+        quaternion_fields (Optional[Sequence[str]], optional): fields holding quaternions (along their last
+                                                               dimension), interpolated along the shortest arc and
+                                                               renormalized. Defaults to None.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from isaacsim.core.api.sensors import SensorHistory
+        >>>
+        >>> history = SensorHistory(capacity=4, fields={"value": ((2,), np.float32)})
+        >>> for i in range(6):
+        ...     history.append(time=0.1 * i, value=[i, -i])
+        >>> history.get_window()["value"]
+        array([[ 2., -2.],
+               [ 3., -3.],
+               [ 4., -4.],
+               [ 5., -5.]], dtype=float32)
+        >>> history.interpolate([0.45])["value"]
+        array([[ 4.5, -4.5]])
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fields: Dict[str, Tuple[Sequence[int], Union[np.dtype, type]]],
+        device: Optional[str] = None,
+        quaternion_fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"The capacity of the history must be positive, got {capacity}")
+        self._quaternion_fields = set(quaternion_fields or ())
+        for name in self._quaternion_fields:
+            if name not in fields or tuple(fields[name][0])[-1:] != (4,) or np.dtype(fields[name][1]).kind != "f":
+                raise ValueError(f"The quaternion field '{name}' must be a floating field with a last dimension of 4")
+        self._capacity = int(capacity)
+        self._device = device
+        self._times = np.zeros(2 * self._capacity, dtype=np.float64)
+        self._buffers = {}
+        for name, (shape, dtype) in fields.items():
+            shape = (2 * self._capacity, *shape)
+            if device is None:
+                self._buffers[name] = np.zeros(shape, dtype=dtype)
+            else:
+                torch_dtype = torch.from_numpy(np.zeros(0, dtype=dtype)).dtype
+                self._buffers[name] = torch.zeros(shape, dtype=torch_dtype, device=device)
+        self._head = self._capacity - 1
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of readings kept."""
+        return self._capacity
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the fields of the readings."""
+        return list(self._buffers.keys())
+
+    @property
+    def latest_time(self) -> Optional[float]:
+        """Timestamp of the latest reading, None if the history is empty."""
+        return float(self._times[self._head]) if self._count else None
+
+    def clear(self) -> None:
+        """Remove all the readings (the buffers are kept)."""
+        self._head = self._capacity - 1
+        self._count = 0
+
+    def append(self, time: float, **values) -> bool:
+        """Append a reading.
+
+        Args:
+            time (float): timestamp of the reading.
+            **values: value of each field of the reading (fields not given are left unchanged).
+
+        Returns:
+            bool: True if a new reading was added, False if the latest reading (with the same timestamp) was replaced.
+        """
+        latest_time = self.latest_time
+        if latest_time is not None and time < latest_time:
+            # time went backwards (e.g.: simulation reset)
+            self.clear()
+            latest_time = None
+        is_new = latest_time is None or time > latest_time
+        if is_new:
+            self._head = (self._head + 1) % self._capacity
+            self._count = min(self._count + 1, self._capacity)
+        for index in (self._head, self._head + self._capacity):
+            self._times[index] = time
+            for name, value in values.items():
+                self._buffers[name][index] = value
+        return is_new
+
+    def get_times(self, length: Optional[int] = None, stride: int = 1) -> np.ndarray:
+        """Get the timestamps of the last readings (see :meth:`get_window`)."""
+        return self._times[self._window_slice(length, stride)]
+
+    def get_window(self, length: Optional[int] = None, stride: int = 1) -> Dict[str, Union[np.ndarray, torch.Tensor]]:
+        """Get views of the last readings, oldest first.
+
+        .. note::
+
+            The returned arrays are views into the history buffers: they are not copied, and they are overwritten
+            by later readings once the history is full.
+
+        Args:
+            length (Optional[int], optional): number of readings. Defaults to None (all the readings available with
+                                              the given stride).
+            stride (int, optional): step between the readings, counted back from the latest one. Defaults to 1.
+
+        Raises:
+            ValueError: if more readings than available are requested.
+
+        Returns:
+            Dict[str, Union[np.ndarray, torch.Tensor]]: the timestamps (under "time") and the values of each field,
+                                                        with the readings along the first dimension.
+        """
+        window = self._window_slice(length, stride)
+        data = {name: buffer[window] for name, buffer in self._buffers.items()}
+        data["time"] = self._times[window]
+        return data
+
+    def interpolate(
+        self,
+        times: Union[float, Sequence[float], np.ndarray],
+        fields: Optional[List[str]] = None,
+        method: str = "linear",
+    ) -> Dict[str, Union[np.ndarray, torch.Tensor]]:
+        """Interpolate the readings at arbitrary timestamps (e.g.: to fuse sensors running at different rates).
+
+        Timestamps outside the history are clamped to the oldest or latest reading.
+
+        Args:
+            times (Union[float, Sequence[float], np.ndarray]): query timestamps.
+            fields (Optional[List[str]], optional): fields to interpolate. Defaults to None (all the fields).
+            method (str, optional): "linear" interpolation between the surrounding readings, "nearest" reading or
+                                    "previous" reading (zero-order hold). Non-floating fields always use the
+                                    nearest reading with "linear", and quaternion fields are renormalized after
+                                    blending along the shortest arc. Defaults to "linear".
+
+        Raises:
+            ValueError: if the history is empty or the method is not supported.
+
+        Returns:
+            Dict[str, Union[np.ndarray, torch.Tensor]]: the query timestamps (under "time") and the values of each
+                                                        field, with the query timestamps along the first dimension.
+        """
+        if method not in ("linear", "nearest", "previous"):
+            raise ValueError(f"Unsupported interpolation method '{method}', expected 'linear', 'nearest' or 'previous'")
+        if not self._count:
+            raise ValueError("Cannot interpolate an empty history")
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        window = self._window_slice(None, 1)
+        window_times = self._times[window]
+        # indices of the surrounding readings and interpolation weights
+        start = np.clip(np.searchsorted(window_times, times, side="right") - 1, 0, self._count - 1)
+        end = np.minimum(start + 1, self._count - 1)
+        duration = window_times[end] - window_times[start]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weights = np.where(duration > 0, (times - window_times[start]) / duration, 0.0)
+        weights = np.clip(weights, 0.0, 1.0)
+        if method == "previous":
+            nearest = np.where(times >= window_times[end], end, start)
+        else:
+            nearest = np.where(weights >= 0.5, end, start)
+        data = {"time": times}
+        for name in self._buffers.keys() if fields is None else fields:
+            values = self._buffers[name][window]
+            is_floating = values.is_floating_point() if self._device is not None else values.dtype.kind in "fc"
+            if method == "linear" and is_floating:
+                # blend the surrounding readings
+                if self._device is None:
+                    w = weights.reshape(-1, *([1] * (values.ndim - 1)))
+                    start_values, end_values = values[start], values[end]
+                else:
+                    w = torch.from_numpy(weights).to(values).reshape(-1, *([1] * (values.ndim - 1)))
+                    start_values = values[torch.from_numpy(start).to(values.device)]
+                    end_values = values[torch.from_numpy(end).to(values.device)]
+                if name in self._quaternion_fields:
+                    data[name] = _nlerp(start_values, end_values, w)
+                else:
+                    data[name] = start_values + (end_values - start_values) * w
+            else:
+                # select a reading (non-floating fields, such as flags, are never blended)
+                data[name] = values[nearest if self._device is None else torch.from_numpy(nearest).to(values.device)]
+        return data
+
+    def _window_slice(self, length: Optional[int], stride: int) -> slice:
+        if stride < 1:
+            raise ValueError(f"The stride must be positive, got {stride}")
+        available = (self._count - 1) // stride + 1 if self._count else 0
+        length = available if length is None else length
+        if length > available:
+            raise ValueError(f"Requested {length} readings with stride {stride}, only {available} available")
+        end = self._head + self._capacity + 1
+        return slice(end - 1 - (length - 1) * stride, end, stride) if length else slice(0, 0)
@@ -13,3 +13,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from isaacsim.core.api.simulation_context.simulation_context import SimulationContext
+from isaacsim.core.api.simulation_context.step_profiler import StepProfiler
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import builtins
+import contextlib
 import gc
 
 # python
@@ -32,6 +33,7 @@ import isaacsim.core.utils.warp as warp_utils
 import omni.kit.app
 import omni.physics.tensors
 from isaacsim.core.api.physics_context import PhysicsContext
+from isaacsim.core.api.simulation_context.step_profiler import StepProfiler
 from isaacsim.core.simulation_manager import IsaacEvents, SimulationManager
 from isaacsim.core.utils.carb import get_carb_setting, set_carb_setting
 from isaacsim.core.utils.prims import get_prim_type_name, is_prim_ancestral, is_prim_no_delete
@@ -47,6 +49,9 @@ from isaacsim.core.utils.stage import (
 )
 from pxr import Usd
 
+# phase timer used when the step profiling is disabled
+_NULL_PHASE = contextlib.nullcontext()
+
 
 class SimulationContext:
     """This class provide functions that take care of many time-related events such as
@@ -137,6 +142,7 @@ class SimulationContext:
         self._physics_context = None
         self._current_time = 0
         self._skip_next_stage_open_callback_fn = False
+        self._step_profiler = None
         if self._set_defaults:
             if self._initial_rendering_dt is None:
                 self._initial_rendering_dt = 1.0 / 60.0
@@ -697,20 +703,25 @@ class SimulationContext:
         """
         if self.stage is None:
             raise Exception("There is no stage currently opened, init_stage needed before calling this func")
-        if render:
-            # physics dt is zero, no need to step physics, just render
-            if self.get_physics_dt() == 0:
-                SimulationContext.render(self)
-            # rendering dt is zero, but physics is not, call step and then render
-            elif self.get_rendering_dt() == 0 and self.get_physics_dt() != 0:
-                if self.is_playing():
-                    self._physics_context._step(current_time=self.current_time, update_fabric=update_fabric)
-                SimulationContext.render(self)
+        with self._profile_phase("simulation_step"):
+            if render:
+                # physics dt is zero, no need to step physics, just render
+                if self.get_physics_dt() == 0:
+                    SimulationContext.render(self)
+                # rendering dt is zero, but physics is not, call step and then render
+                elif self.get_rendering_dt() == 0 and self.get_physics_dt() != 0:
+                    if self.is_playing():
+                        with self._profile_phase("physics_step"):
+                            self._physics_context._step(current_time=self.current_time, update_fabric=update_fabric)
+                    SimulationContext.render(self)
+                else:
+                    # physics and rendering in a single app update
+                    with self._profile_phase("app_update"):
+                        self._app.update()
             else:
-                self._app.update()
-        else:
-            if self.is_playing():
-                self._physics_context._step(current_time=self.current_time, update_fabric=update_fabric)
+                if self.is_playing():
+                    with self._profile_phase("physics_step"):
+                        self._physics_context._step(current_time=self.current_time, update_fabric=update_fabric)
         return
 
     def render(self) -> None:
@@ -727,23 +738,24 @@ class SimulationContext:
 
             >>> simulation_context.render()
         """
-        if (
-            self.device is not None
-            and "cuda" in self.device
-            and self.physics_sim_view is not None
-            and self.is_playing()
-        ):
-            self.physics_sim_view.update_articulations_kinematic()
-        if self._physx_fabric_interface is None:
-            if self.current_time > 0 and self._extension_manager.is_extension_enabled("omni.physx.fabric"):
-                from omni.physxfabric import get_physx_fabric_interface
-
-                self._physx_fabric_interface = get_physx_fabric_interface()
-        if self._physx_fabric_interface:
-            self._physx_fabric_interface.force_update(self._physics_context.get_physics_dt(), self.current_time)
-        set_carb_setting(self._settings, "/app/player/playSimulations", False)
-        self._app.update()
-        set_carb_setting(self._settings, "/app/player/playSimulations", True)
+        with self._profile_phase("render"):
+            if (
+                self.device is not None
+                and "cuda" in self.device
+                and self.physics_sim_view is not None
+                and self.is_playing()
+            ):
+                self.physics_sim_view.update_articulations_kinematic()
+            if self._physx_fabric_interface is None:
+                if self.current_time > 0 and self._extension_manager.is_extension_enabled("omni.physx.fabric"):
+                    from omni.physxfabric import get_physx_fabric_interface
+
+                    self._physx_fabric_interface = get_physx_fabric_interface()
+            if self._physx_fabric_interface:
+                self._physx_fabric_interface.force_update(self._physics_context.get_physics_dt(), self.current_time)
+            set_carb_setting(self._settings, "/app/player/playSimulations", False)
+            self._app.update()
+            set_carb_setting(self._settings, "/app/player/playSimulations", True)
         return
 
     async def render_async(self) -> None:
@@ -990,6 +1002,81 @@ class SimulationContext:
             set_carb_setting(self._settings, "/app/player/playSimulations", True)
         return
 
+    """
+    Operations- Profiling.
+    """
+
+    def enable_step_profiling(self, capacity: int = 1000) -> StepProfiler:
+        """Record the wall time of the phases of the simulation steps and of the callbacks.
+
+        The following phases are recorded (see :class:`StepProfiler`):
+
+        - ``simulation_step``: :meth:`step`, divided in ``physics_step``, ``render`` or ``app_update`` (physics and
+          rendering in a single app update, depending on the physics and rendering dt).
+        - ``physics_callback:<name>``: physics callbacks added with :meth:`add_physics_callback` (called during the
+          physics step).
+        - ``render_callback:<name>``: render callbacks added with :meth:`add_render_callback` while the profiling is
+          enabled.
+        - For a :class:`~isaacsim.core.api.World`: ``world_step``, divided in ``pre_step:<task name>``,
+          ``bbox_cache_update``, ``simulation_step`` and ``data_logging``.
+
+        Args:
+            capacity (int, optional): number of occurrences kept for each phase. Defaults to 1000.
+
+        Returns:
+            StepProfiler: the profiler (a new one, if the profiling was already enabled).
+
+        Example:
+
+        .. code-block:: python
+
+            >>> profiler = simulation_context.enable_step_profiling()
+            >>> for i in range(100):
+            ...     simulation_context.step()
+            >>> profiler.get_percentiles("simulation_step", [50, 99])
+            array([..., ...])
+        """
+        self._step_profiler = StepProfiler(capacity=capacity)
+        self._resubscribe_physics_callbacks()
+        return self._step_profiler
+
+    def disable_step_profiling(self) -> None:
+        """Stop recording the wall time of the phases of the simulation steps and of the callbacks.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> simulation_context.disable_step_profiling()
+        """
+        if self._step_profiler is None:
+            return
+        self._step_profiler = None
+        self._resubscribe_physics_callbacks()
+        return
+
+    def get_step_profiler(self) -> Optional[StepProfiler]:
+        """Get the profiler recording the wall time of the phases of the simulation steps and of the callbacks.
+
+        Returns:
+            Optional[StepProfiler]: the profiler, None if the profiling is disabled (see :meth:`enable_step_profiling`).
+
+        Example:
+
+        .. code-block:: python
+
+            >>> simulation_context.get_step_profiler()
+            <isaacsim.core.api.simulation_context.step_profiler.StepProfiler object at 0x...>
+        """
+        return self._step_profiler
+
+    def _resubscribe_physics_callbacks(self) -> None:
+        # (un)wrap the physics callbacks registered so far
+        for callback_name in list(self._physics_callback_functions.keys()):
+            self._physics_callback_functions[callback_name] = self._subscribe_physics_callback(
+                callback_name, self._physics_functions[callback_name]
+            )
+
     """
     Operations- Callbacks Management.
     """
@@ -1015,9 +1102,7 @@ class SimulationContext:
         if callback_name in self._physics_callback_functions:
             carb.log_error(f"Physics callback `{callback_name}` already exists")
             return
-        self._physics_callback_functions[callback_name] = (
-            self._physics_context._physx_interface.subscribe_physics_step_events(callback_fn)
-        )
+        self._physics_callback_functions[callback_name] = self._subscribe_physics_callback(callback_name, callback_fn)
         self._physics_functions[callback_name] = callback_fn
         return
 
@@ -1256,6 +1341,8 @@ class SimulationContext:
             carb.log_error(f"Render callback `{callback_name}` already exists")
             return
             # TODO: should we raise exception?
+        if self._step_profiler is not None:
+            callback_fn = self._step_profiler.wrap(f"render_callback:{callback_name}", callback_fn)
         self._render_callback_functions[callback_name] = self.app.get_update_event_stream().create_subscription_to_pop(
             callback_fn
         )
@@ -1449,6 +1536,16 @@ class SimulationContext:
 
     def _on_post_physics_ready(self, event):
         for callback_name, callback_function in self._physics_functions.items():
-            self._physics_callback_functions[callback_name] = (
-                self._physics_context._physx_interface.subscribe_physics_step_events(callback_function)
+            self._physics_callback_functions[callback_name] = self._subscribe_physics_callback(
+                callback_name, callback_function
             )
+
+    def _subscribe_physics_callback(self, callback_name: str, callback_fn: Callable[[float], None]):
+        if self._step_profiler is not None:
+            callback_fn = self._step_profiler.wrap(f"physics_callback:{callback_name}", callback_fn)
+        return self._physics_context._physx_interface.subscribe_physics_step_events(callback_fn)
+
+    def _profile_phase(self, name: str) -> contextlib.AbstractContextManager:
+        if self._step_profiler is None:
+            return _NULL_PHASE
+        return self._step_profiler.phase(name)
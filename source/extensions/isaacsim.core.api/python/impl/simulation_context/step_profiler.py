@@ -0,0 +1,257 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class _PhaseTimer:
+    """Reusable context manager timing a phase (see :meth:`StepProfiler.phase`)."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "StepProfiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> "_PhaseTimer":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._profiler.record(self._name, self._start, time.perf_counter_ns())
+
+
+class StepProfiler:
+    """Record the wall time of the phases of the simulation steps and of the callbacks.
+
+    The start time and duration of the last ``capacity`` occurrences of each phase are kept in preallocated ring
+    buffers, from which rolling statistics and a Chrome trace (``chrome://tracing`` or Perfetto) are computed.
+
+    Args:
+        capacity (int, optional): number of occurrences kept for each phase. Defaults to 1000.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.core.api.simulation_context import StepProfiler
+        >>>
+        >>> profiler = StepProfiler(capacity=100)
+        >>> for i in range(10):
+        ...     with profiler.phase("work"):
+        ...         sum(range(10000))
+        >>> profiler.get_count("work")
+        10
+        >>> profiler.export_chrome_trace("/tmp/trace.json")
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        if capacity < 1:
+            raise ValueError(f"The capacity of the profiler must be positive, got {capacity}")
+        self._capacity = int(capacity)
+        self._starts = {}
+        self._durations = {}
+        self._counts = {}
+        self._threads = {}
+        self._timers = {}
+        self._origin = time.perf_counter_ns()
+
+    @property
+    def capacity(self) -> int:
+        """Number of occurrences kept for each phase."""
+        return self._capacity
+
+    @property
+    def phases(self) -> List[str]:
+        """Names of the phases recorded."""
+        return list(self._counts.keys())
+
+    def phase(self, name: str) -> _PhaseTimer:
+        """Get a context manager recording the wall time of a phase.
+
+        .. note::
+
+            The context manager of a phase is reused, so a phase can't be nested in itself.
+
+        Args:
+            name (str): name of the phase.
+
+        Returns:
+            _PhaseTimer: the context manager.
+        """
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _PhaseTimer(self, name)
+        return timer
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """Wrap a function (e.g.: a callback) so that the wall time of each call is recorded as a phase.
+
+        Args:
+            name (str): name of the phase.
+            fn (Callable): function to wrap.
+
+        Returns:
+            Callable: the wrapped function.
+        """
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter_ns())
+
+        return wrapper
+
+    def record(self, name: str, start: int, end: int) -> None:
+        """Record an occurrence of a phase.
+
+        Args:
+            name (str): name of the phase.
+            start (int): start time of the occurrence, in nanoseconds (from ``time.perf_counter_ns``).
+            end (int): end time of the occurrence, in nanoseconds (from ``time.perf_counter_ns``).
+        """
+        count = self._counts.get(name)
+        if count is None:
+            self._starts[name] = np.zeros(self._capacity, dtype=np.int64)
+            self._durations[name] = np.zeros(self._capacity, dtype=np.int64)
+            self._threads[name] = np.zeros(self._capacity, dtype=np.int64)
+            count = 0
+        index = count % self._capacity
+        self._starts[name][index] = start
+        self._durations[name][index] = end - start
+        self._threads[name][index] = threading.get_ident()
+        self._counts[name] = count + 1
+
+    def reset(self) -> None:
+        """Remove all the recorded occurrences."""
+        self._starts = {}
+        self._durations = {}
+        self._counts = {}
+        self._threads = {}
+        self._origin = time.perf_counter_ns()
+
+    def get_count(self, name: str) -> int:
+        """Get the number of occurrences of a phase since the last reset (including the ones no longer kept).
+
+        Args:
+            name (str): name of the phase.
+
+        Returns:
+            int: the number of occurrences.
+        """
+        return self._counts.get(name, 0)
+
+    def get_durations(self, name: str) -> np.ndarray:
+        """Get the durations of the occurrences of a phase kept, oldest first.
+
+        Args:
+            name (str): name of the phase.
+
+        Returns:
+            np.ndarray: the durations, in milliseconds.
+        """
+        count = self._counts.get(name, 0)
+        if not count:
+            return np.zeros(0)
+        durations = self._durations[name]
+        if count > self._capacity:
+            durations = np.roll(durations, -(count % self._capacity))
+        return durations[: min(count, self._capacity)] * 1e-6
+
+    def get_percentiles(self, name: str, percentiles: Sequence[float] = (50, 90, 99)) -> np.ndarray:
+        """Get rolling percentiles of the duration of a phase.
+
+        Args:
+            name (str): name of the phase.
+            percentiles (Sequence[float], optional): percentiles to compute. Defaults to (50, 90, 99).
+
+        Returns:
+            np.ndarray: the percentiles, in milliseconds (NaN if the phase was not recorded).
+        """
+        durations = self.get_durations(name)
+        if not durations.size:
+            return np.full(len(percentiles), np.nan)
+        return np.percentile(durations, percentiles)
+
+    def get_summary(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[str, Dict[str, float]]:
+        """Get rolling statistics of the duration of each phase.
+
+        Args:
+            percentiles (Sequence[float], optional): percentiles to compute. Defaults to (50, 90, 99).
+
+        Returns:
+            Dict[str, Dict[str, float]]: for each phase, the number of occurrences ("count") and the "mean", "min",
+                                         "max" and percentiles (e.g.: "p50") of the durations kept, in milliseconds.
+        """
+        summary = {}
+        for name in self._counts.keys():
+            durations = self.get_durations(name)
+            summary[name] = {
+                "count": self._counts[name],
+                "mean": float(durations.mean()),
+                "min": float(durations.min()),
+                "max": float(durations.max()),
+            }
+            for percentile, value in zip(percentiles, np.percentile(durations, percentiles)):
+                summary[name][f"p{percentile:g}"] = float(value)
+        return summary
+
+    def get_chrome_trace(self, names: Optional[List[str]] = None) -> dict:
+        """Get the occurrences kept as a Chrome trace (complete events, in microseconds).
+
+        Args:
+            names (Optional[List[str]], optional): phases to include. Defaults to None (all the phases).
+
+        Returns:
+            dict: the trace, in the Chrome trace event format.
+        """
+        events = []
+        for name in self._counts.keys() if names is None else names:
+            count = min(self._counts.get(name, 0), self._capacity)
+            starts = (self._starts[name][:count] - self._origin) * 1e-3 if count else []
+            durations = self._durations[name][:count] * 1e-3 if count else []
+            threads = self._threads[name][:count] if count else []
+            for start, duration, thread in zip(starts, durations, threads):
+                events.append(
+                    {
+                        "name": name,
+                        "ph": "X",
+                        "ts": float(start),
+                        "dur": float(duration),
+                        "pid": 0,
+                        "tid": int(thread),
+                    }
+                )
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str, names: Optional[List[str]] = None) -> None:
+        """Export the occurrences kept to a Chrome trace JSON file (see :meth:`get_chrome_trace`).
+
+        Args:
+            path (str): path of the JSON file.
+            names (Optional[List[str]], optional): phases to include. Defaults to None (all the phases).
+        """
+        with open(path, "w") as trace_file:
+            json.dump(self.get_chrome_trace(names), trace_file)
@@ -537,21 +537,11 @@ class World(SimulationContext):
 
             >>> world.step()
         """
-        if self._task_scene_built:
-            for task in self._current_tasks.values():
-                task.pre_step(self.current_time_step_index, self.current_time)
-        if self.scene._enable_bounding_box_computations:
-            self.scene._bbox_cache.SetTime(Usd.TimeCode(self._current_time))
-
-        if step_sim:
-            SimulationContext.step(self, render=render, update_fabric=update_fabric)
-        if self._data_logger.is_started():
-            if self._data_logger._data_frame_logging_func is None:
-                raise Exception("You need to add data logging function before starting the data logger")
-            data = self._data_logger._data_frame_logging_func(tasks=self.get_current_tasks(), scene=self.scene)
-            self._data_logger.add_data(
-                data=data, current_time_step=self.current_time_step_index, current_time=self.current_time
-            )
+        with self._profile_phase("world_step"):
+            self._pre_step_tasks()
+            if step_sim:
+                SimulationContext.step(self, render=render, update_fabric=update_fabric)
+            self._log_data_frame()
         return
 
     def step_async(self, step_size: Optional[float] = None) -> None:
@@ -576,18 +566,9 @@ class World(SimulationContext):
             ...
             >>> run_coroutine(task())
         """
-        if self._task_scene_built:
-            for task in self._current_tasks.values():
-                task.pre_step(self.current_time_step_index, self.current_time)
-        if self.scene._enable_bounding_box_computations:
-            self.scene._bbox_cache.SetTime(Usd.TimeCode(self._current_time))
-        if self._data_logger.is_started():
-            if self._data_logger._data_frame_logging_func is None:
-                raise Exception("You need to add data logging function before starting the data logger")
-            data = self._data_logger._data_frame_logging_func(tasks=self.get_current_tasks(), scene=self.scene)
-            self._data_logger.add_data(
-                data=data, current_time_step=self.current_time_step_index, current_time=self.current_time
-            )
+        with self._profile_phase("world_step"):
+            self._pre_step_tasks()
+            self._log_data_frame()
         return
 
     def clear(self) -> None:
@@ -602,6 +583,27 @@ class World(SimulationContext):
         self.scene.clear(registry_only=False)
         self._current_tasks = dict()
         self._task_scene_built = False
+        # close the columnar log file the data logger may be streaming to
+        self._data_logger.reset()
         self._data_logger = DataLogger()
         # clear all prims in the stage.
         SimulationContext.clear(self)
+
+    def _pre_step_tasks(self) -> None:
+        if self._task_scene_built:
+            for task_name, task in self._current_tasks.items():
+                with self._profile_phase(f"pre_step:{task_name}"):
+                    task.pre_step(self.current_time_step_index, self.current_time)
+        if self.scene._enable_bounding_box_computations:
+            with self._profile_phase("bbox_cache_update"):
+                self.scene._bbox_cache.SetTime(Usd.TimeCode(self._current_time))
+
+    def _log_data_frame(self) -> None:
+        if self._data_logger.is_started():
+            if self._data_logger._data_frame_logging_func is None:
+                raise Exception("You need to add data logging function before starting the data logger")
+            with self._profile_phase("data_logging"):
+                data = self._data_logger._data_frame_logging_func(tasks=self.get_current_tasks(), scene=self.scene)
+                self._data_logger.add_data(
+                    data=data, current_time_step=self.current_time_step_index, current_time=self.current_time
+                )
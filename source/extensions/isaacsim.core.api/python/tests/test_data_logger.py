@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+from isaacsim.core.api.loggers import ColumnarLogReader, DataLogger
+
+
+class TestDataLogger(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._log_path = os.path.join(self._temp_dir.name, "log.bin")
+
+    async def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _get_data(self, index):
+        return {
+            "joint_positions": [0.1 * index] * 9,
+            "gripper_closed": index % 2 == 0,
+            "task": f"pick_{index}",
+            "contacts": [index] * (index % 3),
+        }
+
+    def _add_data(self, data_logger, num_frames):
+        for index in range(num_frames):
+            data_logger.add_data(data=self._get_data(index), current_time_step=index, current_time=index / 60.0)
+
+    async def test_streaming(self):
+        memory_logger = DataLogger()
+        self._add_data(memory_logger, 100)
+        streaming_logger = DataLogger()
+        streaming_logger.start_streaming(self._log_path, chunk_size=16)
+        self.assertTrue(streaming_logger.is_streaming())
+        self._add_data(streaming_logger, 100)
+        self.assertEqual(streaming_logger.get_num_of_data_frames(), 100)
+        # frames already written to the file and frames of the chunk being filled
+        for index in [0, 15, 16, 50, 95, 99, -1]:
+            self.assertEqual(
+                streaming_logger.get_data_frame(index).get_dict(), memory_logger.get_data_frame(index).get_dict()
+            )
+        self.assertEqual(streaming_logger.get_data_frame_at_time_step(42).data["task"], "pick_42")
+        self.assertIsNone(streaming_logger.get_data_frame_at_time_step(1000))
+        # same JSON export
+        json_paths = [os.path.join(self._temp_dir.name, name) for name in ["memory.json", "streaming.json"]]
+        memory_logger.save(json_paths[0])
+        streaming_logger.save(json_paths[1])
+        with open(json_paths[0]) as memory_file, open(json_paths[1]) as streaming_file:
+            self.assertEqual(json.load(memory_file), json.load(streaming_file))
+        streaming_logger.stop_streaming()
+        self.assertFalse(streaming_logger.is_streaming())
+        self.assertEqual(streaming_logger.get_data_frame(99).data, self._get_data(99))
+        streaming_logger.reset()
+
+    async def test_load(self):
+        data_logger = DataLogger()
+        data_logger.start_streaming(self._log_path, chunk_size=16)
+        self._add_data(data_logger, 100)
+        data_logger.reset()
+        data_logger.load(self._log_path)
+        self.assertEqual(data_logger.get_num_of_data_frames(), 100)
+        self.assertEqual(data_logger.get_data_frame_at_time_step(7).data, self._get_data(7))
+        # resume recording (appended to the columnar log file)
+        data_logger.add_data(data=self._get_data(100), current_time_step=100, current_time=100 / 60.0)
+        self.assertTrue(data_logger.is_streaming())
+        self.assertEqual(data_logger.get_num_of_data_frames(), 101)
+        self.assertEqual(data_logger.get_data_frame(100).data, self._get_data(100))
+        data_logger.stop_streaming()
+        data_logger.add_data(data=self._get_data(101), current_time_step=101, current_time=101 / 60.0)
+        data_logger.reset()
+        data_logger.load(self._log_path)
+        self.assertEqual(data_logger.get_num_of_data_frames(), 102)
+        self.assertEqual(data_logger.get_data_frame(7).data, self._get_data(7))
+        self.assertEqual(data_logger.get_data_frame(101).data, self._get_data(101))
+        # stream to another file
+        other_log_path = os.path.join(self._temp_dir.name, "other_log.bin")
+        data_logger.start_streaming(other_log_path, chunk_size=16)
+        self.assertEqual(data_logger.get_num_of_data_frames(), 102)
+        self.assertEqual(data_logger.get_data_frame(50).data, self._get_data(50))
+        data_logger.reset()
+
+    async def test_unclosed_log(self):
+        data_logger = DataLogger()
+        data_logger.start_streaming(self._log_path, chunk_size=16)
+        self._add_data(data_logger, 40)
+        # only the complete chunks are written until the log is closed
+        reader = ColumnarLogReader(self._log_path)
+        self.assertEqual(len(reader), 32)
+        self.assertEqual(reader.get_data_frame(31).data, self._get_data(31))
+        reader.close()
+        data_logger.reset()
+        reader = ColumnarLogReader(self._log_path)
+        self.assertEqual(len(reader), 40)
+        reader.close()
+
+    async def test_time_step_lookup(self):
+        data_logger = DataLogger()
+        data_logger.start_streaming(self._log_path, chunk_size=16)
+        self.assertIsNone(data_logger.get_data_frame_at_time_step(0))
+        self._add_data(data_logger, 20)
+        # the frames of the chunk being filled are searched without being written
+        self.assertEqual(data_logger.get_data_frame_at_time_step(18).data, self._get_data(18))
+        self.assertEqual(data_logger.get_data_frame_at_time_step(3).data, self._get_data(3))
+        reader = ColumnarLogReader(self._log_path)
+        self.assertEqual(len(reader), 16)
+        reader.close()
+        data_logger.reset()
+
+    async def test_value_types(self):
+        data_logger = DataLogger()
+        data_logger.start_streaming(self._log_path, chunk_size=4)
+        for index in range(6):
+            data = {
+                "position": np.array([index, 0.5, 0.0], dtype=np.float32),
+                "count": np.int64(index),
+                "nested": {"velocity": np.zeros(2), "ids": (index, index + 1)},
+                # integers and floats mixed across frames
+                "value": index if index % 2 else index + 0.5,
+                "flags": [True, index],
+            }
+            data_logger.add_data(data=data, current_time_step=index, current_time=index / 60.0)
+        data_logger.stop_streaming()
+        for index in [1, 2, 5]:
+            data = data_logger.get_data_frame(index).data
+            self.assertEqual(data["position"], [float(index), 0.5, 0.0])
+            self.assertIs(type(data["count"]), int)
+            self.assertEqual(data["nested"], {"velocity": [0.0, 0.0], "ids": [index, index + 1]})
+            self.assertIs(type(data["value"]), int if index % 2 else float)
+            self.assertEqual(data["value"], index if index % 2 else index + 0.5)
+            self.assertIs(type(data["flags"][0]), bool)
+            self.assertIs(type(data["flags"][1]), int)
+        # unsupported values are rejected when added
+        with self.assertRaises(TypeError):
+            data_logger.add_data(data={"object": object()}, current_time_step=6, current_time=0.1)
+        data_logger.reset()
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import omni.kit.test
+import torch
+from isaacsim.core.api.sensors import SensorHistory
+
+
+class TestSensorHistory(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._history = SensorHistory(4, {"value": ((2,), np.float32), "flag": ((), bool)})
+        for i in range(6):
+            self._history.append(0.1 * i, value=(i, -i), flag=i % 2 == 0)
+
+    async def tearDown(self):
+        pass
+
+    async def test_window(self):
+        self.assertEqual(len(self._history), 4)
+        window = self._history.get_window()
+        np.testing.assert_allclose(window["time"], [0.2, 0.3, 0.4, 0.5])
+        np.testing.assert_array_equal(window["value"][:, 0], [2, 3, 4, 5])
+        np.testing.assert_array_equal(window["flag"], [True, False, True, False])
+        # windows are views into the history buffers
+        self.assertTrue(np.shares_memory(window["value"], self._history.get_window(2)["value"]))
+        np.testing.assert_array_equal(self._history.get_window(2, stride=2)["value"][:, 0], [3, 5])
+        np.testing.assert_allclose(self._history.get_times(stride=3), [0.2, 0.5])
+        with self.assertRaises(ValueError):
+            self._history.get_window(3, stride=2)
+
+    async def test_timestamps(self):
+        # same timestamp replaces the latest reading
+        self.assertFalse(self._history.append(0.5, value=(9, 9)))
+        self.assertEqual(len(self._history), 4)
+        np.testing.assert_array_equal(self._history.get_window(1)["value"], [[9, 9]])
+        # earlier timestamp (e.g.: simulation reset) clears the history
+        self.assertTrue(self._history.append(0.0, value=(1, 1)))
+        self.assertEqual(len(self._history), 1)
+        self.assertEqual(self._history.latest_time, 0.0)
+
+    async def test_interpolate(self):
+        data = self._history.interpolate([0.27, 0.0, 1.0])
+        np.testing.assert_allclose(data["value"][:, 0], [2.7, 2.0, 5.0], atol=1e-6)
+        np.testing.assert_array_equal(data["flag"], [False, True, False])
+        data = self._history.interpolate([0.29, 0.31], method="previous")
+        np.testing.assert_array_equal(data["value"][:, 0], [2, 3])
+        data = self._history.interpolate(0.33, fields=["value"], method="nearest")
+        self.assertEqual(list(data.keys()), ["time", "value"])
+        np.testing.assert_array_equal(data["value"][:, 0], [3])
+        with self.assertRaises(ValueError):
+            self._history.interpolate(0.3, method="cubic")
+
+    async def test_torch(self):
+        history = SensorHistory(3, {"value": ((2,), np.float32)}, device="cpu")
+        for i in range(4):
+            history.append(float(i), value=torch.tensor([i, -i]))
+        window = history.get_window()
+        self.assertIsInstance(window["value"], torch.Tensor)
+        self.assertTrue(torch.equal(window["value"][:, 0], torch.tensor([1.0, 2.0, 3.0])))
+        data = history.interpolate([1.5])
+        self.assertTrue(torch.allclose(data["value"], torch.tensor([[1.5, -1.5]])))
+
+    async def test_interpolate_quaternions(self):
+        half = np.sqrt(0.5)
+        for device in (None, "cpu"):
+            history = SensorHistory(
+                2, {"orientation": ((4,), np.float32)}, device=device, quaternion_fields=["orientation"]
+            )
+            # 90 degrees around z, then the same rotation with the opposite sign
+            history.append(0.0, orientation=(1.0, 0.0, 0.0, 0.0))
+            history.append(1.0, orientation=(-half, 0.0, 0.0, -half))
+            data = history.interpolate([0.0, 0.5, 1.0])["orientation"]
+            if device is not None:
+                self.assertIsInstance(data, torch.Tensor)
+                data = data.numpy()
+            # unit quaternions, blended along the shortest arc
+            np.testing.assert_allclose(np.linalg.norm(data, axis=-1), 1.0, atol=1e-6)
+            expected = np.array([np.cos(np.pi / 8), 0.0, 0.0, np.sin(np.pi / 8)])
+            np.testing.assert_allclose(data[1], expected, atol=1e-6)
+        with self.assertRaises(ValueError):
+            SensorHistory(2, {"value": ((3,), np.float32)}, quaternion_fields=["value"])
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import tempfile
 import unittest
 
 import carb
@@ -204,3 +207,44 @@ class TestScene(CoreTestCase):
         self.assertTrue(not is_prim_path_valid("/World/Franka"))
         await create_new_stage_async()
         return
+
+    async def test_step_profiling(self):
+        await create_new_stage_async()
+        my_world = World(stage_units_in_meters=1.0, device="cpu")
+        await my_world.initialize_simulation_context_async()
+        my_world.scene.add_default_ground_plane()
+        await my_world.reset_async()
+        physics_steps = []
+        my_world.add_physics_callback("count_steps", lambda step_size: physics_steps.append(step_size))
+        profiler = my_world.enable_step_profiling(capacity=8)
+        self.assertIs(my_world.get_step_profiler(), profiler)
+        data_logger = my_world.get_data_logger()
+        data_logger.add_data_frame_logging_func(lambda tasks, scene: {"time": my_world.current_time})
+        data_logger.start()
+        for _ in range(10):
+            my_world.step(render=False)
+        data_logger.reset()
+        self.assertEqual(len(physics_steps), 10)
+        for phase in ["world_step", "simulation_step", "physics_step", "physics_callback:count_steps", "data_logging"]:
+            self.assertEqual(profiler.get_count(phase), 10, phase)
+            self.assertEqual(profiler.get_durations(phase).shape, (8,))
+        p50, p99 = profiler.get_percentiles("world_step", [50, 99])
+        self.assertGreater(p50, 0.0)
+        self.assertLessEqual(p50, p99)
+        # the physics step is part of the world step
+        summary = profiler.get_summary()
+        self.assertLessEqual(summary["physics_step"]["max"], summary["world_step"]["max"])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = os.path.join(temp_dir, "trace.json")
+            profiler.export_chrome_trace(trace_path)
+            with open(trace_path) as trace_file:
+                events = json.load(trace_file)["traceEvents"]
+        self.assertEqual(len([event for event in events if event["name"] == "world_step"]), 8)
+        my_world.disable_step_profiling()
+        self.assertIsNone(my_world.get_step_profiler())
+        my_world.step(render=False)
+        self.assertEqual(profiler.get_count("world_step"), 10)
+        self.assertEqual(len(physics_steps), 11)
+        my_world.remove_physics_callback("count_steps")
+        await create_new_stage_async()
+        return
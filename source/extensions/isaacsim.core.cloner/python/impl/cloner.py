@@ -12,7 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Union
+import time
+from typing import Dict, List, Union
 
 import carb
 import carb.settings
@@ -32,7 +33,9 @@ class Cloner:
     placed at user-specified locations in the scene.
 
     Note that the cloning process is performed in a for-loop, so performance should
-    be expected to follow linear scaling with an increase of clones.
+    be expected to follow linear scaling with an increase of clones. Only the first clone
+    is authored from the source prim, the others are copied from it in a single Sdf call each.
+    The time spent in each phase of the last clone is available from :meth:`get_clone_timings`.
     """
 
     def __init__(self, stage: Usd.Stage = None):
@@ -42,6 +45,8 @@ class Cloner:
         """
         self._base_env_path = None
         self._root_path = None
+        self._clone_timings = {}
+        self._env_ids_enabled = False
         self._stage = stage
         if stage is None:
             self._stage = omni.usd.get_context().get_stage()
@@ -204,6 +209,8 @@ class Cloner:
             Exception: Raises exception if source prim path is not valid.
 
         """
+        clone_start = time.perf_counter()
+        self._clone_timings = {}
         self.disable_change_listener()
 
         # check if inputs are valid
@@ -314,7 +321,9 @@ class Cloner:
             prim.GetPrim().GetAttribute("xformOp:orient").Set(orientation)
 
         has_clones = False
+        self._clone_timings["prepare"] = time.perf_counter() - clone_start
 
+        phase_start = time.perf_counter()
         if clone_in_fabric:
             stageId = UsdUtils.StageCache.Get().Insert(self._stage).ToLongInt()
             ret_val = _fabric_clone(stageId, source_prim_path, prim_paths)
@@ -356,89 +365,212 @@ class Cloner:
             else:
                 carb.log_error("Failed to clone in Fabric")
         else:
-            with Sdf.ChangeBlock():
-                for i, prim_path in enumerate(prim_paths):
-                    if prim_path != source_prim_path:
-                        has_clones = True
-
-                        env_spec = Sdf.CreatePrimInLayer(self._stage.GetRootLayer(), prim_path)
-                        stack = UsdGeom.Xform(self._stage.GetPrimAtPath(source_prim_path)).GetPrim().GetPrimStack()
-
-                        if copy_from_source:
-                            Sdf.CopySpec(
-                                env_spec.layer, Sdf.Path(source_prim_path), env_spec.layer, Sdf.Path(prim_path)
-                            )
-                        else:
-                            env_spec.inheritPathList.Prepend(source_prim_path)
-
-                        if positions is not None:
-                            translation = positions[i]  # use specified translation
-                        else:
-                            translation = current_translation  # use the same translation as source
-
-                        if orientations is not None:
-                            orientation = orientations[i]  # use specified orientation
-                        else:
-                            orientation = current_orientation  # use the same orientation as source
-
-                        translate_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:translate")
-                        if translate_spec is None:
-                            translate_spec = Sdf.AttributeSpec(
-                                env_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3
-                            )
-                        translate_spec.default = translation
-
-                        orient_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:orient")
-                        default_precision = carb.settings.get_settings().get_as_string(
-                            "app/primCreation/DefaultXformOpPrecision"
-                        )
-                        if orient_spec is None:
-                            if len(default_precision) > 0 and default_precision == "Float":
-                                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatf)
-                                orient_spec.default = Gf.Quatf(orientation)
-                            else:
-                                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatd)
-                                orient_spec.default = Gf.Quatd(orientation)
-                        elif orient_spec.default is not None and type(orient_spec.default) == Gf.Quatf:
-                            orient_spec.default = Gf.Quatf(orientation)
-                        else:
-                            orient_spec.default = Gf.Quatd(orientation)
-
-                        scale_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:scale")
-                        if scale_spec is None:
-                            scale_spec = Sdf.AttributeSpec(env_spec, "xformOp:scale", Sdf.ValueTypeNames.Double3)
-                        scale_spec.default = current_scale
-
-                        op_order_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOpOrder")
-                        if op_order_spec is None:
-                            op_order_spec = Sdf.AttributeSpec(
-                                env_spec, UsdGeom.Tokens.xformOpOrder, Sdf.ValueTypeNames.TokenArray
-                            )
-                        op_order_spec.default = Vt.TokenArray(["xformOp:translate", "xformOp:orient", "xformOp:scale"])
+            has_clones = self._clone_specs(
+                source_prim_path,
+                prim_paths,
+                positions,
+                orientations,
+                current_translation,
+                current_orientation,
+                current_scale,
+                copy_from_source,
+            )
+        self._clone_timings["author"] = time.perf_counter() - phase_start
 
+        phase_start = time.perf_counter()
         if replicate_physics and has_clones:
             self.replicate_physics(
                 source_prim_path, prim_paths, base_env_path, root_path, enable_env_ids, clone_in_fabric
             )
+            self._env_ids_enabled = enable_env_ids
         elif unregister_physics_replication:
             get_physx_replicator_interface().unregister_replicator(
                 UsdUtils.StageCache.Get().Insert(self._stage).ToLongInt()
             )
+        self._clone_timings["replicate_physics"] = time.perf_counter() - phase_start
 
         self.enable_change_listener()
+        self._clone_timings["total"] = time.perf_counter() - clone_start
+        carb.log_info(
+            f"Cloned {source_prim_path} to {len(prim_paths)} paths in {self._clone_timings['total']:.3f} s "
+            f"(prepare: {self._clone_timings['prepare']:.3f} s, author: {self._clone_timings['author']:.3f} s, "
+            f"replicate physics: {self._clone_timings['replicate_physics']:.3f} s)"
+        )
+
+    def get_clone_timings(self) -> Dict[str, float]:
+        """Gets the wall-clock time spent in each phase of the last call to :meth:`clone`.
+
+        Returns:
+            Dict[str, float]: Durations in seconds of the ``prepare`` (input conversion and source xform setup),
+                ``author`` (authoring the clones), ``replicate_physics`` (registering the physics replication) phases
+                and the ``total`` duration. Empty if :meth:`clone` was not called.
+        """
+        return dict(self._clone_timings)
+
+    def _clone_specs(
+        self,
+        source_prim_path: str,
+        prim_paths: List[str],
+        positions: Vt.Vec3fArray,
+        orientations: Vt.QuatdArray,
+        current_translation: Gf.Vec3d,
+        current_orientation: Union[Gf.Quatd, Gf.Quatf],
+        current_scale: Gf.Vec3d,
+        copy_from_source: bool,
+    ) -> bool:
+        """Authors the clones in the root layer of the stage.
+
+        The first clone is authored from the source prim (copy or inherit arc, plus its xform op specs), and every
+        other clone is stamped out from that first clone with a single Sdf.CopySpec call, after which only its
+        translation and orientation are authored. When inheriting, clone paths that already have a spec are authored
+        in place instead, to keep their existing content.
+
+        Returns:
+            bool: True if any clone was authored.
+        """
+        layer = self._stage.GetRootLayer()
+        default_precision = carb.settings.get_settings().get_as_string("app/primCreation/DefaultXformOpPrecision")
+        has_clones = False
+        template_path = None
+        parent_paths = set()
+        with Sdf.ChangeBlock():
+            for i, prim_path in enumerate(prim_paths):
+                if prim_path == source_prim_path:
+                    continue
+                translation = positions[i] if positions is not None else current_translation
+                orientation = orientations[i] if orientations is not None else current_orientation
+                path = Sdf.Path(prim_path)
+                # in inherit mode, specs already authored at the clone path are kept (Sdf.CopySpec would replace them)
+                has_spec = not copy_from_source and bool(layer.GetPrimAtPath(path))
+                if template_path is None or has_spec:
+                    env_spec = Sdf.CreatePrimInLayer(layer, path)
+                    if copy_from_source:
+                        Sdf.CopySpec(layer, Sdf.Path(source_prim_path), layer, path)
+                    else:
+                        env_spec.inheritPathList.Prepend(source_prim_path)
+                    orient_spec = self._author_xform_specs(
+                        env_spec, default_precision, translation, orientation, current_scale
+                    )
+                    if template_path is None and not has_spec:
+                        template_path = path
+                        orient_type = type(orient_spec.default)
+                    has_clones = True
+                    continue
+                parent_path = path.GetParentPath()
+                if parent_path not in parent_paths:
+                    Sdf.CreatePrimInLayer(layer, parent_path)
+                    parent_paths.add(parent_path)
+                Sdf.CopySpec(layer, template_path, layer, path)
+                layer.GetAttributeAtPath(path.AppendProperty("xformOp:translate")).default = translation
+                layer.GetAttributeAtPath(path.AppendProperty("xformOp:orient")).default = orient_type(orientation)
+        return has_clones
+
+    def _author_xform_specs(
+        self,
+        env_spec: Sdf.PrimSpec,
+        default_precision: str,
+        translation: Union[Gf.Vec3d, Gf.Vec3f],
+        orientation: Union[Gf.Quatd, Gf.Quatf],
+        scale: Gf.Vec3d,
+    ) -> Sdf.AttributeSpec:
+        """Authors the translate, orient and scale xform op specs (and their order) of a clone.
+
+        Returns:
+            Sdf.AttributeSpec: The orient attribute spec.
+        """
+        translate_spec = env_spec.GetAttributeAtPath(env_spec.path.AppendProperty("xformOp:translate"))
+        if translate_spec is None:
+            translate_spec = Sdf.AttributeSpec(env_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3)
+        translate_spec.default = translation
+
+        orient_spec = env_spec.GetAttributeAtPath(env_spec.path.AppendProperty("xformOp:orient"))
+        if orient_spec is None:
+            if len(default_precision) > 0 and default_precision == "Float":
+                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatf)
+                orient_spec.default = Gf.Quatf(orientation)
+            else:
+                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatd)
+                orient_spec.default = Gf.Quatd(orientation)
+        elif orient_spec.default is not None and type(orient_spec.default) == Gf.Quatf:
+            orient_spec.default = Gf.Quatf(orientation)
+        else:
+            orient_spec.default = Gf.Quatd(orientation)
+
+        scale_spec = env_spec.GetAttributeAtPath(env_spec.path.AppendProperty("xformOp:scale"))
+        if scale_spec is None:
+            scale_spec = Sdf.AttributeSpec(env_spec, "xformOp:scale", Sdf.ValueTypeNames.Double3)
+        scale_spec.default = scale
+
+        op_order_spec = env_spec.GetAttributeAtPath(env_spec.path.AppendProperty(UsdGeom.Tokens.xformOpOrder))
+        if op_order_spec is None:
+            op_order_spec = Sdf.AttributeSpec(env_spec, UsdGeom.Tokens.xformOpOrder, Sdf.ValueTypeNames.TokenArray)
+        op_order_spec.default = Vt.TokenArray(["xformOp:translate", "xformOp:orient", "xformOp:scale"])
+        return orient_spec
 
     def filter_collisions(
-        self, physicsscene_path: str, collision_root_path: str, prim_paths: List[str], global_paths: List[str] = []
+        self,
+        physicsscene_path: str,
+        collision_root_path: str,
+        prim_paths: List[str],
+        global_paths: List[str] = [],
+        mode: str = "groups",
+        positions: Union[np.ndarray, torch.Tensor] = None,
+        separation: float = None,
     ):
         """Filters collisions between clones. Clones will not collide with each other, but can collide with objects specified in global_paths.
 
+        The filtering is authored according to the mode:
+
+        - "groups": one collision group per clone. The number of authored specs grows linearly with the number of clones.
+        - "buckets": clones are distributed in a few collision groups so that clones closer than ``separation`` are in
+          different groups (clones of a group further apart can't touch each other). The number of authored specs only
+          grows with the number of clones within ``separation`` of each other.
+        - "env_ids": no collision group is authored, the clones are filtered by their environment IDs in physics. The
+          clones must be replicated with ``clone(..., replicate_physics=True, enable_env_ids=True)``, and every object
+          not replicated (such as the ones in global_paths) collides with all the clones.
+
         Args:
             physicsscene_path (str): Path to PhysicsScene object in stage.
             collision_root_path (str): Path to place collision groups under.
             prim_paths (List[str]): Paths of objects to filter out collision.
             global_paths (List[str]): Paths of objects to generate collision (e.g. ground plane).
+            mode (str): Filtering mode, "groups", "buckets" or "env_ids". Defaults to "groups".
+            positions (Union[np.ndarray, torch.Tensor]): World positions of the clones, used by the "buckets" mode.
+                                    Defaults to None, the positions are read from the stage.
+            separation (float): Minimum distance between the positions of the clones of a bucket (e.g.: the size of a
+                                clone plus a safety margin). Required by the "buckets" mode.
 
+        Raises:
+            ValueError: If the mode is not supported, or if separation is not given in the "buckets" mode.
         """
+        if mode not in ("groups", "buckets", "env_ids"):
+            raise ValueError(
+                f"Unsupported collision filtering mode '{mode}', expected 'groups', 'buckets' or 'env_ids'"
+            )
+        if mode == "env_ids":
+            if not self._env_ids_enabled:
+                carb.log_warn(
+                    "Collision filtering with environment IDs requires the clones to be replicated with "
+                    "replicate_physics=True and enable_env_ids=True"
+                )
+            return
+        if mode == "groups":
+            groups = [[prim_path] for prim_path in prim_paths]
+        else:
+            if separation is None:
+                raise ValueError("separation needs to be specified to filter collisions with buckets!")
+            if positions is None:
+                xform_cache = UsdGeom.XformCache()
+                positions = [
+                    xform_cache.GetLocalToWorldTransform(self._stage.GetPrimAtPath(prim_path)).ExtractTranslation()
+                    for prim_path in prim_paths
+                ]
+            elif isinstance(positions, torch.Tensor):
+                positions = positions.detach().cpu().numpy()
+            buckets = self._get_collision_buckets(np.asarray(positions, dtype=np.float64), separation)
+            groups = [[] for _ in range(int(buckets.max()) + 1 if len(buckets) else 0)]
+            for prim_path, bucket in zip(prim_paths, buckets):
+                groups[bucket].append(prim_path)
 
         physx_scene = PhysxSchema.PhysxSceneAPI(self._stage.GetPrimAtPath(physicsscene_path))
 
@@ -447,78 +579,84 @@ class Cloner:
 
         # Make sure we create the collision_scope in the RootLayer since the edit target may be a live layer in the case of Live Sync.
         with Usd.EditContext(self._stage, Usd.EditTarget(self._stage.GetRootLayer())):
-            collision_scope = UsdGeom.Scope.Define(self._stage, collision_root_path)
+            UsdGeom.Scope.Define(self._stage, collision_root_path)
 
         with Sdf.ChangeBlock():
+            collision_root = self._stage.GetRootLayer().GetPrimAtPath(collision_root_path)
             if len(global_paths) > 0:
                 global_collision_group_path = collision_root_path + "/global_group"
-                # add collision group prim
-                global_collision_group = Sdf.PrimSpec(
-                    self._stage.GetRootLayer().GetPrimAtPath(collision_root_path),
-                    "global_group",
-                    Sdf.SpecifierDef,
-                    "PhysicsCollisionGroup",
-                )
-                # prepend collision API schema
-                global_collision_group.SetInfo(
-                    Usd.Tokens.apiSchemas, Sdf.TokenListOp.Create({"CollectionAPI:colliders"})
-                )
-
-                # expansion rule
-                expansion_rule = Sdf.AttributeSpec(
-                    global_collision_group,
-                    "collection:colliders:expansionRule",
-                    Sdf.ValueTypeNames.Token,
-                    Sdf.VariabilityUniform,
-                )
-                expansion_rule.default = "expandPrims"
-
-                # includes rel
-                global_includes_rel = Sdf.RelationshipSpec(
-                    global_collision_group, "collection:colliders:includes", False
-                )
-                for global_path in global_paths:
-                    global_includes_rel.targetPathList.Append(global_path)
-
-                # filteredGroups rel
-                global_filtered_groups = Sdf.RelationshipSpec(global_collision_group, "physics:filteredGroups", False)
-                # We are using inverted collision group filtering, which means objects by default don't collide across
-                # groups. We need to add this group as a filtered group, so that objects within this group collide with
-                # each other.
-                global_filtered_groups.targetPathList.Append(global_collision_group_path)
+                global_filtered_groups = self._create_collision_group(collision_root, "global_group", global_paths)
 
             # set collision groups and filters
-            for i, prim_path in enumerate(prim_paths):
+            group_paths = []
+            for i, group in enumerate(groups):
                 collision_group_path = collision_root_path + f"/group{i}"
-                # add collision group prim
-                collision_group = Sdf.PrimSpec(
-                    self._stage.GetRootLayer().GetPrimAtPath(collision_root_path),
-                    f"group{i}",
-                    Sdf.SpecifierDef,
-                    "PhysicsCollisionGroup",
-                )
-                # prepend collision API schema
-                collision_group.SetInfo(Usd.Tokens.apiSchemas, Sdf.TokenListOp.Create({"CollectionAPI:colliders"}))
-
-                # expansion rule
-                expansion_rule = Sdf.AttributeSpec(
-                    collision_group,
-                    "collection:colliders:expansionRule",
-                    Sdf.ValueTypeNames.Token,
-                    Sdf.VariabilityUniform,
-                )
-                expansion_rule.default = "expandPrims"
-
-                # includes rel
-                includes_rel = Sdf.RelationshipSpec(collision_group, "collection:colliders:includes", False)
-                includes_rel.targetPathList.Append(prim_path)
-
-                # filteredGroups rel
-                filtered_groups = Sdf.RelationshipSpec(collision_group, "physics:filteredGroups", False)
+                filtered_groups = self._create_collision_group(collision_root, f"group{i}", group)
                 # We are using inverted collision group filtering, which means objects by default don't collide across
                 # groups. We need to add this group as a filtered group, so that objects within this group collide with
                 # each other.
-                filtered_groups.targetPathList.Append(collision_group_path)
                 if len(global_paths) > 0:
-                    filtered_groups.targetPathList.Append(global_collision_group_path)
-                    global_filtered_groups.targetPathList.Append(collision_group_path)
+                    filtered_groups.targetPathList.appendedItems = [collision_group_path, global_collision_group_path]
+                else:
+                    filtered_groups.targetPathList.appendedItems = [collision_group_path]
+                group_paths.append(collision_group_path)
+
+            if len(global_paths) > 0:
+                # the global group collides with itself and all the other groups (authored at once since appending
+                # the targets one by one rewrites the whole list op every time)
+                global_filtered_groups.targetPathList.appendedItems = [global_collision_group_path] + group_paths
+
+    def _create_collision_group(
+        self, collision_root: Sdf.PrimSpec, name: str, include_paths: List[str]
+    ) -> Sdf.RelationshipSpec:
+        """Authors a collision group including the given prims.
+
+        Returns:
+            Sdf.RelationshipSpec: The (empty) filteredGroups relationship of the group.
+        """
+        # add collision group prim
+        collision_group = Sdf.PrimSpec(collision_root, name, Sdf.SpecifierDef, "PhysicsCollisionGroup")
+        # prepend collision API schema
+        collision_group.SetInfo(Usd.Tokens.apiSchemas, Sdf.TokenListOp.Create({"CollectionAPI:colliders"}))
+
+        # expansion rule
+        expansion_rule = Sdf.AttributeSpec(
+            collision_group,
+            "collection:colliders:expansionRule",
+            Sdf.ValueTypeNames.Token,
+            Sdf.VariabilityUniform,
+        )
+        expansion_rule.default = "expandPrims"
+
+        # includes rel
+        includes_rel = Sdf.RelationshipSpec(collision_group, "collection:colliders:includes", False)
+        includes_rel.targetPathList.appendedItems = include_paths
+
+        # filteredGroups rel
+        return Sdf.RelationshipSpec(collision_group, "physics:filteredGroups", False)
+
+    def _get_collision_buckets(self, positions: np.ndarray, separation: float) -> np.ndarray:
+        """Greedily assigns the clones to buckets so that clones closer than the separation are in different buckets.
+
+        Returns:
+            np.ndarray: Bucket index of each clone.
+        """
+        # hash the clones in cells of the separation size, only the clones of adjacent cells can be too close
+        cells = np.floor(positions / separation).astype(np.int64)
+        cell_members = {}
+        buckets = -np.ones(len(positions), dtype=np.int64)
+        neighbor_offsets = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), axis=-1)
+        neighbor_offsets = neighbor_offsets.reshape(-1, 3)
+        for i, cell in enumerate(map(tuple, cells)):
+            neighbors = [j for offset in neighbor_offsets for j in cell_members.get(tuple(cell + offset), ())]
+            bucket = 0
+            if neighbors:
+                neighbors = np.asarray(neighbors)
+                close = np.linalg.norm(positions[neighbors] - positions[i], axis=-1) < separation
+                # smallest bucket not used by a close clone
+                used = set(buckets[neighbors[close]].tolist())
+                while bucket in used:
+                    bucket += 1
+            buckets[i] = bucket
+            cell_members.setdefault(cell, []).append(i)
+        return buckets
@@ -12,27 +12,66 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Union
+from typing import List, Tuple
 
 import numpy as np
-import omni.usd
 import torch
 from isaacsim.core.cloner import Cloner
-from pxr import Gf, Usd, UsdGeom
+from pxr import Usd, UsdGeom
+
+
+def _to_numpy(data) -> np.ndarray:
+    """Converts NumPy-like, torch or warp data to a NumPy array (None is kept)."""
+    if data is None or isinstance(data, np.ndarray):
+        return data
+    if isinstance(data, torch.Tensor):
+        return data.detach().cpu().numpy()
+    if type(data).__module__.startswith("warp"):
+        return data.numpy()
+    return np.asarray(data)
+
+
+def _like(data: np.ndarray, reference):
+    """Converts a NumPy array to the backend (and device) of the reference data (NumPy if None or not an array)."""
+    if isinstance(reference, torch.Tensor):
+        return torch.from_numpy(data).to(device=reference.device)
+    if reference is not None and type(reference).__module__.startswith("warp"):
+        import warp as wp
+
+        return wp.array(data, dtype=wp.float64, device=reference.device)
+    return data.copy()
+
+
+# Layouts supported by GridCloner
+CLONE_LAYOUTS = ("grid", "hex", "spiral", "poisson")
 
 
 class GridCloner(Cloner):
-    """This is a specialized Cloner class that will automatically generate clones in a grid fashion."""
+    """This is a specialized Cloner class that will automatically generate clones in a grid fashion.
+
+    Besides the default square grid, clones can be laid out in a hexagonal grid (denser packing), a square spiral
+    around the first clone (so any number of clones stays centered), or a random Poisson-disk distribution (no
+    regular pattern, every clone at least ``spacing`` apart from the others).
+    """
 
-    def __init__(self, spacing: float, num_per_row: int = -1, stage: Usd.Stage = None):
+    def __init__(
+        self, spacing: float, num_per_row: int = -1, stage: Usd.Stage = None, layout: str = "grid", seed: int = 0
+    ):
         """
         Args:
             spacing (float): Spacing between clones.
-            num_per_row (int): Number of clones to place in a row. Defaults to sqrt(num_clones).
+            num_per_row (int): Number of clones to place in a row. Defaults to sqrt(num_clones). Used by the
+                               "grid" and "hex" layouts.
             stage (Usd.Stage): Usd stage where source prim and clones are added to.
+            layout (str): Layout of the clones, one of "grid", "hex", "spiral" or "poisson". Defaults to "grid".
+            seed (int): Seed of the random generator of the "poisson" layout. Defaults to 0.
         """
+        if layout not in CLONE_LAYOUTS:
+            raise ValueError(f"Unsupported layout '{layout}', expected one of {CLONE_LAYOUTS}")
         self._spacing = spacing
         self._num_per_row = num_per_row
+        self._layout = layout
+        self._seed = seed
 
         self._positions = None
         self._orientations = None
@@ -47,84 +86,139 @@ class GridCloner(Cloner):
     ):
         """Computes the positions and orientations of clones in a grid.
 
+        The transforms of all the clones are computed at once, and returned in the backend of the offsets
+        (NumPy, torch or warp, on the offsets device), or as NumPy arrays if no offsets are given.
+
         Args:
             num_clones (int): Number of clones.
-            position_offsets (np.ndarray): Positions to be applied as local translations on top of computed clone position.
-            position_offsets (np.ndarray | torch.Tensor): Positions to be applied as local translations on top of computed clone position.
+            position_offsets (np.ndarray | torch.Tensor | wp.array): Positions to be applied as local translations on top of computed clone position.
                                            Defaults to None, no offset will be applied.
-            orientation_offsets (np.ndarray | torch.Tensor): Orientations to be applied as local rotations for each clone.
+            orientation_offsets (np.ndarray | torch.Tensor | wp.array): Orientations to be applied as local rotations for each clone.
                                            Defaults to None, no offset will be applied.
         Returns:
-            positions (List): Computed positions of all clones.
-            orientations (List): Computed orientations of all clones.
+            positions (np.ndarray | torch.Tensor | wp.array): Computed (num_clones, 3) positions of all clones.
+            orientations (np.ndarray | torch.Tensor | wp.array): Computed (num_clones, 4) orientations (w, x, y, z) of all clones.
         """
         # check if inputs are valid
+        if position_offsets is not None and len(position_offsets) != num_clones:
+            raise ValueError("Dimension mismatch between position_offsets and prim_paths!")
+        if orientation_offsets is not None and len(orientation_offsets) != num_clones:
+            raise ValueError("Dimension mismatch between orientation_offsets and prim_paths!")
+        reference = position_offsets if position_offsets is not None else orientation_offsets
+
+        if self._positions is None or self._orientations is None:
+            self._positions, self._orientations = self._compute_clone_transforms(
+                num_clones, _to_numpy(position_offsets), _to_numpy(orientation_offsets)
+            )
+
+        return _like(self._positions, reference), _like(self._orientations, reference)
+
+    def _compute_clone_transforms(
+        self, num_clones: int, position_offsets: np.ndarray, orientation_offsets: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes the (num_clones, 3) positions and (num_clones, 4) orientations of the clones as NumPy arrays."""
+        if self._layout in ("grid", "hex"):
+            self._num_per_row = int(np.sqrt(num_clones)) if self._num_per_row == -1 else self._num_per_row
+        if self._layout == "grid":
+            grid = self._get_grid_layout(num_clones)
+        elif self._layout == "hex":
+            grid = self._get_hex_layout(num_clones)
+        elif self._layout == "spiral":
+            grid = self._get_spiral_layout(num_clones)
+        else:
+            grid = self._get_poisson_layout(num_clones)
+
+        # place the layout in the horizontal plane of the stage
+        positions = np.zeros((num_clones, 3), dtype=np.float64)
+        up_axis = UsdGeom.GetStageUpAxis(self._stage)
+        positions[:, 0] = grid[:, 0]
+        positions[:, 1 if up_axis == UsdGeom.Tokens.z else 2] = grid[:, 1]
         if position_offsets is not None:
-            if len(position_offsets) != num_clones:
-                raise ValueError("Dimension mismatch between position_offsets and prim_paths!")
-            # convert to numpy array
-            if isinstance(position_offsets, torch.Tensor):
-                position_offsets = position_offsets.detach().cpu().numpy()
-            elif not isinstance(position_offsets, np.ndarray):
-                position_offsets = np.asarray(position_offsets)
+            positions = position_offsets + positions
+
+        # the clones have identity orientations, so the composed orientations are the offsets themselves
         if orientation_offsets is not None:
-            if len(orientation_offsets) != num_clones:
-                raise ValueError("Dimension mismatch between orientation_offsets and prim_paths!")
-            # convert to numpy array
-            if isinstance(orientation_offsets, torch.Tensor):
-                orientation_offsets = orientation_offsets.detach().cpu().numpy()
-            elif not isinstance(orientation_offsets, np.ndarray):
-                orientation_offsets = np.asarray(orientation_offsets)
-
-        if self._positions is not None and self._orientations is not None:
-            return self._positions, self._orientations
-
-        self._num_per_row = int(np.sqrt(num_clones)) if self._num_per_row == -1 else self._num_per_row
+            orientations = orientation_offsets.astype(np.float64)
+        else:
+            orientations = np.zeros((num_clones, 4), dtype=np.float64)
+            orientations[:, 0] = 1.0
+        return positions, orientations
+
+    def _get_grid_layout(self, num_clones: int) -> np.ndarray:
         num_rows = np.ceil(num_clones / self._num_per_row)
         num_cols = np.ceil(num_clones / num_rows)
 
         row_offset = 0.5 * self._spacing * (num_rows - 1)
         col_offset = 0.5 * self._spacing * (num_cols - 1)
 
-        positions = []
-        orientations = []
-
-        for i in range(num_clones):
-            # compute transform
-            row = i // num_cols
-            col = i % num_cols
-            x = row_offset - row * self._spacing
-            y = col * self._spacing - col_offset
+        indices = np.arange(num_clones)
+        rows = indices // num_cols
+        cols = indices % num_cols
+        return np.stack([row_offset - rows * self._spacing, cols * self._spacing - col_offset], axis=-1)
 
-            up_axis = UsdGeom.GetStageUpAxis(self._stage)
-            position = [x, y, 0] if up_axis == UsdGeom.Tokens.z else [x, 0, y]
-            orientation = Gf.Quatd.GetIdentity()
-
-            if position_offsets is not None:
-                translation = position_offsets[i] + position
-            else:
-                translation = position
-
-            if orientation_offsets is not None:
-                orientation = (
-                    Gf.Quatd(orientation_offsets[i][0].item(), Gf.Vec3d(orientation_offsets[i][1:].tolist()))
-                    * orientation
-                )
-
-            orientation = [
-                orientation.GetReal(),
-                orientation.GetImaginary()[0],
-                orientation.GetImaginary()[1],
-                orientation.GetImaginary()[2],
-            ]
+    def _get_hex_layout(self, num_clones: int) -> np.ndarray:
+        # odd rows are shifted by half a spacing, and rows are sqrt(3) / 2 spacing apart
+        num_rows = np.ceil(num_clones / self._num_per_row)
+        num_cols = np.ceil(num_clones / num_rows)
+        row_spacing = self._spacing * np.sqrt(3.0) / 2.0
 
-            positions.append(translation)
-            orientations.append(orientation)
+        indices = np.arange(num_clones)
+        rows = indices // num_cols
+        cols = indices % num_cols
+        x = 0.5 * row_spacing * (num_rows - 1) - rows * row_spacing
+        col_offset = 0.5 * self._spacing * (num_cols - 1 + 0.5 * (num_rows > 1))
+        y = (cols + 0.5 * (rows % 2)) * self._spacing - col_offset
+        return np.stack([x, y], axis=-1)
 
-        self._positions = positions
-        self._orientations = orientations
+    def _get_spiral_layout(self, num_clones: int) -> np.ndarray:
+        # square spiral: the first clone at the origin, then rings of 8 * k clones (k = 1, 2, ...) around it
+        indices = np.arange(num_clones)
+        ring = np.ceil((np.sqrt(indices + 1) - 1) / 2).astype(np.int64)
+        side = 2 * ring
+        # position along the ring, starting from its bottom right corner
+        offset = np.where(ring > 0, indices - (2 * ring - 1) ** 2, 0)
+        edge = np.where(side > 0, offset // np.maximum(side, 1), 0)
+        along = np.where(side > 0, offset % np.maximum(side, 1), 0)
+        x = np.select([edge == 0, edge == 1, edge == 2], [ring, ring - 1 - along, -ring], -ring + 1 + along)
+        y = np.select([edge == 0, edge == 1, edge == 2], [-ring + 1 + along, ring, ring - 1 - along], -ring)
+        grid = np.stack([x, y], axis=-1).astype(np.float64) * self._spacing
+        grid[ring == 0] = 0.0
+        return grid
 
-        return positions, orientations
+    def _get_poisson_layout(self, num_clones: int, num_passes: int = 16) -> np.ndarray:
+        # parallel dart throwing on a background grid of spacing / sqrt(2) cells (at most one clone per cell): cells
+        # five apart can't hold conflicting clones, so the candidates of each of the 5 x 5 cell phases are drawn and
+        # tested against the clones of the neighboring cells at once
+        rng = np.random.default_rng(self._seed)
+        cell_size = self._spacing / np.sqrt(2.0)
+        neighbor_offsets = [(di, dj) for di in range(-2, 3) for dj in range(-2, 3) if (di, dj) != (0, 0)]
+        # area for the clones at a conservative Poisson-disk density, grown until enough clones are placed
+        area = num_clones * self._spacing**2 / 0.4
+        while True:
+            num_cells = int(np.ceil(np.sqrt(area) / cell_size)) + 1
+            cells = np.full((num_cells, num_cells, 2), np.nan)
+            cell_i, cell_j = np.meshgrid(np.arange(num_cells), np.arange(num_cells), indexing="ij")
+            for _ in range(num_passes):
+                for phase_i in range(5):
+                    for phase_j in range(5):
+                        empty = (cell_i % 5 == phase_i) & (cell_j % 5 == phase_j) & np.isnan(cells[..., 0])
+                        i, j = np.nonzero(empty)
+                        candidates = (np.stack([i, j], axis=-1) + rng.random((len(i), 2))) * cell_size
+                        accepted = np.ones(len(i), dtype=bool)
+                        for di, dj in neighbor_offsets:
+                            ni, nj = i + di, j + dj
+                            inside = (ni >= 0) & (ni < num_cells) & (nj >= 0) & (nj < num_cells)
+                            neighbors = cells[np.clip(ni, 0, num_cells - 1), np.clip(nj, 0, num_cells - 1)]
+                            # empty cells hold NaN, never closer than the spacing
+                            accepted &= ~(inside & (np.linalg.norm(neighbors - candidates, axis=-1) < self._spacing))
+                        cells[i[accepted], j[accepted]] = candidates[accepted]
+            points = cells[~np.isnan(cells[..., 0])] - 0.5 * num_cells * cell_size
+            if len(points) >= num_clones:
+                break
+            area *= 1.5
+        # keep the clones closest to the origin, the first one at the center
+        order = np.argsort(np.linalg.norm(points, axis=-1), kind="stable")[:num_clones]
+        return points[order]
 
     def clone(
         self,
@@ -144,9 +238,9 @@ class GridCloner(Cloner):
         Args:
             source_prim_path (str): Path of source object.
             prim_paths (List[str]): List of destination paths.
-            position_offsets (np.ndarray): Positions to be applied as local translations on top of computed clone position.
+            position_offsets (np.ndarray | torch.Tensor | wp.array): Positions to be applied as local translations on top of computed clone position.
                                            Defaults to None, no offset will be applied.
-            orientation_offsets (np.ndarray): Orientations to be applied as local rotations for each clone.
+            orientation_offsets (np.ndarray | torch.Tensor | wp.array): Orientations to be applied as local rotations for each clone.
                                            Defaults to None, no offset will be applied.
             replicate_physics (bool): Uses omni.physics replication. This will replicate physics properties directly for paths beginning with root_path and skip physics parsing for anything under the base_env_path.
             base_env_path (str): Path to namespace for all environments. Required if replicate_physics=True and define_base_env() not called.
@@ -155,7 +249,7 @@ class GridCloner(Cloner):
                          Setting this to True will make copies of the source prim when creating new clones; changes to the source prim will not be reflected in clones. Defaults to False. Note that setting this to True will take longer to execute.
             enable_env_ids (bool): Setting this enables co-location of clones in physics with automatic filtering of collisions between clones.
         Returns:
-            positions (List): Computed positions of all clones.
+            positions (np.ndarray | torch.Tensor | wp.array): Computed positions of all clones, in the backend of the offsets.
         """
 
         num_clones = len(prim_paths)
@@ -165,8 +259,8 @@ class GridCloner(Cloner):
         super().clone(
             source_prim_path=source_prim_path,
             prim_paths=prim_paths,
-            positions=positions,
-            orientations=orientations,
+            positions=self._positions,
+            orientations=self._orientations,
             replicate_physics=replicate_physics,
             base_env_path=base_env_path,
             root_path=root_path,
@@ -15,13 +15,15 @@
 
 import os
 
+import carb.settings
 import numpy as np
 import omni.kit
+import torch
 import usdrt
 from isaacsim.core.cloner import Cloner, GridCloner
 from isaacsim.storage.native import get_assets_root_path_async
 from omni.physx import get_physx_simulation_interface, get_physxunittests_interface
-from pxr import Gf, Usd, UsdGeom, UsdPhysics, UsdUtils, Vt
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics, UsdUtils, Vt
 
 
 class TestSimpleCloner(omni.kit.test.AsyncTestCase):
@@ -450,6 +452,44 @@ class TestSimpleCloner(omni.kit.test.AsyncTestCase):
         self.assertTrue(stage.GetPrimAtPath(f"/World/envs/env_1/Cube").IsValid() == True)
         self.assertTrue(stage.GetPrimAtPath(f"/World/envs/env_1/Sphere").IsValid() == True)
 
+    async def test_grid_cloner_transforms(self):
+        stage = omni.usd.get_context().get_stage()
+        UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.z)
+        num_clones = 37
+        position_offsets = np.random.default_rng(0).random((num_clones, 3)).astype(np.float32)
+        orientation_offsets = np.tile([0.0, 0.0, 0.0, 1.0], (num_clones, 1))
+        positions, orientations = GridCloner(spacing=2.5).get_clone_transforms(
+            num_clones, position_offsets, orientation_offsets
+        )
+        self.assertIsInstance(positions, np.ndarray)
+        self.assertEqual(positions.shape, (num_clones, 3))
+        # reference layout: rows along -x, columns along +y, centered
+        num_per_row = int(np.sqrt(num_clones))
+        num_rows = np.ceil(num_clones / num_per_row)
+        num_cols = np.ceil(num_clones / num_rows)
+        for i in range(num_clones):
+            x = 0.5 * 2.5 * (num_rows - 1) - (i // num_cols) * 2.5
+            y = (i % num_cols) * 2.5 - 0.5 * 2.5 * (num_cols - 1)
+            self.assertTrue(np.array_equal(positions[i], position_offsets[i] + [x, y, 0]))
+        self.assertTrue(np.array_equal(orientations, orientation_offsets))
+
+        # outputs in the backend of the offsets
+        positions, orientations = GridCloner(spacing=2.5).get_clone_transforms(
+            num_clones, position_offsets=torch.from_numpy(position_offsets)
+        )
+        self.assertIsInstance(positions, torch.Tensor)
+        self.assertTrue(torch.equal(orientations[:, 0], torch.ones(num_clones, dtype=torch.float64)))
+
+        # alternative layouts keep the clones at least one spacing apart
+        for layout in ["hex", "spiral", "poisson"]:
+            positions, _ = GridCloner(spacing=2.0, layout=layout).get_clone_transforms(200)
+            distances = np.linalg.norm(positions[:, None] - positions[None], axis=-1)
+            np.fill_diagonal(distances, np.inf)
+            self.assertGreaterEqual(distances.min(), 2.0 - 1e-6, layout)
+            self.assertTrue(np.all(positions[:, 2] == 0.0), layout)
+        with self.assertRaises(ValueError):
+            GridCloner(spacing=2.0, layout="circle")
+
     async def test_grid_cloner_offsets(self):
         stage = omni.usd.get_context().get_stage()
 
@@ -527,6 +567,124 @@ class TestSimpleCloner(omni.kit.test.AsyncTestCase):
                 == target_translations[i]
             )
 
+    def _legacy_clone_specs(self, stage, source_prim_path, prim_paths, positions, copy_from_source):
+        # reference authoring of the clones: one spec copy (or inherit arc) and xform op specs per clone
+        layer = stage.GetRootLayer()
+        source_prim = stage.GetPrimAtPath(source_prim_path)
+        orientation = source_prim.GetAttribute("xformOp:orient").Get()
+        scale = source_prim.GetAttribute("xformOp:scale").Get()
+        default_precision = carb.settings.get_settings().get_as_string("app/primCreation/DefaultXformOpPrecision")
+        orient_type, orient_value_type = (Gf.Quatd, Sdf.ValueTypeNames.Quatd)
+        if default_precision == "Float":
+            orient_type, orient_value_type = (Gf.Quatf, Sdf.ValueTypeNames.Quatf)
+        with Sdf.ChangeBlock():
+            for i, prim_path in enumerate(prim_paths):
+                if prim_path == source_prim_path:
+                    continue
+                env_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+                if copy_from_source:
+                    Sdf.CopySpec(layer, Sdf.Path(source_prim_path), layer, Sdf.Path(prim_path))
+                else:
+                    env_spec.inheritPathList.Prepend(source_prim_path)
+                for name, value_type, value in [
+                    ("xformOp:translate", Sdf.ValueTypeNames.Double3, Gf.Vec3f(*positions[i].tolist())),
+                    ("xformOp:orient", orient_value_type, orient_type(orientation)),
+                    ("xformOp:scale", Sdf.ValueTypeNames.Double3, scale),
+                    (
+                        "xformOpOrder",
+                        Sdf.ValueTypeNames.TokenArray,
+                        Vt.TokenArray(["xformOp:translate", "xformOp:orient", "xformOp:scale"]),
+                    ),
+                ]:
+                    spec = env_spec.GetAttributeAtPath(prim_path + "." + name)
+                    if spec is None:
+                        spec = Sdf.AttributeSpec(env_spec, name, value_type)
+                    elif name == "xformOp:orient":
+                        value = type(spec.default)(orientation)
+                    spec.default = value
+
+    async def test_cloner_matches_legacy_authoring(self):
+        positions = np.arange(64 * 3, dtype=np.float32).reshape(64, 3)
+        for copy_from_source in [False, True]:
+            layers = []
+            for legacy in [False, True]:
+                stage = Usd.Stage.CreateInMemory()
+                UsdGeom.Xform.Define(stage, "/World/envs/env_0")
+                UsdGeom.Cube.Define(stage, "/World/envs/env_0/Cube").GetSizeAttr().Set(2.0)
+                UsdGeom.Sphere.Define(stage, "/World/envs/env_0/Sphere")
+                cloner = Cloner(stage=stage)
+                target_paths = cloner.generate_paths("/World/envs/env", 64)
+                if legacy:
+                    # only set up the source xform ops, then author the clones as the reference does
+                    cloner.clone(
+                        source_prim_path="/World/envs/env_0", prim_paths=target_paths[:1], positions=positions[:1]
+                    )
+                    self._legacy_clone_specs(stage, "/World/envs/env_0", target_paths, positions, copy_from_source)
+                else:
+                    cloner.clone(
+                        source_prim_path="/World/envs/env_0",
+                        prim_paths=target_paths,
+                        positions=positions,
+                        copy_from_source=copy_from_source,
+                    )
+                    timings = cloner.get_clone_timings()
+                    for phase in ["prepare", "author", "replicate_physics", "total"]:
+                        self.assertGreaterEqual(timings[phase], 0.0)
+                layers.append(stage.GetRootLayer().ExportToString())
+            self.assertEqual(layers[0], layers[1], f"copy_from_source={copy_from_source}")
+
+    async def test_filter_collisions(self):
+        stage = omni.usd.get_context().get_stage()
+        UsdPhysics.Scene.Define(stage, "/physicsScene")
+        UsdGeom.Cube.Define(stage, "/World/groundPlane")
+        cloner = GridCloner(spacing=2.0)
+        cloner.define_base_env("/World/envs")
+        UsdGeom.Xform.Define(stage, "/World/envs/env_0")
+        UsdGeom.Cube.Define(stage, "/World/envs/env_0/Cube")
+        target_paths = cloner.generate_paths("/World/envs/env", 64)
+        positions = np.array(cloner.clone(source_prim_path="/World/envs/env_0", prim_paths=target_paths))
+
+        def get_groups(collision_root_path):
+            groups = {}
+            for prim in stage.GetPrimAtPath(collision_root_path).GetChildren():
+                includes = prim.GetRelationship("collection:colliders:includes").GetTargets()
+                filtered = prim.GetRelationship("physics:filteredGroups").GetTargets()
+                groups[prim.GetName()] = ([str(path) for path in includes], [str(path) for path in filtered])
+            return groups
+
+        # one group per clone
+        cloner.filter_collisions("/physicsScene", "/World/collisions", target_paths, ["/World/groundPlane"])
+        groups = get_groups("/World/collisions")
+        self.assertEqual(len(groups), 65)
+        self.assertEqual(
+            groups["group3"], ([target_paths[3]], ["/World/collisions/group3", "/World/collisions/global_group"])
+        )
+        self.assertEqual(groups["global_group"][0], ["/World/groundPlane"])
+        self.assertEqual(len(groups["global_group"][1]), 65)
+
+        # clones within the separation are in different buckets
+        cloner.filter_collisions(
+            "/physicsScene", "/World/buckets", target_paths, ["/World/groundPlane"], mode="buckets", separation=2.5
+        )
+        groups = get_groups("/World/buckets")
+        self.assertLess(len(groups), 8)
+        buckets = [includes for name, (includes, _) in groups.items() if name != "global_group"]
+        self.assertEqual(sorted(path for includes in buckets for path in includes), sorted(target_paths))
+        for includes in buckets:
+            bucket_positions = positions[[target_paths.index(path) for path in includes]]
+            distances = np.linalg.norm(bucket_positions[:, None] - bucket_positions[None], axis=-1)
+            np.fill_diagonal(distances, np.inf)
+            self.assertGreaterEqual(distances.min(), 2.5)
+
+        # the "env_ids" mode authors nothing
+        cloner.filter_collisions("/physicsScene", "/World/env_ids", target_paths, mode="env_ids")
+        self.assertFalse(stage.GetPrimAtPath("/World/env_ids").IsValid())
+
+        with self.assertRaises(ValueError):
+            cloner.filter_collisions("/physicsScene", "/World/invalid", target_paths, mode="pairs")
+        with self.assertRaises(ValueError):
+            cloner.filter_collisions("/physicsScene", "/World/invalid", target_paths, mode="buckets")
+
     async def test_fabric_cloner(self):
         stage = Usd.Stage.CreateInMemory()
 
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ctypes
+
+import numpy as np
+import omni.graph.core as og
+import warp as wp
+from isaacsim.core.utils.point_cloud import dequantize_points, get_render_product_point_cloud_processor
+
+
+def read_points(data_ptr: int, buffer_size: int, cuda_device_index: int) -> np.ndarray:
+    """Copy a buffer of float xyz points (on host or on a CUDA device) into a (N, 3) array"""
+    count = buffer_size // (3 * ctypes.sizeof(ctypes.c_float))
+    if count == 0:
+        return np.zeros((0, 3), dtype=np.float32)
+    if cuda_device_index < 0:
+        buffer = (ctypes.c_float * (3 * count)).from_address(data_ptr)
+        return np.ctypeslib.as_array(buffer).reshape(count, 3).copy()
+    points = wp.array(ptr=data_ptr, dtype=wp.vec3f, shape=(count,), device=f"cuda:{cuda_device_index}")
+    return points.numpy()
+
+
+class OgnIsaacProcessPointCloud:
+    """
+    Node applying the point cloud processor of a render product
+    """
+
+    @staticmethod
+    def compute(db) -> bool:
+        if db.inputs.dataPtr == 0:
+            return False
+        processor = get_render_product_point_cloud_processor(db.inputs.renderProductPath)
+        if processor is None:
+            # nothing to process: pass the buffer through
+            db.outputs.dataPtr = db.inputs.dataPtr
+            db.outputs.data = np.zeros((0, 3), dtype=np.float32)
+            db.outputs.cudaDeviceIndex = db.inputs.cudaDeviceIndex
+            db.outputs.bufferSize = db.inputs.bufferSize
+        else:
+            output = processor.process(read_points(db.inputs.dataPtr, db.inputs.bufferSize, db.inputs.cudaDeviceIndex))
+            points = output["points"]
+            if output["resolution"] is not None:
+                points = dequantize_points(points, output["resolution"], output["origin"])
+            db.outputs.dataPtr = 0
+            db.outputs.data = points.astype(np.float32, copy=False)
+            db.outputs.cudaDeviceIndex = -1
+            db.outputs.bufferSize = points.shape[0] * 3 * ctypes.sizeof(ctypes.c_float)
+        db.outputs.exec = og.ExecutionAttributeState.ENABLED
+        return True
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import omni.graph.core as og
+import omni.graph.core.tests as ogts
+import omni.kit.test
+from isaacsim.core.utils.point_cloud import (
+    PointCloudProcessor,
+    set_render_product_point_cloud_processor,
+    voxel_downsample,
+)
+
+RENDER_PRODUCT_PATH = "/Render/RenderProduct_TestProcessPointCloud"
+
+
+class TestProcessPointCloudNode(ogts.OmniGraphTestCase):
+    async def setUp(self):
+        """Set up  test environment, to be torn down when done"""
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+        self._points = np.random.default_rng(0).uniform(-10.0, 10.0, (1000, 3)).astype(np.float32)
+
+    # ----------------------------------------------------------------------
+    async def tearDown(self):
+        """Get rid of temporary data used by the test"""
+        set_render_product_point_cloud_processor(RENDER_PRODUCT_PATH, None)
+        await omni.kit.app.get_app().next_update_async()
+
+    # ----------------------------------------------------------------------
+    async def test_process_point_cloud(self):
+        (test_graph, new_nodes, _, _) = og.Controller.edit(
+            {"graph_path": "/ActionGraph", "evaluator_name": "execution"},
+            {
+                og.Controller.Keys.CREATE_NODES: [
+                    ("OnTick", "omni.graph.action.OnTick"),
+                    ("ProcessPointCloud", "isaacsim.core.nodes.IsaacProcessPointCloud"),
+                ],
+                og.Controller.Keys.SET_VALUES: [
+                    ("OnTick.inputs:onlyPlayback", False),
+                    ("ProcessPointCloud.inputs:dataPtr", self._points.ctypes.data),
+                    ("ProcessPointCloud.inputs:bufferSize", self._points.nbytes),
+                    ("ProcessPointCloud.inputs:cudaDeviceIndex", -1),
+                    ("ProcessPointCloud.inputs:renderProductPath", RENDER_PRODUCT_PATH),
+                ],
+                og.Controller.Keys.CONNECT: [
+                    ("OnTick.outputs:tick", "ProcessPointCloud.inputs:exec"),
+                ],
+            },
+        )
+        node = new_nodes[-1]
+
+        # no processor: the buffer is passed through
+        await og.Controller.evaluate(test_graph)
+        self.assertEqual(og.Controller.attribute("outputs:dataPtr", node).get(), self._points.ctypes.data)
+        self.assertEqual(og.Controller.attribute("outputs:bufferSize", node).get(), self._points.nbytes)
+        self.assertEqual(len(og.Controller.attribute("outputs:data", node).get()), 0)
+
+        # processor of the render product
+        processor = PointCloudProcessor(voxel_size=1.0)
+        set_render_product_point_cloud_processor(RENDER_PRODUCT_PATH, processor)
+        await og.Controller.evaluate(test_graph)
+        expected, _ = voxel_downsample(self._points, 1.0)
+        self.assertEqual(og.Controller.attribute("outputs:dataPtr", node).get(), 0)
+        self.assertEqual(og.Controller.attribute("outputs:cudaDeviceIndex", node).get(), -1)
+        np.testing.assert_allclose(og.Controller.attribute("outputs:data", node).get(), expected)
+        self.assertEqual(og.Controller.attribute("outputs:bufferSize", node).get(), expected.nbytes)
+        self.assertEqual(processor.stats["input_points"], self._points.shape[0])
+
+        # encoded points are decoded to float points
+        processor = PointCloudProcessor(quantize=True)
+        set_render_product_point_cloud_processor(RENDER_PRODUCT_PATH, processor)
+        await og.Controller.evaluate(test_graph)
+        data = og.Controller.attribute("outputs:data", node).get()
+        self.assertEqual(data.shape, self._points.shape)
+        np.testing.assert_allclose(data, self._points, atol=1e-3)
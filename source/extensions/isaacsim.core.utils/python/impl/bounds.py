@@ -22,7 +22,14 @@ import numpy as np
 
 # isaacsim
 from isaacsim.core.utils.prims import get_prim_at_path
-from pxr import Gf, Usd, UsdGeom
+from isaacsim.core.utils.stage import get_current_stage
+from pxr import Gf, Sdf, Tf, Usd, UsdGeom
+
+# sign pattern of the OBB corners (c_0, ..., c_7) along each OBB axis
+_OBB_CORNER_SIGNS = np.array(
+    [[-1, -1, -1], [-1, -1, 1], [-1, 1, -1], [-1, 1, 1], [1, -1, -1], [1, -1, 1], [1, 1, -1], [1, 1, 1]],
+    dtype=np.float64,
+)
 
 
 def recompute_extents(
@@ -332,3 +339,382 @@ def compute_obb_corners(bbox_cache: UsdGeom.BBoxCache, prim_path: str) -> np.nda
     """
     centroid, axis, half_extent = compute_obb(bbox_cache, prim_path)
     return get_obb_corners(centroid, axis, half_extent)
+
+
+def _compute_world_bounds(
+    bbox_cache: UsdGeom.BBoxCache,
+    prims: typing.List[Usd.Prim],
+    aabbs: np.ndarray,
+    matrices: np.ndarray,
+    ranges: np.ndarray,
+    indices: typing.Optional[typing.Iterable[int]] = None,
+) -> None:
+    """Compute the world bounds of the given prims (or a subset of them) and write them into the output arrays
+
+    Args:
+        bbox_cache (UsdGeom.BBoxCache): Bounding box cache to use for computation
+        prims (typing.List[Usd.Prim]): Prims to compute the world bounds for
+        aabbs (np.ndarray): Output array of shape (N, 6) for the AABBs
+        matrices (np.ndarray): Output array of shape (N, 4, 4) for the bound matrices
+        ranges (np.ndarray): Output array of shape (N, 6) for the (untransformed) bound ranges
+        indices (typing.Optional[typing.Iterable[int]], optional): Indices of the prims to compute. Defaults to None (all).
+    """
+    for i in range(len(prims)) if indices is None else indices:
+        bound = bbox_cache.ComputeWorldBound(prims[i])
+        aligned_range = bound.ComputeAlignedRange()
+        bound_range = bound.GetRange()
+        aabbs[i, :3] = aligned_range.GetMin()
+        aabbs[i, 3:] = aligned_range.GetMax()
+        matrices[i] = bound.GetMatrix()
+        ranges[i, :3] = bound_range.GetMin()
+        ranges[i, 3:] = bound_range.GetMax()
+
+
+def _compute_obbs_from_bounds(
+    matrices: np.ndarray, ranges: np.ndarray
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the OBBs (centroids, axes and half extents) from the world bound matrices and ranges
+
+    Args:
+        matrices (np.ndarray): Bound matrices of shape (N, 4, 4) (row-vector convention)
+        ranges (np.ndarray): Untransformed bound ranges of shape (N, 6)
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray, np.ndarray]: Centroids (N, 3), axes (N, 3, 3) and half extents (N, 3)
+    """
+    midpoints = 0.5 * (ranges[:, :3] + ranges[:, 3:])
+    centroids = np.einsum("nj,nji->ni", midpoints, matrices[:, :3, :3]) + matrices[:, 3, :3]
+    axes = matrices[:, :3, :3].copy()
+    half_extents = 0.5 * (ranges[:, 3:] - ranges[:, :3])
+    return centroids, axes, half_extents
+
+
+def compute_aabbs(
+    bbox_cache: UsdGeom.BBoxCache, prim_paths: typing.List[str], include_children: bool = False
+) -> np.ndarray:
+    """Compute the Axis-Aligned Bounding Boxes (AABBs) for a list of prim paths
+
+    The stage is resolved and the bounding box cache is reused for all the prims
+
+    Args:
+        bbox_cache (UsdGeom.BboxCache): Existing Bounding box cache to use for computation
+        prim_paths (typing.List[str]): List of prim paths to compute AABBs for
+        include_children (bool, optional): include children of specified prims in calculation. Defaults to False.
+
+    Returns:
+        np.ndarray: NumPy array of shape (N, 6) containing the bounding box of each prim,
+        [min x, min y, min z, max x, max y, max z]
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.bounds as bounds_utils
+        >>>
+        >>> # 1 stage unit length cube centered at (0.0, 0.0, 0.0)
+        >>> # with a 1 stage unit diameter sphere centered at (-0.5, 0.5, 0.5)
+        >>> cache = bounds_utils.create_bbox_cache()
+        >>> bounds_utils.compute_aabbs(cache, prim_paths=["/World/Cube", "/World/Sphere"])
+        [[-0.5 -0.5 -0.5  0.5  0.5  0.5]
+         [-1.   0.   0.   0.   1.   1. ]]
+    """
+    if include_children:
+        return np.array([compute_aabb(bbox_cache, prim_path, True) for prim_path in prim_paths]).reshape((-1, 6))
+    stage = get_current_stage()
+    prims = [stage.GetPrimAtPath(prim_path) for prim_path in prim_paths]
+    aabbs = np.empty((len(prims), 6), dtype=np.float64)
+    matrices = np.empty((len(prims), 4, 4), dtype=np.float64)
+    ranges = np.empty((len(prims), 6), dtype=np.float64)
+    _compute_world_bounds(bbox_cache, prims, aabbs, matrices, ranges)
+    return aabbs
+
+
+def compute_obbs(
+    bbox_cache: UsdGeom.BBoxCache, prim_paths: typing.List[str]
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the Oriented Bounding Boxes (OBBs) for a list of prim paths
+
+    See :py:func:`compute_obb` for details about the OBB computation
+
+    Args:
+        bbox_cache (UsdGeom.BBoxCache): USD Bounding Box Cache object to use for computation
+        prim_paths (typing.List[str]): List of prim paths to compute OBBs for
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: A tuple containing the following OBBs information:
+            - The centroids of the OBBs as a NumPy array of shape (N, 3).
+            - The axes of the OBBs as a NumPy array of shape (N, 3, 3), where each row represents a different axis.
+            - The half extents of the OBBs as a NumPy array of shape (N, 3).
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.bounds as bounds_utils
+        >>>
+        >>> cache = bounds_utils.create_bbox_cache()
+        >>> centroids, axes, half_extents = bounds_utils.compute_obbs(cache, prim_paths=["/World/Cube"])
+        >>> centroids.shape, axes.shape, half_extents.shape
+        ((1, 3), (1, 3, 3), (1, 3))
+    """
+    stage = get_current_stage()
+    prims = [stage.GetPrimAtPath(prim_path) for prim_path in prim_paths]
+    aabbs = np.empty((len(prims), 6), dtype=np.float64)
+    matrices = np.empty((len(prims), 4, 4), dtype=np.float64)
+    ranges = np.empty((len(prims), 6), dtype=np.float64)
+    _compute_world_bounds(bbox_cache, prims, aabbs, matrices, ranges)
+    return _compute_obbs_from_bounds(matrices, ranges)
+
+
+def get_obbs_corners(centroids: np.ndarray, axes: np.ndarray, half_extents: np.ndarray) -> np.ndarray:
+    """Computes the corners of many Oriented Bounding Boxes (OBBs) from the given OBBs information
+
+    Args:
+        centroids (np.ndarray): The centroids of the OBBs as a NumPy array of shape (N, 3).
+        axes (np.ndarray): The axes of the OBBs as a NumPy array of shape (N, 3, 3), where each row represents an axis.
+        half_extents (np.ndarray): The half extents of the OBBs as a NumPy array of shape (N, 3).
+
+    Returns:
+        np.ndarray: NumPy array of shape (N, 8, 3) containing each corner location of the OBBs,
+        in the same order as :py:func:`get_obb_corners`
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.bounds as bounds_utils
+        >>>
+        >>> cache = bounds_utils.create_bbox_cache()
+        >>> centroids, axes, half_extents = bounds_utils.compute_obbs(cache, prim_paths=["/World/Cube"])
+        >>> bounds_utils.get_obbs_corners(centroids, axes, half_extents).shape
+        (1, 8, 3)
+    """
+    centroids = np.asarray(centroids, dtype=np.float64).reshape((-1, 3))
+    axes = np.asarray(axes, dtype=np.float64).reshape((-1, 3, 3))
+    half_extents = np.asarray(half_extents, dtype=np.float64).reshape((-1, 3))
+    return centroids[:, np.newaxis, :] + np.einsum("kj,nj,nji->nki", _OBB_CORNER_SIGNS, half_extents, axes)
+
+
+def compute_obbs_corners(bbox_cache: UsdGeom.BBoxCache, prim_paths: typing.List[str]) -> np.ndarray:
+    """Computes the corners of the Oriented Bounding Boxes (OBBs) for a list of prim paths
+
+    Args:
+        bbox_cache (UsdGeom.BBoxCache): Bounding Box Cache object to use for computation
+        prim_paths (typing.List[str]): List of prim paths to compute OBBs for
+
+    Returns:
+        np.ndarray: NumPy array of shape (N, 8, 3) containing each corner location of the OBBs,
+        in the same order as :py:func:`compute_obb_corners`
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.bounds as bounds_utils
+        >>>
+        >>> cache = bounds_utils.create_bbox_cache()
+        >>> bounds_utils.compute_obbs_corners(cache, prim_paths=["/World/Cube", "/World/Sphere"]).shape
+        (2, 8, 3)
+    """
+    return get_obbs_corners(*compute_obbs(bbox_cache, prim_paths))
+
+
+class BoundsTracker:
+    """Incremental batched bounding box computation for a fixed list of prims
+
+    The tracker owns a single bounding box cache and listens to USD change notices (``Usd.Notice.ObjectsChanged``)
+    on the stage. On each query, only the prims affected by a change since the last query (transform operations
+    authored on the prim or any of its ancestors, or geometry changes such as points or extents on the prim
+    or any of its descendants) are recomputed, while the bounds of the other prims are served from memory.
+
+    .. note::
+
+        Call :py:meth:`destroy` when the tracker is no longer needed to stop listening to USD change notices.
+        The bounds of prims that are no longer valid (e.g.: removed from the stage) are set to NaN.
+
+    Args:
+        prim_paths (typing.List[str]): List of prim paths to track.
+        time (Usd.TimeCode, optional): time at which bounds are computed. Defaults to Usd.TimeCode.Default().
+        use_extents_hint (bool, optional): Use existing extents attribute on prim to compute bounding box.
+            Defaults to True.
+        stage (typing.Optional[Usd.Stage], optional): Stage where the prims are. Defaults to None (current stage).
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.bounds as bounds_utils
+        >>> import isaacsim.core.utils.stage as stage_utils
+        >>>
+        >>> tracker = bounds_utils.BoundsTracker(["/World/Cube", "/World/Sphere"])
+        >>> tracker.compute_aabbs()  # compute the bounds of all the prims
+        [[-0.5 -0.5 -0.5  0.5  0.5  0.5]
+         [-1.   0.   0.   0.   1.   1. ]]
+        >>>
+        >>> # move the cube: only the cube bounds are recomputed on the next query
+        >>> cube = stage_utils.get_current_stage().GetPrimAtPath("/World/Cube")
+        >>> cube.GetAttribute("xformOp:translate").Set((1.0, 0.0, 0.0))
+        >>> tracker.compute_aabbs()
+        [[ 0.5 -0.5 -0.5  1.5  0.5  0.5]
+         [-1.   0.   0.   0.   1.   1. ]]
+    """
+
+    # attributes (or attribute namespaces) whose change may affect the bounds of a prim
+    BOUNDS_ATTRIBUTES = frozenset(
+        ["xformOpOrder", "points", "extent", "extentsHint", "visibility", "purpose", "size", "radius", "height"]
+        + ["axis", "width", "length", "radiusBottom", "radiusTop", "majorRadius", "minorRadius", "proxyPrim"]
+    )
+
+    def __init__(
+        self,
+        prim_paths: typing.List[str],
+        time: Usd.TimeCode = Usd.TimeCode.Default(),
+        use_extents_hint: bool = True,
+        stage: typing.Optional[Usd.Stage] = None,
+    ) -> None:
+        self._stage = get_current_stage() if stage is None else stage
+        self._bbox_cache = create_bbox_cache(time=time, use_extents_hint=use_extents_hint)
+        self._changed_paths = set()
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, self._stage)
+        self.set_prim_paths(prim_paths)
+
+    def destroy(self) -> None:
+        """Stop listening to USD change notices"""
+        if getattr(self, "_listener", None) is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+    @property
+    def prim_paths(self) -> typing.List[str]:
+        """Tracked prim paths
+
+        Returns:
+            typing.List[str]: List of tracked prim paths
+        """
+        return [path.pathString for path in self._paths]
+
+    @property
+    def bbox_cache(self) -> UsdGeom.BBoxCache:
+        """Bounding box cache used for computation
+
+        Returns:
+            UsdGeom.BBoxCache: Bounding box cache
+        """
+        return self._bbox_cache
+
+    @property
+    def num_dirty(self) -> int:
+        """Number of prims whose bounds will be recomputed on the next query
+
+        Returns:
+            int: Number of prims to recompute
+        """
+        self._process_changes()
+        return int(np.count_nonzero(self._dirty))
+
+    def set_prim_paths(self, prim_paths: typing.List[str]) -> None:
+        """Set the list of prim paths to track (all bounds will be recomputed on the next query)
+
+        Args:
+            prim_paths (typing.List[str]): List of prim paths to track.
+        """
+        self._paths = [Sdf.Path(prim_path) for prim_path in prim_paths]
+        self._indices = {path: i for i, path in enumerate(self._paths)}
+        self._prefixes = [path.GetPrefixes() for path in self._paths]
+        self._prims = [self._stage.GetPrimAtPath(path) for path in self._paths]
+        self._aabbs = np.zeros((len(self._paths), 6), dtype=np.float64)
+        self._matrices = np.zeros((len(self._paths), 4, 4), dtype=np.float64)
+        self._ranges = np.zeros((len(self._paths), 6), dtype=np.float64)
+        self._dirty = np.ones(len(self._paths), dtype=bool)
+        self._changed_paths = set()
+
+    def set_time(self, time: Usd.TimeCode) -> None:
+        """Set the time at which bounds are computed (all bounds will be recomputed on the next query)
+
+        Args:
+            time (Usd.TimeCode): time at which bounds are computed
+        """
+        if time != self._bbox_cache.GetTime():
+            self._bbox_cache.SetTime(time)
+            self._dirty[:] = True
+
+    def mark_dirty(self, prim_paths: typing.Optional[typing.List[str]] = None) -> None:
+        """Force the recomputation of the bounds of the given prims on the next query
+
+        Args:
+            prim_paths (typing.Optional[typing.List[str]], optional): Prim paths to recompute.
+                Defaults to None (all the tracked prims).
+        """
+        if prim_paths is None:
+            self._dirty[:] = True
+        else:
+            self._changed_paths.update(Sdf.Path(prim_path) for prim_path in prim_paths)
+
+    def compute_aabbs(self) -> np.ndarray:
+        """Compute the Axis-Aligned Bounding Boxes (AABBs) of the tracked prims
+
+        Returns:
+            np.ndarray: NumPy array of shape (N, 6) containing the bounding box of each prim,
+            [min x, min y, min z, max x, max y, max z]
+        """
+        self._update()
+        return self._aabbs.copy()
+
+    def compute_obbs(self) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the Oriented Bounding Boxes (OBBs) of the tracked prims
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Centroids (N, 3), axes (N, 3, 3) and half extents (N, 3)
+        """
+        self._update()
+        return _compute_obbs_from_bounds(self._matrices, self._ranges)
+
+    def compute_obbs_corners(self) -> np.ndarray:
+        """Compute the corners of the Oriented Bounding Boxes (OBBs) of the tracked prims
+
+        Returns:
+            np.ndarray: NumPy array of shape (N, 8, 3) containing each corner location of the OBBs
+        """
+        return get_obbs_corners(*self.compute_obbs())
+
+    def _on_objects_changed(self, notice, stage):
+        for path in [*notice.GetResyncedPaths(), *notice.GetChangedInfoOnlyPaths()]:
+            if path.IsPropertyPath():
+                name = path.name
+                if name not in self.BOUNDS_ATTRIBUTES and not name.startswith("xformOp:"):
+                    continue
+            self._changed_paths.add(path.GetPrimPath())
+
+    def _process_changes(self) -> None:
+        if not self._changed_paths:
+            return
+        changed_paths, self._changed_paths = self._changed_paths, set()
+        # changes on the prim itself or on any of its ancestors (e.g.: transformations)
+        for i, prefixes in enumerate(self._prefixes):
+            if not self._dirty[i] and any(prefix in changed_paths for prefix in prefixes):
+                self._dirty[i] = True
+        # changes on any of the prim descendants (e.g.: geometry)
+        for path in changed_paths:
+            for prefix in path.GetPrefixes():
+                index = self._indices.get(prefix)
+                if index is not None:
+                    self._dirty[index] = True
+        # resynced prims may have been (re)created
+        for i in np.flatnonzero(self._dirty):
+            if not self._prims[i].IsValid():
+                self._prims[i] = self._stage.GetPrimAtPath(self._paths[i])
+        # cached bounds of changed prims (and their ancestors) are no longer valid
+        self._bbox_cache.Clear()
+
+    def _update(self) -> None:
+        self._process_changes()
+        indices = np.flatnonzero(self._dirty)
+        if indices.size:
+            invalid = [i for i in indices if not self._prims[i].IsValid()]
+            if invalid:
+                self._aabbs[invalid] = np.nan
+                self._matrices[invalid] = np.nan
+                self._ranges[invalid] = np.nan
+                indices = [i for i in indices if self._prims[i].IsValid()]
+            _compute_world_bounds(self._bbox_cache, self._prims, self._aabbs, self._matrices, self._ranges, indices)
+            self._dirty[:] = False
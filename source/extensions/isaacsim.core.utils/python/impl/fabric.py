@@ -208,3 +208,49 @@ def _decompose(m: wp.mat44f):  # -> tuple[wp.vec3f, wp.quatf, wp.vec3f]
     # extract scale
     scale = wp.vec3f(sx, sy, sz)
     return position, rotation, scale
+
+
+@wp.kernel(enable_backward=False)
+def get_world_xform_arrays(
+    fabric_positions: wp.fabricarray(dtype=wp.vec3d),
+    fabric_orientations: wp.fabricarray(dtype=wp.quatf),
+    fabric_to_view: wp.fabricarray(dtype=wp.uint32),
+    positions: wp.array(ndim=2, dtype=wp.float64),
+    orientations: wp.array(ndim=2, dtype=wp.float64),
+    found: wp.array(ndim=1, dtype=wp.int32),
+):
+    fabric_idx = int(wp.tid())
+    view_idx = int(fabric_to_view[fabric_idx])
+    # skip the prims indexed for another view (out of range index)
+    if view_idx < 0 or view_idx >= found.shape[0]:
+        return
+    position = fabric_positions[fabric_idx]
+    positions[view_idx, 0] = position[0]
+    positions[view_idx, 1] = position[1]
+    positions[view_idx, 2] = position[2]
+    # Fabric quaternions are xyzw, the result is scalar-first (wxyz)
+    orientation = fabric_orientations[fabric_idx]
+    orientations[view_idx, 0] = wp.float64(orientation[3])
+    orientations[view_idx, 1] = wp.float64(orientation[0])
+    orientations[view_idx, 2] = wp.float64(orientation[1])
+    orientations[view_idx, 3] = wp.float64(orientation[2])
+    found[view_idx] = 1
+
+
+@wp.kernel(enable_backward=False)
+def get_matrix4d_array(
+    fabric_matrices: wp.fabricarray(dtype=wp.mat44d),
+    fabric_to_view: wp.fabricarray(dtype=wp.uint32),
+    matrices: wp.array(ndim=3, dtype=wp.float64),
+    found: wp.array(ndim=1, dtype=wp.int32),
+):
+    fabric_idx = int(wp.tid())
+    view_idx = int(fabric_to_view[fabric_idx])
+    # skip the prims indexed for another view (out of range index)
+    if view_idx < 0 or view_idx >= found.shape[0]:
+        return
+    matrix = fabric_matrices[fabric_idx]
+    for i in range(4):
+        for j in range(4):
+            matrices[view_idx, i, j] = matrix[i, j]
+    found[view_idx] = 1
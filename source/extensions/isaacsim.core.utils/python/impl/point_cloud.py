@@ -0,0 +1,355 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# python
+import typing
+
+import numpy as np
+
+
+def voxel_downsample(
+    points: np.ndarray, voxel_size: typing.Union[float, typing.Sequence[float]], reduction: str = "first"
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Downsample a point cloud keeping one point per voxel of a regular grid.
+
+    Args:
+        points (np.ndarray): (N, 3) points.
+        voxel_size (typing.Union[float, typing.Sequence[float]]): Size of the voxels (per axis or for all the axes).
+        reduction (str, optional): Point kept for each voxel, the ``"first"`` point of the voxel (in input order)
+            or the ``"centroid"`` of its points. Defaults to "first".
+
+    Raises:
+        ValueError: If the reduction is not supported.
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray]: (M, 3) downsampled points and the (M,) indices of the first input point
+        of each voxel (in input order), to gather other per-point attributes.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from isaacsim.core.utils.point_cloud import voxel_downsample
+        >>>
+        >>> points = np.array([[0.01, 0.0, 0.0], [0.02, 0.0, 0.0], [0.5, 0.0, 0.0]])
+        >>> voxel_downsample(points, 0.1)
+        (array([[0.01, 0.  , 0.  ],
+               [0.5 , 0.  , 0.  ]]), array([0, 2]))
+    """
+    if reduction not in ("first", "centroid"):
+        raise ValueError(f"Unsupported voxel reduction '{reduction}', expected 'first' or 'centroid'")
+    points = np.asarray(points).reshape(-1, 3)
+    if points.shape[0] == 0:
+        return points.copy(), np.zeros(0, dtype=np.int64)
+    voxels = np.floor(points / np.asarray(voxel_size, dtype=np.float64)).astype(np.int64)
+    # pack the voxel coordinates into a single key per point
+    voxels -= voxels.min(axis=0)
+    dims = voxels.max(axis=0) + 1
+    keys = (voxels[:, 0] * dims[1] + voxels[:, 1]) * dims[2] + voxels[:, 2]
+    _, indices, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(indices)
+    indices = indices[order]
+    if reduction == "first":
+        return points[indices], indices
+    # centroids, in the order of the first point of each voxel
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    inverse = rank[inverse.reshape(-1)]
+    counts = np.bincount(inverse, minlength=indices.size).astype(np.float64)
+    centroids = np.stack(
+        [np.bincount(inverse, weights=points[:, i], minlength=indices.size) for i in range(3)], axis=1
+    ) / counts.reshape(-1, 1)
+    return centroids.astype(points.dtype, copy=False), indices
+
+
+def compute_crop_mask(
+    points: np.ndarray,
+    range_limits: typing.Optional[typing.Tuple[float, float]] = None,
+    azimuth_limits: typing.Optional[typing.Tuple[float, float]] = None,
+    elevation_limits: typing.Optional[typing.Tuple[float, float]] = None,
+) -> np.ndarray:
+    """Compute the mask of the points within range, azimuth and elevation limits (relative to the origin).
+
+    Args:
+        points (np.ndarray): (N, 3) points, in the sensor frame.
+        range_limits (typing.Optional[typing.Tuple[float, float]], optional): Minimum and maximum distance to the
+            origin. Defaults to None (no limits).
+        azimuth_limits (typing.Optional[typing.Tuple[float, float]], optional): Minimum and maximum azimuth, in degrees
+            in [-180, 180] measured from +X towards +Y. A minimum greater than the maximum selects the interval
+            wrapping around 180 degrees. Defaults to None (no limits).
+        elevation_limits (typing.Optional[typing.Tuple[float, float]], optional): Minimum and maximum elevation above
+            the XY plane, in degrees. Defaults to None (no limits).
+
+    Returns:
+        np.ndarray: (N,) boolean mask of the points to keep.
+    """
+    points = np.asarray(points).reshape(-1, 3)
+    mask = np.ones(points.shape[0], dtype=bool)
+    if range_limits is not None or elevation_limits is not None:
+        distances = np.linalg.norm(points, axis=1)
+    if range_limits is not None:
+        mask &= (distances >= range_limits[0]) & (distances <= range_limits[1])
+    if azimuth_limits is not None:
+        azimuths = np.degrees(np.arctan2(points[:, 1], points[:, 0]))
+        low, high = azimuth_limits
+        if low <= high:
+            mask &= (azimuths >= low) & (azimuths <= high)
+        else:
+            mask &= (azimuths >= low) | (azimuths <= high)
+    if elevation_limits is not None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            elevations = np.degrees(np.arcsin(np.clip(points[:, 2] / distances, -1.0, 1.0)))
+        mask &= (elevations >= elevation_limits[0]) & (elevations <= elevation_limits[1])
+    return mask
+
+
+def quantize_points(
+    points: np.ndarray,
+    resolution: typing.Optional[typing.Union[float, typing.Sequence[float]]] = None,
+    origin: typing.Optional[typing.Sequence[float]] = None,
+    dtype: type = np.int16,
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Encode points as fixed-point integers: ``points ~= origin + quantized * resolution``.
+
+    Args:
+        points (np.ndarray): (N, 3) points.
+        resolution (typing.Optional[typing.Union[float, typing.Sequence[float]]], optional): Size of the quantization
+            step (per axis or for all the axes). Defaults to None (smallest step covering the points extent).
+        origin (typing.Optional[typing.Sequence[float]], optional): Origin of the encoding. Defaults to None
+            (center of the points bounds if no resolution is given, the zero vector otherwise).
+        dtype (type, optional): Signed integer type of the encoding. Defaults to np.int16.
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray, np.ndarray, int]: (N, 3) quantized points, (3,) resolution, (3,) origin,
+        and number of points clipped to the encoding range.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    limit = np.iinfo(dtype).max
+    if resolution is None:
+        if points.shape[0] == 0:
+            low = high = np.zeros(3)
+        else:
+            low, high = points.min(axis=0), points.max(axis=0)
+        origin = (low + high) / 2 if origin is None else np.asarray(origin, dtype=np.float64)
+        extent = np.maximum(np.abs(high - origin), np.abs(low - origin))
+        resolution = np.where(extent > 0, extent / limit, 1.0)
+    else:
+        origin = np.zeros(3) if origin is None else np.asarray(origin, dtype=np.float64)
+    resolution = np.broadcast_to(np.asarray(resolution, dtype=np.float64), (3,)).copy()
+    origin = np.broadcast_to(np.asarray(origin, dtype=np.float64), (3,)).copy()
+    scaled = np.rint((points - origin) / resolution)
+    clipped = int(np.count_nonzero(np.any(np.abs(scaled) > limit, axis=1)))
+    quantized = np.clip(scaled, -limit, limit).astype(dtype)
+    return quantized, resolution, origin, clipped
+
+
+def dequantize_points(quantized: np.ndarray, resolution: np.ndarray, origin: np.ndarray) -> np.ndarray:
+    """Decode fixed-point points encoded by :func:`quantize_points`.
+
+    Args:
+        quantized (np.ndarray): (N, 3) quantized points.
+        resolution (np.ndarray): (3,) resolution of the encoding.
+        origin (np.ndarray): (3,) origin of the encoding.
+
+    Returns:
+        np.ndarray: (N, 3) points (float32).
+    """
+    return (np.asarray(origin) + np.asarray(quantized, dtype=np.float64) * np.asarray(resolution)).astype(np.float32)
+
+
+class PointCloudProcessor:
+    """Point cloud processing stage: cropping, voxel-grid downsampling and fixed-point encoding.
+
+    The stages run in that order, vectorised with NumPy on CPU. Sensors producing point clouds can attach a processor
+    to reduce the point clouds they return in Python, and the processor keeps the statistics of the last processed
+    point cloud and of all the processed point clouds (including the compression ratio).
+
+    .. note::
+
+        A processor registered for a render product (see :func:`set_render_product_point_cloud_processor`) is also
+        applied by the ``isaacsim.core.nodes.IsaacProcessPointCloud`` node of that render product, which feeds the
+        processed point clouds to writers and ROS 2 publishers (e.g.: ``RtxLidarROS2PublishProcessedPointCloud``).
+
+    Args:
+        voxel_size (typing.Optional[typing.Union[float, typing.Sequence[float]]], optional): Size of the voxels of
+            the downsampling grid. Defaults to None (no downsampling).
+        voxel_reduction (str, optional): Point kept per voxel, ``"first"`` or ``"centroid"``. Defaults to "first".
+        range_limits (typing.Optional[typing.Tuple[float, float]], optional): Distance limits of the crop.
+            Defaults to None.
+        azimuth_limits (typing.Optional[typing.Tuple[float, float]], optional): Azimuth limits of the crop, in
+            degrees. Defaults to None.
+        elevation_limits (typing.Optional[typing.Tuple[float, float]], optional): Elevation limits of the crop, in
+            degrees. Defaults to None.
+        quantize (bool, optional): Whether to encode the points as fixed-point integers. Defaults to False.
+        quantization_resolution (typing.Optional[typing.Union[float, typing.Sequence[float]]], optional): Step of the
+            fixed-point encoding. Defaults to None (computed from the extent of each point cloud).
+        quantization_dtype (type, optional): Signed integer type of the encoding. Defaults to np.int16.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from isaacsim.core.utils.point_cloud import PointCloudProcessor
+        >>>
+        >>> processor = PointCloudProcessor(voxel_size=0.1, range_limits=(0.0, 50.0), quantize=True)
+        >>> output = processor.process(np.random.rand(1000, 3), {"intensity": np.random.rand(1000)})
+        >>> output["points"].dtype, output["intensity"].shape == output["points"].shape[:1]
+        (dtype('int16'), True)
+        >>> processor.stats["compression_ratio"] > 1
+        True
+    """
+
+    def __init__(
+        self,
+        voxel_size: typing.Optional[typing.Union[float, typing.Sequence[float]]] = None,
+        voxel_reduction: str = "first",
+        range_limits: typing.Optional[typing.Tuple[float, float]] = None,
+        azimuth_limits: typing.Optional[typing.Tuple[float, float]] = None,
+        elevation_limits: typing.Optional[typing.Tuple[float, float]] = None,
+        quantize: bool = False,
+        quantization_resolution: typing.Optional[typing.Union[float, typing.Sequence[float]]] = None,
+        quantization_dtype: type = np.int16,
+    ) -> None:
+        if voxel_reduction not in ("first", "centroid"):
+            raise ValueError(f"Unsupported voxel reduction '{voxel_reduction}', expected 'first' or 'centroid'")
+        self.voxel_size = voxel_size
+        self.voxel_reduction = voxel_reduction
+        self.range_limits = range_limits
+        self.azimuth_limits = azimuth_limits
+        self.elevation_limits = elevation_limits
+        self.quantize = quantize
+        self.quantization_resolution = quantization_resolution
+        self.quantization_dtype = quantization_dtype
+        self.reset_stats()
+
+    @property
+    def stats(self) -> dict:
+        """Statistics of the processed point clouds.
+
+        The ``input_points``, ``output_points``, ``input_bytes``, ``output_bytes``, ``compression_ratio``
+        (input bytes / output bytes) and ``clipped_points`` of the last processed point cloud, and the
+        ``total_*`` counterparts accumulated over all the processed point clouds (``processed_count``).
+        """
+        return self._stats
+
+    def reset_stats(self) -> None:
+        """Reset the statistics."""
+        self._stats = {
+            "input_points": 0,
+            "output_points": 0,
+            "input_bytes": 0,
+            "output_bytes": 0,
+            "compression_ratio": 1.0,
+            "clipped_points": 0,
+            "processed_count": 0,
+            "total_input_points": 0,
+            "total_output_points": 0,
+            "total_input_bytes": 0,
+            "total_output_bytes": 0,
+            "total_compression_ratio": 1.0,
+        }
+
+    def process(self, points: np.ndarray, attributes: typing.Optional[typing.Dict[str, np.ndarray]] = None) -> dict:
+        """Process a point cloud.
+
+        Args:
+            points (np.ndarray): (N, 3) points.
+            attributes (typing.Optional[typing.Dict[str, np.ndarray]], optional): Per-point attributes (first dimension
+                of size N, e.g.: intensities) to filter along with the points. Defaults to None.
+
+        Returns:
+            dict: ``points`` (M, 3) processed points (float, or fixed-point integers if quantized), ``indices`` (M,)
+            indices of the kept input points, ``resolution`` and ``origin`` of the encoding (None if not quantized),
+            and the filtered attributes (under their names).
+        """
+        points = np.asarray(points).reshape(-1, 3)
+        attributes = {name: np.asarray(value) for name, value in (attributes or {}).items()}
+        input_bytes = points.nbytes + sum(value.nbytes for value in attributes.values())
+        indices = np.arange(points.shape[0])
+        output = points
+        # crop
+        if self.range_limits is not None or self.azimuth_limits is not None or self.elevation_limits is not None:
+            indices = np.flatnonzero(
+                compute_crop_mask(output, self.range_limits, self.azimuth_limits, self.elevation_limits)
+            )
+            output = output[indices]
+        # downsample
+        if self.voxel_size is not None:
+            output, voxel_indices = voxel_downsample(output, self.voxel_size, self.voxel_reduction)
+            indices = indices[voxel_indices]
+        # encode
+        resolution, origin, clipped = None, None, 0
+        if self.quantize:
+            output, resolution, origin, clipped = quantize_points(
+                output, self.quantization_resolution, dtype=self.quantization_dtype
+            )
+        result = {"points": output, "indices": indices, "resolution": resolution, "origin": origin}
+        for name, value in attributes.items():
+            result[name] = value[indices]
+        output_bytes = output.nbytes + sum(result[name].nbytes for name in attributes)
+        self._update_stats(points.shape[0], output.shape[0], input_bytes, output_bytes, clipped)
+        return result
+
+    def _update_stats(self, input_points: int, output_points: int, input_bytes: int, output_bytes: int, clipped: int):
+        stats = self._stats
+        stats["input_points"] = input_points
+        stats["output_points"] = output_points
+        stats["input_bytes"] = input_bytes
+        stats["output_bytes"] = output_bytes
+        stats["compression_ratio"] = input_bytes / output_bytes if output_bytes else float("inf")
+        stats["clipped_points"] = clipped
+        stats["processed_count"] += 1
+        stats["total_input_points"] += input_points
+        stats["total_output_points"] += output_points
+        stats["total_input_bytes"] += input_bytes
+        stats["total_output_bytes"] += output_bytes
+        total_output_bytes = stats["total_output_bytes"]
+        stats["total_compression_ratio"] = (
+            stats["total_input_bytes"] / total_output_bytes if total_output_bytes else float("inf")
+        )
+
+
+# processors applied by the point cloud processing nodes, per render product
+_render_product_processors: typing.Dict[str, PointCloudProcessor] = {}
+
+
+def set_render_product_point_cloud_processor(
+    render_product_path: str, processor: typing.Optional[PointCloudProcessor]
+) -> None:
+    """Set the processor applied by the point cloud processing nodes (writers and publishers) of a render product.
+
+    Args:
+        render_product_path (str): Path of the render product.
+        processor (typing.Optional[PointCloudProcessor]): Point cloud processor, or None to remove it (the nodes then
+            pass the point clouds through without processing).
+    """
+    if processor is None:
+        _render_product_processors.pop(render_product_path, None)
+    else:
+        _render_product_processors[render_product_path] = processor
+
+
+def get_render_product_point_cloud_processor(render_product_path: str) -> typing.Optional[PointCloudProcessor]:
+    """Get the processor applied by the point cloud processing nodes (writers and publishers) of a render product.
+
+    Args:
+        render_product_path (str): Path of the render product.
+
+    Returns:
+        typing.Optional[PointCloudProcessor]: Point cloud processor, or None if not set.
+    """
+    return _render_product_processors.get(render_product_path)
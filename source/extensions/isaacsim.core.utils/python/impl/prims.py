@@ -17,6 +17,7 @@ import re
 
 # python
 import typing
+from collections import deque
 
 import numpy as np
 import omni.kit
@@ -272,6 +273,91 @@ def move_prim(path_from: str, path_to: str) -> None:
     MovePrimCommand(path_from=path_from, path_to=path_to).do()
 
 
+def traverse_prims(
+    prim_path: str = "/",
+    predicate: typing.Optional[typing.Callable[[str], bool]] = None,
+    prune: typing.Optional[typing.Callable[[str], bool]] = None,
+    depth: typing.Optional[int] = None,
+    breadth_first: bool = False,
+    fabric: bool = False,
+) -> typing.Iterator[typing.Union[Usd.Prim, usdrt.Usd._Usd.Prim]]:
+    """Lazily traverse the prim hierarchy rooted at the given path, visiting each prim exactly once
+
+    The USD depth-first traversal is performed natively by ``Usd.PrimRange`` (pruning subtrees via ``PruneChildren``),
+    while the breadth-first and Fabric (usdrt) traversals use a double-ended queue/stack of prims.
+    In all cases, the traversal runs in linear time with respect to the number of visited prims.
+
+    .. note::
+
+        Pruning (either by ``prune`` predicate or by ``depth``) only skips the descendants of a prim.
+        The prim itself is still tested against the ``predicate``.
+
+    Args:
+        prim_path (str, optional): root prim path to start traversal from. Defaults to "/".
+        predicate (typing.Optional[typing.Callable[[str], bool]], optional): predicate that checks the prim path of a prim
+            and returns whether the prim is yielded. Defaults to None (i.e: yield all prims).
+        prune (typing.Optional[typing.Callable[[str], bool]], optional): predicate that checks the prim path of a prim
+            and returns whether its descendants must be skipped. Defaults to None (i.e: no pruning).
+        depth (typing.Optional[int], optional): maximum depth for traversal (the root prim is at depth 0).
+            Defaults to None (i.e: traversal till the end of the tree).
+        breadth_first (bool, optional): True to visit prims in breadth-first order, False for depth-first (pre-order).
+            Defaults to False.
+        fabric (bool, optional): True for fabric stage and False for USD stage. Defaults to False.
+
+    Raises:
+        ValueError: If ``depth`` is defined and is less than 0.
+
+    Yields:
+        typing.Union[Usd.Prim, usdrt.Usd._Usd.Prim]: USD or Fabric prims matching the specified predicate.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.prims as prims_utils
+        >>>
+        >>> # given the stage: /World/Cube, /World/Cube/Sphere, /World/Xform/Sphere.
+        >>> # get all Sphere prims, skipping the /World/Xform subtree
+        >>> predicate = lambda path: prims_utils.get_prim_type_name(path) == "Sphere"
+        >>> prune = lambda path: path == "/World/Xform"
+        >>> list(prims_utils.traverse_prims("/World", predicate=predicate, prune=prune))
+        [Usd.Prim(</World/Cube/Sphere>)]
+    """
+    if depth is not None and depth < 0:
+        raise ValueError("If defined, 'depth' must be greater or equal to 0")
+    stage = get_current_stage(fabric=fabric)
+    if not stage:
+        return
+    root = stage.GetPrimAtPath(prim_path)
+    if not root or not root.IsValid():
+        return
+    # USD depth-first traversal: delegate the tree walk to Usd.PrimRange
+    if not fabric and not breadth_first:
+        root_element_count = root.GetPath().pathElementCount
+        prim_range = iter(Usd.PrimRange(root))
+        for prim in prim_range:
+            path = prim.GetPath()
+            path_string = path.pathString
+            if predicate is None or predicate(path_string):
+                yield prim
+            if (depth is not None and path.pathElementCount - root_element_count >= depth) or (
+                prune is not None and prune(path_string)
+            ):
+                prim_range.PruneChildren()
+        return
+    # breadth-first (queue) or Fabric depth-first (stack) traversal
+    pending = deque([(root, 0)])
+    pop = pending.popleft if breadth_first else pending.pop
+    while pending:
+        prim, current_depth = pop()
+        path_string = str(prim.GetPath())
+        if predicate is None or predicate(path_string):
+            yield prim
+        if (depth is None or current_depth < depth) and (prune is None or not prune(path_string)):
+            children = prim.GetChildren() if breadth_first else list(prim.GetChildren())[::-1]
+            pending.extend((child, current_depth + 1) for child in children)
+
+
 def get_first_matching_child_prim(
     prim_path: str, predicate: typing.Callable[[str], bool], fabric: bool = False
 ) -> Usd.Prim:
@@ -297,17 +383,7 @@ def get_first_matching_child_prim(
         >>> prims_utils.get_first_matching_child_prim("/", predicate)
         Usd.Prim(</World/Cube>)
     """
-    prim = get_current_stage(fabric=fabric).GetPrimAtPath(prim_path)
-    children_stack = [prim]
-    out = prim.GetChildren()
-    while len(children_stack) > 0:
-        prim = children_stack.pop(0)
-        if predicate(get_prim_path(prim)):
-            return prim
-        children = prim.GetChildren()
-        children_stack = children_stack + children
-        out = out + children
-    return None
+    return next(traverse_prims(prim_path, predicate, breadth_first=True, fabric=fabric), None)
 
 
 def get_first_matching_parent_prim(prim_path: str, predicate: typing.Callable[[str], bool]) -> Usd.Prim:
@@ -368,18 +444,7 @@ def get_all_matching_child_prims(
          Usd.Prim(</OmniverseKit_Right>),
          Usd.Prim(</Render>)]
     """
-    prim = get_prim_at_path(prim_path)
-    traversal_queue = [(prim, 0)]
-    out = []
-    while len(traversal_queue) > 0:
-        prim, current_depth = traversal_queue.pop(0)
-        if is_prim_path_valid(get_prim_path(prim)):
-            if predicate(get_prim_path(prim)):
-                out.append(prim)
-            if depth is None or current_depth < depth:
-                children = get_prim_children(prim)
-                traversal_queue = traversal_queue + [(child, current_depth + 1) for child in children]
-    return out
+    return list(traverse_prims(prim_path, predicate, depth=depth, breadth_first=True))
 
 
 def find_matching_prim_paths(prim_path_regex: str, prim_type: typing.Optional[str] = None) -> typing.List[str]:
@@ -897,7 +962,7 @@ def is_prim_non_root_articulation_link(prim_path: str) -> bool:
         return False
 
     # get all joints under ArticulationRoot
-    joint_prims = get_all_matching_child_prims(
+    joint_prims = traverse_prims(
         prim_path=get_prim_path(parent_articulation_root), predicate=lambda a: "Joint" in get_prim_type_name(a)
     )
     # this assumes if that the first link is a root articulation link
@@ -19,7 +19,7 @@ import isaacsim.core.utils.prims as prim_utils
 import omni.usd
 import Semantics
 from isaacsim.core.utils.stage import get_current_stage, get_current_stage_id
-from pxr import Usd, UsdGeom, UsdSemantics
+from pxr import Sdf, Tf, Usd, UsdGeom, UsdSemantics
 
 
 def add_update_semantics(prim: Usd.Prim, semantic_label: str, type_label: str = "class", suffix="") -> None:
@@ -131,7 +131,7 @@ def check_missing_semantics(prim_path: str = None) -> List[str]:
         stage = get_current_stage()
         prims = stage.Traverse()
     else:
-        prims = prim_utils.get_all_matching_child_prims(prim_path, lambda prim: True)
+        prims = prim_utils.traverse_prims(prim_path)
 
     for prim in prims:
         if prim.IsA(UsdGeom.Mesh):
@@ -159,7 +159,7 @@ def check_incorrect_semantics(prim_path: str = None) -> List[List[str]]:
         stage = get_current_stage()
         prims = stage.Traverse()
     else:
-        prims = prim_utils.get_all_matching_child_prims(prim_path, lambda prim: True)
+        prims = prim_utils.traverse_prims(prim_path)
 
     for prim in prims:
         if prim.IsA(UsdGeom.Mesh):
@@ -198,8 +198,7 @@ def count_semantics_in_scene(prim_path: str = None) -> Dict[str, int]:
         stage = get_current_stage()
         prims = stage.Traverse()
     else:
-        prims = prim_utils.get_all_matching_child_prims(prim_path, lambda prim: True)
-        print(len(prims))
+        prims = prim_utils.traverse_prims(prim_path)
     for prim in prims:
         if prim.IsA(UsdGeom.Mesh):
             semantics = get_semantics(prim)
@@ -283,91 +282,404 @@ def remove_labels(prim: Usd.Prim, instance_name: str | None = None, include_desc
         remove_single_prim_labels(prim)
 
 
-def check_missing_labels(prim_path: str | None = None) -> list[str]:
-    """Returns a list of prim paths of meshes with missing semantic labels (UsdSemantics.LabelsAPI).
+def _find_incorrect_label(prim_path: str, labels_dict: dict[str, list[str]]) -> str | None:
+    """Get the first semantic label that is not found within the prim's path string (case-insensitive,
+    ignoring '_' and '-'), or None if all the labels are found.
+    """
+    prim_path_str = prim_path.lower()
+    all_labels = [
+        label for sublist in labels_dict.values() for label in sublist if label
+    ]  # Flatten and filter None/empty
+    for label in all_labels:
+        label_lower = label.lower()
+        # Check if label (or label without separators) is in path
+        if (
+            label_lower not in prim_path_str
+            and label_lower.replace("_", "") not in prim_path_str
+            and label_lower.replace("-", "") not in prim_path_str
+        ):
+            return label
+    return None
+
+
+class SemanticsIndex:
+    """Index of the semantic labels (UsdSemantics.LabelsAPI) of a stage.
+
+    The index is built in a single stage traversal and maps labels to prims and prims to labels
+    (as well as keeping track of Mesh prims and prims with the deprecated SemanticsAPI applied).
+    It stays current by listening to USD change notices (``Usd.Notice.ObjectsChanged``): changed prims
+    are recorded when notified and are re-indexed lazily on the next query. Queries return the prims in stage
+    traversal order.
+
+    .. note::
+
+        Use :py:func:`get_semantics_index` to get the shared index of the current stage
+        rather than creating (and traversing the stage for) a new index.
 
     Args:
-        prim_path (str | None): This will check Prim path and its childrens' labels. If None, checks the whole stage.
+        stage (Usd.Stage | None): Stage to index. If None, the current stage is used.
+    """
+
+    def __init__(self, stage: Usd.Stage | None = None) -> None:
+        self._stage = get_current_stage() if stage is None else stage
+        # prim path -> (is mesh, labels (instance name -> labels) or None if no LabelsAPI, has deprecated SemanticsAPI)
+        self._records = {}
+        self._label_prims = {}
+        self._label_counts = {}
+        self._incorrect_labels = {}
+        self._label_ids = {}
+        self._missing_count = 0
+        self._resynced_paths = set()
+        self._changed_paths = set()
+        self._index_subtree(self._stage.GetPseudoRoot())
+        self._ordered = True
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, self._stage)
+
+    def destroy(self) -> None:
+        """Stop listening to USD change notices"""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+    @property
+    def stage(self) -> Usd.Stage:
+        """Indexed stage
+
+        Returns:
+            Usd.Stage: Indexed stage
+        """
+        return self._stage
+
+    def get_labels(self, prim_path: str) -> dict[str, list[str]]:
+        """Get the semantic labels of a prim.
+
+        Args:
+            prim_path (str): Prim path.
+
+        Returns:
+            dict[str, list[str]]: Dictionary mapping instance names to a list of labels.
+        """
+        self._process_changes()
+        record = self._records.get(Sdf.Path(prim_path))
+        if record is None or record[1] is None:
+            return {}
+        return {instance_name: list(labels) for instance_name, labels in record[1].items()}
+
+    def get_prims_with_label(self, label: str, instance_name: str | None = None) -> list[str]:
+        """Get the paths of the prims that have the given semantic label.
+
+        Args:
+            label (str): Semantic label.
+            instance_name (str | None, optional): Semantic instance name (e.g.: "class") the label must belong to.
+                If None (default), any instance.
+
+        Returns:
+            list[str]: Prim paths.
+        """
+        self._process_changes()
+        paths = list(self._label_prims.get(label, {}))
+        if instance_name is not None:
+            paths = [path for path in paths if label in self._records[path][1].get(instance_name, [])]
+        return [path.pathString for path in self._in_traversal_order(paths)]
+
+    def get_labeled_prims(self) -> list[str]:
+        """Get the paths of the prims that have semantic labels (UsdSemantics.LabelsAPI) applied.
+
+        Returns:
+            list[str]: Prim paths.
+        """
+        self._process_changes()
+        paths = [path for path, record in self._records.items() if record[1] is not None]
+        return [path.pathString for path in self._in_traversal_order(paths)]
+
+    def get_legacy_prims(self, prim_path: str | None = None) -> list[str]:
+        """Get the paths of the prims that have the deprecated SemanticsAPI applied.
+
+        Args:
+            prim_path (str | None, optional): Root of the subtree to query. If None (default), the whole stage.
+
+        Returns:
+            list[str]: Prim paths.
+        """
+        self._process_changes()
+        root = Sdf.Path(prim_path) if prim_path else None
+        paths = [path for path, record in self._records.items() if record[2] and (root is None or path.HasPrefix(root))]
+        return [path.pathString for path in self._in_traversal_order(paths)]
+
+    def get_label_ids(self) -> dict[str, int]:
+        """Get a unique integer id for each semantic label found in the stage.
+
+        Ids are assigned in order of appearance and are stable for the lifetime of the index
+        (they are not reused when a label disappears from the stage), which makes them suitable for writers.
+
+        Returns:
+            dict[str, int]: Dictionary mapping labels to ids.
+        """
+        self._process_changes()
+        return {label: label_id for label, label_id in self._label_ids.items() if label in self._label_prims}
+
+    def get_id_to_labels(self) -> dict[int, str]:
+        """Get the semantic label of each id (see :py:meth:`get_label_ids`).
+
+        Returns:
+            dict[int, str]: Dictionary mapping ids to labels.
+        """
+        return {label_id: label for label, label_id in self.get_label_ids().items()}
+
+    def count_labels(self, prim_path: str | None = None) -> dict[str, int]:
+        """Count the semantic labels of the Mesh prims.
+
+        Args:
+            prim_path (str | None, optional): Root of the subtree to query. If None (default), the whole stage.
+
+        Returns:
+            dict[str, int]: Dictionary mapping individual labels to their total count across all instances.
+                Includes a 'missing_labels' count for meshes with no LabelsAPI.
+        """
+        self._process_changes()
+        if not prim_path or prim_path == "/":
+            return {"missing_labels": self._missing_count, **self._label_counts}
+        root = Sdf.Path(prim_path)
+        labels_counter = {"missing_labels": 0}
+        for path, (is_mesh, labels_dict, _) in self._records.items():
+            if not is_mesh or not path.HasPrefix(root):
+                continue
+            if not labels_dict:
+                labels_counter["missing_labels"] += 1
+                continue
+            for label in [label for sublist in labels_dict.values() for label in sublist if label]:
+                labels_counter[label] = labels_counter.get(label, 0) + 1
+        return labels_counter
+
+    def get_missing_labels(self, prim_path: str | None = None) -> list[str]:
+        """Get the paths of the Mesh prims with no semantic labels (UsdSemantics.LabelsAPI) applied.
+
+        Args:
+            prim_path (str | None, optional): Root of the subtree to query. If None (default), the whole stage.
+
+        Returns:
+            list[str]: Prim paths.
+        """
+        self._process_changes()
+        root = Sdf.Path(prim_path) if prim_path else None
+        paths = [
+            path
+            for path, (is_mesh, labels_dict, _) in self._records.items()
+            if is_mesh and labels_dict is None and (root is None or path.HasPrefix(root))
+        ]
+        return [path.pathString for path in self._in_traversal_order(paths)]
+
+    def get_incorrect_labels(self, prim_path: str | None = None) -> list[list[str]]:
+        """Get the Mesh prims where at least one semantic label is not found within the prim's path string.
+
+        Args:
+            prim_path (str | None, optional): Root of the subtree to query. If None (default), the whole stage.
+
+        Returns:
+            list[list[str]]: List containing pairs of [prim_path, first_incorrect_label].
+        """
+        self._process_changes()
+        root = Sdf.Path(prim_path) if prim_path else None
+        paths = [path for path in self._incorrect_labels if root is None or path.HasPrefix(root)]
+        return [[path.pathString, self._incorrect_labels[path]] for path in self._in_traversal_order(paths)]
+
+    def _on_objects_changed(self, notice, stage):
+        self._resynced_paths.update(notice.GetResyncedPaths())
+        for path in notice.GetChangedInfoOnlyPaths():
+            # prim metadata (e.g.: apiSchemas) or semantic labels attributes
+            if path.IsPrimPath() or path.name.startswith("semantics:labels:"):
+                self._changed_paths.add(path.GetPrimPath())
+
+    def _process_changes(self) -> None:
+        if not self._resynced_paths and not self._changed_paths:
+            return
+        if self._resynced_paths:
+            resynced_paths = Sdf.Path.RemoveDescendentPaths(
+                [path.GetPrimPath() if path.IsPropertyPath() else path for path in self._resynced_paths]
+            )
+            self._resynced_paths = set()
+            for root in resynced_paths:
+                for path in [path for path in self._records if path.HasPrefix(root)]:
+                    self._remove_record(path)
+                prim = self._stage.GetPrimAtPath(root)
+                if prim:
+                    self._index_subtree(prim)
+                    self._ordered = False
+        if self._changed_paths:
+            changed_paths, self._changed_paths = self._changed_paths, set()
+            for path in changed_paths:
+                self._remove_record(path)
+                prim = self._stage.GetPrimAtPath(path)
+                if prim:
+                    self._index_prim(prim)
+                    self._ordered = False
+
+    def _in_traversal_order(self, paths: list[Sdf.Path]) -> list[Sdf.Path]:
+        # the records are in stage traversal order until prims are re-indexed (appended to the records after a
+        # change notice): only then the query results are sorted
+        # (by the index of each prim of the path among the children of its parent, as traversed by Usd.PrimRange)
+        if self._ordered or len(paths) < 2:
+            return paths
+        child_indices = {}
+
+        def get_traversal_key(path):
+            key = []
+            for prefix in path.GetPrefixes():
+                parent_path = prefix.GetParentPath()
+                indices = child_indices.get(parent_path)
+                if indices is None:
+                    parent = self._stage.GetPrimAtPath(parent_path)
+                    indices = {name: i for i, name in enumerate(parent.GetChildrenNames())} if parent else {}
+                    child_indices[parent_path] = indices
+                key.append(indices.get(prefix.name, -1))
+            return key
+
+        return sorted(paths, key=get_traversal_key)
+
+    def _index_subtree(self, prim: Usd.Prim) -> None:
+        for child_prim in Usd.PrimRange(prim):
+            self._index_prim(child_prim)
+
+    def _index_prim(self, prim: Usd.Prim) -> None:
+        labels_dict = None
+        has_legacy = False
+        for schema_name in prim.GetAppliedSchemas():
+            if schema_name.startswith("SemanticsLabelsAPI:"):
+                if labels_dict is None:
+                    labels_dict = {}
+                instance_name = schema_name.split(":", 1)[1]
+                labels_attr = UsdSemantics.LabelsAPI(prim, instance_name).GetLabelsAttr()
+                labels = labels_attr.Get() if labels_attr else None
+                labels_dict[instance_name] = list(labels) if labels is not None else []
+            elif schema_name.startswith("SemanticsAPI:"):
+                has_legacy = True
+        is_mesh = prim.IsA(UsdGeom.Mesh)
+        if not is_mesh and labels_dict is None and not has_legacy:
+            return
+        path = prim.GetPath()
+        self._records[path] = (is_mesh, labels_dict, has_legacy)
+        if is_mesh and labels_dict is None:
+            self._missing_count += 1
+        if labels_dict:
+            for label in {label for sublist in labels_dict.values() for label in sublist if label}:
+                self._label_prims.setdefault(label, {})[path] = None
+                self._label_ids.setdefault(label, len(self._label_ids))
+            if is_mesh:
+                for label in [label for sublist in labels_dict.values() for label in sublist if label]:
+                    self._label_counts[label] = self._label_counts.get(label, 0) + 1
+                incorrect_label = _find_incorrect_label(path.pathString, labels_dict)
+                if incorrect_label is not None:
+                    self._incorrect_labels[path] = incorrect_label
+
+    def _remove_record(self, path: Sdf.Path) -> None:
+        record = self._records.pop(path, None)
+        if record is None:
+            return
+        is_mesh, labels_dict, _ = record
+        if is_mesh and labels_dict is None:
+            self._missing_count -= 1
+        if labels_dict:
+            for label in {label for sublist in labels_dict.values() for label in sublist if label}:
+                prims = self._label_prims.get(label)
+                if prims is not None:
+                    prims.pop(path, None)
+                    if not prims:
+                        del self._label_prims[label]
+            if is_mesh:
+                for label in [label for sublist in labels_dict.values() for label in sublist if label]:
+                    self._label_counts[label] -= 1
+                    if not self._label_counts[label]:
+                        del self._label_counts[label]
+                self._incorrect_labels.pop(path, None)
+
+
+_semantics_index = None
+
+
+def get_semantics_index(stage: Usd.Stage | None = None) -> SemanticsIndex:
+    """Get the shared semantic index (see :py:class:`SemanticsIndex`) of a stage.
+
+    The index is built on the first call (one stage traversal) and reused by subsequent calls on the same stage.
+
+    Args:
+        stage (Usd.Stage | None, optional): Stage to get the index for. If None (default), the current stage is used.
 
     Returns:
-        list[str]: Prim paths of meshes with no LabelsAPI applied.
+        SemanticsIndex: Semantic index of the stage.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.semantics as semantics_utils
+        >>>
+        >>> index = semantics_utils.get_semantics_index()
+        >>> index.get_prims_with_label("cube")
+        ['/World/Cube_0', '/World/Cube_1']
+        >>> index.get_labels("/World/Cube_0")
+        {'class': ['cube']}
     """
-    prim_paths = []
+    global _semantics_index
+    stage = get_current_stage() if stage is None else stage
+    if _semantics_index is None or _semantics_index.stage != stage:
+        if _semantics_index is not None:
+            _semantics_index.destroy()
+        _semantics_index = SemanticsIndex(stage)
+    return _semantics_index
+
+
+def _get_semantics_index_for_query(prim_path: str | None) -> SemanticsIndex | None:
+    """Get the semantic index of the current stage if the stage (and the prim path, if specified) is valid."""
     stage = get_current_stage()
     if stage is None:
         carb.log_warn("Invalid stage, skipping label check")
-        return prim_paths
+        return None
+    if prim_path and not stage.GetPrimAtPath(prim_path):
+        carb.log_warn(f"Prim path not found: {prim_path}")
+        return None
+    return get_semantics_index(stage)
 
-    start_prim = stage.GetPrimAtPath(prim_path) if prim_path else stage.GetPseudoRoot()
-    if not start_prim:
-        # Allow None prim_path for whole stage check, warn if path specified but not found
-        if prim_path:
-            carb.log_warn(f"Prim path not found: {prim_path}")
-        return prim_paths
 
-    prims_to_check = Usd.PrimRange(start_prim)
+def check_missing_labels(prim_path: str | None = None) -> list[str]:
+    """Returns a list of prim paths of meshes with missing semantic labels (UsdSemantics.LabelsAPI).
 
-    for prim in prims_to_check:
-        if prim.IsA(UsdGeom.Mesh):
-            has_any_label = False
-            for schema_name in prim.GetAppliedSchemas():
-                if schema_name.startswith("SemanticsLabelsAPI:"):
-                    has_any_label = True
-                    break
-            if not has_any_label:
-                prim_paths.append(prim.GetPath().pathString)
-    return prim_paths
+    The query is served by the shared semantic index of the stage (see :py:func:`get_semantics_index`).
+
+    Args:
+        prim_path (str | None): This will check Prim path and its childrens' labels. If None, checks the whole stage.
+
+    Returns:
+        list[str]: Prim paths of meshes with no LabelsAPI applied.
+    """
+    index = _get_semantics_index_for_query(prim_path)
+    if index is None:
+        return []
+    return index.get_missing_labels(prim_path)
 
 
 def check_incorrect_labels(prim_path: str | None = None) -> list[list[str]]:
     """Returns a list of [prim_path, label] for meshes where at least one semantic label (LabelsAPI)
        is not found within the prim's path string (case-insensitive, ignoring '_' and '-').
 
+    The query is served by the shared semantic index of the stage (see :py:func:`get_semantics_index`).
+
     Args:
         prim_path (str | None): This will check Prim path and its childrens' labels. If None, checks the whole stage.
 
     Returns:
         list[list[str]]: List containing pairs of [prim_path, first_incorrect_label].
     """
-    incorrect_pairs = []
-    stage = get_current_stage()
-    if stage is None:
-        carb.log_warn("Invalid stage, skipping label check")
-        return incorrect_pairs
-
-    start_prim = stage.GetPrimAtPath(prim_path) if prim_path else stage.GetPseudoRoot()
-    if not start_prim:
-        if prim_path:
-            carb.log_warn(f"Prim path not found: {prim_path}")
-        return incorrect_pairs
-
-    prims_to_check = Usd.PrimRange(start_prim)
-
-    for prim in prims_to_check:
-        if prim.IsA(UsdGeom.Mesh):
-            labels_dict = get_labels(prim)
-            if labels_dict:
-                prim_path_str = prim.GetPath().pathString.lower()
-                all_labels = [
-                    label for sublist in labels_dict.values() for label in sublist if label
-                ]  # Flatten and filter None/empty
-                for label in all_labels:
-                    label_lower = label.lower()
-                    # Check if label (or label without separators) is in path
-                    if (
-                        label_lower not in prim_path_str
-                        and label_lower.replace("_", "") not in prim_path_str
-                        and label_lower.replace("-", "") not in prim_path_str
-                    ):
-                        incorrect_pair = [prim.GetPath().pathString, label]
-                        incorrect_pairs.append(incorrect_pair)
-                        break  # Only report first incorrect label per prim
-    return incorrect_pairs
+    index = _get_semantics_index_for_query(prim_path)
+    if index is None:
+        return []
+    return index.get_incorrect_labels(prim_path)
 
 
 def count_labels_in_scene(prim_path: str | None = None) -> dict[str, int]:
     """Returns a dictionary of semantic labels (UsdSemantics.LabelsAPI) and their corresponding count.
 
+    The query is served by the shared semantic index of the stage (see :py:func:`get_semantics_index`).
+
     Args:
         prim_path (str | None): This will check Prim path and its childrens' labels. If None, checks the whole stage.
 
@@ -375,32 +687,10 @@ def count_labels_in_scene(prim_path: str | None = None) -> dict[str, int]:
         dict[str, int]: Dictionary mapping individual labels to their total count across all instances.
                        Includes a 'missing_labels' count for meshes with no LabelsAPI.
     """
-    labels_counter = {"missing_labels": 0}
-    stage = get_current_stage()
-    if stage is None:
-        carb.log_warn("Invalid stage, skipping label check")
-        return labels_counter
-
-    start_prim = stage.GetPrimAtPath(prim_path) if prim_path else stage.GetPseudoRoot()
-    if not start_prim:
-        if prim_path:
-            carb.log_warn(f"Prim path not found: {prim_path}")
-        return labels_counter
-
-    prims_to_check = Usd.PrimRange(start_prim)
-
-    for prim in prims_to_check:
-        if prim.IsA(UsdGeom.Mesh):
-            labels_dict = get_labels(prim)
-            if not labels_dict:
-                labels_counter["missing_labels"] += 1
-            else:
-                # Iterate through all labels from all instances on the prim
-                all_labels = [label for sublist in labels_dict.values() for label in sublist if label]
-                for label in all_labels:
-                    labels_counter[label] = labels_counter.get(label, 0) + 1
-
-    return labels_counter
+    index = _get_semantics_index_for_query(prim_path)
+    if index is None:
+        return {"missing_labels": 0}
+    return index.count_labels(prim_path)
 
 
 def upgrade_prim_semantics_to_labels(prim: Usd.Prim, include_descendants: bool = False) -> int:
@@ -422,7 +712,13 @@ def upgrade_prim_semantics_to_labels(prim: Usd.Prim, include_descendants: bool =
     """
     total_upgraded = 0
 
-    prims_to_process = Usd.PrimRange(prim) if include_descendants else [prim]
+    if include_descendants:
+        # only visit the prims that have the deprecated SemanticsAPI applied
+        stage = prim.GetStage()
+        prim_paths = get_semantics_index(stage).get_legacy_prims(prim.GetPath().pathString)
+        prims_to_process = [stage.GetPrimAtPath(prim_path) for prim_path in prim_paths]
+    else:
+        prims_to_process = [prim]
 
     for current_prim in prims_to_process:
         if not current_prim:
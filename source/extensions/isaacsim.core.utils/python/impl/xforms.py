@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing
+
+import isaacsim.core.utils.fabric as fabric_utils
 import numpy as np
 import usdrt
+import warp as wp
 from isaacsim.core.utils.prims import (
     get_prim_at_path,
     get_prim_attribute_names,
@@ -23,6 +27,7 @@ from isaacsim.core.utils.prims import (
     get_prim_path,
     is_prim_path_valid,
 )
+from isaacsim.core.utils.stage import get_current_stage, get_current_stage_id
 from pxr import Gf, Usd, UsdGeom
 from scipy.spatial.transform import Rotation
 
@@ -185,3 +190,269 @@ def get_world_pose(prim_path, fabric=False):
     result_transform = np.transpose(result_transform)
     r = Rotation.from_matrix(result_transform[:3, :3])
     return result_transform[:3, 3], r.as_quat()[[3, 0, 1, 2]]
+
+
+def _decompose_transforms(matrices: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Decompose a batch of (row-major, translation in the last row) transformation matrices into poses
+
+    Args:
+        matrices (np.ndarray): Transformation matrices of shape (N, 4, 4)
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray]: positions (N, 3) and quaternion orientations (N, 4), scalar-first (w, x, y, z)
+    """
+    positions = matrices[:, 3, :3].copy()
+    if not len(matrices):
+        return positions, np.zeros((0, 4), dtype=matrices.dtype)
+    # remove the scale (norm of each row) from the rotation part before extracting the orientation
+    rotations = matrices[:, :3, :3]
+    norms = np.linalg.norm(rotations, axis=2, keepdims=True)
+    rotations = rotations / np.where(norms > 0.0, norms, 1.0)
+    orientations = Rotation.from_matrix(np.transpose(rotations, (0, 2, 1))).as_quat()[:, [3, 0, 1, 2]]
+    return positions, orientations
+
+
+def _get_fabric_hierarchy():
+    stage = get_current_stage(fabric=True)
+    return usdrt.hierarchy.IFabricHierarchy().get_fabric_hierarchy(stage.GetFabricId(), stage.GetStageIdAsStageId())
+
+
+# Fabric attribute holding the index of the prims of the last batched query, so that they are read in a single pass
+_FABRIC_INDEX_ATTR = "isaacsim:xforms:index"
+_FABRIC_INDEX_INVALID = 0xFFFFFFFF
+_fabric_indexed_prims = {"stage_id": None, "prim_paths": ()}
+
+
+def _index_fabric_prims(fabric_stage, prim_paths: typing.Tuple[str, ...]) -> None:
+    # the indices are only written when the queried prims change (the indices of the previous ones are invalidated)
+    stage_id = get_current_stage_id()
+    if _fabric_indexed_prims["stage_id"] == stage_id and _fabric_indexed_prims["prim_paths"] == prim_paths:
+        return
+    if _fabric_indexed_prims["stage_id"] == stage_id:
+        for prim_path in _fabric_indexed_prims["prim_paths"]:
+            fabric_prim = fabric_stage.GetPrimAtPath(prim_path)
+            if fabric_prim and fabric_prim.HasAttribute(_FABRIC_INDEX_ATTR):
+                fabric_prim.GetAttribute(_FABRIC_INDEX_ATTR).Set(_FABRIC_INDEX_INVALID)
+    for i, prim_path in enumerate(prim_paths):
+        fabric_prim = fabric_stage.GetPrimAtPath(prim_path)
+        if fabric_prim:
+            fabric_prim.CreateAttribute(_FABRIC_INDEX_ATTR, usdrt.Sdf.ValueTypeNames.UInt, True).Set(i)
+    _fabric_indexed_prims["stage_id"] = stage_id
+    _fabric_indexed_prims["prim_paths"] = prim_paths
+
+
+def _select_fabric_prims(fabric_stage, attributes: typing.List[typing.Tuple[typing.Any, str]]):
+    return fabric_stage.SelectPrims(
+        require_attrs=[
+            (usdrt.Sdf.ValueTypeNames.UInt, _FABRIC_INDEX_ATTR, usdrt.Usd.Access.Read),
+            *[(value_type, name, usdrt.Usd.Access.Read) for value_type, name in attributes],
+        ],
+        device="cpu",
+    )
+
+
+def _read_fabric_world_poses(fabric_stage, count: int) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # world position and orientation attributes (written by PhysX), as read by usdrt.Rt.Xformable
+    positions = wp.zeros((count, 3), dtype=wp.float64, device="cpu")
+    orientations = wp.zeros((count, 4), dtype=wp.float64, device="cpu")
+    found = wp.zeros((count,), dtype=wp.int32, device="cpu")
+    selection = _select_fabric_prims(
+        fabric_stage,
+        [(usdrt.Sdf.ValueTypeNames.Double3, "_worldPosition"), (usdrt.Sdf.ValueTypeNames.Quatf, "_worldOrientation")],
+    )
+    if selection.GetCount():
+        wp.launch(
+            fabric_utils.get_world_xform_arrays,
+            dim=selection.GetCount(),
+            inputs=[
+                wp.fabricarray(selection, "_worldPosition"),
+                wp.fabricarray(selection, "_worldOrientation"),
+                wp.fabricarray(selection, _FABRIC_INDEX_ATTR),
+                positions,
+                orientations,
+                found,
+            ],
+            device="cpu",
+        )
+    return found.numpy().astype(bool), positions.numpy(), orientations.numpy()
+
+
+def _read_fabric_matrices(fabric_stage, count: int, attribute: str) -> typing.Tuple[np.ndarray, np.ndarray]:
+    matrices = wp.zeros((count, 4, 4), dtype=wp.float64, device="cpu")
+    found = wp.zeros((count,), dtype=wp.int32, device="cpu")
+    selection = _select_fabric_prims(fabric_stage, [(usdrt.Sdf.ValueTypeNames.Matrix4d, attribute)])
+    if selection.GetCount():
+        wp.launch(
+            fabric_utils.get_matrix4d_array,
+            dim=selection.GetCount(),
+            inputs=[
+                wp.fabricarray(selection, attribute),
+                wp.fabricarray(selection, _FABRIC_INDEX_ATTR),
+                matrices,
+                found,
+            ],
+            device="cpu",
+        )
+    return found.numpy().astype(bool), matrices.numpy()
+
+
+def _compose_transforms(positions: np.ndarray, orientations: np.ndarray) -> np.ndarray:
+    # (row-major, translation in the last row) transformation matrices from scalar-first (w, x, y, z) orientations
+    matrices = np.zeros((len(positions), 4, 4), dtype=np.float64)
+    rotations = Rotation.from_quat(orientations[:, [1, 2, 3, 0]]).as_matrix()
+    matrices[:, :3, :3] = np.transpose(rotations, (0, 2, 1))
+    matrices[:, 3, :3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def _get_usd_transforms(
+    prims: typing.List[Usd.Prim], xform_cache: typing.Optional[UsdGeom.XformCache], local: bool
+) -> np.ndarray:
+    # compute the transforms using the USD xform cache (ancestors' transforms are computed only once)
+    if xform_cache is None:
+        xform_cache = UsdGeom.XformCache(Usd.TimeCode.Default())
+    matrices = np.empty((len(prims), 4, 4), dtype=np.float64)
+    for i, prim in enumerate(prims):
+        if local:
+            matrices[i] = np.array(xform_cache.GetLocalTransformation(prim)[0], dtype=np.float64)
+        elif prim.IsPseudoRoot():
+            matrices[i] = np.identity(4)
+        else:
+            matrices[i] = np.array(xform_cache.GetLocalToWorldTransform(prim), dtype=np.float64)
+    return matrices
+
+
+def _get_fabric_transforms(
+    prims: typing.List[Usd.Prim],
+    prim_paths: typing.List[str],
+    matrices: np.ndarray,
+    xform_cache: typing.Optional[UsdGeom.XformCache],
+    local: bool,
+) -> np.ndarray:
+    # read the transforms of all the prims from Fabric in a single pass per attribute, with the same precedence
+    # as get_world_pose/get_local_pose: world pose attributes (usdrt.Rt.Xformable), then the Fabric hierarchy matrices
+    fabric_stage = get_current_stage(fabric=True)
+    unique_paths = tuple(dict.fromkeys(prim_paths))
+    unique_indices = {prim_path: i for i, prim_path in enumerate(unique_paths)}
+    indices = np.array([unique_indices[prim_path] for prim_path in prim_paths], dtype=np.int64)
+    _index_fabric_prims(fabric_stage, unique_paths)
+
+    found, positions, orientations = _read_fabric_world_poses(fabric_stage, len(unique_paths))
+    found, positions, orientations = found[indices], positions[indices], orientations[indices]
+    if found.any():
+        world_matrices = _compose_transforms(positions[found], orientations[found])
+        if local:
+            # with respect to the world transform of the parent prim (from USD, without scale) as get_local_pose does
+            parent_matrices = _get_usd_transforms(
+                [prims[i].GetParent() for i in np.flatnonzero(found)], xform_cache, local=False
+            )
+            norms = np.linalg.norm(parent_matrices[:, :3, :3], axis=2, keepdims=True)
+            parent_matrices[:, :3, :3] /= np.where(norms > 0.0, norms, 1.0)
+            world_matrices = np.matmul(world_matrices, np.linalg.inv(parent_matrices))
+        matrices[found] = world_matrices
+
+    if not found.all():
+        if not local:
+            _get_fabric_hierarchy().update_world_xforms()
+        attribute = "omni:fabric:localMatrix" if local else "omni:fabric:worldMatrix"
+        found_matrices, fabric_matrices = _read_fabric_matrices(fabric_stage, len(unique_paths), attribute)
+        found_matrices = found_matrices[indices] & ~found
+        matrices[found_matrices] = fabric_matrices[indices][found_matrices]
+        found |= found_matrices
+    return found
+
+
+def _get_transforms(
+    prim_paths: typing.List[str], fabric: bool, xform_cache: typing.Optional[UsdGeom.XformCache], local: bool
+) -> np.ndarray:
+    stage = get_current_stage()
+    prims = [stage.GetPrimAtPath(prim_path) for prim_path in prim_paths]
+    for prim_path, prim in zip(prim_paths, prims):
+        if not prim.IsValid():
+            raise Exception(f"Prim path is not valid: {prim_path}")
+    matrices = np.empty((len(prims), 4, 4), dtype=np.float64)
+    usd_indices = np.arange(len(prims))
+    if fabric and len(prims):
+        usd_indices = np.flatnonzero(~_get_fabric_transforms(prims, prim_paths, matrices, xform_cache, local))
+    if len(usd_indices):
+        matrices[usd_indices] = _get_usd_transforms([prims[i] for i in usd_indices], xform_cache, local)
+    return matrices
+
+
+def get_world_poses(
+    prim_paths: typing.List[str], fabric: bool = False, xform_cache: typing.Optional[UsdGeom.XformCache] = None
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Get the world poses of many prims in a single call
+
+    Batched version of :py:func:`get_world_pose`. The transforms are read from a shared ``UsdGeom.XformCache``
+    (so that the transforms of common ancestors are computed only once) or from Fabric, and decomposed into
+    positions and orientations as a single array operation.
+
+    With Fabric, the prims are read as :py:func:`get_world_pose` reads them, in a single pass for all the prims:
+    the world position and orientation attributes (e.g.: written by PhysX) first, then the world matrices computed
+    by the Fabric hierarchy. The prims are indexed in Fabric (``isaacsim:xforms:index`` attribute) when the queried
+    prim paths change from the previous call, so querying the same prims repeatedly is the fastest.
+
+    Args:
+        prim_paths (typing.List[str]): prim paths to get the world poses for
+        fabric (bool, optional): True to read the world poses from Fabric (prims not present in Fabric are
+            computed from USD). Defaults to False.
+        xform_cache (typing.Optional[UsdGeom.XformCache], optional): USD transform cache to (re)use.
+            Defaults to None (a new cache is created for the call). The cache is not cleared by this function:
+            its transforms go stale once the stage is edited (or simulated), so call ``xform_cache.Clear()``
+            before reusing it after any change.
+
+    Raises:
+        Exception: If any of the prim paths is not valid
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray]: positions (N, 3) and quaternion orientations (N, 4), scalar-first (w, x, y, z)
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.xforms as xforms_utils
+        >>>
+        >>> positions, orientations = xforms_utils.get_world_poses(["/World/Cube", "/World/Sphere"])
+        >>> positions
+        [[ 1.  0.  0.]
+         [-1.  0.  0.]]
+        >>> orientations
+        [[1. 0. 0. 0.]
+         [1. 0. 0. 0.]]
+    """
+    return _decompose_transforms(_get_transforms(prim_paths, fabric, xform_cache, local=False))
+
+
+def get_local_poses(
+    prim_paths: typing.List[str], fabric: bool = True, xform_cache: typing.Optional[UsdGeom.XformCache] = None
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Get the local poses (with respect to the parent prims) of many prims in a single call
+
+    Batched version of :py:func:`get_local_pose`. See :py:func:`get_world_poses` for details.
+
+    Args:
+        prim_paths (typing.List[str]): prim paths to get the local poses for
+        fabric (bool, optional): True to read the local poses from Fabric, as :py:func:`get_local_pose` does (prims
+            not present in Fabric are computed from USD). Defaults to True, as :py:func:`get_local_pose` prefers Fabric.
+        xform_cache (typing.Optional[UsdGeom.XformCache], optional): USD transform cache to (re)use.
+            Defaults to None (a new cache is created for the call). The cache is not cleared by this function:
+            call ``xform_cache.Clear()`` before reusing it after the stage is edited (or simulated).
+
+    Raises:
+        Exception: If any of the prim paths is not valid
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray]: positions (N, 3) and quaternion orientations (N, 4), scalar-first (w, x, y, z)
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import isaacsim.core.utils.xforms as xforms_utils
+        >>>
+        >>> positions, orientations = xforms_utils.get_local_poses(["/World/Xform/Cube", "/World/Xform/Sphere"])
+    """
+    return _decompose_transforms(_get_transforms(prim_paths, fabric, xform_cache, local=True))
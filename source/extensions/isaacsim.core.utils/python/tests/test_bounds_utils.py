@@ -13,18 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import omni.kit.commands
 import omni.kit.test
 from isaacsim.core.utils.bounds import (
+    BoundsTracker,
     compute_aabb,
+    compute_aabbs,
     compute_combined_aabb,
     compute_obb,
     compute_obb_corners,
+    compute_obbs,
+    compute_obbs_corners,
     create_bbox_cache,
     recompute_extents,
 )
 from isaacsim.core.utils.stage import get_current_stage
-from pxr import UsdGeom
+from pxr import Sdf, UsdGeom
 
 
 class TestBounds(omni.kit.test.AsyncTestCase):
@@ -410,3 +415,77 @@ class TestBounds(omni.kit.test.AsyncTestCase):
         ]
         for a, b in zip(cornersC.flatten().tolist(), cornersC_expected):
             self.assertAlmostEqual(a, b)
+
+    def _define_cubes(self, stage):
+        paths = []
+        for i in range(4):
+            path = f"/World/Xform_{i}/Cube"
+            UsdGeom.Xform.Define(stage, f"/World/Xform_{i}").AddTranslateOp().Set((2.0 * i, -1.0 * i, 0.5 * i))
+            cube = UsdGeom.Cube.Define(stage, path)
+            cube.CreateSizeAttr(1.0 + i)
+            recompute_extents(cube.GetPrim())
+            cube.AddScaleOp().Set((1.0, 2.0, 0.5))
+            cube.AddRotateXYZOp().Set((15.0 * i, 30.0, 45.0 * i))
+            paths.append(path)
+        return paths
+
+    async def test_batched_bounds(self):
+        stage = get_current_stage()
+        paths = self._define_cubes(stage)
+        await omni.kit.app.get_app().next_update_async()
+        cache = create_bbox_cache()
+
+        aabbs = compute_aabbs(cache, paths)
+        self.assertEqual(aabbs.shape, (len(paths), 6))
+        centroids, axes, half_extents = compute_obbs(cache, paths)
+        self.assertEqual(centroids.shape, (len(paths), 3))
+        self.assertEqual(axes.shape, (len(paths), 3, 3))
+        self.assertEqual(half_extents.shape, (len(paths), 3))
+        corners = compute_obbs_corners(cache, paths)
+        self.assertEqual(corners.shape, (len(paths), 8, 3))
+        for i, path in enumerate(paths):
+            self.assertTrue(np.allclose(aabbs[i], compute_aabb(cache, path)))
+            centroid, axis, half_extent = compute_obb(cache, path)
+            self.assertTrue(np.allclose(centroids[i], centroid))
+            self.assertTrue(np.allclose(axes[i], axis))
+            self.assertTrue(np.allclose(half_extents[i], half_extent))
+            self.assertTrue(np.allclose(corners[i], compute_obb_corners(cache, path)))
+        # include children
+        aabbs = compute_aabbs(cache, ["/World", "/World/Xform_0"], include_children=True)
+        self.assertTrue(np.allclose(aabbs[0], compute_aabb(cache, "/World", include_children=True)))
+        self.assertTrue(np.allclose(aabbs[1], compute_aabb(cache, "/World/Xform_0", include_children=True)))
+        # empty list
+        self.assertEqual(compute_aabbs(cache, []).shape, (0, 6))
+        self.assertEqual(compute_obbs_corners(cache, []).shape, (0, 8, 3))
+
+    async def test_bounds_tracker(self):
+        stage = get_current_stage()
+        paths = self._define_cubes(stage)
+        await omni.kit.app.get_app().next_update_async()
+
+        tracker = BoundsTracker(paths)
+        self.assertEqual(tracker.num_dirty, len(paths))
+        aabbs = tracker.compute_aabbs()
+        self.assertEqual(tracker.num_dirty, 0)
+        self.assertTrue(np.allclose(aabbs, compute_aabbs(create_bbox_cache(), paths)))
+        # unrelated changes don't trigger recomputation
+        stage.GetPrimAtPath(paths[0]).CreateAttribute("custom:value", Sdf.ValueTypeNames.Float).Set(1.0)
+        self.assertEqual(tracker.num_dirty, 0)
+        # ancestor transformation change
+        stage.GetPrimAtPath("/World/Xform_1").GetAttribute("xformOp:translate").Set((10.0, 10.0, 10.0))
+        self.assertEqual(tracker.num_dirty, 1)
+        aabbs = tracker.compute_aabbs()
+        self.assertTrue(np.allclose(aabbs, compute_aabbs(create_bbox_cache(), paths)))
+        # geometry change
+        cube = UsdGeom.Cube(stage.GetPrimAtPath(paths[2]))
+        cube.GetSizeAttr().Set(5.0)
+        recompute_extents(cube.GetPrim())
+        self.assertEqual(tracker.num_dirty, 1)
+        corners = tracker.compute_obbs_corners()
+        self.assertTrue(np.allclose(corners, compute_obbs_corners(create_bbox_cache(), paths)))
+        # removed prim
+        stage.RemovePrim(paths[3])
+        aabbs = tracker.compute_aabbs()
+        self.assertTrue(np.isnan(aabbs[3]).all())
+        self.assertTrue(np.allclose(aabbs[:3], compute_aabbs(create_bbox_cache(), paths[:3])))
+        tracker.destroy()
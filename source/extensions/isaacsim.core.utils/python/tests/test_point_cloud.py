@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import omni.kit.test
+from isaacsim.core.utils.point_cloud import (
+    PointCloudProcessor,
+    compute_crop_mask,
+    dequantize_points,
+    get_render_product_point_cloud_processor,
+    quantize_points,
+    set_render_product_point_cloud_processor,
+    voxel_downsample,
+)
+
+
+class TestPointCloud(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._points = np.random.default_rng(0).uniform(-10.0, 10.0, (10000, 3)).astype(np.float32)
+
+    async def tearDown(self):
+        pass
+
+    async def test_voxel_downsample(self):
+        points, indices = voxel_downsample(self._points, 1.0)
+        voxels = np.floor(self._points)
+        self.assertEqual(points.shape[0], np.unique(voxels, axis=0).shape[0])
+        np.testing.assert_array_equal(points, self._points[indices])
+        # first point of each voxel, in input order
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        centroids, centroid_indices = voxel_downsample(self._points, 1.0, reduction="centroid")
+        np.testing.assert_array_equal(centroid_indices, indices)
+        np.testing.assert_array_equal(np.floor(centroids), voxels[indices])
+        with self.assertRaises(ValueError):
+            voxel_downsample(self._points, 1.0, reduction="median")
+
+    async def test_crop_mask(self):
+        distances = np.linalg.norm(self._points, axis=1)
+        azimuths = np.degrees(np.arctan2(self._points[:, 1], self._points[:, 0]))
+        mask = compute_crop_mask(self._points, range_limits=(1.0, 5.0))
+        np.testing.assert_array_equal(mask, (distances >= 1.0) & (distances <= 5.0))
+        mask = compute_crop_mask(self._points, azimuth_limits=(-45.0, 45.0))
+        np.testing.assert_array_equal(mask, np.abs(azimuths) <= 45.0)
+        # interval wrapping around 180 degrees
+        mask = compute_crop_mask(self._points, azimuth_limits=(135.0, -135.0))
+        np.testing.assert_array_equal(mask, np.abs(azimuths) >= 135.0)
+        mask = compute_crop_mask(self._points, elevation_limits=(0.0, 90.0))
+        np.testing.assert_array_equal(mask, self._points[:, 2] >= 0.0)
+
+    async def test_quantization(self):
+        quantized, resolution, origin, clipped = quantize_points(self._points)
+        self.assertEqual(quantized.dtype, np.int16)
+        self.assertEqual(clipped, 0)
+        decoded = dequantize_points(quantized, resolution, origin)
+        self.assertLessEqual(np.abs(decoded - self._points).max(), resolution.max())
+        quantized, resolution, origin, clipped = quantize_points(self._points, resolution=0.0001)
+        self.assertGreater(clipped, 0)
+
+    async def test_processor(self):
+        intensities = np.arange(self._points.shape[0], dtype=np.float32)
+        processor = PointCloudProcessor(voxel_size=0.5, range_limits=(0.0, 8.0), quantize=True)
+        output = processor.process(self._points, {"intensity": intensities})
+        self.assertEqual(output["points"].dtype, np.int16)
+        np.testing.assert_array_equal(output["intensity"], intensities[output["indices"]])
+        decoded = dequantize_points(output["points"], output["resolution"], output["origin"])
+        np.testing.assert_allclose(decoded, self._points[output["indices"]], atol=output["resolution"].max())
+        stats = processor.stats
+        self.assertEqual(stats["input_points"], self._points.shape[0])
+        self.assertEqual(stats["output_points"], output["points"].shape[0])
+        self.assertEqual(stats["input_bytes"], self._points.nbytes + intensities.nbytes)
+        self.assertAlmostEqual(stats["compression_ratio"], stats["input_bytes"] / stats["output_bytes"])
+        self.assertGreater(stats["compression_ratio"], 1.0)
+        processor.process(self._points)
+        self.assertEqual(processor.stats["processed_count"], 2)
+        self.assertEqual(processor.stats["total_input_points"], 2 * self._points.shape[0])
+        processor.reset_stats()
+        self.assertEqual(processor.stats["processed_count"], 0)
+
+    async def test_render_product_processor(self):
+        processor = PointCloudProcessor(voxel_size=0.5)
+        self.assertIsNone(get_render_product_point_cloud_processor("/Render/RenderProduct_Lidar"))
+        set_render_product_point_cloud_processor("/Render/RenderProduct_Lidar", processor)
+        self.assertIs(get_render_product_point_cloud_processor("/Render/RenderProduct_Lidar"), processor)
+        self.assertIsNone(get_render_product_point_cloud_processor("/Render/RenderProduct_Camera"))
+        set_render_product_point_cloud_processor("/Render/RenderProduct_Lidar", None)
+        self.assertIsNone(get_render_product_point_cloud_processor("/Render/RenderProduct_Lidar"))
@@ -16,7 +16,15 @@
 
 import carb
 import omni.kit.test
-from isaacsim.core.utils.prims import define_prim, get_prim_attribute_value, set_prim_attribute_value
+from isaacsim.core.utils.prims import (
+    define_prim,
+    get_all_matching_child_prims,
+    get_first_matching_child_prim,
+    get_prim_attribute_value,
+    get_prim_path,
+    set_prim_attribute_value,
+    traverse_prims,
+)
 from pxr import Gf, Sdf
 
 
@@ -162,3 +170,40 @@ class TestPrims(omni.kit.test.AsyncTestCase):
                     set_prim_attribute_value(prim_path, attribute_name=attribute_name, value=value, fabric=fabric)
                 except Exception as e:
                     carb.log_error(f"[Set '{attribute_name}' ({attribute_type}) to '{value}'] {e}")
+
+    async def test_traverse_prims(self):
+        for path in ["/World/A", "/World/A/B", "/World/A/B/C", "/World/D", "/World/D/E"]:
+            define_prim(path, "Xform")
+        await omni.kit.app.get_app().next_update_async()
+        # depth-first (pre-order)
+        paths = [get_prim_path(prim) for prim in traverse_prims("/World")]
+        self.assertListEqual(paths, ["/World", "/World/A", "/World/A/B", "/World/A/B/C", "/World/D", "/World/D/E"])
+        # breadth-first
+        paths = [get_prim_path(prim) for prim in traverse_prims("/World", breadth_first=True)]
+        self.assertListEqual(paths, ["/World", "/World/A", "/World/D", "/World/A/B", "/World/D/E", "/World/A/B/C"])
+        # depth limit
+        for breadth_first in [False, True]:
+            paths = [get_prim_path(prim) for prim in traverse_prims("/World", depth=1, breadth_first=breadth_first)]
+            self.assertListEqual(sorted(paths), ["/World", "/World/A", "/World/D"])
+        self.assertRaises(ValueError, lambda: list(traverse_prims("/World", depth=-1)))
+        # pruning and predicate
+        paths = [
+            get_prim_path(prim)
+            for prim in traverse_prims(
+                "/World", predicate=lambda path: path != "/World", prune=lambda path: path == "/World/A"
+            )
+        ]
+        self.assertListEqual(paths, ["/World/A", "/World/D", "/World/D/E"])
+        # fabric
+        paths = [str(prim.GetPath()) for prim in traverse_prims("/World", fabric=True)]
+        self.assertListEqual(
+            sorted(paths), ["/World", "/World/A", "/World/A/B", "/World/A/B/C", "/World/D", "/World/D/E"]
+        )
+        # invalid root
+        self.assertListEqual(list(traverse_prims("/Invalid")), [])
+        # helpers built on top of the traversal
+        paths = [get_prim_path(prim) for prim in get_all_matching_child_prims("/World", depth=2)]
+        self.assertListEqual(paths, ["/World", "/World/A", "/World/D", "/World/A/B", "/World/D/E"])
+        prim = get_first_matching_child_prim("/World", lambda path: path.endswith("E"))
+        self.assertEqual(get_prim_path(prim), "/World/D/E")
+        self.assertIsNone(get_first_matching_child_prim("/World", lambda path: False))
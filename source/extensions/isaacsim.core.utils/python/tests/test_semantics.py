@@ -32,6 +32,7 @@ from isaacsim.core.utils.semantics import (
     count_labels_in_scene,
     count_semantics_in_scene,
     get_labels,
+    get_semantics_index,
     remove_all_semantics,
     remove_labels,
     upgrade_prim_semantics_to_labels,
@@ -367,3 +368,53 @@ class TestSemantics(omni.kit.test.AsyncTestCase):
         self.assertEqual(labels_dict_subtree.get("nested", 0), 1)
         # Expect 3 keys: cube, nested, and missing_labels (even if 0)
         self.assertEqual(len(labels_dict_subtree), 3)
+
+    async def test_semantics_index(self):
+        """Test that the semantic index is built from the stage and stays current after stage changes."""
+        cube_paths = self.create_test_environment_new_labels()
+        index = get_semantics_index()
+        self.assertIs(index, get_semantics_index())
+        self.assertListEqual(index.get_prims_with_label("cube"), cube_paths[:2])
+        self.assertListEqual(index.get_labeled_prims(), [cube_paths[0], cube_paths[4], cube_paths[1], cube_paths[2]])
+        self.assertListEqual(index.get_prims_with_label("nested", instance_name="shape"), [cube_paths[4]])
+        self.assertListEqual(index.get_prims_with_label("nested", instance_name="class"), [])
+        self.assertDictEqual(index.get_labels(cube_paths[2]), {"class": ["sphere"]})
+        self.assertDictEqual(index.get_labels(cube_paths[3]), {})
+        label_ids = index.get_label_ids()
+        self.assertSetEqual(set(label_ids.keys()), {"cube", "sphere", "nested"})
+        self.assertDictEqual(index.get_id_to_labels(), {v: k for k, v in label_ids.items()})
+
+        # add labels
+        add_labels(prim=get_prim_at_path(cube_paths[3]), labels=["cube"], instance_name="class")
+        self.assertEqual(count_labels_in_scene().get("cube", 0), 3)
+        self.assertEqual(count_labels_in_scene().get("missing_labels", 0), 0)
+        self.assertListEqual(check_missing_labels(), [])
+        self.assertListEqual(index.get_prims_with_label("cube"), [cube_paths[0], cube_paths[1], cube_paths[3]])
+
+        # modify labels
+        add_labels(prim=get_prim_at_path(cube_paths[0]), labels=["sphere"], instance_name="class")
+        self.assertDictEqual(index.get_labels(cube_paths[0]), {"class": ["sphere"]})
+        self.assertNotIn(cube_paths[0], index.get_prims_with_label("cube"))
+        # re-indexed prims keep their stage traversal order
+        self.assertListEqual(index.get_prims_with_label("sphere"), [cube_paths[0], cube_paths[2]])
+        self.assertListEqual(
+            index.get_labeled_prims(), [cube_paths[0], cube_paths[4], cube_paths[1], cube_paths[2], cube_paths[3]]
+        )
+        self.assertIn([cube_paths[0], "sphere"], check_incorrect_labels())
+        self.assertEqual(index.get_label_ids()["cube"], label_ids["cube"])
+
+        # remove labels
+        remove_labels(get_prim_at_path(cube_paths[1]))
+        self.assertIn(cube_paths[1], check_missing_labels())
+
+        # remove prims (including the nested one)
+        omni.kit.commands.execute("DeletePrims", paths=[cube_paths[0]])
+        self.assertListEqual(index.get_prims_with_label("nested"), [])
+        self.assertNotIn("nested", count_labels_in_scene())
+        self.assertNotIn("nested", index.get_label_ids())
+        self.assertDictEqual(index.get_labels(cube_paths[4]), {})
+
+        # new stage
+        await omni.usd.get_context().new_stage_async()
+        self.assertIsNot(index, get_semantics_index())
+        self.assertDictEqual(count_labels_in_scene(), {"missing_labels": 0})
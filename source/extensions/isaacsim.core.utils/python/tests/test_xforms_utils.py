@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2021-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import carb
+import numpy as np
+import omni.kit.app
+import omni.kit.test
+import omni.timeline
+from isaacsim.core.utils.prims import create_prim
+from isaacsim.core.utils.xforms import get_local_pose, get_local_poses, get_world_pose, get_world_poses
+from pxr import UsdGeom, UsdPhysics
+
+
+class TestXforms(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+
+    # After running each test
+    async def tearDown(self):
+        pass
+
+    def assertSameOrientation(self, a, b):
+        # q and -q represent the same rotation
+        self.assertTrue(np.allclose(a, b, atol=1e-5) or np.allclose(a, -np.array(b), atol=1e-5))
+
+    async def test_batched_poses(self):
+        create_prim("/World/Xform", "Xform", translation=(1.0, 2.0, 3.0), orientation=(0.7071068, 0.0, 0.0, 0.7071068))
+        create_prim("/World/Xform/Cube", "Cube", translation=(1.0, 0.0, 0.0), scale=(2.0, 3.0, 4.0))
+        create_prim("/World/Xform/Cube/Sphere", "Sphere", translation=(0.0, 1.0, 0.0), orientation=(0.0, 1.0, 0.0, 0.0))
+        create_prim("/World/Cone", "Cone", translation=(-1.0, 0.0, 0.0))
+        prim_paths = ["/World/Xform", "/World/Xform/Cube", "/World/Xform/Cube/Sphere", "/World/Cone"]
+
+        for fabric in [False, True]:
+            positions, orientations = get_world_poses(prim_paths, fabric=fabric)
+            self.assertEqual(positions.shape, (4, 3))
+            self.assertEqual(orientations.shape, (4, 4))
+            for i, prim_path in enumerate(prim_paths):
+                position, orientation = get_world_pose(prim_path)
+                self.assertTrue(np.allclose(positions[i], position, atol=1e-5))
+                self.assertSameOrientation(orientations[i], orientation)
+        # shared xform cache
+        xform_cache = UsdGeom.XformCache()
+        positions, _ = get_world_poses(prim_paths, xform_cache=xform_cache)
+        self.assertTrue(np.allclose(positions[-1], [-1.0, 0.0, 0.0], atol=1e-5))
+        # local poses
+        positions, orientations = get_local_poses(prim_paths)
+        for i, prim_path in enumerate(prim_paths):
+            position, orientation = get_local_pose(prim_path)
+            self.assertTrue(np.allclose(positions[i], position, atol=1e-5))
+            self.assertSameOrientation(orientations[i], orientation)
+        # empty input and invalid paths
+        positions, orientations = get_world_poses([])
+        self.assertEqual(positions.shape, (0, 3))
+        self.assertEqual(orientations.shape, (0, 4))
+        with self.assertRaises(Exception):
+            get_world_poses(["/World/Invalid"])
+
+    async def test_batched_poses_physics(self):
+        # rigid bodies moved by PhysX, with the poses written to Fabric only
+        settings = carb.settings.get_settings()
+        update_to_usd = settings.get_as_bool("/physics/updateToUsd")
+        ext_manager = omni.kit.app.get_app().get_extension_manager()
+        fabric_enabled = ext_manager.is_extension_enabled("omni.physx.fabric")
+        ext_manager.set_extension_enabled_immediate("omni.physx.fabric", True)
+        settings.set_bool("/physics/updateToUsd", False)
+        timeline = omni.timeline.get_timeline_interface()
+        try:
+            UsdPhysics.Scene.Define(omni.usd.get_context().get_stage(), "/World/PhysicsScene")
+            create_prim("/World/Xform", "Xform", translation=(0.0, 0.0, 1.0))
+            prim_paths = ["/World/Cube_0", "/World/Xform/Cube_1", "/World/Xform/Cube_2"]
+            for i, prim_path in enumerate(prim_paths):
+                cube = create_prim(
+                    prim_path, "Cube", translation=(3.0 * i, 0.0, 1.0), orientation=(0.9659, 0.0, 0.2588, 0.0)
+                )
+                UsdPhysics.RigidBodyAPI.Apply(cube)
+                UsdPhysics.CollisionAPI.Apply(cube)
+            timeline.play()
+            for _ in range(30):
+                await omni.kit.app.get_app().next_update_async()
+            timeline.pause()
+            await omni.kit.app.get_app().next_update_async()
+
+            positions, orientations = get_world_poses(prim_paths, fabric=True)
+            local_positions, local_orientations = get_local_poses(prim_paths)
+            usd_positions, _ = get_world_poses(prim_paths, fabric=False)
+            for i, prim_path in enumerate(prim_paths):
+                position, orientation = get_world_pose(prim_path, fabric=True)
+                self.assertTrue(np.allclose(positions[i], position, atol=1e-5), f"{prim_path}: {positions[i]}")
+                self.assertSameOrientation(orientations[i], orientation)
+                position, orientation = get_local_pose(prim_path)
+                self.assertTrue(np.allclose(local_positions[i], position, atol=1e-5), f"{prim_path}: {position}")
+                self.assertSameOrientation(local_orientations[i], orientation)
+                # the bodies fell, but USD was not updated
+                self.assertLess(positions[i][2], usd_positions[i][2] - 0.1)
+            # querying another set of prims re-indexes them
+            positions, _ = get_world_poses(prim_paths[::-1], fabric=True)
+            self.assertTrue(np.allclose(positions, get_world_poses(prim_paths, fabric=True)[0][::-1], atol=1e-5))
+        finally:
+            timeline.stop()
+            settings.set_bool("/physics/updateToUsd", update_to_usd)
+            ext_manager.set_extension_enabled_immediate("omni.physx.fabric", fabric_enabled)
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import omni.kit.window.property
+from isaacsim.replicator.behavior.behavior_scheduler import get_behavior_scheduler
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
@@ -51,7 +52,6 @@ class BaseBehavior(BehaviorScript):
         if self.__class__.__name__ == "BaseBehavior":
             return
 
-        self._update_counter = 0
         self._interval = 0
 
         # Expose the variables as USD attributes
@@ -62,6 +62,7 @@ class BaseBehavior(BehaviorScript):
 
     def on_destroy(self):
         """Called when the script is unassigned from a prim."""
+        get_behavior_scheduler().unregister(self)
         # Exposed variables should be removed if the script is no longer assigned to the prim
         if check_if_exposed_variables_should_be_removed(self.prim, __file__):
             remove_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -71,27 +72,17 @@ class BaseBehavior(BehaviorScript):
         """Called when `play` is pressed."""
         self._interval = self._get_exposed_variable("interval")
         print(f"[BaseBehavior][{self.prim_path}] on_play(); interval: {self._interval}")
+        # The scheduler applies the behavior every `interval` frames while playing
+        get_behavior_scheduler().register(self, self._interval)
 
     def on_stop(self):
         """Called when `stop` is pressed."""
         print(f"[BaseBehavior][{self.prim_path}] on_stop()")
+        get_behavior_scheduler().unregister(self)
         self._interval = 0
-        self._update_counter = 0
-
-    def on_update(self, current_time: float, delta_time: float):
-        """Called on per frame update events that occur when `playing`"""
-        if delta_time <= 0:
-            return
-        if self._interval <= 0:
-            self._apply_behavior()
-        else:
-            self._update_counter += 1
-            if self._update_counter >= self._interval:
-                self._apply_behavior()
-                self._update_counter = 0
 
     def _apply_behavior(self):
-        """Pure virtual method that must be implemented by subclasses."""
+        """Pure virtual method that must be implemented by subclasses, called by the behavior scheduler."""
         raise NotImplementedError
 
     def _get_exposed_variable(self, attr_name):
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import time
+
+import carb
+import omni.timeline
+
+
+class _ScheduledBehavior:
+    """Scheduling state and timing statistics of a registered behavior."""
+
+    __slots__ = ("behavior", "period", "order", "due_frame", "active", "calls", "total_time")
+
+    def __init__(self, behavior, period: int, order: int, due_frame: int):
+        self.behavior = behavior
+        self.period = period
+        self.order = order
+        self.due_frame = due_frame
+        self.active = True
+        self.calls = 0
+        self.total_time = 0.0
+
+
+class BehaviorScheduler:
+    """
+    Central scheduler running the updates of the registered behavior scripts.
+
+    Instead of every behavior script counting its own update interval in `on_update`, behaviors register with the
+    scheduler which keeps a priority queue of the frames at which they are due. A single timeline subscription advances
+    the frame counter and only the due behaviors are popped and applied, so idle behaviors cost nothing per frame.
+
+    A registered behavior must implement `_apply_behavior()`. Due behaviors of the same type are coalesced into a
+    single update if the type implements a `_apply_behaviors(behaviors)` classmethod. By default only behaviors that
+    are consecutive in registration order are coalesced, preserving the order in which the behaviors are applied (and
+    therefore the order of the random draws of seeded runs); `group_by_type` coalesces all the due behaviors of a type.
+    """
+
+    def __init__(self, group_by_type: bool = False):
+        self._group_by_type = group_by_type
+        self._queue = []
+        self._entries = {}
+        self._order = itertools.count()
+        self._frame = 0
+        self._timeline_sub = None
+
+    @property
+    def frame(self) -> int:
+        """Number of frames (timeline ticks with a positive delta time) processed by the scheduler."""
+        return self._frame
+
+    @property
+    def group_by_type(self) -> bool:
+        """Whether all the due behaviors of the same type are coalesced, or only consecutive ones."""
+        return self._group_by_type
+
+    @group_by_type.setter
+    def group_by_type(self, value: bool):
+        self._group_by_type = value
+
+    def register(self, behavior, interval: int = 0) -> None:
+        """Register (or re-register with a new interval) a behavior to be applied every `interval` frames.
+
+        An interval of 0 means every frame. The first update happens `interval` frames after the registration.
+        """
+        self.unregister(behavior)
+        period = max(int(interval or 0), 1)
+        entry = _ScheduledBehavior(behavior, period, next(self._order), self._frame + period)
+        self._entries[id(behavior)] = entry
+        heapq.heappush(self._queue, (entry.due_frame, entry.order, entry))
+        if self._timeline_sub is None:
+            self._timeline_sub = (
+                omni.timeline.get_timeline_interface()
+                .get_timeline_event_stream()
+                .create_subscription_to_pop_by_type(
+                    int(omni.timeline.TimelineEventType.CURRENT_TIME_TICKED), self._on_timeline_tick
+                )
+            )
+
+    def unregister(self, behavior) -> None:
+        """Unregister a behavior, its queued updates are dropped."""
+        entry = self._entries.pop(id(behavior), None)
+        if entry is None:
+            return
+        # Stale queue items are discarded lazily when popped
+        entry.active = False
+        if not self._entries:
+            self._queue.clear()
+            self._timeline_sub = None
+
+    def is_registered(self, behavior) -> bool:
+        """Check if the behavior is registered with the scheduler."""
+        return id(behavior) in self._entries
+
+    def update(self, delta_time: float) -> int:
+        """Advance the scheduler by one frame and apply the due behaviors.
+
+        Args:
+            delta_time (float): The frame delta time, frames with a non-positive delta time are skipped.
+
+        Returns:
+            int: The number of applied behaviors.
+        """
+        if delta_time <= 0:
+            return 0
+        self._frame += 1
+        due = []
+        while self._queue and self._queue[0][0] <= self._frame:
+            _, _, entry = heapq.heappop(self._queue)
+            if entry.active:
+                due.append(entry)
+        if not due:
+            return 0
+        # Apply the behaviors in registration order
+        due.sort(key=lambda entry: entry.order)
+        for batch in self._coalesce(due):
+            self._apply(batch)
+        # Schedule the next updates of the behaviors that are still registered
+        for entry in due:
+            if entry.active:
+                entry.due_frame = self._frame + entry.period
+                heapq.heappush(self._queue, (entry.due_frame, entry.order, entry))
+        return len(due)
+
+    def get_timings(self) -> dict:
+        """Get the number of updates and the time spent (in seconds) per registered behavior.
+
+        The time of a coalesced update is split evenly between the behaviors of the batch.
+
+        Returns:
+            dict: Per behavior (keyed by its prim path, or name) the behavior type, interval, calls and total time.
+        """
+        timings = {}
+        for entry in sorted(self._entries.values(), key=lambda entry: entry.order):
+            behavior = entry.behavior
+            name = str(getattr(behavior, "prim_path", None) or behavior)
+            timings[f"{type(behavior).__name__}:{name}"] = {
+                "type": type(behavior).__name__,
+                "interval": entry.period,
+                "calls": entry.calls,
+                "total_time": entry.total_time,
+            }
+        return timings
+
+    def reset_timings(self) -> None:
+        """Reset the timing statistics of the registered behaviors."""
+        for entry in self._entries.values():
+            entry.calls = 0
+            entry.total_time = 0.0
+
+    def destroy(self) -> None:
+        """Unregister all the behaviors and release the timeline subscription."""
+        for entry in self._entries.values():
+            entry.active = False
+        self._entries.clear()
+        self._queue.clear()
+        self._timeline_sub = None
+
+    def _on_timeline_tick(self, event) -> None:
+        self.update(event.payload["dt"])
+
+    def _coalesce(self, due: list) -> list:
+        if self._group_by_type:
+            batches = {}
+            for entry in due:
+                batches.setdefault(type(entry.behavior), []).append(entry)
+            return list(batches.values())
+        return [list(batch) for _, batch in itertools.groupby(due, key=lambda entry: type(entry.behavior))]
+
+    def _apply(self, batch: list) -> None:
+        apply_behaviors = getattr(type(batch[0].behavior), "_apply_behaviors", None)
+        if apply_behaviors is not None and len(batch) > 1:
+            start = time.perf_counter()
+            try:
+                apply_behaviors([entry.behavior for entry in batch])
+            except Exception as e:
+                carb.log_error(f"[BehaviorScheduler] Failed to apply {type(batch[0].behavior).__name__} batch: {e}")
+            elapsed = (time.perf_counter() - start) / len(batch)
+            for entry in batch:
+                entry.calls += 1
+                entry.total_time += elapsed
+            return
+        for entry in batch:
+            start = time.perf_counter()
+            try:
+                entry.behavior._apply_behavior()
+            except Exception as e:
+                carb.log_error(f"[BehaviorScheduler] Failed to apply {type(entry.behavior).__name__}: {e}")
+            entry.calls += 1
+            entry.total_time += time.perf_counter() - start
+
+
+_behavior_scheduler = None
+
+
+def get_behavior_scheduler() -> BehaviorScheduler:
+    """Get the behavior scheduler shared by all the behavior scripts."""
+    global _behavior_scheduler
+    if _behavior_scheduler is None:
+        _behavior_scheduler = BehaviorScheduler()
+    return _behavior_scheduler
+
+
+def destroy_behavior_scheduler() -> None:
+    """Destroy the shared behavior scheduler (e.g. on extension shutdown)."""
+    global _behavior_scheduler
+    if _behavior_scheduler is not None:
+        _behavior_scheduler.destroy()
+        _behavior_scheduler = None
@@ -13,13 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import random
-
 import carb
 import omni.kit.commands
 import omni.kit.window.property
 import omni.usd
+from isaacsim.replicator.behavior.behavior_scheduler import get_behavior_scheduler
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS
+from isaacsim.replicator.behavior.utils.authoring_utils import (
+    BatchAttributeWriter,
+    apply_queued_behaviors,
+    draw_uniform,
+)
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
@@ -71,10 +75,12 @@ class LightRandomizer(BehaviorScript):
 
     def on_init(self):
         """Called when the script is assigned to a prim."""
-        self._update_counter = 0
         self._interval = 0
         self._valid_prims = []
         self._initial_attributes = {}
+        self._color_attrs = []
+        self._intensity_attrs = []
+        self._writer = None
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -84,6 +90,7 @@ class LightRandomizer(BehaviorScript):
 
     def on_destroy(self):
         """Called when the script is unassigned from a prim."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
         # Exposed variables should be removed if the script is no longer assigned to the prim
         if check_if_exposed_variables_should_be_removed(self.prim, __file__):
@@ -96,23 +103,14 @@ class LightRandomizer(BehaviorScript):
         # Make sure the initial behavior is applied if the interval is larger than 0
         if self._interval > 0:
             self._apply_behavior()
+        # The scheduler applies the behavior every `interval` frames while playing
+        get_behavior_scheduler().register(self, self._interval)
 
     def on_stop(self):
         """Called when `stop` is pressed."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
 
-    def on_update(self, current_time: float, delta_time: float):
-        """Called on per frame update events that occur when `playing`."""
-        if delta_time <= 0:
-            return
-        if self._interval <= 0:
-            self._apply_behavior()
-        else:
-            self._update_counter += 1
-            if self._update_counter >= self._interval:
-                self._apply_behavior()
-                self._update_counter = 0
-
     def _setup(self):
         # Fetch the exposed attributes
         include_children = self._get_exposed_variable("includeChildren")
@@ -134,29 +132,53 @@ class LightRandomizer(BehaviorScript):
         self._initial_attributes = {}
         for prim in self._valid_prims:
             self._cache_initial_attributes(prim)
+        self._color_attrs = [prim.GetAttribute("inputs:color") for prim in self._valid_prims]
+        self._intensity_attrs = [prim.GetAttribute("inputs:intensity") for prim in self._valid_prims]
+        self._writer = BatchAttributeWriter(self.prim.GetStage())
 
     def _reset(self):
         # Restore original attributes
-        for prim, attrs in self._initial_attributes.items():
-            for attr_name, attr_value in attrs.items():
-                prim.GetAttribute(attr_name).Set(attr_value)
+        if self._writer is not None:
+            for prim, attrs in self._initial_attributes.items():
+                for attr_name, attr_value in attrs.items():
+                    attr = prim.GetAttribute(attr_name)
+                    if not attr:
+                        continue
+                    if attr_value is None:
+                        # No value was authored before the randomization
+                        attr.Clear()
+                    else:
+                        self._writer.set(attr, attr_value)
+            self._writer.flush()
 
         # Clear cached values
         self._valid_prims.clear()
         self._initial_attributes.clear()
-        self._update_counter = 0
+        self._color_attrs.clear()
+        self._intensity_attrs.clear()
+        self._writer = None
 
     def _apply_behavior(self):
-        for prim in self._valid_prims:
-            rand_color = (
-                random.uniform(self._min_color[0], self._max_color[0]),
-                random.uniform(self._min_color[1], self._max_color[1]),
-                random.uniform(self._min_color[2], self._max_color[2]),
-            )
-            prim.GetAttribute("inputs:color").Set(rand_color)
-
-            rand_intensity = random.uniform(self._intensity_range[0], self._intensity_range[1])
-            prim.GetAttribute("inputs:intensity").Set(rand_intensity)
+        # Randomize the color and intensity of all the lights and author them in a single change block
+        if self._writer is not None:
+            self._queue_behavior(self._writer)
+            self._writer.flush()
+
+    @classmethod
+    def _apply_behaviors(cls, behaviors):
+        # Apply the behavior of several instances (coalesced by the behavior scheduler) in a single change block
+        apply_queued_behaviors(behaviors)
+
+    def _queue_behavior(self, writer):
+        if not self._valid_prims:
+            return
+        # Per light values are drawn as (r, g, b, intensity)
+        low = (*self._min_color, self._intensity_range[0])
+        high = (*self._max_color, self._intensity_range[1])
+        values = draw_uniform(low, high, len(self._valid_prims)).tolist()
+        for color_attr, intensity_attr, (r, g, b, intensity) in zip(self._color_attrs, self._intensity_attrs, values):
+            writer.set(color_attr, Gf.Vec3f(r, g, b))
+            writer.set(intensity_attr, intensity)
 
     def _cache_initial_attributes(self, prim):
         if not prim.HasAttribute("inputs:intensity"):
@@ -13,11 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import random
-
 import carb
+import numpy as np
 import omni.kit.window.property
+from isaacsim.replicator.behavior.behavior_scheduler import get_behavior_scheduler
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS
+from isaacsim.replicator.behavior.utils.authoring_utils import (
+    BatchAttributeWriter,
+    XformOpCache,
+    apply_queued_behaviors,
+    draw_uniform,
+)
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
@@ -81,11 +87,13 @@ class LocationRandomizer(BehaviorScript):
         self._max_position = Gf.Vec3d(1.0, 1.0, 1.0)
         self._use_relative_frame = False
         self._target_prim = None
-        self._update_counter = 0
         self._interval = 0
         self._valid_prims = []
-        self._initial_locations = {}
-        self._target_offsets = {}
+        self._location_ops = []
+        self._initial_locations = np.zeros((0, 3))
+        self._target_offsets = np.zeros((0, 3))
+        self._xform_op_cache = XformOpCache()
+        self._writer = None
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -95,6 +103,7 @@ class LocationRandomizer(BehaviorScript):
 
     def on_destroy(self):
         """Called when the script is unassigned from a prim."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
         # Exposed variables should be removed if the script is no longer assigned to the prim
         if check_if_exposed_variables_should_be_removed(self.prim, __file__):
@@ -107,23 +116,14 @@ class LocationRandomizer(BehaviorScript):
         # Make sure the initial behavior is applied if the interval is larger than 0
         if self._interval > 0:
             self._apply_behavior()
+        # The scheduler applies the behavior every `interval` frames while playing
+        get_behavior_scheduler().register(self, self._interval)
 
     def on_stop(self):
         """Called when `stop` is pressed."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
 
-    def on_update(self, current_time: float, delta_time: float):
-        """Called on per frame update events that occur when `playing`."""
-        if delta_time <= 0:
-            return
-        if self._interval <= 0:
-            self._apply_behavior()
-        else:
-            self._update_counter += 1
-            if self._update_counter >= self._interval:
-                self._apply_behavior()
-                self._update_counter = 0
-
     def _setup(self):
         # Fetch the exposed attributes
         self._min_position = self._get_exposed_variable("range:minPosition")
@@ -157,97 +157,68 @@ class LocationRandomizer(BehaviorScript):
                         f"[{self.prim_path}] Target prim '{target_prim_path}' not found, not valid, or not Xformable."
                     )
 
-        # Save the initial locations (and relative offsets) of the prims
-        for prim in self._valid_prims:
-            self._initial_locations[prim] = self._get_location(prim)
-            if self._target_prim:
-                self._target_offsets[prim] = self._initial_locations[prim] - get_world_location(self._target_prim)
+        # Resolve the location ops (create a default translation if none exists) and save the initial locations
+        # (and relative offsets) of the prims
+        self._writer = BatchAttributeWriter(self.prim.GetStage())
+        self._location_ops = [self._xform_op_cache.get_location_op(prim) for prim in self._valid_prims]
+        self._initial_locations = np.array(
+            [self._xform_op_cache.get_location(prim) for prim in self._valid_prims], dtype=np.float64
+        ).reshape(-1, 3)
+        if self._target_prim:
+            self._target_offsets = self._initial_locations - np.array(get_world_location(self._target_prim))
 
     def _reset(self):
         # Set prims back to their initial locations
-        for prim, location in self._initial_locations.items():
-            self._set_location(prim, location)
+        if self._writer is not None:
+            for op, location in zip(self._location_ops, self._initial_locations.tolist()):
+                self._writer.set_location(op, location)
+            self._writer.flush()
         # Clear cached values
         self._valid_prims.clear()
-        self._initial_locations.clear()
-        self._target_offsets.clear()
+        self._location_ops.clear()
+        self._initial_locations = np.zeros((0, 3))
+        self._target_offsets = np.zeros((0, 3))
+        self._xform_op_cache.clear()
+        self._writer = None
         self._target_prim = None
         self._interval = 0
-        self._update_counter = 0
 
     def _apply_behavior(self):
-        # Run the randomization for each valid prim
-        for prim in self._valid_prims:
-            self._randomize_location(prim)
+        # Randomize the locations of all the valid prims and author them in a single change block
+        if self._writer is not None:
+            self._queue_behavior(self._writer)
+            self._writer.flush()
+
+    @classmethod
+    def _apply_behaviors(cls, behaviors):
+        # Apply the behavior of several instances (coalesced by the behavior scheduler) in a single change block
+        apply_queued_behaviors(behaviors)
+
+    def _queue_behavior(self, writer):
+        if not self._valid_prims:
+            return
+        for op, location in zip(self._location_ops, self._randomize_locations().tolist()):
+            writer.set_location(op, location)
 
     def _get_exposed_variable(self, attr_name):
         full_attr_name = f"{EXPOSED_ATTR_NS}:{self.BEHAVIOR_NS}:{attr_name}"
         return get_exposed_variable(self.prim, full_attr_name)
 
-    def _get_location(self, prim):
-        # Get the location of the prim based on the available xformOps, create a default translation if none exists
-        xformable = UsdGeom.Xformable(prim)
-        xform_ops = xformable.GetOrderedXformOps()
-
-        for op in xform_ops:
-            op_name = op.GetOpName()
-            if op_name == "xformOp:translate":
-                return op.Get()
-            elif op_name == "xformOp:transform":
-                transform_matrix = op.Get()
-                return Gf.Transform(transform_matrix).GetTranslation()
-
-        # If no translation op exists, create one with a default translation
-        translate_op = xformable.AddXformOp(UsdGeom.XformOp.TypeTranslate, UsdGeom.XformOp.PrecisionDouble)
-        default_translation = Gf.Vec3d(0.0, 0.0, 0.0)
-        translate_op.Set(default_translation)
-        return default_translation
-
-    def _set_location(self, prim, location: Gf.Vec3d):
-        # Set the location of the prim based on the available xformOps
-        xformable = UsdGeom.Xformable(prim)
-        xform_ops = xformable.GetOrderedXformOps()
-
-        # Look for a valid translation op to set the new rotation
-        for op in xform_ops:
-            op_name = op.GetOpName()
-            if op_name == "xformOp:translate":
-                op.Set(location)
-                return
-            elif op_name == "xformOp:transform":
-                transform_matrix = op.Get()
-                transform = Gf.Transform(transform_matrix)
-                transform.SetTranslation(location)
-                op.Set(transform.GetMatrix())
-                return
-
-        carb.log_warn(f"No valid location op found on {prim.GetPath()}")
-
-    def _randomize_location(self, prim):
-        # Generate a random offset within the bounds
-        random_offset = Gf.Vec3d(
-            random.uniform(self._min_position[0], self._max_position[0]),
-            random.uniform(self._min_position[1], self._max_position[1]),
-            random.uniform(self._min_position[2], self._max_position[2]),
-        )
-
-        # Initialize location
-        loc = random_offset
+    def _randomize_locations(self) -> np.ndarray:
+        # Generate random offsets within the bounds for all the prims
+        random_offsets = draw_uniform(self._min_position, self._max_position, len(self._valid_prims))
 
         # Handle the target prim if specified
         if self._target_prim:
-            target_loc = get_world_location(self._target_prim)
+            target_loc = np.array(get_world_location(self._target_prim))
 
             if self._use_relative_frame:
                 # Maintain the offset from the target prim
-                loc = target_loc + self._target_offsets[prim] + random_offset
-            else:
-                # Move the prim to the randomized location relative to the target prim
-                loc = target_loc + random_offset
-        else:
-            if self._use_relative_frame:
-                # Add the initial location if using the relative frame
-                loc += self._initial_locations[prim]
-
-        # Set the randomized location to the prim
-        self._set_location(prim, loc)
+                return target_loc + self._target_offsets + random_offsets
+            # Move the prims to the randomized location relative to the target prim
+            return target_loc + random_offsets
+
+        if self._use_relative_frame:
+            # Add the initial locations if using the relative frame
+            return self._initial_locations + random_offsets
+        return random_offsets
@@ -17,20 +17,16 @@ import asyncio
 
 import carb
 import omni.kit.window.property
+from isaacsim.replicator.behavior.behavior_scheduler import get_behavior_scheduler
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS
+from isaacsim.replicator.behavior.utils.authoring_utils import BatchAttributeWriter, XformOpCache
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
     get_exposed_variable,
     remove_exposed_variables,
 )
-from isaacsim.replicator.behavior.utils.scene_utils import (
-    calculate_look_at_rotation,
-    get_rotation_op_and_value,
-    get_world_location,
-    set_rotation_op_and_value,
-    set_rotation_with_ops,
-)
+from isaacsim.replicator.behavior.utils.scene_utils import calculate_look_at_rotation, get_world_location
 from omni.kit.scripting import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdGeom
 
@@ -86,10 +82,12 @@ class LookAtBehavior(BehaviorScript):
         self._target_location = Gf.Vec3d(0.0, 0.0, 0.0)
         self._target_prim = None
         self._up_axis = Gf.Vec3d(0.0, 0.0, 1.0)
-        self._update_counter = 0
         self._interval = 0
         self._valid_prims = []
-        self._initial_rotations = {}
+        self._rotation_ops = []
+        self._initial_rotations = []
+        self._xform_op_cache = XformOpCache()
+        self._writer = None
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -99,6 +97,7 @@ class LookAtBehavior(BehaviorScript):
 
     def on_destroy(self):
         """Called when the script is unassigned from a prim."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
         # Exposed variables should be removed if the script is no longer assigned to the prim
         if check_if_exposed_variables_should_be_removed(self.prim, __file__):
@@ -111,23 +110,14 @@ class LookAtBehavior(BehaviorScript):
         # Make sure the initial behavior is applied if the interval is larger than 0
         if self._interval > 0:
             self._apply_behavior()
+        # The scheduler applies the behavior every `interval` frames while playing
+        get_behavior_scheduler().register(self, self._interval)
 
     def on_stop(self):
         """Called when `stop` is pressed."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
 
-    def on_update(self, current_time: float, delta_time: float):
-        """Called on per frame update events that occur when `playing`."""
-        if delta_time <= 0:
-            return
-        if self._interval <= 0:
-            self._apply_behavior()
-        else:
-            self._update_counter += 1
-            if self._update_counter >= self._interval:
-                self._apply_behavior()
-                self._update_counter = 0
-
     def _setup(self):
         # Fetch the exposed attributes
         self._target_location = self._get_exposed_variable("targetLocation")
@@ -145,10 +135,10 @@ class LookAtBehavior(BehaviorScript):
             self._valid_prims = []
             carb.log_warn(f"[{self.prim_path}] No valid prims found.")
 
-        # Save the initial rotation op and value of the prims (create xformOp:orient if none present)
-        for prim in self._valid_prims:
-            rotation_data = get_rotation_op_and_value(prim)
-            self._initial_rotations[prim] = rotation_data
+        # Resolve the rotation ops (create xformOp:orient if none present) and save the initial rotation values
+        self._writer = BatchAttributeWriter(self.prim.GetStage())
+        self._rotation_ops = [self._xform_op_cache.get_rotation_op(prim) for prim in self._valid_prims]
+        self._initial_rotations = [self._xform_op_cache.get_rotation_value(prim) for prim in self._valid_prims]
 
         # Check if targetPrimPath is specified and retrieve the target prim
         if target_prim_path:
@@ -167,32 +157,49 @@ class LookAtBehavior(BehaviorScript):
 
     def _reset(self):
         # Set prims back to their initial rotations
-        for prim, rotation_data in self._initial_rotations.items():
-            rotation_op_name, rotation_value = rotation_data
-            set_rotation_op_and_value(prim, rotation_op_name, rotation_value)
+        if self._writer is not None:
+            for op, rotation_value in zip(self._rotation_ops, self._initial_rotations):
+                self._writer.set_rotation_value(op, rotation_value)
+            self._writer.flush()
         # Clear cached values
         self._valid_prims.clear()
+        self._rotation_ops.clear()
         self._initial_rotations.clear()
+        self._xform_op_cache.clear()
+        self._writer = None
         self._interval = 0
-        self._update_counter = 0
 
     def _apply_behavior(self):
-        target_location = self._get_target_location()
+        if not self._valid_prims or self._writer is None:
+            return
+        xform_cache = UsdGeom.XformCache()
+        target_location = self._get_target_location(xform_cache)
+
+        # Rotations are authored in a single change block per hierarchy level, the world location of a prim depends on
+        # the (new) rotations of its ancestors, so the pending rotations are flushed before processing a descendant
+        pending_paths = set()
+        for prim, op in zip(self._valid_prims, self._rotation_ops):
+            prim_path = prim.GetPath()
+            if pending_paths and any(path in pending_paths for path in prim_path.GetPrefixes()[:-1]):
+                self._writer.flush()
+                xform_cache.Clear()
+                pending_paths.clear()
 
-        for prim in self._valid_prims:
             # Get the world position of the current prim (camera) we want to orient towards the target
-            eye = get_world_location(prim)
+            eye = get_world_location(prim, xform_cache)
 
             # Calculate the look-at rotation
             look_at_rotation = calculate_look_at_rotation(eye, target_location, self._up_axis)
 
-            # Set the rotation using and existing xformOp (orient, rotate, transform) or create a new default xformOp:orient
-            set_rotation_with_ops(prim, look_at_rotation)
+            # Set the rotation using the existing xformOp (orient, rotate, transform) or the default xformOp:orient
+            self._writer.set_rotation(op, look_at_rotation)
+            pending_paths.add(prim_path)
+        self._writer.flush()
 
-    def _get_target_location(self):
+    def _get_target_location(self, xform_cache: UsdGeom.XformCache | None = None):
         # Fetches the target location from the prim or stored location
         if self._target_prim:
-            return get_world_location(self._target_prim)
+            return get_world_location(self._target_prim, xform_cache)
         return self._target_location
 
     def _get_exposed_variable(self, attr_name):
@@ -13,22 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import random
-
 import carb
 import omni.kit.window.property
+from isaacsim.replicator.behavior.behavior_scheduler import get_behavior_scheduler
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS
+from isaacsim.replicator.behavior.utils.authoring_utils import (
+    BatchAttributeWriter,
+    XformOpCache,
+    apply_queued_behaviors,
+    compose_euler_rotations,
+    draw_uniform,
+)
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
     get_exposed_variable,
     remove_exposed_variables,
 )
-from isaacsim.replicator.behavior.utils.scene_utils import (
-    get_rotation_op_and_value,
-    set_rotation_op_and_value,
-    set_rotation_with_ops,
-)
 from omni.kit.scripting import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdGeom
 
@@ -73,10 +74,12 @@ class RotationRandomizer(BehaviorScript):
         """Called when the script is assigned to a prim."""
         self._min_rotation = Gf.Vec3d(0.0, 0.0, 0.0)
         self._max_rotation = Gf.Vec3d(360.0, 360.0, 360.0)
-        self._update_counter = 0
         self._interval = 0
         self._valid_prims = []
-        self._initial_rotations = {}
+        self._rotation_ops = []
+        self._initial_rotations = []
+        self._xform_op_cache = XformOpCache()
+        self._writer = None
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -86,6 +89,7 @@ class RotationRandomizer(BehaviorScript):
 
     def on_destroy(self):
         """Called when the script is unassigned from a prim."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
         # Exposed variables should be removed if the script is no longer assigned to the prim
         if check_if_exposed_variables_should_be_removed(self.prim, __file__):
@@ -98,23 +102,14 @@ class RotationRandomizer(BehaviorScript):
         # Make sure the initial behavior is applied if the interval is larger than 0
         if self._interval > 0:
             self._apply_behavior()
+        # The scheduler applies the behavior every `interval` frames while playing
+        get_behavior_scheduler().register(self, self._interval)
 
     def on_stop(self):
         """Called when `stop` is pressed."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
 
-    def on_update(self, current_time: float, delta_time: float):
-        """Called on per frame update events that occur when `playing`."""
-        if delta_time <= 0:
-            return
-        if self._interval <= 0:
-            self._apply_behavior()
-        else:
-            self._update_counter += 1
-            if self._update_counter >= self._interval:
-                self._apply_behavior()
-                self._update_counter = 0
-
     def _setup(self):
         # Fetch the exposed attributes
         self._min_rotation = self._get_exposed_variable("range:minRotation")
@@ -131,36 +126,44 @@ class RotationRandomizer(BehaviorScript):
             self._valid_prims = []
             carb.log_warn(f"[{self.prim_path}] No valid prims found.")
 
-        # Save the initial rotation op and value of the prims (create xformOp:orient if none present)
-        for prim in self._valid_prims:
-            rotation_data = get_rotation_op_and_value(prim)
-            self._initial_rotations[prim] = rotation_data
+        # Resolve the rotation ops (create xformOp:orient if none present) and save the initial rotation values
+        self._writer = BatchAttributeWriter(self.prim.GetStage())
+        self._rotation_ops = [self._xform_op_cache.get_rotation_op(prim) for prim in self._valid_prims]
+        self._initial_rotations = [self._xform_op_cache.get_rotation_value(prim) for prim in self._valid_prims]
 
     def _reset(self):
         # Set prims back to their initial rotations
-        for prim, rotation_data in self._initial_rotations.items():
-            rotation_op, rotation_val = rotation_data
-            set_rotation_op_and_value(prim, rotation_op, rotation_val)
+        if self._writer is not None:
+            for op, rotation_val in zip(self._rotation_ops, self._initial_rotations):
+                self._writer.set_rotation_value(op, rotation_val)
+            self._writer.flush()
         # Clear cached values
         self._valid_prims.clear()
+        self._rotation_ops.clear()
         self._initial_rotations.clear()
+        self._xform_op_cache.clear()
+        self._writer = None
         self._interval = 0
-        self._update_counter = 0
 
     def _apply_behavior(self):
-        # Randomize the rotation for each valid prim
-        for prim in self._valid_prims:
-            self._randomize_rotation(prim)
-
-    def _randomize_rotation(self, prim):
-        # Create a Gf.Rotation from random Euler angles within the bounds
-        rotation = (
-            Gf.Rotation(Gf.Vec3d.XAxis(), random.uniform(self._min_rotation[0], self._max_rotation[0]))
-            * Gf.Rotation(Gf.Vec3d.YAxis(), random.uniform(self._min_rotation[1], self._max_rotation[1]))
-            * Gf.Rotation(Gf.Vec3d.ZAxis(), random.uniform(self._min_rotation[2], self._max_rotation[2]))
-        )
-        # Set the rotation using and existing xformOp (orient, rotate, transform) or create a new default xformOp:orient
-        set_rotation_with_ops(prim, rotation)
+        # Randomize the rotations of all the valid prims and author them in a single change block
+        if self._writer is not None:
+            self._queue_behavior(self._writer)
+            self._writer.flush()
+
+    @classmethod
+    def _apply_behaviors(cls, behaviors):
+        # Apply the behavior of several instances (coalesced by the behavior scheduler) in a single change block
+        apply_queued_behaviors(behaviors)
+
+    def _queue_behavior(self, writer):
+        if not self._valid_prims:
+            return
+        # Create the rotations from random Euler angles within the bounds
+        angles = draw_uniform(self._min_rotation, self._max_rotation, len(self._valid_prims))
+        for op, rotation in zip(self._rotation_ops, compose_euler_rotations(angles)):
+            # Set the rotation using the existing xformOp (orient, rotate, transform) or the default xformOp:orient
+            writer.set_rotation(op, rotation)
 
     def _get_exposed_variable(self, attr_name):
         full_attr_name = f"{EXPOSED_ATTR_NS}:{self.BEHAVIOR_NS}:{attr_name}"
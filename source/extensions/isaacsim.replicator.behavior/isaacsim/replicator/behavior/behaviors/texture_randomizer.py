@@ -19,7 +19,9 @@ import string
 import carb
 import omni.kit.window.property
 import omni.usd
+from isaacsim.replicator.behavior.behavior_scheduler import get_behavior_scheduler
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS, SCOPE_NAME
+from isaacsim.replicator.behavior.utils.authoring_utils import BatchAttributeWriter, apply_queued_behaviors
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
@@ -89,12 +91,13 @@ class TextureRandomizer(BehaviorScript):
 
     def on_init(self):
         """Called when the script is assigned to a prim."""
-        self._update_counter = 0
         self._interval = 0
         self._texture_urls = []
         self._valid_prims = []
         self._initial_materials = {}
         self._texture_materials = []
+        self._shader_inputs = []
+        self._writer = None
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -104,6 +107,7 @@ class TextureRandomizer(BehaviorScript):
 
     def on_destroy(self):
         """Called when the script is unassigned from a prim."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
         # Exposed variables should be removed if the script is no longer assigned to the prim
         if check_if_exposed_variables_should_be_removed(self.prim, __file__):
@@ -116,23 +120,14 @@ class TextureRandomizer(BehaviorScript):
         # Make sure the initial behavior is applied if the interval is larger than 0
         if self._interval > 0:
             self._apply_behavior()
+        # The scheduler applies the behavior every `interval` frames while playing
+        get_behavior_scheduler().register(self, self._interval)
 
     def on_stop(self):
         """Called when `stop` is pressed."""
+        get_behavior_scheduler().unregister(self)
         self._reset()
 
-    def on_update(self, current_time: float, delta_time: float):
-        """Called on per frame update events that occur when `playing`."""
-        if delta_time <= 0:
-            return
-        if self._interval <= 0:
-            self._apply_behavior()
-        else:
-            self._update_counter += 1
-            if self._update_counter >= self._interval:
-                self._apply_behavior()
-                self._update_counter = 0
-
     def _setup(self):
         # Fetch the exposed attributes
         include_children = self._get_exposed_variable("includeChildren")
@@ -198,24 +193,34 @@ class TextureRandomizer(BehaviorScript):
             carb.log_warn(f"[{self.prim_path}] Stage is not valid to remove empty scopes.")
 
         self._valid_prims.clear()
-        self._update_counter = 0
 
     def _apply_behavior(self):
-        # Randomize the textures and parameters for each material
-        for mat in self._texture_materials:
-            shader = UsdShade.Shader(omni.usd.get_shader_from_material(mat.GetPrim(), get_prim=True))
+        # Randomize the textures and parameters for each material and author them in a single change block
+        if self._writer is not None:
+            self._queue_behavior(self._writer)
+            self._writer.flush()
+
+    @classmethod
+    def _apply_behaviors(cls, behaviors):
+        # Apply the behavior of several instances (coalesced by the behavior scheduler) in a single change block
+        apply_queued_behaviors(behaviors)
+
+    def _queue_behavior(self, writer):
+        if not self._texture_urls:
+            return
+        for texture_attr, project_uvw_attr, scale_attr, rotate_attr in self._shader_inputs:
             diffuse_texture = random.choice(self._texture_urls)
-            shader.GetInput("diffuse_texture").Set(diffuse_texture)
+            writer.set(texture_attr, diffuse_texture)
             project_uvw = random.choices(
                 [True, False],
                 weights=[self._project_uvw_probability, 1 - self._project_uvw_probability],
                 k=1,
             )[0]
-            shader.GetInput("project_uvw").Set(bool(project_uvw))
+            writer.set(project_uvw_attr, bool(project_uvw))
             texture_scale = random.uniform(self._texture_scale_range[0], self._texture_scale_range[1])
-            shader.GetInput("texture_scale").Set((texture_scale, texture_scale))
+            writer.set(scale_attr, Gf.Vec2f(texture_scale, texture_scale))
             texture_rotate = random.uniform(self._texture_rotate_range[0], self._texture_rotate_range[1])
-            shader.GetInput("texture_rotate").Set(texture_rotate)
+            writer.set(rotate_attr, texture_rotate)
 
     def _create_materials(self):
         if not self.stage:
@@ -237,8 +242,16 @@ class TextureRandomizer(BehaviorScript):
             material = create_mdl_material(MDL, mtl_name, mtl_path)
             UsdShade.MaterialBindingAPI(prim).Bind(material, UsdShade.Tokens.strongerThanDescendants)
 
-            # Cache the material for randomization
+            # Cache the material and its randomized shader inputs
             self._texture_materials.append(material)
+            shader = UsdShade.Shader(omni.usd.get_shader_from_material(material.GetPrim(), get_prim=True))
+            self._shader_inputs.append(
+                tuple(
+                    shader.GetInput(input_name).GetAttr()
+                    for input_name in ("diffuse_texture", "project_uvw", "texture_scale", "texture_rotate")
+                )
+            )
+        self._writer = BatchAttributeWriter(self.stage)
 
     def _get_exposed_variable(self, attr_name):
         full_attr_name = f"{EXPOSED_ATTR_NS}:{self.BEHAVIOR_NS}:{attr_name}"
@@ -259,3 +272,5 @@ class TextureRandomizer(BehaviorScript):
             UsdShade.MaterialBindingAPI(mat.GetPrim()).UnbindAllBindings()
             self.stage.RemovePrim(mat.GetPath())
         self._texture_materials.clear()
+        self._shader_inputs.clear()
+        self._writer = None
@@ -20,11 +20,13 @@ from enum import Enum
 import carb
 import carb.events
 import carb.settings
+import numpy as np
 import omni.kit.app
 import omni.kit.window.property
 import omni.physx
 import omni.usd
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS, EXTENSION_NAME, SCOPE_NAME
+from isaacsim.replicator.behavior.utils.authoring_utils import compose_euler_rotations
 from isaacsim.replicator.behavior.utils.behavior_utils import (
     check_if_exposed_variables_should_be_removed,
     create_exposed_variables,
@@ -33,6 +35,7 @@ from isaacsim.replicator.behavior.utils.behavior_utils import (
     remove_exposed_variables,
 )
 from isaacsim.replicator.behavior.utils.scene_utils import (
+    SpatialHashGrid,
     add_colliders,
     add_rigid_body_dynamics,
     apply_forces_and_simulate_async,
@@ -46,6 +49,7 @@ from isaacsim.replicator.behavior.utils.scene_utils import (
     get_world_rotation,
     reset_simulation_and_enable_reset_on_stop,
     run_simulation_async,
+    sample_drop_locations,
     set_transform_attributes,
 )
 from isaacsim.storage.native import get_assets_root_path_async
@@ -74,6 +78,9 @@ class VolumeStackRandomizer(BehaviorScript):
         "run": "_run_behavior_async",
         "reset": "_reset_async",
     }
+    # Number of random drop locations to try before accepting a location overlapping an already dropping asset
+    DROP_LOCATION_MAX_ATTEMPTS = 10
+    DROP_ROTATION_ANGLES = [180, 90, 0, -90, -180]
 
     VARIABLES_TO_EXPOSE = [
         {
@@ -160,6 +167,7 @@ class VolumeStackRandomizer(BehaviorScript):
         self._valid_prims = []
         self._prim_collision_walls = {}
         self._prim_assets = {}
+        self._asset_drop_margins = {}
         self._reset_requested = False
         self._physx_dt = 1 / self.stage.GetTimeCodesPerSecond()
 
@@ -394,9 +402,15 @@ class VolumeStackRandomizer(BehaviorScript):
                 # Cache the spawned assets for later use
                 assets.append(asset_prim)
 
-            # Clear the cache to account for newly added prims and sort the assets by volume to drop large assets first
+            # Clear the cache to account for newly added prims and compute the asset bounds once, the volume is used to
+            # drop large assets first and the largest dimension as a margin for avoiding overlaps in any direction
             bbox_cache.Clear()
-            assets.sort(key=lambda asset: bbox_cache.ComputeWorldBound(asset).GetVolume(), reverse=True)
+            asset_volumes = {}
+            for asset in assets:
+                asset_bound = bbox_cache.ComputeWorldBound(asset)
+                asset_volumes[asset] = asset_bound.GetVolume()
+                self._asset_drop_margins[asset] = max(asset_bound.GetRange().GetSize()) / 2
+            assets.sort(key=lambda asset: asset_volumes[asset], reverse=True)
 
             # Store the assets in the dictionary
             self._prim_assets[prim] = assets
@@ -419,80 +433,89 @@ class VolumeStackRandomizer(BehaviorScript):
         # Group the prims and their associated assets into batches to allow parallel simulation between the prims
         prim_asset_batches = self._group_prims_and_assets_into_batches()
 
+        # Compute the drop areas of the prims once, the prims do not move during the drop
+        drop_areas = self._compute_drop_areas(self._drop_height)
+
+        # Spatial hash of the dropping assets (sphere with the drop margin as radius) to reject overlapping drop locations
+        spatial_hash = SpatialHashGrid(cell_size=2 * max(self._asset_drop_margins.values(), default=0.0))
+        dropped_assets = []
+
         # Spawn the assets at random poses and simulate the drop start for a few frames for each batch of prim-asset pairs
         for prim_asset_batch in prim_asset_batches:
+            # The assets of the previous batches are still dropping, use their current locations
+            spatial_hash.clear()
+            xform_cache = UsdGeom.XformCache()
+            for asset in dropped_assets:
+                spatial_hash.insert(get_world_location(asset, xform_cache), self._asset_drop_margins[asset])
+
             await self._start_batched_asset_drop_async(
-                prim_asset_batch, self._drop_height, sim_steps=drop_interval_steps
+                prim_asset_batch, drop_areas, spatial_hash, sim_steps=drop_interval_steps
             )
             if self._reset_requested:
                 return
+            dropped_assets.extend(asset for _, asset in prim_asset_batch)
 
         # Let the simulation run for additional steps to allow all assets to finish dropping
         await run_simulation_async(
             sim_steps=settling_sim_steps, physx_dt=self._physx_dt, render=self._render_simulation
         )
 
-    async def _start_batched_asset_drop_async(self, prim_asset_batch, drop_height, sim_steps):
-        # For each prim-assset pair calculate the drop area and prepare to drop the asset from a random location
+    def _compute_drop_areas(self, drop_height):
+        # For each prim compute the drop area center (in world frame) at the given height above the surface, the half
+        # size of the drop area, and the prim world rotation
         bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), includedPurposes=[UsdGeom.Tokens.default_])
         xform_cache = UsdGeom.XformCache()
-        for prim, asset in prim_asset_batch:
-            # Compute prim's size, midpoint, and calculate the drop area center at the specified height above the surface
+        drop_areas = {}
+        for prim in self._prim_assets:
             prim_bound = bbox_cache.ComputeWorldBound(prim)
-            prim_scale = Gf.Transform(prim_bound.GetMatrix()).GetScale()
-
-            # NOTE: GetRange() returns the untransformed size of the bounding box
-            prim_range_untransformed = bbox_cache.ComputeWorldBound(prim).GetRange()
-
-            # Apply the prim scale to the range to get the transformed size
-            prim_width, prim_depth, prim_height = prim_range_untransformed.GetSize()
-            prim_width *= prim_scale[0]
-            prim_depth *= prim_scale[1]
-            prim_height *= prim_scale[2]
-
-            # Calculate the drop area center at the specified height above the surface
-            mid_point = prim_range_untransformed.GetMidpoint()
-            mid_point[0] *= prim_scale[0]
-            mid_point[1] *= prim_scale[1]
-            mid_point[2] *= prim_scale[2]
-            drop_area_center = mid_point + Gf.Vec3d(0, 0, prim_height / 2 + drop_height)
-
-            # Compute the asset's size and drop margin to avoid overlapping with the prim
-            asset_width, asset_depth, asset_height = bbox_cache.ComputeWorldBound(asset).GetRange().GetSize()
-
-            # Use the largest dimension of the asset to calculate a margin for avoiding overlap in any direction
-            drop_margin = max(asset_width, asset_depth, asset_height) / 2
-
-            # Adjust the drop area width and depth by subtracting the margin
-            drop_area_size = min(prim_width, prim_depth) / 2 - drop_margin
-
-            # Use the asset's largest dimension to calculate the margin needed to avoid overlap with the collision walls
-            asset_width, asset_depth, asset_height = bbox_cache.ComputeWorldBound(asset).GetRange().GetSize()
-            drop_margin = max(asset_width, asset_depth, asset_height) / 2
-            drop_area_size = min(prim_width, prim_depth) / 2 - drop_margin
-
-            # Generate a random location for the asset within the adjusted drop area, ensuring no overlap with the walls
-            random_location = drop_area_center + Gf.Vec3d(
-                random.uniform(-drop_area_size, drop_area_size),
-                random.uniform(-drop_area_size, drop_area_size),
-                0,  # No vertical offset in randomization
+            prim_scale = np.array(Gf.Transform(prim_bound.GetMatrix()).GetScale())
+
+            # NOTE: GetRange() returns the untransformed size of the bounding box, apply the prim scale to the range
+            prim_range_untransformed = prim_bound.GetRange()
+            prim_width, prim_depth, prim_height = np.array(prim_range_untransformed.GetSize()) * prim_scale
+            mid_point = np.array(prim_range_untransformed.GetMidpoint()) * prim_scale
+
+            # Calculate the drop area center at the specified height above the surface relative to the prim location
+            drop_area_center = mid_point + (0.0, 0.0, prim_height / 2 + drop_height)
+            drop_area_center += np.array(get_world_location(prim, xform_cache))
+            drop_areas[prim] = (
+                drop_area_center,
+                min(prim_width, prim_depth) / 2,
+                get_world_rotation(prim, xform_cache),
             )
+        return drop_areas
+
+    async def _start_batched_asset_drop_async(self, prim_asset_batch, drop_areas, spatial_hash, sim_steps):
+        # Draw the drop poses of the whole batch at once, from a generator seeded by the `random` module for seeded runs
+        rng = np.random.default_rng(random.getrandbits(64))
+        batch_drop_areas = [drop_areas[prim] for prim, _ in prim_asset_batch]
+        drop_margins = np.array([self._asset_drop_margins[asset] for _, asset in prim_asset_batch])
+
+        # Generate random locations within the drop areas adjusted by the asset margins to avoid overlapping with the
+        # collision walls, rejecting locations overlapping other assets
+        spawn_locations = sample_drop_locations(
+            [drop_area_center for drop_area_center, _, _ in batch_drop_areas],
+            np.array([drop_area_half_size for _, drop_area_half_size, _ in batch_drop_areas]) - drop_margins,
+            drop_margins,
+            spatial_hash,
+            self.DROP_LOCATION_MAX_ATTEMPTS,
+            rng,
+        )
 
-            # Generate a random orientation with 90-degree steps around the x, y, and z axes
-            random_rotation = (
-                Gf.Rotation(Gf.Vec3d.XAxis(), random.choice([180, 90, 0, -90, -180]))
-                * Gf.Rotation(Gf.Vec3d.YAxis(), random.choice([180, 90, 0, -90, -180]))
-                * Gf.Rotation(Gf.Vec3d.ZAxis(), random.choice([180, 90, 0, -90, -180]))
-            )
-
-            # Calculate the spawn location and rotation relative to the prim's world transform
-            world_location = get_world_location(prim, xform_cache)
-            spawn_location = random_location + world_location
-            world_rotation = get_world_rotation(prim, xform_cache)
-            spawn_rotation = random_rotation * world_rotation
-
+        # Generate random orientations with 90-degree steps around the x, y, and z axes relative to the prims
+        random_angles = rng.choice(
+            np.array(self.DROP_ROTATION_ANGLES, dtype=np.float64), size=(len(prim_asset_batch), 3)
+        )
+        spawn_rotations = [
+            random_rotation * world_rotation
+            for random_rotation, (_, _, world_rotation) in zip(compose_euler_rotations(random_angles), batch_drop_areas)
+        ]
+
+        for (prim, asset), spawn_location, spawn_rotation in zip(
+            prim_asset_batch, spawn_locations.tolist(), spawn_rotations
+        ):
             # Set the drop pose and enable collisions and rigid body dynamics with dampened angular movements
-            set_transform_attributes(asset, location=spawn_location, orientation=spawn_rotation.GetQuat())
+            set_transform_attributes(asset, location=Gf.Vec3d(*spawn_location), orientation=spawn_rotation.GetQuat())
             add_colliders(asset)
             add_rigid_body_dynamics(asset, angular_damping=10.0, linear_damping=0.01)
 
@@ -634,6 +657,7 @@ class VolumeStackRandomizer(BehaviorScript):
                         self.stage.RemovePrim(asset.GetPath())
 
         self._prim_assets.clear()
+        self._asset_drop_margins.clear()
 
     def _remove_physics_material(self):
         if not self.stage:
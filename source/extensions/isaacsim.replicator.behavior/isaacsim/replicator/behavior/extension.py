@@ -15,10 +15,12 @@
 
 import omni.ext
 
+from .behavior_scheduler import destroy_behavior_scheduler
+
 
 class Extension(omni.ext.IExt):
     def on_startup(self, ext_id):
         pass
 
     def on_shutdown(self):
-        pass
+        destroy_behavior_scheduler()
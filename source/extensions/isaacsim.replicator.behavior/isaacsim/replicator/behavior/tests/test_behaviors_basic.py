@@ -15,16 +15,21 @@
 
 import importlib
 import os
+import random
 
 import isaacsim.replicator.behavior.behaviors as behaviors_module
+import numpy as np
 import omni.kit.app
 import omni.kit.commands
 import omni.kit.test
 import omni.timeline
 import omni.usd
+from isaacsim.replicator.behavior.behavior_scheduler import BehaviorScheduler
 from isaacsim.replicator.behavior.global_variables import EXPOSED_ATTR_NS
+from isaacsim.replicator.behavior.utils.authoring_utils import BatchAttributeWriter, XformOpCache, draw_uniform
+from isaacsim.replicator.behavior.utils.scene_utils import SpatialHashGrid, sample_drop_locations
 from omni.kit.scripting import BehaviorScript
-from pxr import Sdf
+from pxr import Gf, Sdf, UsdGeom, UsdLux
 
 SCRIPTS_ATTR = "omni:scripting:scripts"
 
@@ -170,3 +175,147 @@ class TestBehaviorsBasic(omni.kit.test.AsyncTestCase):
         for behavior_class in BEHAVIOR_CLASSES:
             print(f"Testing behavior: {behavior_class.__name__}")
             await self.check_exposed_variables(behavior_class)
+
+    async def test_batch_authoring(self):
+        stage = omni.usd.get_context().get_stage()
+        xform = UsdGeom.Xform.Define(stage, "/World/Xform")
+        xform.AddTransformOp().Set(Gf.Matrix4d().SetTranslate(Gf.Vec3d(1.0, 2.0, 3.0)))
+        cube = UsdGeom.Cube.Define(stage, "/World/Xform/Cube")
+        cube.AddRotateXYZOp()
+        light = UsdLux.SphereLight.Define(stage, "/World/Light")
+        light.CreateIntensityAttr(1000.0)
+
+        # Resolved ops are cached, default ops are created if none exist
+        xform_op_cache = XformOpCache()
+        xform_op = xform_op_cache.get_location_op(xform.GetPrim())
+        self.assertEqual(xform_op.GetOpName(), "xformOp:transform")
+        self.assertIs(xform_op_cache.get_location_op(xform.GetPrim()), xform_op)
+        self.assertEqual(xform_op_cache.get_location(xform.GetPrim()), Gf.Vec3d(1.0, 2.0, 3.0))
+        cube_location_op = xform_op_cache.get_location_op(cube.GetPrim())
+        self.assertEqual(cube_location_op.GetOpName(), "xformOp:translate")
+        cube_rotation_op = xform_op_cache.get_rotation_op(cube.GetPrim())
+        self.assertEqual(cube_rotation_op.GetOpName(), "xformOp:rotateXYZ")
+        self.assertEqual(xform_op_cache.get_rotation_op(xform.GetPrim()).GetOpName(), "xformOp:transform")
+
+        # Values are drawn in the same order as per-prim random.uniform calls
+        random.seed(42)
+        values = draw_uniform((0.0, -1.0, 10.0), (1.0, 1.0, 20.0), 2)
+        random.seed(42)
+        expected = [[random.uniform(0.0, 1.0), random.uniform(-1.0, 1.0), random.uniform(10.0, 20.0)] for _ in range(2)]
+        self.assertEqual(values.shape, (2, 3))
+        self.assertTrue(all(abs(a - b) < 1e-12 for a, b in zip(values.flatten().tolist(), sum(expected, []))))
+
+        # All the queued values are authored in a single change block
+        writer = BatchAttributeWriter(stage)
+        writer.set_location(xform_op, Gf.Vec3d(4.0, 5.0, 6.0))
+        writer.set_location(cube_location_op, Gf.Vec3d(0.0, 0.0, 1.0))
+        writer.set_rotation(cube_rotation_op, Gf.Rotation(Gf.Vec3d.ZAxis(), 90.0))
+        writer.set(light.GetIntensityAttr(), 5000.0)
+        writer.set(light.GetColorAttr(), Gf.Vec3d(0.5, 0.5, 0.5))
+        self.assertEqual(len(writer), 5)
+        writer.flush()
+        self.assertEqual(len(writer), 0)
+        self.assertTrue(Gf.IsClose(Gf.Transform(xform_op.Get()).GetTranslation(), Gf.Vec3d(4.0, 5.0, 6.0), 1e-6))
+        self.assertEqual(cube_location_op.Get(), Gf.Vec3d(0.0, 0.0, 1.0))
+        self.assertTrue(Gf.IsClose(cube_rotation_op.Get(), Gf.Vec3f(0.0, 0.0, 90.0), 1e-4))
+        self.assertAlmostEqual(light.GetIntensityAttr().Get(), 5000.0)
+        self.assertEqual(light.GetColorAttr().Get(), Gf.Vec3f(0.5, 0.5, 0.5))
+
+    async def test_behavior_scheduler(self):
+        applied = []
+
+        class CountingBehavior:
+            def __init__(self, name):
+                self.prim_path = name
+
+            def _apply_behavior(self):
+                applied.append(self.prim_path)
+
+        class BatchedBehavior(CountingBehavior):
+            @classmethod
+            def _apply_behaviors(cls, behaviors):
+                applied.append(tuple(behavior.prim_path for behavior in behaviors))
+
+        scheduler = BehaviorScheduler()
+        every_frame = CountingBehavior("/every_frame")
+        every_third = CountingBehavior("/every_third")
+        batched = [BatchedBehavior(f"/batched_{i}") for i in range(3)]
+        scheduler.register(every_frame, 0)
+        scheduler.register(every_third, 3)
+        for behavior in batched:
+            scheduler.register(behavior, 2)
+        self.assertTrue(scheduler.is_registered(every_third))
+
+        # Frames with a non-positive delta time are skipped
+        self.assertEqual(scheduler.update(0.0), 0)
+        self.assertEqual(scheduler.frame, 0)
+
+        # Only the due behaviors are applied, same type behaviors are coalesced into a single update
+        self.assertEqual(scheduler.update(1.0 / 60.0), 1)
+        self.assertEqual(applied, ["/every_frame"])
+        applied.clear()
+        self.assertEqual(scheduler.update(1.0 / 60.0), 4)
+        self.assertEqual(applied, ["/every_frame", ("/batched_0", "/batched_1", "/batched_2")])
+        applied.clear()
+        self.assertEqual(scheduler.update(1.0 / 60.0), 2)
+        self.assertEqual(applied, ["/every_frame", "/every_third"])
+
+        # Unregistered behaviors are no longer applied
+        scheduler.unregister(every_frame)
+        applied.clear()
+        scheduler.update(1.0 / 60.0)
+        self.assertEqual(applied, [("/batched_0", "/batched_1", "/batched_2")])
+
+        # Timings are reported per registered behavior
+        timings = scheduler.get_timings()
+        self.assertEqual(len(timings), 4)
+        self.assertEqual(timings["CountingBehavior:/every_third"]["calls"], 1)
+        self.assertEqual(timings["BatchedBehavior:/batched_1"]["calls"], 2)
+        self.assertEqual(timings["BatchedBehavior:/batched_1"]["interval"], 2)
+        scheduler.reset_timings()
+        self.assertEqual(scheduler.get_timings()["BatchedBehavior:/batched_1"]["calls"], 0)
+        scheduler.destroy()
+        self.assertFalse(scheduler.is_registered(every_third))
+
+    async def test_spatial_hash_grid(self):
+        grid = SpatialHashGrid(cell_size=1.0)
+        self.assertFalse(grid.overlaps((0.0, 0.0, 0.0), 0.5))
+        grid.insert((0.0, 0.0, 0.0), 0.5)
+        grid.insert((10.0, 0.0, 2.0), 0.25)
+        self.assertEqual(len(grid), 2)
+        self.assertTrue(grid.overlaps((0.9, 0.0, 0.0), 0.5))
+        self.assertFalse(grid.overlaps((1.1, 0.0, 0.0), 0.5))
+        # Spheres larger than the cell size are checked against the neighboring cells they reach
+        self.assertTrue(grid.overlaps((3.0, 0.0, 0.0), 2.75))
+        self.assertTrue(grid.overlaps((10.0, 0.0, 2.2), 0.1))
+        grid.clear()
+        self.assertEqual(len(grid), 0)
+        self.assertFalse(grid.overlaps((0.0, 0.0, 0.0), 0.5))
+
+    async def test_sample_drop_locations(self):
+        centers = [(0.0, 0.0, 5.0), (0.0, 0.0, 5.0), (10.0, 0.0, 2.0)]
+        half_sizes = [4.0, 4.0, 1.0]
+        radii = [0.5, 0.5, 0.25]
+        grid = SpatialHashGrid(cell_size=1.0)
+        grid.insert((0.0, 0.0, 5.0), 1.0)
+        locations = sample_drop_locations(centers, half_sizes, radii, grid, 10, np.random.default_rng(42))
+        self.assertEqual(locations.shape, (3, 3))
+        # Locations are drawn horizontally within the drop areas
+        self.assertTrue(np.all(np.abs(locations[:, :2] - np.array(centers)[:, :2]) <= np.array(half_sizes)[:, None]))
+        self.assertTrue(np.allclose(locations[:, 2], [5.0, 5.0, 2.0]))
+        # The sampled spheres avoid the spheres of the grid and each other, and are added to the grid
+        self.assertGreaterEqual(np.linalg.norm(locations[0] - (0.0, 0.0, 5.0)), 1.5)
+        self.assertGreaterEqual(np.linalg.norm(locations[1] - (0.0, 0.0, 5.0)), 1.5)
+        self.assertGreaterEqual(np.linalg.norm(locations[0] - locations[1]), 1.0)
+        self.assertEqual(len(grid), 4)
+        # Seeded generators draw the same locations
+        other = sample_drop_locations(
+            centers, half_sizes, radii, SpatialHashGrid(cell_size=1.0), 10, np.random.default_rng(42)
+        )
+        self.assertTrue(np.allclose(other[2], locations[2]))
+        # The last candidate is kept if all of them overlap
+        grid.clear()
+        grid.insert((0.0, 0.0, 0.0), 10.0)
+        locations = sample_drop_locations([(0.0, 0.0, 0.0)], [1.0], [0.5], grid, 3, np.random.default_rng(0))
+        self.assertEqual(len(grid), 2)
+        self.assertLessEqual(np.abs(locations[0, :2]).max(), 1.0)
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import carb
+import numpy as np
+from isaacsim.replicator.behavior.utils.scene_utils import decompose_rotation
+from pxr import Gf, Sdf, Usd, UsdGeom
+
+LOCATION_OP_NAMES = ("xformOp:translate", "xformOp:transform")
+
+
+def draw_uniform(low, high, count: int) -> np.ndarray:
+    """Draw a (count, len(low)) array of uniform values in [low, high] for all the prims of a frame.
+
+    The values are drawn from the `random` module in the same order as per-prim `random.uniform` calls would,
+    so that seeded runs (`random.seed`) produce the same results as the per-prim randomization.
+    """
+    low = np.asarray(low, dtype=np.float64).reshape(-1)
+    high = np.asarray(high, dtype=np.float64).reshape(-1)
+    samples = np.fromiter((random.random() for _ in range(count * low.size)), dtype=np.float64, count=count * low.size)
+    return low + (high - low) * samples.reshape(count, low.size)
+
+
+def compose_euler_rotations(angles: np.ndarray) -> list[Gf.Rotation]:
+    """Create rotations from (N, 3) euler angles in degrees (applied in X, Y, Z order)."""
+    return [
+        Gf.Rotation(Gf.Vec3d.XAxis(), x) * Gf.Rotation(Gf.Vec3d.YAxis(), y) * Gf.Rotation(Gf.Vec3d.ZAxis(), z)
+        for x, y, z in angles.tolist()
+    ]
+
+
+class XformOpCache:
+    """Cache of the resolved location and rotation xformOps of prims.
+
+    The ops are resolved once (walking the ordered xformOps of the prim) instead of on every update. If no suitable
+    op exists a default one (`xformOp:translate` for locations, `xformOp:orient` for rotations) is created, this
+    should therefore be called during setup and not from within a change block.
+    """
+
+    def __init__(self):
+        self._location_ops = {}
+        self._rotation_ops = {}
+
+    def get_location_op(self, prim: Usd.Prim) -> UsdGeom.XformOp:
+        """Get the first translate or transform op of the prim, creating a translate op if none exists."""
+        path = prim.GetPath()
+        op = self._location_ops.get(path)
+        if op is None:
+            xformable = UsdGeom.Xformable(prim)
+            op = next((op for op in xformable.GetOrderedXformOps() if op.GetOpName() in LOCATION_OP_NAMES), None)
+            if op is None:
+                op = xformable.AddXformOp(UsdGeom.XformOp.TypeTranslate, UsdGeom.XformOp.PrecisionDouble)
+                op.Set(Gf.Vec3d(0.0, 0.0, 0.0))
+            self._location_ops[path] = op
+        return op
+
+    def get_rotation_op(self, prim: Usd.Prim) -> UsdGeom.XformOp:
+        """Get the first orient, rotate or transform op of the prim, creating an orient op if none exists."""
+        path = prim.GetPath()
+        op = self._rotation_ops.get(path)
+        if op is None:
+            xformable = UsdGeom.Xformable(prim)
+            for xform_op in xformable.GetOrderedXformOps():
+                op_name = xform_op.GetOpName()
+                if op_name.startswith("xformOp:rotate") or op_name in ("xformOp:orient", "xformOp:transform"):
+                    op = xform_op
+                    break
+            else:
+                op = xformable.AddXformOp(UsdGeom.XformOp.TypeOrient, UsdGeom.XformOp.PrecisionDouble)
+                op.Set(Gf.Quatd(1.0, 0.0, 0.0, 0.0))
+            self._rotation_ops[path] = op
+        return op
+
+    def get_location(self, prim: Usd.Prim) -> Gf.Vec3d:
+        """Get the local location of the prim from its cached location op."""
+        op = self.get_location_op(prim)
+        if op.GetOpName() == "xformOp:transform":
+            return Gf.Transform(op.Get()).GetTranslation()
+        return Gf.Vec3d(op.Get())
+
+    def get_rotation_value(self, prim: Usd.Prim):
+        """Get the raw value of the cached rotation op (`Gf.Rotation` for transform ops)."""
+        op = self.get_rotation_op(prim)
+        if op.GetOpName() == "xformOp:transform":
+            return Gf.Transform(op.Get()).GetRotation()
+        return op.Get()
+
+    def clear(self):
+        """Clear the cached ops."""
+        self._location_ops.clear()
+        self._rotation_ops.clear()
+
+
+class BatchAttributeWriter:
+    """Collect attribute values and author them all at once in a single `Sdf.ChangeBlock` using the Sdf layer API.
+
+    Values are written as default (non time-sampled) opinions in the current edit target of the stage, the same
+    opinions `Usd.Attribute.Set` would author, but with a single change notification for the whole batch.
+    """
+
+    def __init__(self, stage: Usd.Stage):
+        self._stage = stage
+        self._values = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def set(self, attr: Usd.Attribute, value) -> None:
+        """Queue a value for the attribute, a later value for the same attribute overrides the earlier one.
+
+        Invalid attributes (e.g. of removed prims) are skipped.
+        """
+        if not attr:
+            return
+        type_name = attr.GetTypeName()
+        # Cast the value to the attribute value type (e.g. Gf.Vec3d -> Gf.Vec3f, str -> Sdf.AssetPath)
+        python_class = type_name.type.pythonClass
+        if python_class is not None and not isinstance(value, python_class):
+            value = python_class(value)
+        self._values[attr.GetPath()] = (type_name, attr.IsCustom(), value)
+
+    def set_location(self, op: UsdGeom.XformOp, location: Gf.Vec3d) -> None:
+        """Queue a location for a translate op, or the translation part of a transform op."""
+        if op.GetOpName() == "xformOp:transform":
+            transform = Gf.Transform(op.Get())
+            transform.SetTranslation(Gf.Vec3d(*location))
+            self.set(op.GetAttr(), transform.GetMatrix())
+        else:
+            self.set(op.GetAttr(), Gf.Vec3d(*location))
+
+    def set_rotation(self, op: UsdGeom.XformOp, rotation: Gf.Rotation) -> None:
+        """Queue a rotation for an orient, rotate or transform op, converting it to the op's value type."""
+        op_name = op.GetOpName()
+        if op_name == "xformOp:orient":
+            quat_type = Gf.Quatf if op.GetTypeName() == Sdf.ValueTypeNames.Quatf else Gf.Quatd
+            self.set(op.GetAttr(), quat_type(rotation.GetQuat()))
+        elif op_name.startswith("xformOp:rotate"):
+            rotation_decomp = decompose_rotation(rotation, op_name[len("xformOp:rotate") :])
+            if rotation_decomp is None:
+                carb.log_warn(f"Unsupported rotation op {op_name} on {op.GetAttr().GetPrimPath()}")
+                return
+            self.set(op.GetAttr(), rotation_decomp)
+        elif op_name == "xformOp:transform":
+            transform = Gf.Transform(op.Get())
+            transform.SetRotation(rotation)
+            self.set(op.GetAttr(), transform.GetMatrix())
+        else:
+            carb.log_warn(f"Unsupported rotation op {op_name} on {op.GetAttr().GetPrimPath()}")
+
+    def set_rotation_value(self, op: UsdGeom.XformOp, rotation_value) -> None:
+        """Queue a raw rotation value (as returned by `XformOpCache.get_rotation_value`) for the op."""
+        if op.GetOpName() == "xformOp:transform":
+            transform = Gf.Transform(op.Get())
+            transform.SetRotation(rotation_value)
+            self.set(op.GetAttr(), transform.GetMatrix())
+        else:
+            self.set(op.GetAttr(), rotation_value)
+
+    def flush(self) -> None:
+        """Author all the queued values in a single change block and clear the queue."""
+        if not self._values:
+            return
+        edit_target = self._stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+        with Sdf.ChangeBlock():
+            for attr_path, (type_name, custom, value) in self._values.items():
+                spec_path = edit_target.MapToSpecPath(attr_path)
+                attr_spec = layer.GetAttributeAtPath(spec_path)
+                if not attr_spec:
+                    prim_spec = Sdf.CreatePrimInLayer(layer, spec_path.GetPrimPath())
+                    attr_spec = Sdf.AttributeSpec(prim_spec, spec_path.name, type_name, declaresCustom=custom)
+                attr_spec.default = value
+        self._values.clear()
+
+    def clear(self) -> None:
+        """Discard the queued values."""
+        self._values.clear()
+
+
+def apply_queued_behaviors(behaviors: list) -> None:
+    """Author the updates of several behavior instances in a single change block.
+
+    The behaviors implement `_queue_behavior(writer)` and hold a `_writer` (None if the behavior is not set up).
+    """
+    writer = next((behavior._writer for behavior in behaviors if behavior._writer is not None), None)
+    if writer is None:
+        return
+    for behavior in behaviors:
+        if behavior._writer is not None:
+            behavior._queue_behavior(writer)
+    writer.flush()
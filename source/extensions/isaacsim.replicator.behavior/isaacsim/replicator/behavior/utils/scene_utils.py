@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+from collections import defaultdict
+
 import carb
 import carb.settings
+import numpy as np
 import omni.kit.app
 import omni.kit.commands
 import omni.physx
@@ -601,3 +605,67 @@ def reset_simulation_and_enable_reset_on_stop():
     physx_interface = omni.physx.get_physx_interface()
     physx_interface.reset_simulation()
     carb.settings.get_settings().set(omni.physx.bindings._physx.SETTING_RESET_ON_STOP, True)
+
+
+class SpatialHashGrid:
+    """Uniform grid hashing spheres (center, radius) into cells for overlap queries against their neighbors only."""
+
+    def __init__(self, cell_size: float):
+        self._cell_size = max(float(cell_size), 1e-6)
+        self._cells = defaultdict(list)
+        self._max_radius = 0.0
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._cells.values())
+
+    def _get_cell(self, center) -> tuple[int, int, int]:
+        return tuple(math.floor(value / self._cell_size) for value in center)
+
+    def insert(self, center, radius: float) -> None:
+        """Add a sphere to the grid."""
+        self._cells[self._get_cell(center)].append((tuple(center), radius))
+        self._max_radius = max(self._max_radius, radius)
+
+    def overlaps(self, center, radius: float) -> bool:
+        """Check if a sphere overlaps any of the spheres in the grid."""
+        if not self._cells:
+            return False
+        # Number of neighboring cells to check in each direction to cover the largest possible overlap distance
+        reach = math.ceil((radius + self._max_radius) / self._cell_size)
+        cx, cy, cz = self._get_cell(center)
+        for x in range(cx - reach, cx + reach + 1):
+            for y in range(cy - reach, cy + reach + 1):
+                for z in range(cz - reach, cz + reach + 1):
+                    for other_center, other_radius in self._cells.get((x, y, z), ()):
+                        if math.dist(center, other_center) < radius + other_radius:
+                            return True
+        return False
+
+    def clear(self) -> None:
+        """Remove all the spheres from the grid."""
+        self._cells.clear()
+        self._max_radius = 0.0
+
+
+def sample_drop_locations(
+    centers, half_sizes, radii, spatial_hash: SpatialHashGrid, max_attempts: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Sample a location in the horizontal square area (center, half size) of each sphere, rejecting the locations
+    overlapping the spheres of the grid.
+
+    The candidate locations of all the spheres are drawn at once, the last candidate is kept if all of them overlap.
+    The sampled spheres are added to the grid, in order, so the later spheres also avoid the earlier ones.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    count = centers.shape[0]
+    half_sizes = np.asarray(half_sizes, dtype=np.float64).reshape(count, 1, 1)
+    candidates = np.repeat(centers[:, np.newaxis, :], max_attempts, axis=1)
+    candidates[:, :, :2] += rng.uniform(-1.0, 1.0, (count, max_attempts, 2)) * half_sizes
+    locations = np.empty((count, 3))
+    for i, (sphere_candidates, radius) in enumerate(zip(candidates.tolist(), np.asarray(radii).tolist())):
+        for location in sphere_candidates:
+            if not spatial_hash.overlaps(location, radius):
+                break
+        spatial_hash.insert(location, radius)
+        locations[i] = location
+    return locations
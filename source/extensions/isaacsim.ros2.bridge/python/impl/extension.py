@@ -352,6 +352,20 @@ class ROS2BridgeExtension(omni.ext.IExt):
                 category=BRIDGE_NAME,
             )
 
+            # RTX lidar PCL publisher, processed by the point cloud processor of the render product
+            register_node_writer_with_telemetry(
+                name=f"RtxLidar{BRIDGE_PREFIX}{time_type[1]}PublishProcessedPointCloud",
+                node_type_id=f"{BRIDGE_NAME}.{BRIDGE_PREFIX}PublishPointCloud",
+                annotators=[
+                    "IsaacProcessRTXSensorPointCloud",
+                    "PostProcessDispatchIsaacSimulationGate",
+                    omni.syntheticdata.SyntheticData.NodeConnectionTemplate(
+                        f"IsaacReadS{time_type[0]}", attributes_mapping={f"outputs:s{time_type[0]}": "inputs:timeStamp"}
+                    ),
+                ],
+                category=BRIDGE_NAME,
+            )
+
             # RTX Radar PCL publisher
             register_node_writer_with_telemetry(
                 name=f"RtxRadar{BRIDGE_PREFIX}{time_type[1]}PublishPointCloud",
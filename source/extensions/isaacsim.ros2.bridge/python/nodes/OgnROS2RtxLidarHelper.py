@@ -21,6 +21,7 @@ import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
 import omni.replicator.core as rep
 import omni.syntheticdata
 from isaacsim.core.nodes import BaseWriterNode, WriterRequest
+from isaacsim.core.utils.point_cloud import get_render_product_point_cloud_processor
 from isaacsim.core.utils.render_product import get_camera_prim_path
 from isaacsim.ros2.bridge import collect_namespace
 from pxr import Usd, UsdGeom
@@ -109,6 +110,9 @@ class OgnROS2RtxLidarHelper:
                     elif sensor_type == "point_cloud":
                         if db.inputs.fullScan:
                             writer = rep.writers.get("RtxLidar" + f"ROS2{time_type}PublishPointCloudBuffer")
+                        elif get_render_product_point_cloud_processor(render_product_path) is not None:
+                            # publish the point clouds processed by the processor of the render product
+                            writer = rep.writers.get("RtxLidar" + f"ROS2{time_type}PublishProcessedPointCloud")
                         else:
                             writer = rep.writers.get("RtxLidar" + f"ROS2{time_type}PublishPointCloud")
 
@@ -13,5 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .impl.command_queue import *
+from .impl.entity_batcher import *
+from .impl.entity_index import *
 from .impl.entity_utils import *
 from .impl.simulation_control import *
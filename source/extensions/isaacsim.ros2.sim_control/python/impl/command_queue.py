@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+# Number of latest wait times kept for the statistics
+WAIT_HISTORY_SIZE = 1000
+
+
+class _Command:
+    __slots__ = ("async_callback", "args", "kwargs", "deadline", "bounded", "sequence", "submit_time", "future")
+
+    def __init__(self, async_callback, args, kwargs, deadline, bounded, sequence, submit_time):
+        self.async_callback = async_callback
+        self.args = args
+        self.kwargs = kwargs
+        self.deadline = deadline
+        self.bounded = bounded
+        self.sequence = sequence
+        self.submit_time = submit_time
+        self.future = concurrent.futures.Future()
+
+    def __lt__(self, other):
+        # earliest deadline first (commands without deadline last), then first submitted first
+        return (self.deadline, self.sequence) < (other.deadline, other.sequence)
+
+
+class CommandQueue:
+    """Queue of commands (async callbacks) submitted from other threads (e.g.: ROS 2 executor threads) and started on
+    the simulation thread (the Kit event loop), a bounded number per frame.
+
+    Submitting a command only appends it to a deque (thread-safe without locks), and only the simulation thread
+    consumes the queue: once per frame, :meth:`drain` starts up to ``max_commands_per_frame`` commands as tasks of the
+    event loop, earliest deadline first (commands without deadline are started in submission order after them).
+    Commands that would miss their deadline by waiting for the next frame are started regardless of the bound, and
+    so are the commands submitted with ``bounded=False`` (e.g.: cheap requests that are coalesced into one batched
+    operation per frame, which the bound would otherwise split across frames).
+
+    .. note::
+
+        Commands are only started by :meth:`drain`: every command, even submitted to an empty queue, waits for the
+        next drain (the next update event, i.e.: up to one frame) before it starts.
+
+    Args:
+        max_commands_per_frame: Maximum number of commands started per frame. Defaults to 16.
+        clock: Function returning the current time in seconds. Defaults to ``time.perf_counter``.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> import asyncio
+        >>> from isaacsim.ros2.sim_control import CommandQueue
+        >>>
+        >>> async def command(value):
+        ...     return 2 * value
+        >>>
+        >>> command_queue = CommandQueue(max_commands_per_frame=4)
+        >>> future = command_queue.submit(command, 21)  # from any thread
+        >>> command_queue.drain(asyncio.get_event_loop())  # once per frame, from the simulation thread
+        1
+    """
+
+    def __init__(self, max_commands_per_frame=16, clock=time.perf_counter):
+        if max_commands_per_frame < 1:
+            raise ValueError(f"The maximum number of commands per frame must be positive, got {max_commands_per_frame}")
+        self.max_commands_per_frame = int(max_commands_per_frame)
+        self._clock = clock
+        self._incoming = deque()
+        self._pending = []
+        self._sequence = itertools.count()
+        self._closed = False
+        # statistics (updated by the simulation thread only)
+        self._wait_times = deque(maxlen=WAIT_HISTORY_SIZE)
+        self._received = 0
+        self._started = 0
+        self._deadline_misses = 0
+        self._max_depth = 0
+        self._last_drain_time = None
+        self._frame_time = 0.0
+
+    def __len__(self):
+        return len(self._incoming) + len(self._pending)
+
+    def submit(self, async_callback, *args, timeout=None, bounded=True, **kwargs):
+        """Submit a command to be started on the simulation thread.
+
+        This method can be called from any thread.
+
+        Args:
+            async_callback: Async function to call (on the simulation thread).
+            *args: Positional arguments of the function.
+            timeout: Maximum time (in seconds) the command should wait before being started. Commands with a
+                deadline are started before the ones without, earliest deadline first. Defaults to None (no deadline).
+            bounded: Whether the command counts towards the maximum number of commands started per frame. Commands
+                not bounded are started on the next frame. Defaults to True.
+            **kwargs: Keyword arguments of the function.
+
+        Raises:
+            RuntimeError: If the queue is closed.
+
+        Returns:
+            Future (``concurrent.futures.Future``) with the result of the command (cancelled if the queue is closed
+            while the command is submitted).
+        """
+        if self._closed:
+            raise RuntimeError("The command queue is closed")
+        submit_time = self._clock()
+        deadline = math.inf if timeout is None else submit_time + timeout
+        command = _Command(async_callback, args, kwargs, deadline, bounded, next(self._sequence), submit_time)
+        self._incoming.append(command)
+        if self._closed:
+            # closed (and drained) since the check above: the command would never be started
+            command.future.cancel()
+            try:
+                self._incoming.remove(command)
+            except ValueError:
+                pass
+        return command.future
+
+    def drain(self, loop):
+        """Start the queued commands due this frame as tasks of the event loop.
+
+        This method must be called from the simulation thread (once per frame).
+
+        Args:
+            loop: Event loop on which the commands run.
+
+        Returns:
+            Number of commands started.
+        """
+        now = self._clock()
+        if self._last_drain_time is not None:
+            self._frame_time = now - self._last_drain_time
+        self._last_drain_time = now
+        # move the submitted commands to the (deadline ordered) pending heap, and start the unbounded ones
+        unbounded = []
+        while self._incoming:
+            command = self._incoming.popleft()
+            if command.bounded:
+                heapq.heappush(self._pending, command)
+            else:
+                unbounded.append(command)
+            self._received += 1
+        self._max_depth = max(self._max_depth, len(self._pending) + len(unbounded))
+        for command in unbounded:
+            if not command.future.cancelled():
+                self._start(command, loop, now)
+        started = 0
+        while self._pending:
+            # beyond the bound, only start the commands that would miss their deadline by waiting for the next frame
+            if started >= self.max_commands_per_frame and self._pending[0].deadline > now + self._frame_time:
+                break
+            command = heapq.heappop(self._pending)
+            if command.future.cancelled():
+                continue
+            self._start(command, loop, now)
+            started += 1
+        return started + len(unbounded)
+
+    def close(self):
+        """Close the queue: cancel the queued commands and reject new ones.
+
+        A command submitted concurrently (appended after the queued commands are cancelled) is cancelled by
+        :meth:`submit`.
+        """
+        self._closed = True
+        while self._incoming:
+            self._incoming.popleft().future.cancel()
+        while self._pending:
+            self._pending.pop().future.cancel()
+
+    def get_stats(self):
+        """Get statistics of the queue.
+
+        Returns:
+            dict: Current ("depth") and maximum ("max_depth") number of queued commands, number of commands
+            "submitted" and "started", number of commands started after their deadline ("deadline_misses"), and
+            "mean", "p50", "p90", "p99" and "max" time (in milliseconds) the latest commands waited before being started
+            (NaN if no command was started).
+        """
+        wait_times = np.array(self._wait_times) * 1e3
+        depth = len(self)
+        stats = {
+            "depth": depth,
+            "max_depth": max(self._max_depth, depth),
+            "submitted": self._received + len(self._incoming),
+            "started": self._started,
+            "deadline_misses": self._deadline_misses,
+        }
+        if wait_times.size:
+            p50, p90, p99 = np.percentile(wait_times, [50, 90, 99])
+            stats.update(mean=float(wait_times.mean()), p50=float(p50), p90=float(p90), p99=float(p99))
+            stats["max"] = float(wait_times.max())
+        else:
+            stats.update({key: math.nan for key in ["mean", "p50", "p90", "p99", "max"]})
+        return stats
+
+    def reset_stats(self):
+        """Reset the statistics of the queue."""
+        self._wait_times.clear()
+        self._received = 0
+        self._started = 0
+        self._deadline_misses = 0
+        self._max_depth = 0
+
+    def _start(self, command, loop, now):
+        self._wait_times.append(now - command.submit_time)
+        self._started += 1
+        if now > command.deadline:
+            self._deadline_misses += 1
+        try:
+            task = loop.create_task(command.async_callback(*command.args, **command.kwargs))
+        except Exception as e:
+            command.future.set_exception(e)
+            return
+
+        def on_done(task):
+            if command.future.cancelled():
+                return
+            if task.cancelled():
+                command.future.cancel()
+            elif task.exception() is not None:
+                command.future.set_exception(task.exception())
+            else:
+                command.future.set_result(task.result())
+
+        task.add_done_callback(on_done)
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections import OrderedDict, namedtuple
+
+import carb
+import isaacsim.core.utils.stage as stage_utils
+import numpy as np
+import omni.kit.app
+from isaacsim.core.experimental.prims import RigidPrim, XformPrim
+from pxr import Sdf
+
+# Pending operations
+_EntityStateWrite = namedtuple(
+    "_EntityStateWrite", ["path", "is_rigid_body", "position", "orientation", "linear_velocity", "angular_velocity"]
+)
+_EntitySpawn = namedtuple("_EntitySpawn", ["path", "asset_path", "position", "orientation", "namespace"])
+
+
+class EntityBatcher:
+    """Coalesce the entity state writes and spawns requested within a frame into batched operations.
+
+    The requests are queued, and applied together before the next app update: the prims to spawn are authored in a
+    single ``Sdf.ChangeBlock`` and posed with a single ``XformPrim``, and the states of the entities are set with a
+    single ``RigidPrim`` (one tensor write while simulating) and a single ``XformPrim``, through the indices of the
+    entities in the wrappers cached by the entity index.
+    If a batched operation fails, the operations of the batch are applied one by one, so that an error only affects
+    the request that caused it.
+
+    Args:
+        entity_index: Index of the entities, providing the (cached) prim wrappers over the batched entities.
+    """
+
+    def __init__(self, entity_index):
+        self._entity_index = entity_index
+        self._state_writes = []
+        self._spawns = []
+        self._flush_task = None
+
+    def destroy(self):
+        """Cancel the pending operations."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        for _, future in self._state_writes + self._spawns:
+            if not future.done():
+                future.cancel()
+        self._state_writes = []
+        self._spawns = []
+
+    @property
+    def num_pending_spawns(self):
+        """Number of entities waiting to be spawned."""
+        return len(self._spawns)
+
+    def is_spawn_pending(self, entity_path):
+        """Check whether an entity is waiting to be spawned (its path is reserved).
+
+        Args:
+            entity_path: Path to the entity as a string.
+
+        Returns:
+            True if the entity is waiting to be spawned, False otherwise.
+        """
+        return any(spawn.path == entity_path for spawn, _ in self._spawns)
+
+    async def set_entity_state(
+        self, entity_path, is_rigid_body, position, orientation, linear_velocity=None, angular_velocity=None
+    ):
+        """Set the pose (and the velocities of a rigid body) of an entity along with the other requests of the frame.
+
+        Args:
+            entity_path: Path to the entity as a string.
+            is_rigid_body: Whether the entity is a rigid body (its velocities are set).
+            position: Position of the entity in the world frame.
+            orientation: Orientation of the entity in the world frame (quaternion wxyz).
+            linear_velocity: Linear velocity of the rigid body. Defaults to zero.
+            angular_velocity: Angular velocity of the rigid body. Defaults to zero.
+
+        Returns:
+            Error message, empty if the state was set.
+        """
+        write = _EntityStateWrite(
+            path=entity_path,
+            is_rigid_body=is_rigid_body,
+            position=position,
+            orientation=orientation,
+            linear_velocity=(0.0, 0.0, 0.0) if linear_velocity is None else linear_velocity,
+            angular_velocity=(0.0, 0.0, 0.0) if angular_velocity is None else angular_velocity,
+        )
+        return await self._enqueue(self._state_writes, write)
+
+    async def spawn_entity(self, entity_path, asset_path, position, orientation, namespace=None):
+        """Spawn an entity along with the other requests of the frame.
+
+        Args:
+            entity_path: Path to the entity to spawn as a string.
+            asset_path: Path to the USD file to reference. If None, an Xform is spawned.
+            position: Position of the entity in the world frame.
+            orientation: Orientation of the entity in the world frame (quaternion wxyz).
+            namespace: Namespace of the entity (``isaac:namespace`` attribute), if any.
+
+        Returns:
+            Error message, empty if the entity was spawned.
+        """
+        spawn = _EntitySpawn(
+            path=entity_path, asset_path=asset_path, position=position, orientation=orientation, namespace=namespace
+        )
+        return await self._enqueue(self._spawns, spawn)
+
+    async def _enqueue(self, queue, operation):
+        future = asyncio.get_event_loop().create_future()
+        queue.append((operation, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_async())
+        return await future
+
+    async def _flush_async(self):
+        """Apply the operations requested until the next app update."""
+        await omni.kit.app.get_app().next_update_async()
+        spawns, self._spawns = self._spawns, []
+        state_writes, self._state_writes = self._state_writes, []
+        # operations requested from now on go into the next batch
+        self._flush_task = None
+        spawn_errors = self._apply(spawns, self._apply_spawns)
+        self._resolve(state_writes, self._apply(state_writes, self._apply_state_writes))
+        if spawns:
+            # let the spawned entities be loaded (e.g.: in Fabric) before responding
+            await omni.kit.app.get_app().next_update_async()
+            self._resolve(spawns, spawn_errors)
+
+    def _apply(self, operations, apply):
+        """Apply queued operations with the given function, returning an error message for each of them."""
+        if not operations:
+            return []
+        try:
+            return apply([operation for operation, _ in operations])
+        except Exception as e:
+            carb.log_error(f"Error applying batched entity operations: {e}")
+            return [str(e)] * len(operations)
+
+    def _resolve(self, operations, errors):
+        for (_, future), error in zip(operations, errors):
+            if not future.done():
+                future.set_result(error)
+
+    def _apply_spawns(self, spawns):
+        stage = stage_utils.get_current_stage(backend="usd")
+        if not stage:
+            return ["Stage not available"] * len(spawns)
+        edit_target = stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+        # ancestors that do not exist yet are defined (as with Usd.Stage.DefinePrim)
+        undefined_ancestors = set()
+        for spawn in spawns:
+            if not Sdf.Path.IsValidPathString(spawn.path) or not Sdf.Path(spawn.path).IsAbsolutePath():
+                continue
+            for ancestor in Sdf.Path(spawn.path).GetParentPath().GetPrefixes():
+                if not stage.GetPrimAtPath(ancestor):
+                    undefined_ancestors.add(ancestor)
+
+        errors = [""] * len(spawns)
+        with Sdf.ChangeBlock():
+            for ancestor in undefined_ancestors:
+                Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(ancestor)).specifier = Sdf.SpecifierDef
+            for i, spawn in enumerate(spawns):
+                try:
+                    prim_spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(Sdf.Path(spawn.path)))
+                    prim_spec.specifier = Sdf.SpecifierDef
+                    if spawn.asset_path:
+                        prim_spec.referenceList.prependedItems.append(Sdf.Reference(spawn.asset_path))
+                    else:
+                        prim_spec.typeName = "Xform"
+                    # track the spawned entities by adding an attribute to mark them as spawned via this service
+                    Sdf.AttributeSpec(
+                        prim_spec, "simulationInterfacesSpawned", Sdf.ValueTypeNames.Bool, declaresCustom=True
+                    ).default = True
+                    if spawn.namespace:
+                        Sdf.AttributeSpec(
+                            prim_spec, "isaac:namespace", Sdf.ValueTypeNames.String, declaresCustom=True
+                        ).default = spawn.namespace
+                except Exception as e:
+                    errors[i] = f"Failed to parse or load USD file: {e}"
+
+        # pose the spawned entities (errors are only logged: the entities exist)
+        spawned = [spawn for spawn, error in zip(spawns, errors) if not error]
+        if spawned:
+            try:
+                self._set_world_poses(XformPrim, spawned, reset_xform_op_properties=True, cache=False)
+            except Exception as e:
+                carb.log_warn(f"Error setting batched transforms ({e}), setting the transforms one by one")
+                for spawn in spawned:
+                    try:
+                        self._set_world_poses(XformPrim, [spawn], reset_xform_op_properties=True, cache=False)
+                    except Exception as e:
+                        carb.log_error(f"Error setting transform for {spawn.path}: {e}")
+        return errors
+
+    def _apply_state_writes(self, state_writes):
+        # the last write requested for an entity wins
+        latest_writes = OrderedDict((write.path, write) for write in state_writes)
+        errors = {}
+        for prim_type, is_rigid_body in [(RigidPrim, True), (XformPrim, False)]:
+            writes = [write for write in latest_writes.values() if write.is_rigid_body == is_rigid_body]
+            if not writes:
+                continue
+            try:
+                self._set_world_poses(prim_type, writes, reset_xform_op_properties=True)
+            except Exception as e:
+                carb.log_warn(f"Error setting batched entity states ({e}), setting the states one by one")
+                self._entity_index._drop_prims(prim_type, reset_xform_op_properties=True)
+                for write in writes:
+                    try:
+                        self._set_world_poses(prim_type, [write], reset_xform_op_properties=True, cache=False)
+                    except Exception as e:
+                        errors[write.path] = str(e)
+                        carb.log_error(f"Error setting state for '{write.path}': {e}")
+        return [errors.get(write.path, "") for write in state_writes]
+
+    def _set_world_poses(self, prim_type, operations, reset_xform_op_properties, cache=True):
+        """Set the poses (and velocities of rigid bodies) of entities with a single prim wrapper."""
+        paths = [operation.path for operation in operations]
+        if cache:
+            prims, indices = self._entity_index._get_prims(prim_type, paths, reset_xform_op_properties)
+        else:
+            prims = prim_type(paths=paths, resolve_paths=False, reset_xform_op_properties=reset_xform_op_properties)
+            indices = None
+        positions = np.array([operation.position for operation in operations], dtype=np.float32).reshape((-1, 3))
+        orientations = np.array([operation.orientation for operation in operations], dtype=np.float32).reshape((-1, 4))
+        # no Sdf.ChangeBlock here: these are Usd-level writes (when not going through the physics tensors), which are
+        # not safe within a change block
+        prims.set_world_poses(positions=positions, orientations=orientations, indices=indices)
+        if prim_type is RigidPrim:
+            prims.set_velocities(
+                linear_velocities=np.array([write.linear_velocity for write in operations], dtype=np.float32),
+                angular_velocities=np.array([write.angular_velocity for write in operations], dtype=np.float32),
+                indices=indices,
+            )
@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections import namedtuple
+
+import carb
+import isaacsim.core.utils.stage as stage_utils
+import numpy as np
+from geometry_msgs.msg import Accel, Point, Pose, Quaternion, Twist, Vector3
+from isaacsim.core.experimental.prims import RigidPrim, XformPrim
+from pxr import Sdf, Tf, Usd, UsdGeom
+from simulation_interfaces.msg import EntityState, Result
+from std_msgs.msg import Header
+
+from .entity_utils import get_entity_state
+
+# Cached information about an entity
+_EntityInfo = namedtuple("_EntityInfo", ["frame_id", "is_rigid_body", "is_instance_proxy", "is_xformable"])
+
+
+def _make_entity_state(frame_id, position, orientation, linear_velocity=None, angular_velocity=None):
+    """Create an entity state message from a pose (quaternion wxyz) and optional velocities."""
+    entity_state = EntityState()
+    entity_state.header = Header(frame_id=frame_id, stamp=Header().stamp)
+    entity_state.pose = Pose(
+        position=Point(x=float(position[0]), y=float(position[1]), z=float(position[2])),
+        orientation=Quaternion(
+            w=float(orientation[0]), x=float(orientation[1]), y=float(orientation[2]), z=float(orientation[3])
+        ),
+    )
+    entity_state.twist = Twist(linear=Vector3(x=0.0, y=0.0, z=0.0), angular=Vector3(x=0.0, y=0.0, z=0.0))
+    if linear_velocity is not None:
+        entity_state.twist.linear = Vector3(
+            x=float(linear_velocity[0]), y=float(linear_velocity[1]), z=float(linear_velocity[2])
+        )
+        entity_state.twist.angular = Vector3(
+            x=float(angular_velocity[0]), y=float(angular_velocity[1]), z=float(angular_velocity[2])
+        )
+    entity_state.acceleration = Accel(linear=Vector3(x=0.0, y=0.0, z=0.0), angular=Vector3(x=0.0, y=0.0, z=0.0))
+    return entity_state
+
+
+class EntityIndex:
+    """Index of the entities (prim paths) of the current stage, kept current from USD change notices.
+
+    The list of entities is built from a traversal of the usdrt stage the first time it is queried, and is only
+    rebuilt after prims are added or removed (resynced) on the USD stage. Matches of filter patterns and per-entity
+    information (frame id, rigid body, instance proxy) are cached as well, so polling the entities of an unchanged
+    stage does not traverse it.
+
+    The states of the entities are queried in batches: the poses and velocities of all the matched rigid bodies are
+    read with a single ``RigidPrim``, and the poses of the other entities with a single ``XformPrim``. One wrapper of
+    each type is cached over all the entities queried so far (grown when new entities are queried, and dropped when
+    prims are resynced), and each batch is read or written through the indices of its entities in that wrapper.
+
+    .. note::
+
+        Prims created or removed only in Fabric (not on the USD stage) do not send USD change notices.
+        Call :meth:`invalidate` after such changes.
+    """
+
+    def __init__(self):
+        self._stage = None
+        self._listener = None
+        self._paths = None
+        self._filtered_paths = {}
+        self._entity_info = {}
+        self._prims = {}
+        self._resynced_paths = set()
+        self._changed_paths = set()
+
+    def destroy(self):
+        """Stop listening to USD change notices and clear the index."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+        self._stage = None
+        self.invalidate()
+
+    def invalidate(self):
+        """Clear the index (it is rebuilt on the next query)."""
+        self._paths = None
+        self._filtered_paths = {}
+        self._entity_info = {}
+        self._prims = {}
+        self._resynced_paths = set()
+        self._changed_paths = set()
+
+    def get_entities(self, usdrt_stage, filter_pattern=None):
+        """Get the entities, optionally filtered based on a regex pattern.
+
+        Args:
+            usdrt_stage: The usdrt stage to traverse for entities (only when the index needs to be rebuilt).
+            filter_pattern: Regex pattern to filter entities. If None, all entities are returned.
+
+        Returns:
+            Tuple containing filtered entities list and error message if any.
+            The first element is a list of prim path strings, the second is an error message string.
+        """
+        if not usdrt_stage:
+            return [], "usdrt Stage not available for traversing"
+        self._update()
+        if self._paths is None:
+            self._paths = [
+                path
+                for path in (prim.GetPrimPath().pathString for prim in list(usdrt_stage.Traverse())[1:])
+                if not path.startswith("/Render")
+            ]
+        if not filter_pattern:
+            return list(self._paths), ""
+        filtered_paths = self._filtered_paths.get(filter_pattern)
+        if filtered_paths is None:
+            try:
+                pattern = re.compile(filter_pattern)
+            except re.error as e:
+                return [], f"Invalid regex pattern: {e}"
+            filtered_paths = self._filtered_paths[filter_pattern] = [
+                path for path in self._paths if pattern.search(path)
+            ]
+        return list(filtered_paths), ""
+
+    async def get_entities_states(self, entity_paths):
+        """Get the states of multiple entities.
+
+        Args:
+            entity_paths: Paths to the entities as strings.
+
+        Returns:
+            List containing, for each entity, a tuple with the entity state (or None if error occurred), an error
+            message and a status code (see :func:`get_entity_state`).
+        """
+        self._update()
+        results = [None] * len(entity_paths)
+        rigid_body_indices, xform_indices = [], []
+        for index, entity_path in enumerate(entity_paths):
+            entity_info = self._get_entity_info(entity_path)
+            if entity_info is None:
+                results[index] = (None, f"Entity '{entity_path}' does not exist", Result.RESULT_NOT_FOUND)
+            elif entity_info.is_instance_proxy:
+                results[index] = (
+                    None,
+                    f"Entity '{entity_path}' is of InstanceProxy type. Cannot retrieve state.",
+                    Result.RESULT_FEATURE_UNSUPPORTED,
+                )
+            elif entity_info.is_rigid_body:
+                rigid_body_indices.append(index)
+            elif entity_info.is_xformable:
+                xform_indices.append(index)
+            else:
+                # entities without a transform (e.g.: materials) have an identity pose
+                entity_state = _make_entity_state(entity_info.frame_id, (0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0))
+                results[index] = (entity_state, "", Result.RESULT_OK)
+
+        for indices, prim_type in [(rigid_body_indices, RigidPrim), (xform_indices, XformPrim)]:
+            if not indices:
+                continue
+            paths = [entity_paths[index] for index in indices]
+            try:
+                prims, prim_indices = self._get_prims(prim_type, paths)
+                positions, orientations = prims.get_world_poses(indices=prim_indices)
+                positions, orientations = positions.numpy(), orientations.numpy()
+                linear_velocities = angular_velocities = [None] * len(paths)
+                if prim_type is RigidPrim:
+                    if prims.is_physics_tensor_entity_valid():
+                        linear_velocities, angular_velocities = (
+                            data.numpy() for data in prims.get_velocities(indices=prim_indices)
+                        )
+                    else:
+                        carb.log_warn("Physics tensor entity not valid for rigid bodies, velocities set to zero")
+            except Exception as error:
+                carb.log_warn(f"Error getting batched states ({error}), getting the states one by one")
+                self._drop_prims(prim_type)
+                for index in indices:
+                    results[index] = await get_entity_state(entity_paths[index])
+                continue
+            for i, index in enumerate(indices):
+                entity_state = _make_entity_state(
+                    self._entity_info[entity_paths[index]].frame_id,
+                    positions[i],
+                    orientations[i],
+                    linear_velocities[i],
+                    angular_velocities[i],
+                )
+                results[index] = (entity_state, "", Result.RESULT_OK)
+        return results
+
+    def get_entity_info(self, entity_path):
+        """Get the (cached) information about an entity.
+
+        Args:
+            entity_path: Path to the entity as a string.
+
+        Returns:
+            Named tuple with the frame id of the entity and whether it is a rigid body, an instance proxy or
+            xformable, or None if the entity does not exist.
+        """
+        self._update()
+        return self._get_entity_info(entity_path)
+
+    def _get_entity_info(self, entity_path):
+        """Get the (cached) information about an entity, None if it doesn't exist."""
+        entity_info = self._entity_info.get(entity_path)
+        if entity_info is None:
+            if self._stage is None or not Sdf.Path.IsValidPathString(entity_path):
+                return None
+            prim = self._stage.GetPrimAtPath(entity_path)
+            if not prim or not prim.IsValid():
+                return None
+            # use isaac:nameOverride if available and not empty, otherwise use prim name
+            frame_id = prim.GetName()
+            if prim.HasAttribute("isaac:nameOverride"):
+                override_value = prim.GetAttribute("isaac:nameOverride").Get()
+                if override_value and override_value.strip():
+                    frame_id = override_value
+            entity_info = _EntityInfo(
+                frame_id=frame_id,
+                is_rigid_body="PhysicsRigidBodyAPI" in prim.GetAppliedSchemas(),
+                is_instance_proxy=prim.IsInstanceProxy(),
+                is_xformable=prim.IsA(UsdGeom.Xformable),
+            )
+            self._entity_info[entity_path] = entity_info
+        return entity_info
+
+    def _get_prims(self, prim_type, paths, reset_xform_op_properties=False):
+        """Get the cached prim wrapper over the entities queried so far, and the indices of the given entities in it.
+
+        The wrapper is only rebuilt (over the previous and the new entities) when some of the entities are new.
+        """
+        key = (prim_type, reset_xform_op_properties)
+        prims, path_indices = self._prims.get(key, (None, {}))
+        new_paths = [path for path in dict.fromkeys(paths) if path not in path_indices]
+        if prims is None or not prims.valid or new_paths:
+            all_paths = list(path_indices) + new_paths
+            # the paths are existing prim paths: skip their (regex) resolution
+            prims = prim_type(paths=all_paths, resolve_paths=False, reset_xform_op_properties=reset_xform_op_properties)
+            path_indices = {path: index for index, path in enumerate(all_paths)}
+            self._prims[key] = (prims, path_indices)
+        return prims, np.array([path_indices[path] for path in paths], dtype=np.int32)
+
+    def _drop_prims(self, prim_type, reset_xform_op_properties=False):
+        """Drop the cached prim wrapper (e.g.: after an error), to rebuild it over the next queried entities only."""
+        self._prims.pop((prim_type, reset_xform_op_properties), None)
+
+    def _update(self):
+        """Follow the current stage and process the USD changes since the last query."""
+        stage = stage_utils.get_current_stage(backend="usd")
+        if stage != self._stage:
+            if self._listener is not None:
+                self._listener.Revoke()
+            self._stage = stage
+            self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+            self.invalidate()
+            return
+        if self._resynced_paths:
+            resynced_paths = self._resynced_paths
+            self._paths = None
+            self._filtered_paths = {}
+            self._prims = {}
+            if Sdf.Path.absoluteRootPath in resynced_paths:
+                self._entity_info = {}
+            else:
+                # drop the information of the resynced prims and of their descendants
+                for entity_path in list(self._entity_info.keys()):
+                    path = Sdf.Path(entity_path)
+                    if any(path.HasPrefix(resynced_path) for resynced_path in resynced_paths):
+                        del self._entity_info[entity_path]
+            self._resynced_paths = set()
+        for path in self._changed_paths:
+            self._entity_info.pop(path.pathString, None)
+        self._changed_paths = set()
+
+    def _on_objects_changed(self, notice, stage):
+        for path in notice.GetResyncedPaths():
+            if path.IsPropertyPath():
+                # a property was added or removed (e.g.: isaac:nameOverride): the prims are unchanged
+                self._changed_paths.add(path.GetPrimPath())
+            else:
+                self._resynced_paths.add(path)
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPropertyPath() and path.name == "isaac:nameOverride":
+                self._changed_paths.add(path.GetPrimPath())
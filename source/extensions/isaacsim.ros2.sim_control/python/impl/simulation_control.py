@@ -16,6 +16,8 @@
 import asyncio
 import os
 import threading
+import time
+from collections import deque
 
 import carb
 import isaacsim.core.utils.prims as prim_utils
@@ -24,7 +26,7 @@ import nest_asyncio
 import numpy as np
 import omni
 import omni.timeline
-from isaacsim.core.experimental.prims import RigidPrim, XformPrim
+from isaacsim.core.simulation_manager import SimulationManager
 from isaacsim.storage.native import (
     find_filtered_files_async,
     get_assets_root_path_async,
@@ -32,10 +34,12 @@ from isaacsim.storage.native import (
     is_valid_usd_file,
     resolve_asset_path_async,
 )
-from pxr import Sdf
 from usdrt import Usd
 
-from .entity_utils import create_empty_entity_state, get_entity_state, get_filtered_entities
+from .command_queue import CommandQueue
+from .entity_batcher import EntityBatcher
+from .entity_index import EntityIndex
+from .entity_utils import create_empty_entity_state, get_entity_state
 
 # Service prefix constant
 SERVICE_PREFIX = ""  # Prefix for all ROS2 services (empty by default)
@@ -68,6 +72,22 @@ ACTION_TYPES = [
     ("simulation_interfaces.action", "SimulateSteps", "simulate_steps"),
 ]
 
+# Number of latest request latencies kept for each service and action server
+LATENCY_HISTORY_SIZE = 1000
+
+# Maximum number of requests started per frame (requests that would miss their deadline are started regardless,
+# and so are the SpawnEntity and SetEntityState requests, which are coalesced into one batched operation per frame)
+MAX_COMMANDS_PER_FRAME = 16
+
+# Maximum time (in seconds) the requests controlling the simulation should wait before being started:
+# they are started before other requests (e.g.: entity queries) under load
+CONTROL_COMMAND_TIMEOUT = 0.05
+
+# Settings of the SimulateSteps action lockstep mode
+SIMULATE_STEPS_LOCKSTEP_SETTING = "/exts/isaacsim.ros2.sim_control/simulate_steps/lockstep"
+SIMULATE_STEPS_FEEDBACK_RATE_SETTING = "/exts/isaacsim.ros2.sim_control/simulate_steps/feedback_rate"
+SIMULATE_STEPS_YIELD_INTERVAL_SETTING = "/exts/isaacsim.ros2.sim_control/simulate_steps/yield_interval"
+
 
 # Define the Singleton decorator
 def Singleton(class_):
@@ -106,6 +126,13 @@ class ROS2ServiceManager:
         self.loop = None
         # Single callback group for parallel execution of both services and actions
         self.callback_group = None
+        # Latencies (in seconds) of the latest requests and number of requests, per service and action server
+        self.latencies = {}
+        self.request_counts = {}
+        self._latency_lock = threading.Lock()
+        # Queue of the requests received by the executor threads, started on the Kit event loop once per frame
+        self.command_queue = None
+        self._update_subscription = None
 
     def initialize(self):
         """Initialize the ROS2 node for simulation control services.
@@ -147,6 +174,14 @@ class ROS2ServiceManager:
 
             nest_asyncio.apply(self.loop)
 
+            # Drain the queue of requests on each app update
+            self.command_queue = CommandQueue(max_commands_per_frame=MAX_COMMANDS_PER_FRAME)
+            self._update_subscription = (
+                omni.kit.app.get_app()
+                .get_update_event_stream()
+                .create_subscription_to_pop(self._on_update, name="isaacsim.ros2.sim_control.command_queue")
+            )
+
             # Start a separate thread for ROS2 spinning with the multithreaded executor
             self.executor_thread = threading.Thread(target=self._spin)
             self.executor_thread.daemon = True
@@ -174,6 +209,11 @@ class ROS2ServiceManager:
 
         import rclpy
 
+        # Cancel the queued requests (releasing the executor threads waiting for them)
+        if self.command_queue:
+            self.command_queue.close()
+        self._update_subscription = None
+
         if self.executor:
             self.executor.shutdown()
 
@@ -197,6 +237,7 @@ class ROS2ServiceManager:
 
         self.callback_group = None
         self.executor = None
+        self.command_queue = None
 
         try:
             rclpy.shutdown()
@@ -206,13 +247,17 @@ class ROS2ServiceManager:
         self.is_initialized = False
         carb.log_info("ROS2 ServiceManager shutdown completed")
 
-    def register_service(self, service_name, service_type, callback):
+    def register_service(self, service_name, service_type, callback, timeout=None, bounded=True):
         """Register a new ROS2 service
 
         Args:
             service_name (str): Name of the service
             service_type: ROS2 service type
             callback: Async callback function to handle service requests
+            timeout (float): Maximum time (in seconds) a request should wait in the command queue before being
+                started. Requests with a deadline are started first (optional)
+            bounded (bool): Whether the requests count towards the maximum number of requests started per frame.
+                Requests not bounded are all started on the next frame (e.g.: requests batched per frame)
 
         Returns:
             bool: True if registration was successful, False otherwise
@@ -228,7 +273,10 @@ class ROS2ServiceManager:
         try:
             # Create service with callback group for parallel execution
             service = self.node.create_service(
-                service_type, service_name, self._wrap_async_callback(callback), callback_group=self.callback_group
+                service_type,
+                service_name,
+                self._wrap_async_callback(callback, service_name, timeout, bounded),
+                callback_group=self.callback_group,
             )
             self.services[service_name] = service
             carb.log_info(f"Registered ROS2 service: {service_name} with parallel callback execution")
@@ -286,7 +334,7 @@ class ROS2ServiceManager:
             return False
 
     def register_action_server(
-        self, action_name, action_type, execute_callback, goal_callback=None, cancel_callback=None
+        self, action_name, action_type, execute_callback, goal_callback=None, cancel_callback=None, timeout=None
     ):
         """Register a new ROS2 action server
 
@@ -296,6 +344,8 @@ class ROS2ServiceManager:
             execute_callback: Async callback function to handle action execution
             goal_callback: Callback to accept/reject goals (optional)
             cancel_callback: Callback to handle cancellation (optional)
+            timeout (float): Maximum time (in seconds) a goal should wait in the command queue before its execution
+                is started. Goals with a deadline are started first (optional)
 
         Returns:
             bool: True if registration was successful, False otherwise
@@ -317,7 +367,7 @@ class ROS2ServiceManager:
                 node=self.node,
                 action_type=action_type,
                 action_name=action_name,
-                execute_callback=self._wrap_async_callback(execute_callback),
+                execute_callback=self._wrap_async_callback(execute_callback, action_name, timeout),
                 goal_callback=goal_callback,
                 cancel_callback=cancel_callback,
                 callback_group=self.callback_group,
@@ -331,25 +381,108 @@ class ROS2ServiceManager:
             carb.log_error(f"Failed to register action server '{action_name}': {e}")
             return False
 
-    def _wrap_async_callback(self, async_callback):
+    def get_latency_stats(self, name=None):
+        """Get statistics of the latency of the latest requests of the services and action servers.
+
+        The latency of a request is measured from its reception (in the ROS2 executor thread) until its response,
+        including the time spent waiting for the Kit event loop (e.g.: for batched operations to be applied).
+
+        Args:
+            name (str): Name of the service or action server. If None, the statistics of all of them are returned.
+
+        Returns:
+            dict: Number of requests ("count") and "mean", "p50", "p90", "p99" and "max" latencies (in milliseconds)
+            of the latest requests (up to ``LATENCY_HISTORY_SIZE``). If a name is given, the statistics of that
+            service or action server only (empty if it has no requests), otherwise the statistics per name.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> stats = service_manager.get_latency_stats("set_entity_state")
+            >>> stats["count"], stats["p99"]
+            (250, 17.2)
+        """
+        with self._latency_lock:
+            names = list(self.latencies.keys()) if name is None else [name]
+            latencies = {key: np.array(self.latencies.get(key, ())) * 1e3 for key in names}
+            counts = {key: self.request_counts.get(key, 0) for key in names}
+        stats = {}
+        for key in names:
+            if not latencies[key].size:
+                stats[key] = {}
+                continue
+            p50, p90, p99 = np.percentile(latencies[key], [50, 90, 99])
+            stats[key] = {
+                "count": counts[key],
+                "mean": float(latencies[key].mean()),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+                "max": float(latencies[key].max()),
+            }
+        return stats if name is None else stats[name]
+
+    def reset_latency_stats(self):
+        """Clear the latencies of the requests of all the services and action servers."""
+        with self._latency_lock:
+            self.latencies.clear()
+            self.request_counts.clear()
+
+    def get_command_queue_stats(self):
+        """Get statistics of the queue of requests waiting to be started on the Kit event loop.
+
+        Returns:
+            dict: Queue depth and wait time statistics (see :meth:`CommandQueue.get_stats`), empty if the service
+            manager is not initialized.
+        """
+        return self.command_queue.get_stats() if self.command_queue else {}
+
+    def _on_update(self, event):
+        """Start the queued requests due this frame."""
+        if self.command_queue:
+            self.command_queue.drain(self.loop)
+
+    def _wrap_async_callback(self, async_callback, name=None, timeout=None, bounded=True):
         """Wrap any async callback to work with ROS2 services and actions
 
+        The requests are handed off to the Kit event loop through the command queue: each request waits for the next
+        update event (up to one frame) before it starts.
+
         Args:
             async_callback: Async callback function
+            name (str): Name of the service or action server, to record the latency of its requests (optional)
+            timeout (float): Maximum time (in seconds) a request should wait in the command queue (optional)
+            bounded (bool): Whether the requests count towards the maximum number of requests started per frame
 
         Returns:
             function: Wrapped callback that handles the event loop
         """
 
         def wrapper(*args, **kwargs):
-            if not self.loop:
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-            future = asyncio.run_coroutine_threadsafe(async_callback(*args, **kwargs), self.loop)
-            return future.result()
+            start = time.perf_counter()
+            if self.command_queue:
+                future = self.command_queue.submit(async_callback, *args, timeout=timeout, bounded=bounded, **kwargs)
+            else:
+                if not self.loop:
+                    self.loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(self.loop)
+                future = asyncio.run_coroutine_threadsafe(async_callback(*args, **kwargs), self.loop)
+            try:
+                return future.result()
+            finally:
+                if name is not None:
+                    self._record_latency(name, time.perf_counter() - start)
 
         return wrapper
 
+    def _record_latency(self, name, latency):
+        with self._latency_lock:
+            if name not in self.latencies:
+                self.latencies[name] = deque(maxlen=LATENCY_HISTORY_SIZE)
+            self.latencies[name].append(latency)
+            self.request_counts[name] = self.request_counts.get(name, 0) + 1
+
     def unregister_action_server(self, action_name, remove_from_dict=True):
         """Unregister a ROS2 action server.
 
@@ -446,7 +579,11 @@ class SimulationControl:
         """
         self.timeline = omni.timeline.get_timeline_interface()
         self.service_manager = ROS2ServiceManager()
+        self.entity_index = EntityIndex()
+        self.entity_batcher = EntityBatcher(self.entity_index)
         self.is_initialized = False
+        # Timing statistics of the last SimulateSteps goal executed in lockstep mode
+        self.simulate_steps_stats = {}
 
         # Import interfaces using helper method
         self._import_interfaces(SERVICE_TYPES, "service")
@@ -455,23 +592,27 @@ class SimulationControl:
         # Initialize and register services
         self._initialize_ros2_services()
 
-    def _register_service_if_available(self, service_class_name, handler):
+    def _register_service_if_available(self, service_class_name, handler, timeout=None, bounded=True):
         """Register a service if its type is available.
 
         Args:
             service_class_name (str): Name of the service class attribute (e.g., 'GetSimulationState').
             handler: The handler function for the service.
+            timeout (float): Maximum time (in seconds) a request should wait before being started (optional).
+            bounded (bool): Whether the requests count towards the maximum number of requests started per frame.
         """
         if hasattr(self, service_class_name):
             service_class = getattr(self, service_class_name)
             if service_class:
                 service_name = getattr(self, f"{service_class_name}_service_name")
-                self.service_manager.register_service(f"{SERVICE_PREFIX}{service_name}", service_class, handler)
+                self.service_manager.register_service(
+                    f"{SERVICE_PREFIX}{service_name}", service_class, handler, timeout=timeout, bounded=bounded
+                )
             else:
                 carb.log_error(f"{service_class_name} service type not available")
 
     def _register_action_server_if_available(
-        self, action_class_name, execute_handler, goal_callback=None, cancel_callback=None
+        self, action_class_name, execute_handler, goal_callback=None, cancel_callback=None, timeout=None
     ):
         """Register an action server if its type is available.
 
@@ -480,6 +621,7 @@ class SimulationControl:
             execute_handler: The execute callback function for the action server.
             goal_callback: Callback to accept/reject goals (optional).
             cancel_callback: Callback to handle cancellation (optional).
+            timeout (float): Maximum time (in seconds) a goal should wait before its execution is started (optional).
         """
         if hasattr(self, action_class_name):
             action_class = getattr(self, action_class_name)
@@ -491,6 +633,7 @@ class SimulationControl:
                     execute_handler,
                     goal_callback=goal_callback,
                     cancel_callback=cancel_callback,
+                    timeout=timeout,
                 )
             else:
                 carb.log_error(f"{action_class_name} action type not available")
@@ -517,17 +660,27 @@ class SimulationControl:
                 return
 
             # Register services using helper methods
-            self._register_service_if_available("GetSimulationState", self._handle_get_simulation_state)
-            self._register_service_if_available("SetSimulationState", self._handle_set_simulation_state)
+            # (the requests controlling the simulation are started before the other requests under load)
+            self._register_service_if_available(
+                "GetSimulationState", self._handle_get_simulation_state, timeout=CONTROL_COMMAND_TIMEOUT
+            )
+            self._register_service_if_available(
+                "SetSimulationState", self._handle_set_simulation_state, timeout=CONTROL_COMMAND_TIMEOUT
+            )
             self._register_service_if_available("GetEntities", self._handle_get_entities)
             self._register_service_if_available("DeleteEntity", self._handle_delete_entity)
             self._register_service_if_available("GetEntityInfo", self._handle_get_entity_info)
-            self._register_service_if_available("SpawnEntity", self._handle_spawn_entity)
-            self._register_service_if_available("ResetSimulation", self._handle_reset_simulation)
-            self._register_service_if_available("StepSimulation", self._handle_step_simulation)
+            # (the requests batched per frame are not bounded, so that a batch is not split across frames)
+            self._register_service_if_available("SpawnEntity", self._handle_spawn_entity, bounded=False)
+            self._register_service_if_available(
+                "ResetSimulation", self._handle_reset_simulation, timeout=CONTROL_COMMAND_TIMEOUT
+            )
+            self._register_service_if_available(
+                "StepSimulation", self._handle_step_simulation, timeout=CONTROL_COMMAND_TIMEOUT
+            )
             self._register_service_if_available("GetEntityState", self._handle_get_entity_state)
             self._register_service_if_available("GetEntitiesStates", self._handle_get_entities_states)
-            self._register_service_if_available("SetEntityState", self._handle_set_entity_state)
+            self._register_service_if_available("SetEntityState", self._handle_set_entity_state, bounded=False)
             self._register_service_if_available("GetSimulatorFeatures", self._handle_get_simulator_features)
             self._register_service_if_available("LoadWorld", self._handle_load_world)
             self._register_service_if_available("UnloadWorld", self._handle_unload_world)
@@ -540,6 +693,7 @@ class SimulationControl:
                 self._handle_simulate_steps_action,
                 goal_callback=None,
                 cancel_callback=self._handle_simulate_steps_cancel_callback,
+                timeout=CONTROL_COMMAND_TIMEOUT,
             )
 
             self.is_initialized = True
@@ -645,11 +799,11 @@ class SimulationControl:
                 response.result.error_message = "usdrt Stage not available for traversing"
                 return response
 
-            # Get filtered entities using external helper function
+            # Get filtered entities from the entity index
             filter_pattern = (
                 request.filters.filter if hasattr(request, "filters") and hasattr(request.filters, "filter") else None
             )
-            filtered_entities, error = get_filtered_entities(usdrt_stage, filter_pattern)
+            filtered_entities, error = self.entity_index.get_entities(usdrt_stage, filter_pattern)
 
             if error:
                 response.result.result = Result.RESULT_OPERATION_FAILED
@@ -837,15 +991,16 @@ class SimulationControl:
                                 spawned_count += 1
                 else:
                     carb.log_warn("usdrt stage not available for counting spawned entities, using 0 as count")
-                entity_name = f"SpawnedEntity_{spawned_count}"
+                # Entities waiting to be spawned (batched) are counted as well
+                entity_name = f"SpawnedEntity_{spawned_count + self.entity_batcher.num_pending_spawns}"
             elif not entity_name.startswith("/"):
                 # Name provided
                 # The stage will handle the proper path creation based on where this is added
                 entity_name = f"/{entity_name}"
                 carb.log_info(f"Using entity name as is: /{entity_name}")
 
-            # Check if name already exists
-            if stage.GetPrimAtPath(entity_name):
+            # Check if name already exists (or is reserved by an entity waiting to be spawned)
+            if stage.GetPrimAtPath(entity_name) or self.entity_batcher.is_spawn_pending(entity_name):
                 if not request.allow_renaming:
                     response.result.result = response.NAME_NOT_UNIQUE
                     response.result.error_message = f"Entity '{entity_name}' already exists and allow_renaming is false"
@@ -853,7 +1008,9 @@ class SimulationControl:
                 # Generate a unique name
                 base_name = entity_name
                 suffix = 1
-                while stage.GetPrimAtPath(f"{base_name}_{suffix}"):
+                while stage.GetPrimAtPath(f"{base_name}_{suffix}") or self.entity_batcher.is_spawn_pending(
+                    f"{base_name}_{suffix}"
+                ):
                     suffix += 1
                 entity_name = f"{base_name}_{suffix}"
 
@@ -877,60 +1034,20 @@ class SimulationControl:
                         request.initial_pose.pose.orientation.z,
                     ]
 
-            # Create the entity based on URI or create a new Xform
-            if path_to_load:
-                # Load USD file as reference
-                try:
-                    # Create a reference using the validated path
-                    prim = stage.DefinePrim(entity_name)
-                    prim.GetReferences().AddReference(path_to_load)
-
-                    try:
-                        # Create XformPrim wrapper for the spawned entity
-                        xform_prim = XformPrim(entity_name, reset_xform_op_properties=True)
-
-                        # Set position and orientation
-                        xform_prim.set_world_poses(positions=position, orientations=orientation)
-
-                        carb.log_info(f"Set transform for {entity_name}")
-
-                    except Exception as e:
-                        carb.log_error(f"Error setting transform for {entity_name}: {e}")
+            # Create the entity based on URI (loading the USD file as reference) or create a new Xform,
+            # along with the other requests of the frame (batched)
+            namespace = request.entity_namespace if hasattr(request, "entity_namespace") else None
+            error = await self.entity_batcher.spawn_entity(entity_name, path_to_load, position, orientation, namespace)
+            if error:
+                response.result.result = response.RESOURCE_PARSE_ERROR
+                response.result.error_message = error
+                return response
 
-                    carb.log_info(
-                        f"Successfully spawned entity from URI: {entity_name} with reference to {path_to_load}"
-                    )
-                except Exception as e:
-                    response.result.result = response.RESOURCE_PARSE_ERROR
-                    response.result.error_message = f"Failed to parse or load USD file: {e}"
-                    return response
+            if path_to_load:
+                carb.log_info(f"Successfully spawned entity from URI: {entity_name} with reference to {path_to_load}")
             else:
-                # Create a new Xform prim
-                stage.DefinePrim(entity_name, "Xform")
-
-                # Use XformPrim to set the transform
-                xform_prim = XformPrim(entity_name, reset_xform_op_properties=True)
-
-                xform_prim.set_world_poses(positions=position, orientations=orientation)
-
                 carb.log_info(f"Successfully spawned empty Xform entity: {entity_name}")
 
-            # Track the spawned entities by adding an attribute to mark it as spawned via this service
-            prim = stage.GetPrimAtPath(entity_name)
-            attr1 = prim.CreateAttribute("simulationInterfacesSpawned", Sdf.ValueTypeNames.Bool, custom=True)
-            attr1.Set(True)
-
-            # Add namespace attribute if specified in the request
-            if hasattr(request, "entity_namespace") and request.entity_namespace:
-                try:
-                    # Create and set the namespace attribute
-                    attr = prim.CreateAttribute("isaac:namespace", Sdf.ValueTypeNames.String, custom=True)
-                    result = attr.Set(request.entity_namespace)
-                except Exception as e:
-                    carb.log_error(f"Error setting namespace attribute: {e}")
-
-            await omni.kit.app.get_app().next_update_async()
-
             # Set the response
             response.entity_name = entity_name
             response.result.result = Result.RESULT_OK
@@ -1156,21 +1273,19 @@ class SimulationControl:
                 )
                 return response
 
-            # Get filtered entities using external helper function
+            # Get filtered entities from the entity index
             filter_pattern = (
                 request.filters.filter if hasattr(request, "filters") and hasattr(request.filters, "filter") else None
             )
-            filtered_entities, error = get_filtered_entities(usdrt_stage, filter_pattern)
+            filtered_entities, error = self.entity_index.get_entities(usdrt_stage, filter_pattern)
 
             if error:
                 response.result = Result(result=Result.RESULT_OPERATION_FAILED, error_message=error)
                 return response
 
-            # Process each filtered entity to get its state
-            for entity_path in filtered_entities:
-                # Get entity state using external helper function
-                entity_state, error, _ = await get_entity_state(entity_path)
-
+            # Get the states of all the filtered entities at once
+            entities_states = await self.entity_index.get_entities_states(filtered_entities)
+            for entity_path, (entity_state, error, _) in zip(filtered_entities, entities_states):
                 # Add to entities list regardless of state retrieval success
                 response.entities.append(entity_path)
 
@@ -1212,8 +1327,9 @@ class SimulationControl:
 
             from simulation_interfaces.msg import Result
 
-            # Check if the entity exists
-            if not prim_utils.is_prim_path_valid(request.entity):
+            # Check if the entity exists (from the entity index)
+            entity_info = self.entity_index.get_entity_info(request.entity)
+            if entity_info is None:
                 response.result = Result(
                     result=Result.RESULT_NOT_FOUND, error_message=f"Entity '{request.entity}' does not exist"
                 )
@@ -1227,82 +1343,49 @@ class SimulationControl:
             angular_velocity = entity_state.twist.angular
 
             try:
-                # Get regular stage for prim operations
-                stage = stage_utils.get_current_stage()
-                if not stage:
-                    response.result = Result(result=Result.RESULT_OPERATION_FAILED, error_message="Stage not available")
-                    return response
-
-                prim = stage.GetPrimAtPath(request.entity)
-                if not prim:
-                    response.result = Result(
-                        result=Result.RESULT_NOT_FOUND, error_message=f"Entity '{request.entity}' not found in stage"
-                    )
-                    return response
-
-                # Check for PhysicsRigidBodyAPI
-                applied_apis = prim.GetAppliedSchemas()
-                has_rigid_body = "PhysicsRigidBodyAPI" in applied_apis
-
-                velocity_message = ""
-
-                if has_rigid_body:
-                    # Use RigidPrim for rigid bodies - can set both pose and velocities
-                    try:
-                        # Initialize RigidPrim for the entity
-                        rigid_prim = RigidPrim(paths=request.entity, reset_xform_op_properties=True)
-
-                        # Set position and orientation
-                        rigid_prim.set_world_poses(
-                            positions=np.array([position.x, position.y, position.z]),
-                            orientations=np.array([orientation.w, orientation.x, orientation.y, orientation.z]),
-                        )
+                # Set the state along with the other requests of the frame (batched)
+                # Rigid bodies can have both pose and velocities set, other entities only their pose
+                error = await self.entity_batcher.set_entity_state(
+                    request.entity,
+                    entity_info.is_rigid_body,
+                    position=[position.x, position.y, position.z],
+                    orientation=[orientation.w, orientation.x, orientation.y, orientation.z],
+                    linear_velocity=[linear_velocity.x, linear_velocity.y, linear_velocity.z],
+                    angular_velocity=[angular_velocity.x, angular_velocity.y, angular_velocity.z],
+                )
 
-                        # Set linear and angular velocities using the combined method
-                        linear_vel = np.array([linear_velocity.x, linear_velocity.y, linear_velocity.z])
-                        angular_vel = np.array([angular_velocity.x, angular_velocity.y, angular_velocity.z])
-                        rigid_prim.set_velocities(linear_velocities=linear_vel, angular_velocities=angular_vel)
-
-                        # Log based on timeline state
-                        if not self.timeline.is_playing():
-                            velocity_message = "Position, orientation, and velocities set while simulation is paused. Velocities will take effect when simulation resumes."
-                            carb.log_info(
-                                f"Set pose and velocities for rigid body '{request.entity}' while simulation is paused"
-                            )
-                        else:
-                            velocity_message = "Position, orientation, and velocities set successfully."
-                            carb.log_info(f"Set pose and velocities for rigid body '{request.entity}'")
-
-                    except Exception as rigid_error:
+                if entity_info.is_rigid_body:
+                    if error:
                         response.result = Result(
                             result=Result.RESULT_OPERATION_FAILED,
-                            error_message=f"Error setting rigid body state: {rigid_error}",
+                            error_message=f"Error setting rigid body state: {error}",
                         )
-                        carb.log_error(f"Error setting rigid body state for '{request.entity}': {rigid_error}")
+                        carb.log_error(f"Error setting rigid body state for '{request.entity}': {error}")
                         return response
 
-                else:
-                    # Non-rigid bodies - can only set pose
-                    try:
-                        xform_prim = XformPrim(request.entity, resolve_paths=False, reset_xform_op_properties=True)
-
-                        # Set position and orientation
-                        xform_prim.set_world_poses(
-                            positions=[position.x, position.y, position.z],
-                            orientations=[orientation.w, orientation.x, orientation.y, orientation.z],
+                    # Log based on timeline state
+                    if not self.timeline.is_playing():
+                        velocity_message = "Position, orientation, and velocities set while simulation is paused. Velocities will take effect when simulation resumes."
+                        carb.log_info(
+                            f"Set pose and velocities for rigid body '{request.entity}' while simulation is paused"
                         )
+                    else:
+                        velocity_message = "Position, orientation, and velocities set successfully."
+                        carb.log_info(f"Set pose and velocities for rigid body '{request.entity}'")
 
-                        velocity_message = "Entity doesn't have rigid body API, only position and orientation were set."
-                        carb.log_info(f"Set pose for '{request.entity}'")
-
-                    except Exception as xform_error:
+                else:
+                    # Non-rigid bodies - can only set pose
+                    if error:
                         response.result = Result(
                             result=Result.RESULT_OPERATION_FAILED,
-                            error_message=f"Error setting transform: {xform_error}",
+                            error_message=f"Error setting transform: {error}",
                         )
-                        carb.log_error(f"Error setting transform for '{request.entity}': {xform_error}")
+                        carb.log_error(f"Error setting transform for '{request.entity}': {error}")
                         return response
 
+                    velocity_message = "Entity doesn't have rigid body API, only position and orientation were set."
+                    carb.log_info(f"Set pose for '{request.entity}'")
+
                 # Check acceleration values and add message if they are non-zero
                 acceleration_message = ""
                 if hasattr(entity_state, "acceleration"):
@@ -1385,6 +1468,10 @@ class SimulationControl:
                 goal_handle.abort()
                 return result_msg
 
+            # Step the physics only, in a tight loop
+            if carb.settings.get_settings().get_as_bool(SIMULATE_STEPS_LOCKSTEP_SETTING):
+                return await self._simulate_steps_lockstep(goal_handle, steps, feedback_msg, result_msg)
+
             # Get application instance
             app = omni.kit.app.get_app()
             self.timeline.play()
@@ -1447,6 +1534,115 @@ class SimulationControl:
 
         return result_msg
 
+    async def _simulate_steps_lockstep(self, goal_handle, steps, feedback_msg, result_msg):
+        """Execute a SimulateSteps goal in lockstep mode
+
+        The physics is stepped (``SimulationManager.step``) the requested number of times in a tight loop while the
+        timeline stays paused, so that the app does not step the physics in between: the number of physics steps
+        is deterministic, and the per-step overhead is that of a standalone stepping loop.
+        Cancellation is checked before each step, feedback is throttled to the configured rate, and the loop yields
+        to the app at the configured interval (without stepping the physics) so that other requests are served.
+
+        Args:
+            goal_handle: ROS2 action goal handle that contains the goal and methods
+                         to publish feedback and set result
+            steps (int): Number of physics steps
+            feedback_msg: Feedback message for the SimulateSteps action
+            result_msg: Result message for the SimulateSteps action
+
+        Returns:
+            result: Result message for the SimulateSteps action, with the timing statistics in its error message
+        """
+        from simulation_interfaces.msg import Result
+
+        settings = carb.settings.get_settings()
+        feedback_rate = settings.get_as_float(SIMULATE_STEPS_FEEDBACK_RATE_SETTING)
+        yield_interval = settings.get_as_float(SIMULATE_STEPS_YIELD_INTERVAL_SETTING)
+        feedback_period = 1.0 / feedback_rate if feedback_rate > 0 else 0.0
+
+        app = omni.kit.app.get_app()
+        # Start the simulation (paused) if it is stopped
+        if self.timeline.is_stopped():
+            self.timeline.play()
+            self.timeline.commit()
+            self.timeline.pause()
+            self.timeline.commit()
+            await app.next_update_async()
+            SimulationManager.initialize_physics()
+
+        feedback_msg.completed_steps = 0
+        feedback_msg.remaining_steps = steps
+        completed_steps = 0
+        num_feedbacks = 0
+        total_step_time = 0.0
+        max_step_time = 0.0
+        error_message = ""
+        start = last_feedback = last_yield = time.perf_counter()
+        while completed_steps < steps:
+            # Check if goal has been canceled
+            if goal_handle.is_cancel_requested:
+                error_message = "Simulation stepping was canceled"
+                break
+            step_start = time.perf_counter()
+            SimulationManager.step()
+            now = time.perf_counter()
+            completed_steps += 1
+            total_step_time += now - step_start
+            max_step_time = max(max_step_time, now - step_start)
+
+            # Publish (throttled) feedback
+            if now - last_feedback >= feedback_period or completed_steps == steps:
+                feedback_msg.completed_steps = completed_steps
+                feedback_msg.remaining_steps = steps - completed_steps
+                goal_handle.publish_feedback(feedback_msg)
+                num_feedbacks += 1
+                last_feedback = now
+
+            # Yield to the app (the physics is not stepped while the timeline is paused)
+            if yield_interval > 0 and now - last_yield >= yield_interval and completed_steps < steps:
+                await app.next_update_async()
+                last_yield = time.perf_counter()
+                if self.timeline.is_playing():
+                    error_message = "Simulation was played during lockstep stepping"
+                    break
+        wall_time = time.perf_counter() - start
+
+        # Let the app reflect the state of the simulation after the steps
+        await app.next_update_async()
+
+        steps_per_second = completed_steps / wall_time if wall_time > 0 else 0.0
+        mean_step_time = total_step_time / completed_steps * 1e3 if completed_steps else 0.0
+        self.simulate_steps_stats = {
+            "steps": completed_steps,
+            "wall_time": wall_time,
+            "steps_per_second": steps_per_second,
+            "mean_step_time": mean_step_time,
+            "max_step_time": max_step_time * 1e3,
+            "feedbacks": num_feedbacks,
+        }
+        stats_message = (
+            f"{completed_steps} steps in {wall_time:.3f} s ({steps_per_second:.1f} steps/s, "
+            f"mean step {mean_step_time:.3f} ms, max step {max_step_time * 1e3:.3f} ms)"
+        )
+        carb.log_info(f"SimulateSteps lockstep: {stats_message}")
+
+        if error_message:
+            if goal_handle.is_cancel_requested:
+                goal_handle.canceled()
+                result_msg.result.result = Result.RESULT_OPERATION_FAILED
+            else:
+                goal_handle.abort()
+                result_msg.result.result = Result.RESULT_INCORRECT_STATE
+            result_msg.result.error_message = f"{error_message} after {stats_message}"
+            return result_msg
+
+        result_msg.result.result = Result.RESULT_OK
+        result_msg.result.error_message = (
+            f"Successfully stepped simulation by {steps} frames in lockstep: {stats_message}"
+        )
+        goal_handle.succeed()
+        return result_msg
+
     def _handle_simulate_steps_cancel_callback(self, goal_handle):
         """Handle cancellation requests for SimulateSteps action.
 
@@ -1861,6 +2057,10 @@ class SimulationControl:
         """
         if self.service_manager:
             self.service_manager.shutdown()
+        if self.entity_batcher:
+            self.entity_batcher.destroy()
+        if self.entity_index:
+            self.entity_index.destroy()
 
 
 class Extension(omni.ext.IExt):
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import concurrent.futures
+import math
+
+import omni.kit.test
+from isaacsim.ros2.sim_control import CommandQueue
+
+
+class _Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class TestCommandQueue(omni.kit.test.AsyncTestCase):
+    """Test the command queue without ROS: a thread pool stands in for the ROS 2 executor."""
+
+    async def setUp(self):
+        self._clock = _Clock()
+        self._queue = CommandQueue(max_commands_per_frame=2, clock=self._clock)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._started = []
+
+    async def tearDown(self):
+        self._queue.close()
+        self._executor.shutdown(wait=True)
+
+    async def _command(self, name):
+        self._started.append(name)
+        await asyncio.sleep(0)
+        return name
+
+    def _submit(self, name, timeout=None):
+        # submit from a stand-in executor thread, as the ROS 2 service callbacks do
+        return self._executor.submit(lambda: self._queue.submit(self._command, name, timeout=timeout)).result()
+
+    async def _frame(self, duration=0.02):
+        """Simulate a frame: drain the queue and let the started commands run."""
+        self._clock.time += duration
+        started = self._queue.drain(asyncio.get_event_loop())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return started
+
+    async def test_bounded_drain(self):
+        futures = [self._submit(f"command_{i}") for i in range(5)]
+        self.assertEqual(len(self._queue), 5)
+        self.assertEqual(await self._frame(), 2)
+        self.assertEqual(self._started, ["command_0", "command_1"])
+        self.assertEqual(await self._frame(), 2)
+        self.assertEqual(await self._frame(), 1)
+        self.assertEqual(await self._frame(), 0)
+        # results are handed back to the submitting threads
+        results = [self._executor.submit(future.result, 1.0).result() for future in futures]
+        self.assertEqual(results, [f"command_{i}" for i in range(5)])
+
+        stats = self._queue.get_stats()
+        self.assertEqual(stats["depth"], 0)
+        self.assertEqual(stats["max_depth"], 5)
+        self.assertEqual(stats["submitted"], 5)
+        self.assertEqual(stats["started"], 5)
+        self.assertEqual(stats["deadline_misses"], 0)
+        # waited 1 frame (command_0 and 1), 2 frames (command_2 and 3) and 3 frames (command_4)
+        self.assertAlmostEqual(stats["max"], 60.0)
+        self.assertAlmostEqual(stats["p50"], 40.0)
+        self._queue.reset_stats()
+        self.assertTrue(math.isnan(self._queue.get_stats()["mean"]))
+
+    async def test_deadline_scheduling(self):
+        await self._frame()
+        self._submit("bulk_0")
+        self._submit("bulk_1")
+        self._submit("control_late", timeout=0.5)
+        self._submit("control_early", timeout=0.1)
+        # earliest deadline first, then the commands without deadline in submission order
+        await self._frame()
+        self.assertEqual(self._started, ["control_early", "control_late"])
+        await self._frame()
+        self.assertEqual(self._started[2:], ["bulk_0", "bulk_1"])
+
+        # commands that would miss their deadline by waiting for the next frame are started beyond the bound
+        self._started.clear()
+        for i in range(3):
+            self._submit(f"control_{i}", timeout=0.01)
+        self._submit("bulk_2")
+        self.assertEqual(await self._frame(), 3)
+        self.assertEqual(self._started, ["control_0", "control_1", "control_2"])
+        self.assertEqual(self._queue.get_stats()["deadline_misses"], 3)
+
+    async def test_unbounded_commands(self):
+        # commands batched per frame are all started on the next frame, ahead of the bound
+        for i in range(3):
+            self._submit(f"bulk_{i}")
+        futures = [
+            self._executor.submit(lambda i=i: self._queue.submit(self._command, f"batched_{i}", bounded=False)).result()
+            for i in range(5)
+        ]
+        self.assertEqual(await self._frame(), 7)
+        self.assertEqual(self._started, [f"batched_{i}" for i in range(5)] + ["bulk_0", "bulk_1"])
+        self.assertEqual(await self._frame(), 1)
+        results = [self._executor.submit(future.result, 1.0).result() for future in futures]
+        self.assertEqual(results, [f"batched_{i}" for i in range(5)])
+
+    async def test_errors_and_close(self):
+        async def failing_command():
+            raise ValueError("failing command")
+
+        future = self._queue.submit(failing_command)
+        pending_future = self._queue.submit(self._command, "pending")
+        self._queue.max_commands_per_frame = 1
+        await self._frame()
+        with self.assertRaises(ValueError):
+            future.result(1.0)
+        # closing the queue releases the threads waiting for the queued commands
+        self._queue.close()
+        self.assertTrue(pending_future.cancelled())
+        with self.assertRaises(RuntimeError):
+            self._queue.submit(self._command, "rejected")
+        with self.assertRaises(ValueError):
+            CommandQueue(max_commands_per_frame=0)
+
+    async def test_close_while_submitting(self):
+        # the queue is closed (and drained) between the check of submit and the append of the command
+        queue = CommandQueue(clock=lambda: queue.close() or 0.0)
+        future = queue.submit(self._command, "racing")
+        self.assertTrue(future.cancelled())
+        self.assertEqual(len(queue), 0)
+        with self.assertRaises(RuntimeError):
+            queue.submit(self._command, "rejected")
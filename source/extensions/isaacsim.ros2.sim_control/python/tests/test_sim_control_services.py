@@ -21,7 +21,7 @@ import numpy as np
 import omni.kit.test
 from isaacsim.core.utils.stage import create_new_stage_async
 from isaacsim.storage.native import get_assets_root_path_async
-from pxr import Gf, UsdGeom, UsdLux, UsdPhysics
+from pxr import Gf, Sdf, UsdGeom, UsdLux, UsdPhysics
 
 
 class TestSimControlServices(omni.kit.test.AsyncTestCase):
@@ -243,6 +243,14 @@ class TestSimControlServices(omni.kit.test.AsyncTestCase):
         self.assertEqual(list(result.features.spawn_formats), expected_spawn_formats)
         self.assertEqual(result.features.custom_info, expected_custom_info)
 
+        # The latency of the request is recorded by the service manager
+        from isaacsim.ros2.sim_control import ROS2ServiceManager
+
+        stats = ROS2ServiceManager().get_latency_stats("get_simulator_features")
+        self.assertGreaterEqual(stats["count"], 1)
+        self.assertGreater(stats["max"], 0.0)
+        self.assertIn("get_simulator_features", ROS2ServiceManager().get_latency_stats())
+
         self._timeline.stop()
         await omni.kit.app.get_app().next_update_async()
 
@@ -702,6 +710,64 @@ class TestSimControlServices(omni.kit.test.AsyncTestCase):
         self._timeline.stop()
         await omni.kit.app.get_app().next_update_async()
 
+    async def test_entity_index(self):
+        """Test that the entity index follows the stage changes and gets the states of multiple entities at once."""
+        import isaacsim.core.utils.stage as stage_utils
+        from isaacsim.ros2.sim_control import EntityIndex
+        from pxr import UsdShade
+        from simulation_interfaces.msg import Result
+
+        stage = self.create_test_stage()
+        UsdShade.Material.Define(stage, "/World/Objects/Material")
+        await omni.kit.app.get_app().next_update_async()
+
+        entity_index = EntityIndex()
+        usdrt_stage = stage_utils.get_current_stage(fabric=True)
+        entities, error = entity_index.get_entities(usdrt_stage, "^/World/Objects/")
+        self.assertEqual(error, "")
+        self.assertEqual(
+            sorted(entities), ["/World/Objects/DynamicCube", "/World/Objects/Material", "/World/Objects/StaticCone"]
+        )
+        _, error = entity_index.get_entities(usdrt_stage, "(")
+        self.assertTrue(error.startswith("Invalid regex pattern"))
+
+        # prims added and removed are indexed
+        UsdGeom.Xform.Define(stage, "/World/Objects/NewXform")
+        await omni.kit.app.get_app().next_update_async()
+        entities, _ = entity_index.get_entities(usdrt_stage, "^/World/Objects/")
+        self.assertIn("/World/Objects/NewXform", entities)
+        stage.RemovePrim("/World/Objects/NewXform")
+        await omni.kit.app.get_app().next_update_async()
+        entities, _ = entity_index.get_entities(usdrt_stage, "^/World/Objects/")
+        self.assertNotIn("/World/Objects/NewXform", entities)
+
+        # frame id overrides are followed
+        stage.GetPrimAtPath("/World/Objects/StaticCone").CreateAttribute(
+            "isaac:nameOverride", Sdf.ValueTypeNames.String
+        ).Set("cone")
+
+        self._timeline.play()
+        await omni.kit.app.get_app().next_update_async()
+        paths = ["/World/Objects/DynamicCube", "/World/Objects/StaticCone", "/World/Objects/Material", "/World/Invalid"]
+        states = await entity_index.get_entities_states(paths)
+        self.assertEqual([status for _, _, status in states[:3]], [Result.RESULT_OK] * 3)
+        self.assertEqual(states[3][2], Result.RESULT_NOT_FOUND)
+        self.assertIsNone(states[3][0])
+        self.assertEqual(states[0][0].header.frame_id, "DynamicCube")
+        self.assertEqual(states[1][0].header.frame_id, "cone")
+        self.assertAlmostEqual(states[1][0].pose.position.x, 2.0, delta=1e-5)
+        self.assertEqual(states[2][0].pose.orientation.w, 1.0)
+        # same states as the (single entity) GetEntityState service
+        from isaacsim.ros2.sim_control import get_entity_state
+
+        cube_state, _, _ = await get_entity_state("/World/Objects/DynamicCube")
+        self.assertAlmostEqual(states[0][0].pose.position.z, cube_state.pose.position.z, delta=1e-5)
+        self.assertAlmostEqual(states[0][0].twist.linear.z, cube_state.twist.linear.z, delta=1e-5)
+
+        entity_index.destroy()
+        self._timeline.stop()
+        await omni.kit.app.get_app().next_update_async()
+
     async def test_set_entity_state_service(self):
         """Test that SetEntityState service correctly sets entity states.
 
@@ -853,6 +919,84 @@ class TestSimControlServices(omni.kit.test.AsyncTestCase):
         self._timeline.stop()
         await omni.kit.app.get_app().next_update_async()
 
+    async def test_entity_batcher(self):
+        """Test that the entity spawns and state writes requested within a frame are applied together."""
+        from isaacsim.core.experimental.prims import XformPrim
+        from isaacsim.ros2.sim_control import EntityBatcher, EntityIndex
+
+        stage = self.create_test_stage()
+        await omni.kit.app.get_app().next_update_async()
+
+        entity_index = EntityIndex()
+        entity_batcher = EntityBatcher(entity_index)
+
+        # spawn entities (the paths are reserved while waiting to be spawned)
+        spawns = [
+            entity_batcher.spawn_entity(f"/World/Spawned/Entity_{i}", None, [float(i), 0.0, 0.0], [1.0, 0.0, 0.0, 0.0])
+            for i in range(10)
+        ]
+        tasks = [asyncio.ensure_future(spawn) for spawn in spawns]
+        await asyncio.sleep(0)
+        self.assertEqual(entity_batcher.num_pending_spawns, 10)
+        self.assertTrue(entity_batcher.is_spawn_pending("/World/Spawned/Entity_3"))
+        errors = await asyncio.gather(*tasks)
+        self.assertEqual(errors, [""] * 10)
+        self.assertEqual(entity_batcher.num_pending_spawns, 0)
+        for i in range(10):
+            prim = stage.GetPrimAtPath(f"/World/Spawned/Entity_{i}")
+            self.assertTrue(prim.IsValid() and prim.IsDefined())
+            self.assertTrue(prim.GetAttribute("simulationInterfacesSpawned").Get())
+        positions, _ = XformPrim("/World/Spawned/Entity_.*").get_world_poses()
+        self.assertTrue(np.allclose(positions.numpy()[:, 0], np.arange(10)))
+
+        # set the states of rigid bodies and of other entities (the last write requested for an entity wins)
+        self._timeline.play()
+        await omni.kit.app.get_app().next_update_async()
+        writes = [
+            ("/World/Objects/DynamicCube", True, [1.0, 1.0, 5.0], [0.0, 0.0, 1.0]),
+            ("/World/Objects/StaticCone", False, [3.0, 0.0, 1.0], None),
+            ("/World/Spawned/Entity_0", False, [0.0, 0.0, 1.0], None),
+            ("/World/Spawned/Entity_0", False, [0.0, 0.0, 2.0], None),
+        ]
+        errors = await asyncio.gather(
+            *[
+                entity_batcher.set_entity_state(path, is_rigid_body, position, [1.0, 0.0, 0.0, 0.0], velocity)
+                for path, is_rigid_body, position, velocity in writes
+            ]
+        )
+        self.assertEqual(errors, [""] * 4)
+        states = await entity_index.get_entities_states(
+            ["/World/Objects/DynamicCube", "/World/Objects/StaticCone", "/World/Spawned/Entity_0"]
+        )
+        self.assertAlmostEqual(states[0][0].pose.position.x, 1.0, delta=0.1)
+        self.assertGreater(states[0][0].twist.linear.z, 0.0)
+        self.assertAlmostEqual(states[1][0].pose.position.x, 3.0, delta=1e-5)
+        self.assertAlmostEqual(states[2][0].pose.position.z, 2.0, delta=1e-5)
+
+        # batches of known entities (in any composition) are written through the cached wrapper
+        prims, _ = entity_index._get_prims(XformPrim, ["/World/Spawned/Entity_0"], reset_xform_op_properties=True)
+        errors = await asyncio.gather(
+            entity_batcher.set_entity_state("/World/Spawned/Entity_0", False, [0.0, 0.0, 3.0], [1.0, 0.0, 0.0, 0.0]),
+        )
+        self.assertEqual(errors, [""])
+        self.assertIs(entity_index._get_prims(XformPrim, ["/World/Objects/StaticCone"], True)[0], prims)
+        states = await entity_index.get_entities_states(["/World/Spawned/Entity_0", "/World/Objects/StaticCone"])
+        self.assertAlmostEqual(states[0][0].pose.position.z, 3.0, delta=1e-5)
+        self.assertAlmostEqual(states[1][0].pose.position.x, 3.0, delta=1e-5)
+
+        # errors only affect the request that caused them
+        errors = await asyncio.gather(
+            entity_batcher.set_entity_state("/World/Objects/StaticCone", False, [2.0, 0.0, 1.0], [1.0, 0.0, 0.0, 0.0]),
+            entity_batcher.set_entity_state("/World/Invalid", False, [0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]),
+        )
+        self.assertEqual(errors[0], "")
+        self.assertNotEqual(errors[1], "")
+
+        entity_batcher.destroy()
+        entity_index.destroy()
+        self._timeline.stop()
+        await omni.kit.app.get_app().next_update_async()
+
     async def test_spawn_entity_basic_default_position(self):
         """Test basic entity spawn with default position using USD file.
 
@@ -1639,6 +1783,59 @@ class TestSimControlServices(omni.kit.test.AsyncTestCase):
         self._timeline.stop()
         await omni.kit.app.get_app().next_update_async()
 
+    async def test_simulate_steps_action_lockstep(self):
+        """Test that SimulateSteps action in lockstep mode steps the physics the requested number of times."""
+        import carb
+        from isaacsim.core.experimental.prims import RigidPrim
+        from simulation_interfaces.action import SimulateSteps
+
+        # fmt: off
+        from simulation_interfaces.msg import Result
+
+        # fmt: on
+
+        settings = carb.settings.get_settings()
+        settings.set_bool("/exts/isaacsim.ros2.sim_control/simulate_steps/lockstep", True)
+        settings.set_float("/exts/isaacsim.ros2.sim_control/simulate_steps/yield_interval", 0.01)
+
+        self.create_test_stage()
+        await omni.kit.app.get_app().next_update_async()
+
+        # Start with simulation paused
+        self._timeline.play()
+        await omni.kit.app.get_app().next_update_async()
+        self._timeline.pause()
+        await omni.kit.app.get_app().next_update_async()
+
+        # Free falling cube
+        cube_prim = RigidPrim("/World/Objects/DynamicCube", reset_xform_op_properties=True)
+        cube_prim.set_world_poses(positions=np.array([0.0, 0.0, 50.0]))
+        cube_prim.set_velocities(linear_velocities=np.zeros(3))
+        await omni.kit.app.get_app().next_update_async()
+        initial_z = cube_prim.get_world_poses()[0].numpy()[0][2]
+
+        # 60 physics steps (1 second)
+        goal = SimulateSteps.Goal()
+        goal.steps = 60
+        try:
+            action_result = await self._call_action_async(SimulateSteps, "/simulate_steps", goal)
+        finally:
+            settings.set_bool("/exts/isaacsim.ros2.sim_control/simulate_steps/lockstep", False)
+            settings.set_float("/exts/isaacsim.ros2.sim_control/simulate_steps/yield_interval", 0.1)
+
+        self.assertIsNotNone(action_result)
+        self.assertEqual(action_result.result.result.result, Result.RESULT_OK)
+        self.assertIn("in lockstep: 60 steps", action_result.result.result.error_message)
+
+        # The timeline stayed paused, and the cube fell for 1 second (0.5 * 9.81 * 1^2)
+        self.assertFalse(self._timeline.is_playing())
+        self.assertFalse(self._timeline.is_stopped())
+        after_z = cube_prim.get_world_poses()[0].numpy()[0][2]
+        self.assertAlmostEqual(initial_z - after_z, 4.905, delta=0.25)
+
+        self._timeline.stop()
+        await omni.kit.app.get_app().next_update_async()
+
     async def test_load_world_service(self):
         """Test that LoadWorld service correctly loads USD world files.
 
@@ -24,6 +24,7 @@ import omni.kit.app
 import omni.kit.viewport.utility
 
 from . import ui_builder, viewport_scene
+from .transform_tree import diff_transforms
 
 
 class Extension(omni.ext.IExt):
@@ -129,20 +130,34 @@ class Extension(omni.ext.IExt):
 
     def _update_transforms(self):
         self._running = True
+        previous_transforms, previous_relations, previous_root_frame = None, None, None
         while self._running:
             if self._cpp:
                 self._interface.spin()
-            # get transforms
+            # get transforms (the Python listeners report the frames added, removed or moved since the previous call)
             root_frame = self._ui_builder.root_frame
-            frames, transforms, relations = self._interface.get_transforms(root_frame)
-            # add root frame if not listed
+            if self._cpp:
+                frames, transforms, relations = self._interface.get_transforms(root_frame)
+                diff = None
+            else:
+                frames, transforms, relations, diff = self._interface.get_transforms(root_frame)
+            # add root frame if not listed (without modifying the listener's transforms)
+            added_root_frame = None
             if self._include_root_frame and root_frame not in transforms:
-                transforms[root_frame] = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0))
+                transforms = {**transforms, root_frame: ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0))}
+                added_root_frame = root_frame
             # update frames and ui
             self._frames.update(frames)
             self._ui_builder.update(self._frames)
-            # draw scene
-            self._viewport_scene.manipulator.update_transforms(transforms, relations)
+            # draw scene (only the frames added, removed or moved since the previous update)
+            if previous_transforms is None or added_root_frame != previous_root_frame:
+                self._viewport_scene.manipulator.update_transforms(transforms, relations)
+            else:
+                if diff is None:
+                    diff = diff_transforms(previous_transforms, transforms)
+                if diff.added or diff.removed or diff.moved or relations != previous_relations:
+                    self._viewport_scene.manipulator.update_transforms(transforms, relations, diff)
+            previous_transforms, previous_relations, previous_root_frame = transforms, relations, added_root_frame
             time.sleep(1 / self._ui_builder.update_frequency)
         # clear scene
         if self._viewport_scene:
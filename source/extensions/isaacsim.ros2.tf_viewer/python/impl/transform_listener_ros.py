@@ -112,7 +112,8 @@ class TFListener:
                     except:
                         pass
 
-        return frames, transforms, relations
+        # no cached tf tree: the caller computes the frames added, removed and moved
+        return frames, transforms, relations, None
 
     def get_transform(self, target_frame, source_frame):
         try:
@@ -17,6 +17,8 @@ import threading
 import carb
 import yaml
 
+from .transform_tree import TransformTree
+
 
 def acquire_transform_listener_interface():
     interface = TFListener()
@@ -34,6 +36,10 @@ class TFListener:
         self._node = None
         self._listener = None
 
+        # cached tf tree, and time of the latest transform of each frame it was updated with
+        self._tree = TransformTree()
+        self._stamps = {}
+
     def initialize(self, distro):
         import rclpy
         import tf2_ros
@@ -72,30 +78,42 @@ class TFListener:
             carb.log_info(f"rclpy.shutdown: {e}")
 
     def get_transforms(self, root_frame):
-        frames = set()
-        relations = []
-        transforms = {}
+        """Get the transforms of the frames with respect to a root frame.
+
+        Only the frames whose latest transform changed since the previous call are looked up,
+        and only the transforms of their subtrees are recomputed.
 
+        Returns:
+            tuple: Frame IDs, transforms (translation: xyz, rotation: xyzw) for each frame ID, relations between
+            frame IDs (child-parent tuples) and frames added, removed and moved since the previous call.
+        """
         if self._listener:
             frames_info = yaml.load(self._all_frames_as_yaml(), Loader=yaml.SafeLoader)
-            if type(frames_info) is dict:
-                for frame, info in frames_info.items():
-                    frames.add(frame)
-                    frames.add(info["parent"])
-                    relations.append((frame, info["parent"]))
-                    try:
-                        transform = self._lookup_transform(root_frame, frame, self._time())
-                        translation = transform.transform.translation
-                        rotation = transform.transform.rotation
-                        transform = (
-                            [translation.x, translation.y, translation.z],
-                            [rotation.x, rotation.y, rotation.z, rotation.w],
-                        )
-                        transforms[frame] = transform
-                    except:
-                        pass
-
-        return frames, transforms, relations
+            if type(frames_info) is not dict:
+                frames_info = {}
+            # remove the frames no longer listed
+            for frame in [frame for frame in self._stamps if frame not in frames_info]:
+                self._tree.remove_frame(frame)
+                del self._stamps[frame]
+            # update the transforms (relative to the parent frame) received since the previous call
+            for frame, info in frames_info.items():
+                stamp = (info["parent"], info.get("most_recent_transform"))
+                if self._stamps.get(frame) == stamp:
+                    continue
+                try:
+                    transform = self._lookup_transform(info["parent"], frame, self._time())
+                except:
+                    continue
+                translation = transform.transform.translation
+                rotation = transform.transform.rotation
+                self._tree.set_transform(
+                    frame,
+                    info["parent"],
+                    ((translation.x, translation.y, translation.z), (rotation.x, rotation.y, rotation.z, rotation.w)),
+                )
+                self._stamps[frame] = stamp
+        diff = self._tree.compute(root_frame)
+        return self._tree.frames, self._tree.transforms, self._tree.relations, diff
 
     def get_transform(self, target_frame, source_frame):
         try:
@@ -112,6 +130,8 @@ class TFListener:
         if self._listener:
             carb.log_info("Reset TF listener (ROS2)")
             self._tf_buffer.clear()
+            self._tree.clear()
+            self._stamps = {}
 
     def is_ready(self):
         return self._listener != None
@@ -0,0 +1,279 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import namedtuple
+
+# Frames added, removed and moved since the previous query
+TransformTreeDiff = namedtuple("TransformTreeDiff", ["added", "removed", "moved"])
+
+_IDENTITY = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0))
+
+
+def _rotate(q, v):
+    # rotate the vector v by the quaternion q (xyzw)
+    x, y, z, w = q
+    tx = 2.0 * (y * v[2] - z * v[1])
+    ty = 2.0 * (z * v[0] - x * v[2])
+    tz = 2.0 * (x * v[1] - y * v[0])
+    return (
+        v[0] + w * tx + (y * tz - z * ty),
+        v[1] + w * ty + (z * tx - x * tz),
+        v[2] + w * tz + (x * ty - y * tx),
+    )
+
+
+def _compose(a, b):
+    # transform b expressed in the frame of the transform a: (pa, qa) * (pb, qb)
+    (pa, qa), (pb, qb) = a, b
+    x1, y1, z1, w1 = qa
+    x2, y2, z2, w2 = qb
+    p = _rotate(qa, pb)
+    return (
+        (pa[0] + p[0], pa[1] + p[1], pa[2] + p[2]),
+        (
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        ),
+    )
+
+
+def _inverse(a):
+    p, (x, y, z, w) = a
+    q = (-x, -y, -z, w)
+    p = _rotate(q, p)
+    return ((-p[0], -p[1], -p[2]), q)
+
+
+def _is_close(a, b, tolerance):
+    return all(abs(u - v) <= tolerance for u, v in zip((*a[0], *a[1]), (*b[0], *b[1])))
+
+
+def diff_transforms(previous: dict, current: dict, tolerance: float = 1e-6) -> TransformTreeDiff:
+    """Compute the frames added, removed and moved between two sets of transforms.
+
+    Args:
+        previous (dict): Previous transforms (translation: xyz, rotation: xyzw) for each frame ID.
+        current (dict): Current transforms (translation: xyz, rotation: xyzw) for each frame ID.
+        tolerance (float, optional): Maximum component difference for a frame to be considered not moved.
+
+    Returns:
+        TransformTreeDiff: Lists of frame IDs added, removed and moved.
+    """
+    added = [frame for frame in current if frame not in previous]
+    removed = [frame for frame in previous if frame not in current]
+    moved = [
+        frame
+        for frame, transform in current.items()
+        if frame in previous and not _is_close(previous[frame], transform, tolerance)
+    ]
+    return TransformTreeDiff(added, removed, moved)
+
+
+class TransformTree:
+    """Cached tf tree, with incremental updates of the transforms with respect to a root frame.
+
+    The transform of each frame relative to its parent is recorded with :py:meth:`set_transform`. When the transforms
+    are queried with :py:meth:`compute`, only the subtrees whose transforms changed since the previous query are
+    recomputed, and the frames added, removed and moved since the previous query are reported.
+
+    Args:
+        tolerance (float, optional): Maximum component difference for a transform to be considered unchanged.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> tree = TransformTree()
+        >>> tree.set_transform("base", "world", ((1.0, 0.0, 0.0), (0.0, 0.0, 0.0, 1.0)))
+        True
+        >>> tree.set_transform("arm", "base", ((0.0, 0.0, 1.0), (0.0, 0.0, 0.0, 1.0)))
+        True
+        >>> sorted(tree.compute("world").added)
+        ['arm', 'base', 'world']
+        >>> tree.transforms["arm"]
+        ((1.0, 0.0, 1.0), (0.0, 0.0, 0.0, 1.0))
+    """
+
+    def __init__(self, tolerance: float = 1e-6) -> None:
+        self._tolerance = tolerance
+        self._transforms = {}
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all the frames (they are reported as removed by the next :py:meth:`compute` call)."""
+        self._parents = {}
+        self._children = {}
+        self._local_transforms = {}
+        self._world_transforms = {}
+        self._dirty = set()
+        self._root_frame = None
+        self._root_world_transform = None
+
+    @property
+    def frames(self) -> set:
+        """Frame IDs of the tree (including the parent frames without transform)."""
+        return set(self._parents.keys()) | set(self._children.keys())
+
+    @property
+    def relations(self) -> list:
+        """Relations between frame IDs (child-parent tuples)."""
+        return list(self._parents.items())
+
+    @property
+    def transforms(self) -> dict:
+        """Transforms (translation: xyz, rotation: xyzw) of the frames with respect to the root frame of the last
+        :py:meth:`compute` call (the frames not connected to the root frame are not listed)."""
+        return self._transforms
+
+    def has_frame(self, frame: str) -> bool:
+        """Check whether a frame has a transform relative to a parent frame."""
+        return frame in self._parents
+
+    def set_transform(self, frame: str, parent: str, transform: tuple) -> bool:
+        """Set the transform of a frame relative to its parent frame.
+
+        Args:
+            frame (str): Frame ID.
+            parent (str): Parent frame ID.
+            transform (tuple): Transform (translation: xyz, rotation: xyzw) of the frame relative to its parent.
+
+        Returns:
+            bool: Whether the transform (or the parent) of the frame changed.
+        """
+        transform = (tuple(transform[0]), tuple(transform[1]))
+        previous_parent = self._parents.get(frame)
+        if previous_parent == parent:
+            if _is_close(self._local_transforms[frame], transform, self._tolerance):
+                return False
+        else:
+            if previous_parent is not None:
+                self._remove_child(previous_parent, frame)
+            self._parents[frame] = parent
+            self._children.setdefault(parent, set()).add(frame)
+        self._local_transforms[frame] = transform
+        self._dirty.add(frame)
+        return True
+
+    def remove_frame(self, frame: str) -> None:
+        """Remove the transform of a frame relative to its parent (its children are kept, without transforms to the
+        root frame until it is set again).
+
+        Args:
+            frame (str): Frame ID.
+        """
+        parent = self._parents.pop(frame, None)
+        if parent is not None:
+            self._remove_child(parent, frame)
+        self._local_transforms.pop(frame, None)
+        self._world_transforms.pop(frame, None)
+        self._dirty.add(frame)
+
+    def compute(self, root_frame: str) -> TransformTreeDiff:
+        """Compute the transforms of the frames with respect to a root frame.
+
+        Only the transforms of the subtrees that changed since the previous call are recomputed (all of them if the
+        root frame, or its transform, changed).
+
+        Args:
+            root_frame (str): Frame ID with respect to which the transforms are computed.
+
+        Returns:
+            TransformTreeDiff: Lists of frame IDs added, removed and moved since the previous call.
+        """
+        # update the transforms with respect to the top of each tree of the changed subtrees
+        # (from the highest changed ancestor of each changed frame, through all its ancestors, so that each changed
+        # subtree is updated once and after its changed ancestors)
+        top_dirty_frames = set()
+        for frame in self._dirty:
+            top_dirty_frame = frame
+            visited = {frame}
+            while frame in self._parents and self._parents[frame] not in visited:
+                frame = self._parents[frame]
+                visited.add(frame)
+                if frame in self._dirty:
+                    top_dirty_frame = frame
+            top_dirty_frames.add(top_dirty_frame)
+        updated = set()
+        for frame in top_dirty_frames:
+            self._update_subtree(frame, updated)
+        self._dirty = set()
+
+        # tree (and transform) of the root frame
+        root_top = self._get_top(root_frame)
+        root_world_transform = self._get_world_transform(root_frame)
+        previous = self._transforms
+        if root_frame != self._root_frame or (
+            root_world_transform is not None
+            and (
+                self._root_world_transform is None
+                or not _is_close(root_world_transform, self._root_world_transform, self._tolerance)
+            )
+        ):
+            # all the transforms change
+            updated = self.frames | {root_frame}
+            self._transforms = {}
+        self._root_frame = root_frame
+        self._root_world_transform = root_world_transform
+
+        transforms = dict(self._transforms)
+        root_inverse = _inverse(root_world_transform) if root_world_transform is not None else None
+        for frame in updated:
+            world_transform = self._get_world_transform(frame)
+            if world_transform is None or root_inverse is None or self._get_top(frame) != root_top:
+                transforms.pop(frame, None)
+            else:
+                transforms[frame] = _compose(root_inverse, world_transform)
+        # drop the frames no longer in the tree (e.g.: a root frame whose children were all removed)
+        frames = self.frames
+        for frame in [frame for frame in transforms if frame not in frames]:
+            del transforms[frame]
+        self._transforms = transforms
+        return diff_transforms(previous, transforms, self._tolerance)
+
+    def _remove_child(self, parent, frame):
+        self._children[parent].discard(frame)
+        if not self._children[parent]:
+            del self._children[parent]
+
+    def _get_top(self, frame):
+        # frame at the top of the tree of the frame
+        visited = set()
+        while frame in self._parents and frame not in visited:
+            visited.add(frame)
+            frame = self._parents[frame]
+        return frame
+
+    def _get_world_transform(self, frame):
+        # transform with respect to the top of the tree (the top frames are not listed in the world transforms)
+        if frame in self._world_transforms:
+            return self._world_transforms[frame]
+        return _IDENTITY if frame in self._children and frame not in self._parents else None
+
+    def _update_subtree(self, frame, updated):
+        stack = [frame]
+        while stack:
+            frame = stack.pop()
+            if frame in updated:
+                continue
+            updated.add(frame)
+            parent = self._parents.get(frame)
+            parent_transform = self._get_world_transform(parent) if parent is not None else None
+            if parent is not None and parent_transform is not None:
+                self._world_transforms[frame] = _compose(parent_transform, self._local_transforms[frame])
+            else:
+                self._world_transforms.pop(frame, None)
+            stack.extend(self._children.get(frame, ()))
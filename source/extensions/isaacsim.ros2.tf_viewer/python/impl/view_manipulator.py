@@ -13,8 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import threading
 
+import carb.events
 import numpy as np
+import omni.kit.app
 import omni.ui as ui
 import omni.usd
 from omni.ui import color as cl
@@ -30,6 +33,23 @@ class ViewManipulator(sc.Manipulator):
         self._relations = []
         self._transforms = {}
 
+        # scene items drawn for each frame, updated in place when only the frames' transforms change
+        self._lock = threading.Lock()
+        self._moved_transforms = {}
+        self._rebuild = True
+        self._built_relations = None
+        self._points = None
+        self._point_positions = []
+        self._point_indices = {}
+        self._name_transforms = {}
+        self._axes_transforms = {}
+        self._arrows = []
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="isaacsim.ros2.tf_viewer.ViewManipulator")
+        )
+
         # configuration
         self.cfg_root_frame = "World"
 
@@ -49,9 +69,34 @@ class ViewManipulator(sc.Manipulator):
         self.cfg_arrows_color = [0.0, 1.0, 1.0, 1.0]
         self.cfg_arrows_thickness = 4
 
-    def update_transforms(self, transforms, relations):
-        self._relations = relations
-        self._transforms = transforms
+    def destroy(self) -> None:
+        self._update_sub = None
+
+    def update_transforms(self, transforms, relations, diff=None):
+        """Update the transforms to draw.
+
+        This method can be called from any thread.
+
+        Args:
+            transforms (dict): Transforms (translation: xyz, rotation: xyzw) for each frame ID.
+            relations (list): Relations between frame IDs (child-parent tuples).
+            diff (TransformTreeDiff, optional): Frames added, removed and moved since the previous update.
+                If only frames moved, the drawn items of these frames are updated in place (on the next app update).
+                Otherwise (or if not given), the whole scene is redrawn.
+        """
+        with self._lock:
+            self._relations = relations
+            self._transforms = transforms
+            if (
+                diff is not None
+                and not diff.added
+                and not diff.removed
+                and not self._rebuild
+                and relations == self._built_relations
+            ):
+                self._moved_transforms.update((frame, transforms[frame]) for frame in diff.moved)
+                return
+            self._rebuild = True
         # redraw all
         self.invalidate()
 
@@ -60,54 +105,75 @@ class ViewManipulator(sc.Manipulator):
 
     def set_frames_show(self, value: bool) -> None:
         self.cfg_frames_show = value
+        self.invalidate()
 
     def set_frames_color(self, channel: int, value: float) -> None:
         if channel >= 0 and channel <= 3:
             self.cfg_frames_color[int(channel)] = max(min(value, 1), 0)
+        self.invalidate()
 
     def set_frames_size(self, value: float) -> None:
         self.cfg_frames_size = value * 30
+        self.invalidate()
 
     def set_names_show(self, value: bool) -> None:
         self.cfg_names_show = value
+        self.invalidate()
 
     def set_names_color(self, channel: int, value: float) -> None:
         if channel >= 0 and channel <= 3:
             self.cfg_names_color[int(channel)] = max(min(value, 1), 0)
+        self.invalidate()
 
     def set_names_size(self, value: float) -> None:
         self.cfg_names_size = value * 50
+        self.invalidate()
 
     def set_axes_show(self, value: bool) -> None:
         self.cfg_axes_show = value
+        self.invalidate()
 
     def set_axes_length(self, value: float) -> None:
         stage_unit = UsdGeom.GetStageMetersPerUnit(omni.usd.get_context().get_stage())
         self.cfg_axes_length = value / stage_unit
+        self.invalidate()
 
     def set_axes_thickness(self, value):
         self.cfg_axes_thickness = value * 20
+        self.invalidate()
 
     def set_arrows_show(self, value: bool) -> None:
         self.cfg_arrows_show = value
+        self.invalidate()
 
     def set_arrows_color(self, channel: int, value: float) -> None:
         if channel >= 0 and channel <= 3:
             self.cfg_arrows_color[int(channel)] = max(min(value, 1), 0)
+        self.invalidate()
 
     def set_arrows_thickness(self, value: float) -> None:
         self.cfg_arrows_thickness = value * 20
+        self.invalidate()
 
     def clear(self):
         self.update_transforms({}, [])
 
     def on_build(self):
-        if not self._transforms:
+        with self._lock:
+            transforms = copy.deepcopy(self._transforms)
+            relations = copy.deepcopy(self._relations)
+            self._moved_transforms = {}
+            self._rebuild = False
+            self._built_relations = relations
+        self._points = None
+        self._point_positions = []
+        self._point_indices = {}
+        self._name_transforms = {}
+        self._axes_transforms = {}
+        self._arrows = []
+        if not transforms:
             return
 
-        transforms = copy.deepcopy(self._transforms)
-        relations = copy.deepcopy(self._relations)
-
         names = list(transforms.keys())
         positions = [transform[0] for transform in transforms.values()]
         quaternions = [transform[1] for transform in transforms.values()]
@@ -116,41 +182,73 @@ class ViewManipulator(sc.Manipulator):
         if self.cfg_arrows_show:
             for r in relations:
                 if r[0] in transforms and r[1] in transforms:
-                    sc.Line(
+                    line = sc.Line(
                         transforms[r[0]][0],
                         transforms[r[1]][0],
                         color=cl(*self.cfg_arrows_color),
                         thickness=self.cfg_arrows_thickness,
                     )
+                    self._arrows.append((r[0], r[1], line))
 
         # draw frames
         if self.cfg_frames_show:
-            sc.Points(
+            self._points = sc.Points(
                 positions,
                 colors=[cl(*self.cfg_frames_color)] * len(positions),
                 sizes=[self.cfg_frames_size] * len(positions),
             )
+            self._point_positions = [list(position) for position in positions]
+            self._point_indices = {name: i for i, name in enumerate(names)}
 
         # draw names and axes
-        T = np.eye(4)
         for name, position, quaternion in zip(names, positions, quaternions):
 
             # names
-            T[:3, 3] = position
             if self.cfg_names_show:
-                with sc.Transform(transform=sc.Matrix44(*T.T.flatten())):
+                transform = sc.Transform(transform=self._get_matrix(position))
+                with transform:
                     sc.Label(
                         name,
                         alignment=ui.Alignment.CENTER_TOP,
                         color=cl(*self.cfg_names_color),
                         size=self.cfg_names_size,
                     )
+                self._name_transforms[name] = transform
 
             # axes
             if self.cfg_axes_show:
-                T[:3, :3] = Rotation.from_quat(quaternion).as_matrix()
-                with sc.Transform(transform=sc.Matrix44(*T.T.flatten())):
+                transform = sc.Transform(transform=self._get_matrix(position, quaternion))
+                with transform:
                     k = self.cfg_axes_length
                     sc.Line([0, 0, 0], [k, 0, 0], color=cl("#ff0000"), thickness=self.cfg_axes_thickness)
                     sc.Line([0, 0, 0], [0, k, 0], color=cl("#00ff00"), thickness=self.cfg_axes_thickness)
                     sc.Line([0, 0, 0], [0, 0, k], color=cl("#0000ff"), thickness=self.cfg_axes_thickness)
+                self._axes_transforms[name] = transform
+
+    def _get_matrix(self, position, quaternion=None):
+        T = np.eye(4)
+        T[:3, 3] = position
+        if quaternion is not None:
+            T[:3, :3] = Rotation.from_quat(quaternion).as_matrix()
+        return sc.Matrix44(*T.T.flatten())
+
+    def _on_update(self, event: carb.events.IEvent) -> None:
+        # update in place the items of the frames that moved since the scene was drawn
+        with self._lock:
+            moved_transforms, self._moved_transforms = self._moved_transforms, {}
+        if not moved_transforms:
+            return
+        for name, (position, quaternion) in moved_transforms.items():
+            if name in self._name_transforms:
+                self._name_transforms[name].transform = self._get_matrix(position)
+            if name in self._axes_transforms:
+                self._axes_transforms[name].transform = self._get_matrix(position, quaternion)
+            if name in self._point_indices:
+                self._point_positions[self._point_indices[name]] = list(position)
+        if self._points is not None and any(name in self._point_indices for name in moved_transforms):
+            self._points.positions = self._point_positions
+        for child, parent, line in self._arrows:
+            if child in moved_transforms:
+                line.start = list(moved_transforms[child][0])
+            if parent in moved_transforms:
+                line.end = list(moved_transforms[parent][0])
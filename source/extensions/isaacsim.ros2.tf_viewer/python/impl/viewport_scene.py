@@ -23,6 +23,7 @@ class ViewportScene:
     def __init__(self, viewport_window: ui.Window, ext_id: str) -> None:
         self._scene_view = None
         self._viewport_window = viewport_window
+        self.manipulator = None
 
         # scene view frame
         with self._viewport_window.get_frame(ext_id):
@@ -41,6 +42,8 @@ class ViewportScene:
         self.destroy()
 
     def destroy(self):
+        if self.manipulator is not None:
+            self.manipulator.destroy()
         if self._scene_view:
             # empty the scene view
             self._scene_view.scene.clear()
@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import random
+
+import omni.kit.test
+from isaacsim.ros2.tf_viewer.impl.transform_tree import TransformTree, diff_transforms
+
+IDENTITY = (0.0, 0.0, 0.0, 1.0)
+# 90 degrees rotation around the z-axis (xyzw)
+ROT_Z_90 = (0.0, 0.0, math.sin(math.pi / 4), math.cos(math.pi / 4))
+
+
+class TestTransformTree(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        # world -> base -> arm -> hand, world -> camera
+        self._tree = TransformTree()
+        self._tree.set_transform("base", "world", ((1.0, 0.0, 0.0), ROT_Z_90))
+        self._tree.set_transform("arm", "base", ((1.0, 0.0, 0.0), IDENTITY))
+        self._tree.set_transform("hand", "arm", ((0.0, 0.0, 1.0), IDENTITY))
+        self._tree.set_transform("camera", "world", ((0.0, 0.0, 2.0), IDENTITY))
+
+    # After running each test
+    async def tearDown(self):
+        self._tree = None
+
+    def assertTransformAlmostEqual(self, transform, expected):
+        for value, expected_value in zip(transform[0] + transform[1], expected[0] + expected[1]):
+            self.assertAlmostEqual(value, expected_value, delta=1e-6)
+
+    # ----------------------------------------------------------------------
+    async def test_compute(self):
+        diff = self._tree.compute("world")
+        self.assertEqual(sorted(diff.added), ["arm", "base", "camera", "hand", "world"])
+        self.assertEqual(diff.removed, [])
+        self.assertEqual(diff.moved, [])
+        self.assertEqual(self._tree.frames, {"world", "base", "arm", "hand", "camera"})
+        self.assertIn(("hand", "arm"), self._tree.relations)
+        transforms = self._tree.transforms
+        self.assertTransformAlmostEqual(transforms["world"], ((0.0, 0.0, 0.0), IDENTITY))
+        self.assertTransformAlmostEqual(transforms["arm"], ((1.0, 1.0, 0.0), ROT_Z_90))
+        self.assertTransformAlmostEqual(transforms["hand"], ((1.0, 1.0, 1.0), ROT_Z_90))
+
+        # transforms with respect to a frame that is not at the top of the tree
+        diff = self._tree.compute("arm")
+        self.assertEqual(diff.added, [])
+        self.assertEqual(sorted(diff.moved), ["arm", "base", "camera", "hand", "world"])
+        transforms = self._tree.transforms
+        self.assertTransformAlmostEqual(transforms["arm"], ((0.0, 0.0, 0.0), IDENTITY))
+        self.assertTransformAlmostEqual(transforms["hand"], ((0.0, 0.0, 1.0), IDENTITY))
+        self.assertTransformAlmostEqual(transforms["camera"], ((-1.0, 1.0, 2.0), (0.0, 0.0, -ROT_Z_90[2], ROT_Z_90[3])))
+
+        # unknown root frame
+        diff = self._tree.compute("map")
+        self.assertEqual(self._tree.transforms, {})
+        self.assertEqual(sorted(diff.removed), ["arm", "base", "camera", "hand", "world"])
+
+    async def test_incremental_update(self):
+        self._tree.compute("world")
+        # unchanged transforms
+        self.assertFalse(self._tree.set_transform("camera", "world", ((0.0, 0.0, 2.0), IDENTITY)))
+        self.assertEqual(self._tree.compute("world"), ([], [], []))
+
+        # moving a frame moves its subtree only
+        self.assertTrue(self._tree.set_transform("arm", "base", ((2.0, 0.0, 0.0), IDENTITY)))
+        diff = self._tree.compute("world")
+        self.assertEqual(diff.added, [])
+        self.assertEqual(diff.removed, [])
+        self.assertEqual(sorted(diff.moved), ["arm", "hand"])
+        self.assertTransformAlmostEqual(self._tree.transforms["hand"], ((1.0, 2.0, 1.0), ROT_Z_90))
+
+        # adding and reparenting frames
+        self._tree.set_transform("gripper", "hand", ((0.0, 0.0, 0.5), IDENTITY))
+        self._tree.set_transform("camera", "hand", ((0.0, 0.0, 0.0), IDENTITY))
+        diff = self._tree.compute("world")
+        self.assertEqual(diff.added, ["gripper"])
+        self.assertEqual(diff.moved, ["camera"])
+        self.assertTransformAlmostEqual(self._tree.transforms["camera"], self._tree.transforms["hand"])
+        self.assertNotIn(("camera", "world"), self._tree.relations)
+
+        # removing a frame disconnects its subtree from the root frame
+        self._tree.remove_frame("arm")
+        diff = self._tree.compute("world")
+        self.assertEqual(sorted(diff.removed), ["arm", "camera", "gripper", "hand"])
+        self.assertEqual(sorted(self._tree.transforms.keys()), ["base", "world"])
+        # and setting it again reconnects it
+        self._tree.set_transform("arm", "base", ((2.0, 0.0, 0.0), IDENTITY))
+        diff = self._tree.compute("world")
+        self.assertEqual(sorted(diff.added), ["arm", "camera", "gripper", "hand"])
+
+        self._tree.clear()
+        self.assertEqual(self._tree.frames, set())
+        self.assertEqual(len(self._tree.compute("world").removed), 6)
+
+    async def test_update_order(self):
+        # a changed frame and a changed ancestor separated by an unchanged frame: world -> a -> c -> b
+        tree = TransformTree()
+        tree.set_transform("a", "world", ((0.0, 0.0, 0.0), IDENTITY))
+        tree.set_transform("c", "a", ((0.0, 0.0, 0.0), IDENTITY))
+        tree.set_transform("b", "c", ((0.0, 0.0, 0.0), IDENTITY))
+        tree.compute("world")
+        tree.set_transform("b", "c", ((0.0, 1.0, 0.0), IDENTITY))
+        tree.set_transform("a", "world", ((5.0, 0.0, 0.0), IDENTITY))
+        diff = tree.compute("world")
+        self.assertEqual(sorted(diff.moved), ["a", "b", "c"])
+        self.assertTransformAlmostEqual(tree.transforms["b"], ((5.0, 1.0, 0.0), IDENTITY))
+
+        # random changes, compared against the composition of the transforms along each chain
+        rng = random.Random(0)
+        frames = [f"frame_{i}" for i in range(12)]
+        parents = {frame: rng.choice(["world"] + frames[:i]) for i, frame in enumerate(frames)}
+        local_transforms = {}
+        tree = TransformTree()
+        for iteration in range(50):
+            for frame in rng.sample(frames, rng.randint(1, 4)) if iteration else frames:
+                angle = rng.uniform(-math.pi, math.pi)
+                local_transforms[frame] = (
+                    tuple(rng.uniform(-1.0, 1.0) for _ in range(3)),
+                    (0.0, 0.0, math.sin(angle / 2), math.cos(angle / 2)),
+                )
+                tree.set_transform(frame, parents[frame], local_transforms[frame])
+            tree.compute("world")
+            for frame in frames:
+                # expected transform: translation and rotation (around the z-axis) composed up to "world"
+                position, angle, current = (0.0, 0.0, 0.0), 0.0, frame
+                while current != "world":
+                    (x, y, z), (_, _, qz, qw) = local_transforms[current]
+                    a = 2.0 * math.atan2(qz, qw)
+                    px, py, pz = position
+                    position = (
+                        x + math.cos(a) * px - math.sin(a) * py,
+                        y + math.sin(a) * px + math.cos(a) * py,
+                        z + pz,
+                    )
+                    angle += a
+                    current = parents[current]
+                expected = (position, (0.0, 0.0, math.sin(angle / 2), math.cos(angle / 2)))
+                transform = tree.transforms[frame]
+                if transform[1][3] * expected[1][3] + transform[1][2] * expected[1][2] < 0.0:
+                    # same rotation, opposite quaternion
+                    expected = (position, tuple(-value for value in expected[1]))
+                self.assertTransformAlmostEqual(transform, expected)
+
+    async def test_removed_root_children(self):
+        tree = TransformTree()
+        tree.set_transform("base", "world", ((1.0, 0.0, 0.0), IDENTITY))
+        self.assertEqual(sorted(tree.compute("world").added), ["base", "world"])
+        tree.remove_frame("base")
+        diff = tree.compute("world")
+        self.assertEqual(sorted(diff.removed), ["base", "world"])
+        self.assertEqual(tree.transforms, {})
+
+    async def test_diff_transforms(self):
+        previous = {"a": ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0]), "b": ([1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0])}
+        current = {"b": ([1.0, 0.0, 1e-9], [0.0, 0.0, 0.0, 1.0]), "c": ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0])}
+        self.assertEqual(diff_transforms(previous, current), (["c"], ["a"], []))
+        current["b"] = ([1.0, 0.0, 0.1], [0.0, 0.0, 0.0, 1.0])
+        self.assertEqual(diff_transforms(previous, current), (["c"], ["a"], ["b"]))
@@ -16,4 +16,5 @@
 from .camera import *
 from .camera_view import CameraView
 from .extension import *
+from .lens_projection import LensProjection
 from .single_view_depth_sensor import *
@@ -27,11 +27,11 @@ import omni
 import omni.graph.core as og
 import omni.replicator.core as rep
 import omni.syntheticdata._syntheticdata as _syntheticdata
-import torch
 import warp as wp
 from isaacsim.core.api.sensors.base_sensor import BaseSensor
 from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
 from isaacsim.core.utils.carb import get_carb_setting
+from isaacsim.core.utils.point_cloud import PointCloudProcessor
 from isaacsim.core.utils.prims import (
     define_prim,
     get_all_matching_child_prims,
@@ -42,7 +42,10 @@ from isaacsim.core.utils.prims import (
 )
 from isaacsim.core.utils.render_product import get_resolution, set_camera_prim_path, set_resolution
 from omni.isaac.IsaacSensorSchema import IsaacRtxLidarSensorAPI
-from pxr import Gf, Sdf, Usd, UsdGeom, Vt
+from pxr import Gf, Sdf, UsdGeom, Vt
+
+from .camera_parameters import CameraParameterSnapshot
+from .lens_projection import SUPPORTED_PROJECTION_MODELS, LensProjection
 
 # Attribute maps for lens distortion models
 OPENCV_PINHOLE_ATTRIBUTE_MAP = ["k1", "k2", "p1", "p2", "k3", "k4", "k5", "k6", "s1", "s2", "s3", "s4"]
@@ -255,6 +258,10 @@ class Camera(BaseSensor):
             "pointcloud",
         ]
         self._custom_annotators = dict()
+        self._lens_projection = None
+        self._lens_projection_version = None
+        self._parameter_snapshot = None
+        self._point_cloud_processor = None
         BaseSensor.__init__(
             self, prim_path=prim_path, name=name, position=position, translation=translation, orientation=orientation
         )
@@ -295,6 +302,25 @@ class Camera(BaseSensor):
             self._render_product.destroy()
             self._render_product = None
 
+        if getattr(self, "_parameter_snapshot", None) is not None:
+            self._parameter_snapshot.destroy()
+            self._parameter_snapshot = None
+
+    def get_parameter_snapshot(self) -> CameraParameterSnapshot:
+        """Get the cached snapshot of the camera parameters (see :class:`CameraParameterSnapshot`).
+
+        The snapshot is invalidated by USD change notices, so the parameter getters of the camera only read USD
+        attributes after they (or the camera pose) have changed.
+
+        Returns:
+            CameraParameterSnapshot: The parameter snapshot of the camera prim.
+        """
+        if self._parameter_snapshot is None:
+            self._parameter_snapshot = CameraParameterSnapshot(
+                [self.prim_path], self._resolution, stage=self.prim.GetStage()
+            )
+        return self._parameter_snapshot
+
     @property
     def supported_annotators(self) -> List[str]:
         """
@@ -523,6 +549,8 @@ class Camera(BaseSensor):
         """
         self._resolution = value
         set_resolution(self._render_product_path, self._resolution)
+        if self._parameter_snapshot is not None:
+            self._parameter_snapshot.set_resolution(self._resolution)
         if maintain_square_pixels:
             self._maintain_square_pixel_aperture(mode="horizontal")
         return
@@ -1079,8 +1107,8 @@ class Camera(BaseSensor):
             np.ndarray | wp.array: A (N x 3) array of 3D points (X, Y, Z) in either world or camera frame,
                    where N is the number of points.
         Note:
-            The fallback method uses the depth (distance_to_image_plane) annotator and
-            performs a perspective projection using the camera's intrinsic parameters to generate the pointcloud.
+            The fallback method uses the depth (distance_to_image_plane) annotator and unprojects it with the
+            lens projection of the camera (see :meth:`get_lens_projection`) to generate the pointcloud.
             Point ordering may differ between the pointcloud annotator and depth-based fallback methods,
             even though the 3D locations are equivalent.
         """
@@ -1154,31 +1182,10 @@ class Camera(BaseSensor):
             depth = wp.to_torch(depth)
             depth = depth.to(device)  # Ensure tensor is on correct device
 
-        # Create pixel coordinate grid centered around the image center
-        im_height, im_width = depth.shape[0], depth.shape[1]
-
-        if backend_utils == torch_utils:
-            # Create coordinate grid using torch
-            ww = torch.linspace(0.5, im_width - 0.5, im_width, dtype=torch.float32, device=device)
-            hh = torch.linspace(0.5, im_height - 0.5, im_height, dtype=torch.float32, device=device)
-            xmap, ymap = torch.meshgrid(ww, hh, indexing="xy")
-            points_2d = torch.stack((xmap.flatten(), ymap.flatten()), dim=1)
-        else:
-            # Use numpy for non-warp arrays and CPU
-            ww = np.linspace(0.5, im_width - 0.5, im_width, dtype=np.float32)
-            hh = np.linspace(0.5, im_height - 0.5, im_height, dtype=np.float32)
-            xmap, ymap = np.meshgrid(ww, hh, indexing="xy")
-            points_2d = np.column_stack((xmap.ravel(), ymap.ravel()))
-
-        # Project 2D pixel coordinates to 3D world points using depth values
+        # Unproject the whole depth image at once using the cached undistortion lookup table of the lens
+        points_3d = self.get_lens_projection().unproject_depth(depth, backend_utils=backend_utils, device=device)
         if world_frame:
-            points_3d = self.get_world_points_from_image_coords(
-                points_2d, depth.flatten(), device=device, backend_utils_cls=backend_utils
-            )
-        else:
-            points_3d = self.get_camera_points_from_image_coords(
-                points_2d, depth.flatten(), device=device, backend_utils_cls=backend_utils
-            )
+            points_3d = self._get_world_points_from_camera_points(points_3d, device, backend_utils)
 
         # Convert back to warp array if input was warp array
         if is_warp_array and not isinstance(points_3d, wp.types.array):
@@ -1186,6 +1193,49 @@ class Camera(BaseSensor):
 
         return points_3d
 
+    def set_point_cloud_processor(self, processor: Optional[PointCloudProcessor]) -> None:
+        """Set the processing stage (cropping, downsampling, encoding) applied by :meth:`get_processed_pointcloud`.
+
+        .. note::
+
+            Writers and ROS 2 publishers attached to the render product of the camera still receive the
+            full-resolution pointcloud.
+
+        Args:
+            processor (Optional[PointCloudProcessor]): Point cloud processor, or None to remove it.
+        """
+        self._point_cloud_processor = processor
+
+    def get_point_cloud_processor(self) -> Optional[PointCloudProcessor]:
+        """Get the point cloud processor of the camera.
+
+        Returns:
+            Optional[PointCloudProcessor]: Point cloud processor, or None if not set.
+        """
+        return self._point_cloud_processor
+
+    def get_processed_pointcloud(self, world_frame: bool = False) -> Optional[dict]:
+        """Get the pointcloud of the camera processed by its point cloud processor (see :meth:`get_pointcloud`).
+
+        The processing runs on CPU, the pointcloud is copied to host memory if the annotators run on the GPU.
+
+        Args:
+            world_frame: If True, processes the points in world frame. If False (default), in camera frame,
+                where the range and azimuth limits of the processor are relative to the camera.
+
+        Returns:
+            Optional[dict]: Output of :meth:`PointCloudProcessor.process` (``points``, ``indices``, ``resolution``
+                and ``origin``), or None if no processor is set.
+        """
+        if self._point_cloud_processor is None:
+            return None
+        points = self.get_pointcloud(device="cpu", world_frame=world_frame)
+        if isinstance(points, wp.types.array):
+            points = points.numpy()
+        elif not isinstance(points, np.ndarray):
+            points = points.cpu().numpy()
+        return self._point_cloud_processor.process(points.reshape(-1, 3))
+
     def get_focal_length(self) -> float:
         """
         Gets focal length of camera prim, in stage units. Longer focal length corresponds to narrower FOV, shorter focal length corresponds to wider FOV.
@@ -1193,7 +1243,7 @@ class Camera(BaseSensor):
         Returns:
             float: Value of camera prim focalLength attribute, converted to stage units.
         """
-        return self.prim.GetAttribute("focalLength").Get() / USD_CAMERA_TENTHS_TO_STAGE_UNIT
+        return float(self.get_parameter_snapshot().focal_lengths[0]) / USD_CAMERA_TENTHS_TO_STAGE_UNIT
 
     def set_focal_length(self, value: float):
         """Sets focal length of camera prim, in stage units. Longer focal length corresponds to narrower FOV, shorter focal length corresponds to wider FOV.
@@ -1210,7 +1260,7 @@ class Camera(BaseSensor):
         Returns:
             float: Value of camera prim focusDistance attribute, measuring distance from the camera to the focus plane (in stage units).
         """
-        return self.prim.GetAttribute("focusDistance").Get()
+        return float(self.get_parameter_snapshot().focus_distances[0])
 
     def set_focus_distance(self, value: float):
         """Sets distance from the camera to the focus plane (in stage units).
@@ -1228,7 +1278,7 @@ class Camera(BaseSensor):
         Returns:
             float: Value of camera prim fStop attribute. 0 turns off focusing.
         """
-        return self.prim.GetAttribute("fStop").Get()
+        return float(self.get_parameter_snapshot().f_stops[0])
 
     def set_lens_aperture(self, value: float):
         """Sets value of camera prim fStop attribute, which controls distance blurring. Lower numbers decrease focus range, larger
@@ -1248,7 +1298,7 @@ class Camera(BaseSensor):
         Returns:
             float: Horizontal aperture in stage units.
         """
-        return self.prim.GetAttribute("horizontalAperture").Get() / USD_CAMERA_TENTHS_TO_STAGE_UNIT
+        return float(self.get_parameter_snapshot().horizontal_apertures[0]) / USD_CAMERA_TENTHS_TO_STAGE_UNIT
 
     def set_horizontal_aperture(self, value: float, maintain_square_pixels: bool = True) -> None:
         """Set horizontal aperture (sensor width) in stage units and update vertical for square pixels.
@@ -1272,7 +1322,7 @@ class Camera(BaseSensor):
         Returns:
             float: Vertical aperture in stage units, always in sync with the aspect ratio and horizontal aperture.
         """
-        return self.prim.GetAttribute("verticalAperture").Get() / USD_CAMERA_TENTHS_TO_STAGE_UNIT
+        return float(self.get_parameter_snapshot().vertical_apertures[0]) / USD_CAMERA_TENTHS_TO_STAGE_UNIT
 
     def set_vertical_aperture(self, value: float, maintain_square_pixels: bool = True) -> None:
         """Set vertical aperture (sensor height) in stage units and update horizontal for square pixels.
@@ -1294,7 +1344,7 @@ class Camera(BaseSensor):
         Returns:
             Tuple[float, float]: Near and far clipping distances (in stage units).
         """
-        near, far = self.prim.GetAttribute("clippingRange").Get()
+        near, far = self.get_parameter_snapshot().clipping_ranges[0].tolist()
         return near, far
 
     def set_clipping_range(self, near_distance: Optional[float] = None, far_distance: Optional[float] = None) -> None:
@@ -1358,7 +1408,7 @@ class Camera(BaseSensor):
         """
         Gets the `omni:lensdistortion:model` property of the camera prim.
         """
-        return self.prim.GetAttribute("omni:lensdistortion:model").Get() or "pinhole"
+        return self.get_parameter_snapshot().lens_distortion_models[0]
 
     def set_lens_distortion_model(self, value: str) -> None:
         """
@@ -1686,20 +1736,10 @@ class Camera(BaseSensor):
         # Use provided device or fall back to self._device
         device = device if device is not None else self._device
 
-        world_w_cam_u_T = backend_utils.transpose_2d(
-            backend_utils.convert(
-                UsdGeom.Imageable(self.prim).ComputeLocalToWorldTransform(Usd.TimeCode.Default()),
-                dtype="float32",
-                device=device,
-                indexed=True,
-            )
+        return backend_utils.convert(
+            self.get_parameter_snapshot().view_matrices_ros[0], dtype="float32", device=device, indexed=True
         )
 
-        r_u_transform_converted = backend_utils.convert(R_U_TRANSFORM, dtype="float32", device=device, indexed=True)
-
-        result = backend_utils.matmul(r_u_transform_converted, backend_utils.inverse(world_w_cam_u_T))
-        return result
-
     def get_intrinsics_matrix(self, device: str = None, backend_utils_cls: type = None):
         """Get the intrinsics matrix of the camera.
 
@@ -1728,34 +1768,94 @@ class Camera(BaseSensor):
         # Use provided device or fall back to self._device
         device = device if device is not None else self._device
 
-        # Calculate intrinsics parameters
-        focal_length = self.get_focal_length()
-        horizontal_aperture = self.get_horizontal_aperture()
-        vertical_aperture = self.get_vertical_aperture()
-        width, height = self.get_resolution()
-        fx = width * focal_length / horizontal_aperture
-        fy = height * focal_length / vertical_aperture
-        cx = width * 0.5
-        cy = height * 0.5
+        return backend_utils.convert(
+            self.get_parameter_snapshot().intrinsics_matrices[0], dtype="float32", device=device
+        )
+
+    def get_lens_projection(self) -> LensProjection:
+        """Get the projection engine of the camera lens (see :class:`LensProjection`).
+
+        The projection is cached, and rebuilt only after the camera resolution, intrinsics or lens distortion
+        attributes change (as reported by the parameter snapshot), so that the lens attributes are not read on each
+        call and its cached undistortion lookup tables are reused across calls.
 
-        return backend_utils.create_tensor_from_list(
-            [[fx, 0.0, cx], [0.0, fy, cy], [0.0, 0.0, 1.0]], dtype="float32", device=device
+        Returns:
+            LensProjection: The forward and inverse projection of the current lens distortion model.
+        """
+        version = int(self.get_parameter_snapshot().intrinsics_versions[0])
+        if self._lens_projection is not None and self._lens_projection_version == version:
+            return self._lens_projection
+        model = self.get_lens_distortion_model()
+        if model not in SUPPORTED_PROJECTION_MODELS:
+            raise Exception(
+                f"'{model}' lens distortion model is not supported for projection, supported models are {SUPPORTED_PROJECTION_MODELS}."
+            )
+        width, height = self.get_resolution()
+        nominal_width = None
+        max_fov = None
+        coefficients = None
+        if model in ("opencvPinhole", "opencvFisheye"):
+            if model == "opencvPinhole":
+                cx, cy, fx, fy, coefficients = self.get_opencv_pinhole_properties()
+            else:
+                cx, cy, fx, fy, coefficients = self.get_opencv_fisheye_properties()
+            image_size = self.get_parameter_snapshot().lens_distortion_attributes[0].get(f"{model}:imageSize")
+            # The calibration parameters are scaled to the rendered resolution
+            scale = width / image_size[0] if image_size is not None and image_size[0] else 1.0
+            focal_length = (fx * scale, fy * scale)
+            principal_point = (cx * scale, cy * scale)
+        else:
+            focal_length_usd = self.get_focal_length()
+            focal_length = (
+                width * focal_length_usd / self.get_horizontal_aperture(),
+                height * focal_length_usd / self.get_vertical_aperture(),
+            )
+            principal_point = (width * 0.5, height * 0.5)
+            if model != "pinhole":
+                properties_getter = {
+                    "ftheta": self.get_ftheta_properties,
+                    "kannalaBrandtK3": self.get_kannala_brandt_k3_properties,
+                    "radTanThinPrism": self.get_rad_tan_thin_prism_properties,
+                }[model]
+                _, nominal_width, optical_center, max_fov, coefficients = properties_getter()
+                if optical_center is not None:
+                    scale = width / nominal_width if nominal_width else 1.0
+                    principal_point = (optical_center[0] * scale, optical_center[1] * scale)
+        projection = LensProjection(
+            model=model,
+            resolution=(width, height),
+            focal_length=focal_length,
+            principal_point=principal_point,
+            coefficients=coefficients,
+            nominal_width=nominal_width,
+            max_fov=max_fov,
         )
+        if self._lens_projection is None or self._lens_projection.key != projection.key:
+            self._lens_projection = projection
+        self._lens_projection_version = version
+        return self._lens_projection
 
     def get_image_coords_from_world_points(self, points_3d: np.ndarray) -> np.ndarray:
-        """Using pinhole perspective projection, this method projects 3d points in the world frame to the image
-           plane giving the pixel coordinates [[0, width], [0, height]]
+        """Using the lens projection of the camera (pinhole or lens distortion model), this method projects 3d points
+           in the world frame to the image plane giving the pixel coordinates [[0, width], [0, height]]
 
         Args:
             points_3d (np.ndarray): 3d points (X, Y, Z) in world frame. shape is (n, 3) where n is the number of points.
 
         Returns:
             np.ndarray: 2d points (u, v) corresponds to the pixel coordinates. shape is (n, 2) where n is the number of points.
+                Points that cannot be projected by a lens distortion model (e.g. outside its field of view) are NaN.
         """
-        if "pinhole" not in self.get_lens_distortion_model():
-            raise Exception(
-                "pinhole projection type is not set to be able to use get_image_coords_from_world_points method which use pinhole prespective projection."
+        if self.get_lens_distortion_model() != "pinhole":
+            projection = self.get_lens_projection()
+            homogenous = self._backend_utils.pad(points_3d, ((0, 0), (0, 1)), value=1.0)
+            points_camera = self._backend_utils.matmul(
+                self.get_view_matrix_ros()[:3, :], self._backend_utils.transpose_2d(homogenous)
+            )
+            points_2d = projection.project(
+                self._backend_utils.to_numpy(self._backend_utils.transpose_2d(points_camera))
             )
+            return self._backend_utils.convert(points_2d, device=self._device, dtype="float32")
         homogenous = self._backend_utils.pad(points_3d, ((0, 0), (0, 1)), value=1.0)
         projection_matrix = self._backend_utils.matmul(self.get_intrinsics_matrix(), self.get_view_matrix_ros()[:3, :])
         points = self._backend_utils.matmul(projection_matrix, self._backend_utils.transpose_2d(homogenous))
@@ -1763,12 +1863,12 @@ class Camera(BaseSensor):
         return self._backend_utils.transpose_2d(points[:2, :])
 
     def get_camera_points_from_image_coords(self, points_2d, depth, device: str = None, backend_utils_cls: type = None):
-        """Using pinhole perspective projection, this method does the inverse projection given the depth of the
-            pixels to get 3D points in camera frame.
+        """Using the lens projection of the camera (pinhole or lens distortion model), this method does the inverse
+            projection given the depth of the pixels to get 3D points in camera frame.
 
         Args:
             points_2d: 2d points (u, v) corresponds to the pixel coordinates. shape is (n, 2) where n is the number of points.
-            depth: depth corresponds to each of the pixel coords. shape is (n,)
+            depth: depth (distance to image plane) corresponds to each of the pixel coords. shape is (n,)
             device: str, optional, default is None. If None, uses self._device.
                 Device to place tensors on. Select from ['cpu', 'cuda', 'cuda:<device_index>']
             backend_utils_cls: type, optional, default is None. If None, the class will be inferred from self._backend_utils.
@@ -1776,13 +1876,9 @@ class Camera(BaseSensor):
 
         Returns:
             np.ndarray | torch.Tensor | wp.array: (n, 3) 3d points (X, Y, Z) in camera frame.
-                +Z points forward (optical axis), +X right, +Y down
+                +Z points forward (optical axis), +X right, +Y down. Pixels outside of the field of view of a
+                lens distortion model are NaN.
         """
-        if "pinhole" not in self.get_lens_distortion_model():
-            raise Exception(
-                "pinhole projection type is not set to be able to use get_camera_points_from_image_coords method."
-            )
-
         # Determine backend utilities
         if backend_utils_cls is None:
             if device is None:
@@ -1792,22 +1888,25 @@ class Camera(BaseSensor):
         else:
             backend_utils = backend_utils_cls
 
-        # Convert image coordinates to homogeneous coordinates
-        homogenous = backend_utils.pad(points_2d, ((0, 0), (0, 1)), value=1.0)
+        # Use provided device or fall back to self._device
+        device = device if device is not None else self._device
 
-        # Get intrinsics matrix using the same backend and device
-        intrinsics_matrix = self.get_intrinsics_matrix(device=device, backend_utils_cls=backend_utils)
+        projection = self.get_lens_projection()
 
-        # Back-project to camera frame using inverse of intrinsics matrix and depth
-        points_in_camera_axes = backend_utils.matmul(
-            backend_utils.inverse(intrinsics_matrix),
-            backend_utils.transpose_2d(homogenous) * backend_utils.expand_dims(depth, 0),
-        )
-        return backend_utils.transpose_2d(points_in_camera_axes)
+        # For warp arrays, we use torch_utils until warp has feature parity
+        if backend_utils == warp_utils:
+            points_3d = projection.unproject_points(
+                wp.to_torch(warp_utils.convert(points_2d, device=device)),
+                wp.to_torch(warp_utils.convert(depth, device=device)),
+                backend_utils=torch_utils,
+                device=device,
+            )
+            return wp.from_torch(points_3d)
+        return projection.unproject_points(points_2d, depth, backend_utils=backend_utils, device=device)
 
     def get_world_points_from_image_coords(self, points_2d, depth, device: str = None, backend_utils_cls: type = None):
-        """Using pinhole perspective projection, this method does the inverse projection given the depth of the
-            pixels to get 3D points in world frame.
+        """Using the lens projection of the camera (pinhole or lens distortion model), this method does the inverse
+            projection given the depth of the pixels to get 3D points in world frame.
 
         Args:
             points_2d: 2d points (u, v) corresponds to the pixel coordinates. shape is (n, 2) where n is the number of points.
@@ -1820,11 +1919,6 @@ class Camera(BaseSensor):
         Returns:
             np.ndarray | torch.Tensor | wp.array: (n, 3) 3d points (X, Y, Z) in world frame.
         """
-        if "pinhole" not in self.get_lens_distortion_model():
-            raise Exception(
-                "pinhole projection type is not set to be able to use get_world_points_from_image_coords method."
-            )
-
         # Determine backend utilities
         if backend_utils_cls is None:
             if device is None:
@@ -1839,6 +1933,10 @@ class Camera(BaseSensor):
             points_2d, depth, device=device, backend_utils_cls=backend_utils
         )
 
+        return self._get_world_points_from_camera_points(points_in_camera_frame, device, backend_utils)
+
+    def _get_world_points_from_camera_points(self, points_in_camera_frame, device: str, backend_utils):
+        """Transform (n, 3) points from the camera frame (ROS convention) to the world frame."""
         # Convert to homogeneous coordinates
         points_in_camera_frame_homogenous = backend_utils.pad(points_in_camera_frame, ((0, 0), (0, 1)), value=1.0)
 
@@ -1904,7 +2002,8 @@ class Camera(BaseSensor):
                 nominal_height, nominal_width, optical_center, max_fov, distortion_coefficients
                 where distortion_coefficients are in order:
         """
-        if self.prim.GetAttribute("omni:lensdistortion:model").Get() != distortion_model_attr:
+        lens_distortion_attributes = self.get_parameter_snapshot().lens_distortion_attributes[0]
+        if lens_distortion_attributes.get("model") != distortion_model_attr:
             carb.log_error(f"Camera omni:lensdistortion:model attribute not set to '{distortion_model_attr}'.")
             return
         attrs = []
@@ -1913,17 +2012,14 @@ class Camera(BaseSensor):
             updated_attr_name = tokens[0]
             for i in tokens[1:]:
                 updated_attr_name += i.capitalize()
-            if attr := self.prim.GetAttribute(f"omni:lensdistortion:{distortion_model_attr}:{updated_attr_name}"):
-                attrs.append(attr.Get())
-            else:
-                attrs.append(None)
+            attrs.append(lens_distortion_attributes.get(f"{distortion_model_attr}:{updated_attr_name}"))
         if coefficient_map:
-            attrs.append([])
-            for coefficient_name in coefficient_map:
-                if attr := self.prim.GetAttribute(f"omni:lensdistortion:{distortion_model_attr}:{coefficient_name}"):
-                    attrs[-1].append(attr.Get())
-                else:
-                    attrs[-1].append(None)
+            attrs.append(
+                [
+                    lens_distortion_attributes.get(f"{distortion_model_attr}:{coefficient_name}")
+                    for coefficient_name in coefficient_map
+                ]
+            )
         return tuple(attrs)
 
     def set_ftheta_properties(
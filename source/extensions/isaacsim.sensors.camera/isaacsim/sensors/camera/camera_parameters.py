@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from isaacsim.core.utils.stage import get_current_stage
+from pxr import Sdf, Tf, Usd, UsdGeom
+
+# from USD camera convention to ROS camera convention
+R_U_TRANSFORM = np.array([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]], dtype=np.float64)
+
+# USD camera attributes cached by the snapshot (focal length and apertures are in tenths of a stage unit)
+CAMERA_PARAMETER_ATTRIBUTES = frozenset(
+    ["focalLength", "focusDistance", "fStop", "horizontalAperture", "verticalAperture", "clippingRange"]
+)
+LENS_DISTORTION_NAMESPACE = "omni:lensdistortion:"
+
+
+class CameraParameterSnapshot:
+    """Cached snapshot of the intrinsic, extrinsic and lens parameters of a set of camera prims.
+
+    The parameters are read from USD once and stored in preallocated arrays (indexed by camera), so that per-frame
+    code can access them in O(1) without any USD attribute read. The snapshot listens to USD change notices:
+    changes to the camera attributes (or to the transforms of the cameras and their ancestors) mark the affected
+    cameras dirty, and only those are read again on the next access.
+
+    Args:
+        prim_paths (Sequence[str]): Paths of the camera prims.
+        resolution (Tuple[int, int]): Rendered resolution (width, height) of the cameras, used for the intrinsics.
+        stage (Optional[Usd.Stage], optional): Stage of the cameras. Defaults to None (current stage).
+    """
+
+    def __init__(self, prim_paths: Sequence[str], resolution: Tuple[int, int], stage: Optional[Usd.Stage] = None):
+        self._stage = get_current_stage() if stage is None else stage
+        self._paths = [Sdf.Path(str(prim_path)) for prim_path in prim_paths]
+        self._prefixes = [path.GetPrefixes() for path in self._paths]
+        self._prims = [self._stage.GetPrimAtPath(path) for path in self._paths]
+        self._resolution = (int(resolution[0]), int(resolution[1]))
+        count = len(self._paths)
+        self._focal_lengths = np.zeros(count, dtype=np.float64)
+        self._focus_distances = np.zeros(count, dtype=np.float64)
+        self._f_stops = np.zeros(count, dtype=np.float64)
+        self._horizontal_apertures = np.zeros(count, dtype=np.float64)
+        self._vertical_apertures = np.zeros(count, dtype=np.float64)
+        self._clipping_ranges = np.zeros((count, 2), dtype=np.float64)
+        self._intrinsics_matrices = np.zeros((count, 3, 3), dtype=np.float32)
+        self._local_to_world_transforms = np.zeros((count, 4, 4), dtype=np.float64)
+        self._view_matrices_ros = np.zeros((count, 4, 4), dtype=np.float32)
+        self._lens_distortion_models = ["pinhole"] * count
+        self._lens_distortion_attributes = [{} for _ in range(count)]
+        self._intrinsics_versions = np.zeros(count, dtype=np.int64)
+        self._dirty_intrinsics = np.ones(count, dtype=bool)
+        self._dirty_extrinsics = np.ones(count, dtype=bool)
+        self._changed_intrinsics_paths = set()
+        self._changed_extrinsics_paths = set()
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, self._stage)
+
+    def destroy(self) -> None:
+        """Stop listening to USD change notices."""
+        if getattr(self, "_listener", None) is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+    @property
+    def count(self) -> int:
+        """Number of cameras in the snapshot."""
+        return len(self._paths)
+
+    @property
+    def prim_paths(self) -> List[str]:
+        """Paths of the camera prims."""
+        return [path.pathString for path in self._paths]
+
+    @property
+    def resolution(self) -> Tuple[int, int]:
+        """Rendered resolution (width, height) used for the intrinsics."""
+        return self._resolution
+
+    def set_resolution(self, resolution: Tuple[int, int]) -> None:
+        """Set the rendered resolution of the cameras (the intrinsics are recomputed on the next access)."""
+        resolution = (int(resolution[0]), int(resolution[1]))
+        if resolution != self._resolution:
+            self._resolution = resolution
+            self._dirty_intrinsics[:] = True
+
+    def invalidate(self, indices: Optional[Sequence[int]] = None) -> None:
+        """Force the parameters of the given cameras to be read again on the next access.
+
+        Args:
+            indices (Optional[Sequence[int]], optional): Indices of the cameras. Defaults to None (all cameras).
+        """
+        if indices is None:
+            indices = slice(None)
+        self._dirty_intrinsics[indices] = True
+        self._dirty_extrinsics[indices] = True
+
+    @property
+    def focal_lengths(self) -> np.ndarray:
+        """(N,) focal lengths, in tenths of a stage unit (``focalLength`` attribute)."""
+        self._update_intrinsics()
+        return self._focal_lengths
+
+    @property
+    def focus_distances(self) -> np.ndarray:
+        """(N,) focus distances, in stage units (``focusDistance`` attribute)."""
+        self._update_intrinsics()
+        return self._focus_distances
+
+    @property
+    def f_stops(self) -> np.ndarray:
+        """(N,) lens apertures (``fStop`` attribute)."""
+        self._update_intrinsics()
+        return self._f_stops
+
+    @property
+    def horizontal_apertures(self) -> np.ndarray:
+        """(N,) horizontal apertures, in tenths of a stage unit (``horizontalAperture`` attribute)."""
+        self._update_intrinsics()
+        return self._horizontal_apertures
+
+    @property
+    def vertical_apertures(self) -> np.ndarray:
+        """(N,) vertical apertures, in tenths of a stage unit (``verticalAperture`` attribute)."""
+        self._update_intrinsics()
+        return self._vertical_apertures
+
+    @property
+    def clipping_ranges(self) -> np.ndarray:
+        """(N, 2) near and far clipping distances, in stage units (``clippingRange`` attribute)."""
+        self._update_intrinsics()
+        return self._clipping_ranges
+
+    @property
+    def intrinsics_matrices(self) -> np.ndarray:
+        """(N, 3, 3) pinhole intrinsics matrices computed from the focal lengths, apertures and resolution."""
+        self._update_intrinsics()
+        return self._intrinsics_matrices
+
+    @property
+    def lens_distortion_models(self) -> List[str]:
+        """(N,) lens distortion models (``omni:lensdistortion:model`` attribute, "pinhole" if unset)."""
+        self._update_intrinsics()
+        return self._lens_distortion_models
+
+    @property
+    def lens_distortion_attributes(self) -> List[dict]:
+        """(N,) lens distortion attribute values, keyed by name without the ``omni:lensdistortion:`` namespace."""
+        self._update_intrinsics()
+        return self._lens_distortion_attributes
+
+    @property
+    def intrinsics_versions(self) -> np.ndarray:
+        """(N,) counters incremented each time the intrinsic and lens parameters of a camera are read again."""
+        self._update_intrinsics()
+        return self._intrinsics_versions
+
+    @property
+    def local_to_world_transforms(self) -> np.ndarray:
+        """(N, 4, 4) local to world transforms of the cameras (USD row-vector convention)."""
+        self._update_extrinsics()
+        return self._local_to_world_transforms
+
+    @property
+    def view_matrices_ros(self) -> np.ndarray:
+        """(N, 4, 4) view matrices transforming world points to the camera frame (ROS convention)."""
+        self._update_extrinsics()
+        return self._view_matrices_ros
+
+    def _on_objects_changed(self, notice, stage):
+        for path in notice.GetResyncedPaths():
+            prim_path = path.GetPrimPath()
+            self._changed_intrinsics_paths.add(prim_path)
+            self._changed_extrinsics_paths.add(prim_path)
+        for path in notice.GetChangedInfoOnlyPaths():
+            if not path.IsPropertyPath():
+                continue
+            name = path.name
+            if name.startswith("xformOp"):
+                self._changed_extrinsics_paths.add(path.GetPrimPath())
+            elif name in CAMERA_PARAMETER_ATTRIBUTES or name.startswith(LENS_DISTORTION_NAMESPACE):
+                self._changed_intrinsics_paths.add(path.GetPrimPath())
+
+    def _process_changes(self) -> None:
+        for changed_paths, dirty in (
+            (self._changed_intrinsics_paths, self._dirty_intrinsics),
+            (self._changed_extrinsics_paths, self._dirty_extrinsics),
+        ):
+            if not changed_paths:
+                continue
+            if Sdf.Path.absoluteRootPath in changed_paths:
+                dirty[:] = True
+            else:
+                # changes on the camera itself or on any of its ancestors (e.g.: transformations, resyncs)
+                for i, prefixes in enumerate(self._prefixes):
+                    if not dirty[i] and any(prefix in changed_paths for prefix in prefixes):
+                        dirty[i] = True
+            changed_paths.clear()
+        # resynced prims may have been (re)created
+        for i in np.flatnonzero(self._dirty_intrinsics | self._dirty_extrinsics):
+            if not self._prims[i].IsValid():
+                self._prims[i] = self._stage.GetPrimAtPath(self._paths[i])
+
+    def _update_intrinsics(self) -> None:
+        self._process_changes()
+        indices = np.flatnonzero(self._dirty_intrinsics)
+        if not indices.size:
+            return
+        width, height = self._resolution
+        for i in indices:
+            prim = self._prims[i]
+            if not prim.IsValid():
+                continue
+            camera = UsdGeom.Camera(prim)
+            self._focal_lengths[i] = _get_value(camera.GetFocalLengthAttr())
+            self._focus_distances[i] = _get_value(camera.GetFocusDistanceAttr())
+            self._f_stops[i] = _get_value(camera.GetFStopAttr())
+            self._horizontal_apertures[i] = _get_value(camera.GetHorizontalApertureAttr())
+            self._vertical_apertures[i] = _get_value(camera.GetVerticalApertureAttr())
+            clipping_range = camera.GetClippingRangeAttr().Get()
+            self._clipping_ranges[i] = clipping_range if clipping_range is not None else np.nan
+            lens_distortion_attributes = {}
+            for attribute in prim.GetAttributes():
+                name = attribute.GetName()
+                if name.startswith(LENS_DISTORTION_NAMESPACE):
+                    lens_distortion_attributes[name[len(LENS_DISTORTION_NAMESPACE) :]] = attribute.Get()
+            self._lens_distortion_attributes[i] = lens_distortion_attributes
+            self._lens_distortion_models[i] = lens_distortion_attributes.get("model") or "pinhole"
+        # intrinsics of the dirty cameras
+        fx = width * self._focal_lengths[indices] / self._horizontal_apertures[indices]
+        fy = height * self._focal_lengths[indices] / self._vertical_apertures[indices]
+        self._intrinsics_matrices[indices] = 0.0
+        self._intrinsics_matrices[indices, 0, 0] = fx
+        self._intrinsics_matrices[indices, 1, 1] = fy
+        self._intrinsics_matrices[indices, 0, 2] = width * 0.5
+        self._intrinsics_matrices[indices, 1, 2] = height * 0.5
+        self._intrinsics_matrices[indices, 2, 2] = 1.0
+        self._intrinsics_versions[indices] += 1
+        self._dirty_intrinsics[indices] = False
+
+    def _update_extrinsics(self) -> None:
+        self._process_changes()
+        indices = np.flatnonzero(self._dirty_extrinsics)
+        if not indices.size:
+            return
+        xform_cache = UsdGeom.XformCache(Usd.TimeCode.Default())
+        for i in indices:
+            prim = self._prims[i]
+            if prim.IsValid():
+                self._local_to_world_transforms[i] = np.array(xform_cache.GetLocalToWorldTransform(prim))
+            else:
+                self._local_to_world_transforms[i] = np.nan
+        # world (column-vector convention) -> camera (USD) -> camera (ROS)
+        world_transforms = np.transpose(self._local_to_world_transforms[indices], (0, 2, 1))
+        self._view_matrices_ros[indices] = R_U_TRANSFORM @ np.linalg.inv(world_transforms)
+        self._dirty_extrinsics[indices] = False
+
+
+def _get_value(attribute: Usd.Attribute) -> float:
+    value = attribute.Get() if attribute else None
+    return np.nan if value is None else value
@@ -14,14 +14,20 @@
 # limitations under the License.
 from typing import Any, List, Optional, Tuple, Union
 
+import carb.eventdispatcher
 import numpy as np
+import omni.kit.app
 import omni.replicator.core as rep
 import torch
 import warp as wp
+from isaacsim.core.api.sensors.sensor_history import SensorHistory
+from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
 from isaacsim.core.prims import XFormPrim
 from isaacsim.core.utils.carb import get_carb_setting
 from pxr import Usd, Vt
 
+from .camera_parameters import CameraParameterSnapshot
+
 # from ROS camera convention to USD camera convention
 U_R_TRANSFORM = np.array([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
 
@@ -190,15 +196,104 @@ class CameraView(XFormPrim):
         self._annotators = dict()
         self.camera_resolution = camera_resolution
         self._tiled_render_product = None
+        self._parameter_snapshot = None
+        self._history = None
+        self._history_annotator = None
+        self._history_device = None
+        self._history_frame = None
+        self._history_callback = None
         self._setup_tiled_sensor()
 
     def __del__(self):
         self.destroy()
 
     def destroy(self) -> None:
+        self.disable_history()
         self._clean_up_tiled_sensor()
+        if getattr(self, "_parameter_snapshot", None) is not None:
+            self._parameter_snapshot.destroy()
+            self._parameter_snapshot = None
         super().destroy()
 
+    def get_parameter_snapshot(self) -> CameraParameterSnapshot:
+        """Get the cached snapshot of the parameters of the cameras (see :class:`CameraParameterSnapshot`).
+
+        The snapshot is invalidated by USD change notices, so the batch parameter getters of the view only read
+        USD attributes of the cameras that have changed.
+
+        Returns:
+            CameraParameterSnapshot: The parameter snapshot of the camera prims, indexed as the view.
+        """
+        if self._parameter_snapshot is None:
+            self._parameter_snapshot = CameraParameterSnapshot(
+                self.prim_paths, self.camera_resolution, stage=self.prims[0].GetStage()
+            )
+        return self._parameter_snapshot
+
+    def enable_history(self, annotator_type: str, capacity: int, device: str = "cuda:0") -> SensorHistory:
+        """Record the batched frames of an annotator/sensor type in a ring buffer (see :class:`SensorHistory`).
+
+        Frames are fetched once per rendered update in which the simulation time advanced, and stored in a
+        preallocated (capacity, N, height, width, channels) torch buffer timestamped with the simulation time.
+        Changing the resolution (see :meth:`set_resolutions`) replaces the history with an empty one at the new
+        resolution (get it again with :meth:`get_history`).
+
+        Args:
+            annotator_type: Annotator/sensor type to record (it must be configured when instantiating the object).
+            capacity: Number of frames kept.
+            device: Torch device of the history buffers. Defaults to "cuda:0".
+
+        Returns:
+            SensorHistory: The history of the view, with a field named after the annotator/sensor type.
+
+        Raises:
+            ValueError: If the specified annotator type is not supported or not configured.
+        """
+        spec = ANNOTATOR_SPEC.get(annotator_type)
+        if spec is None:
+            raise ValueError(
+                f"Unsupported annotator type: {annotator_type}. Supported types are {list(ANNOTATOR_SPEC.keys())}"
+            )
+        if spec["name"] not in self._annotators:
+            raise ValueError(
+                f"The specified annotator type ({annotator_type}) was not configured. Enable it when instantiating the object"
+            )
+        height, width = self.camera_resolution
+        shape = (len(self.prims), height, width, 3 if annotator_type == "rgb" else spec["channels"])
+        self._history = SensorHistory(
+            capacity, {annotator_type: (shape, wp.types.warp_type_to_np_dtype[spec["dtype"]])}, device=device
+        )
+        self._history_annotator = annotator_type
+        self._history_device = device
+        self._history_frame = wp.zeros(shape, dtype=spec["dtype"], device=str(device))
+        if self._history_callback is None:
+            self._core_nodes = _isaacsim_core_nodes.acquire_interface()
+            self._history_callback = carb.eventdispatcher.get_eventdispatcher().observe_event(
+                event_name=omni.kit.app.GLOBAL_EVENT_UPDATE,
+                on_event=self._record_history,
+                observer_name="isaacsim.sensors.camera.CameraView._record_history",
+            )
+        return self._history
+
+    def disable_history(self) -> None:
+        """Stop recording frames and release the history."""
+        self._history_callback = None
+        self._history = None
+        self._history_frame = None
+
+    def get_history(self) -> Optional[SensorHistory]:
+        """Get the history of the view (None if :meth:`enable_history` was not called)."""
+        return self._history
+
+    def _record_history(self, event) -> None:
+        time = float(self._core_nodes.get_sim_time())
+        if self._history.latest_time == time:
+            return
+        data, _ = self.get_data(self._history_annotator, out=self._history_frame)
+        if data.shape[0] == 0:
+            return
+        self._history.append(time, **{self._history_annotator: wp.to_torch(self._history_frame)})
+
     def _clean_up_tiled_sensor(self):
         """Clean up the sensor by detaching annotators and destroying render products, and removing related prims."""
         if self._tiled_render_product is not None:
@@ -269,13 +364,20 @@ class CameraView(XFormPrim):
     def set_resolutions(self, resolution: Tuple[int, int]) -> None:
         """Set the resolutions for all cameras, updating the tiled sensor configuration if changed.
 
+        If the history is enabled, it is replaced with an empty one at the new resolution (see :meth:`get_history`).
+
         Args:
             resolution (Tuple[int, int]): The new resolution to apply to all cameras.
         """
         if not resolution == self.camera_resolution:
             self.camera_resolution = resolution
+            if self._parameter_snapshot is not None:
+                self._parameter_snapshot.set_resolution(resolution)
             # update tiled sensor after changing resolution
             self._setup_tiled_sensor()
+            # the history buffers have the shape of the previous resolution
+            if self._history is not None:
+                self.enable_history(self._history_annotator, self._history.capacity, device=self._history_device)
 
     def get_resolutions(self) -> Tuple[int, int]:
         """Retrieve the current resolution setting for all cameras.
@@ -662,14 +764,10 @@ class CameraView(XFormPrim):
         Returns:
             list[float]: list containing the focal lengths of the cameras.
         """
-        focal_lengths = []
         indices = self._backend_utils.resolve_indices(indices, self.count, self._device)
         indices = self._backend_utils.to_list(indices)
 
-        for i in indices:
-            focal_lengths.append(self.prims[i].GetAttribute("focalLength").Get() / 10.0)
-
-        return focal_lengths
+        return (self.get_parameter_snapshot().focal_lengths[indices] / 10.0).tolist()
 
     def set_focal_lengths(
         self,
@@ -713,14 +811,10 @@ class CameraView(XFormPrim):
         Returns:
             list[float]: list containing the focal distances of the cameras.
         """
-        focus_distances = []
         indices = self._backend_utils.resolve_indices(indices, self.count, self._device)
         indices = self._backend_utils.to_list(indices)
 
-        for i in indices:
-            focus_distances.append(self.prims[i].GetAttribute("focusDistance").Get())
-
-        return focus_distances
+        return self.get_parameter_snapshot().focus_distances[indices].tolist()
 
     def set_focus_distances(
         self,
@@ -764,14 +858,10 @@ class CameraView(XFormPrim):
         Returns:
             list[float]: list containing the focal distances of the cameras.
         """
-        lens_apertures = []
         indices = self._backend_utils.resolve_indices(indices, self.count, self._device)
         indices = self._backend_utils.to_list(indices)
 
-        for i in indices:
-            lens_apertures.append(self.prims[i].GetAttribute("fStop").Get())
-
-        return lens_apertures
+        return self.get_parameter_snapshot().f_stops[indices].tolist()
 
     def set_lens_apertures(
         self,
@@ -819,14 +909,10 @@ class CameraView(XFormPrim):
         Returns:
             list[float]: list containing the focal distances of the cameras.
         """
-        horizontal_apertures = []
         indices = self._backend_utils.resolve_indices(indices, self.count, self._device)
         indices = self._backend_utils.to_list(indices)
 
-        for i in indices:
-            horizontal_apertures.append(self.prims[i].GetAttribute("horizontalAperture").Get())
-
-        return horizontal_apertures
+        return self.get_parameter_snapshot().horizontal_apertures[indices].tolist()
 
     def set_horizontal_apertures(
         self,
@@ -872,14 +958,10 @@ class CameraView(XFormPrim):
         Returns:
             list[float]: list containing the focal distances of the cameras.
         """
-        vertical_apertures = []
         indices = self._backend_utils.resolve_indices(indices, self.count, self._device)
         indices = self._backend_utils.to_list(indices)
 
-        for i in indices:
-            vertical_apertures.append(self.prims[i].GetAttribute("verticalAperture").Get())
-
-        return vertical_apertures
+        return self.get_parameter_snapshot().vertical_apertures[indices].tolist()
 
     def set_vertical_apertures(
         self,
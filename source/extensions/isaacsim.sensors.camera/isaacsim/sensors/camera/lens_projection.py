@@ -0,0 +1,408 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Lens distortion models supported by the projection engine
+SUPPORTED_PROJECTION_MODELS = [
+    "pinhole",
+    "opencvPinhole",
+    "opencvFisheye",
+    "ftheta",
+    "kannalaBrandtK3",
+    "radTanThinPrism",
+]
+
+# Number of iterations used to numerically invert the distortion functions
+UNDISTORTION_ITERATIONS = 20
+
+
+def _coefficients(coefficients: Optional[Sequence[float]], count: int) -> np.ndarray:
+    """Pad the (possibly partial, possibly None valued) coefficients with zeros."""
+    values = np.zeros(count, dtype=np.float64)
+    for i, value in enumerate(list(coefficients or [])[:count]):
+        values[i] = 0.0 if value is None else value
+    return values
+
+
+def distort_rational_polynomial(
+    x: np.ndarray, y: np.ndarray, coefficients: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Distort normalized image coordinates using the OpenCV rational polynomial model with thin prism terms.
+
+    Args:
+        x (np.ndarray): Normalized (z = 1) x coordinates.
+        y (np.ndarray): Normalized (z = 1) y coordinates.
+        coefficients (np.ndarray): Coefficients in OpenCV order [k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4].
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distorted normalized x and y coordinates.
+    """
+    k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4 = coefficients
+    r2 = x * x + y * y
+    r4 = r2 * r2
+    r6 = r4 * r2
+    radial = (1.0 + k1 * r2 + k2 * r4 + k3 * r6) / (1.0 + k4 * r2 + k5 * r4 + k6 * r6)
+    xd = x * radial + 2.0 * p1 * x * y + p2 * (r2 + 2.0 * x * x) + s1 * r2 + s2 * r4
+    yd = y * radial + p1 * (r2 + 2.0 * y * y) + 2.0 * p2 * x * y + s3 * r2 + s4 * r4
+    return xd, yd
+
+
+def undistort_rational_polynomial(
+    xd: np.ndarray, yd: np.ndarray, coefficients: np.ndarray, iterations: int = UNDISTORTION_ITERATIONS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Invert :func:`distort_rational_polynomial` using fixed-point iterations (as ``cv2.undistortPoints`` does).
+
+    Args:
+        xd (np.ndarray): Distorted normalized x coordinates.
+        yd (np.ndarray): Distorted normalized y coordinates.
+        coefficients (np.ndarray): Coefficients in OpenCV order [k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4].
+        iterations (int, optional): Number of fixed-point iterations. Defaults to UNDISTORTION_ITERATIONS.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Undistorted normalized x and y coordinates.
+    """
+    k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4 = coefficients
+    x, y = xd.copy(), yd.copy()
+    if not np.any(coefficients):
+        return x, y
+    for _ in range(iterations):
+        r2 = x * x + y * y
+        r4 = r2 * r2
+        r6 = r4 * r2
+        inverse_radial = (1.0 + k4 * r2 + k5 * r4 + k6 * r6) / (1.0 + k1 * r2 + k2 * r4 + k3 * r6)
+        delta_x = 2.0 * p1 * x * y + p2 * (r2 + 2.0 * x * x) + s1 * r2 + s2 * r4
+        delta_y = p1 * (r2 + 2.0 * y * y) + 2.0 * p2 * x * y + s3 * r2 + s4 * r4
+        x = (xd - delta_x) * inverse_radial
+        y = (yd - delta_y) * inverse_radial
+    return x, y
+
+
+def distort_equidistant(x: np.ndarray, y: np.ndarray, coefficients: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distort normalized image coordinates using the equidistant (OpenCV fisheye / Kannala-Brandt) model.
+
+    Args:
+        x (np.ndarray): Normalized (z = 1) x coordinates.
+        y (np.ndarray): Normalized (z = 1) y coordinates.
+        coefficients (np.ndarray): Coefficients [k1, k2, k3, k4] of theta_d = theta * (1 + k1 theta^2 + ... + k4 theta^8).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distorted normalized x and y coordinates.
+    """
+    k1, k2, k3, k4 = coefficients
+    r = np.sqrt(x * x + y * y)
+    theta = np.arctan(r)
+    theta2 = theta * theta
+    theta_d = theta * (1.0 + theta2 * (k1 + theta2 * (k2 + theta2 * (k3 + theta2 * k4))))
+    scale = np.where(r > 1e-8, theta_d / np.maximum(r, 1e-8), 1.0)
+    return x * scale, y * scale
+
+
+def undistort_equidistant(
+    xd: np.ndarray, yd: np.ndarray, coefficients: np.ndarray, iterations: int = UNDISTORTION_ITERATIONS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Invert :func:`distort_equidistant` solving for the incidence angle with Newton iterations.
+
+    Points whose incidence angle is 90 degrees or more cannot be represented with normalized (z = 1) coordinates
+    and are set to NaN.
+
+    Args:
+        xd (np.ndarray): Distorted normalized x coordinates.
+        yd (np.ndarray): Distorted normalized y coordinates.
+        coefficients (np.ndarray): Coefficients [k1, k2, k3, k4].
+        iterations (int, optional): Number of Newton iterations. Defaults to UNDISTORTION_ITERATIONS.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Undistorted normalized x and y coordinates.
+    """
+    k1, k2, k3, k4 = coefficients
+    theta_d = np.sqrt(xd * xd + yd * yd)
+    theta = theta_d.copy()
+    if np.any(coefficients):
+        for _ in range(iterations):
+            theta2 = theta * theta
+            value = theta * (1.0 + theta2 * (k1 + theta2 * (k2 + theta2 * (k3 + theta2 * k4)))) - theta_d
+            derivative = 1.0 + theta2 * (3.0 * k1 + theta2 * (5.0 * k2 + theta2 * (7.0 * k3 + theta2 * 9.0 * k4)))
+            theta = theta - value / np.where(np.abs(derivative) > 1e-12, derivative, 1e-12)
+    with np.errstate(invalid="ignore"):
+        scale = np.where(theta_d > 1e-8, np.tan(theta) / np.maximum(theta_d, 1e-8), 1.0)
+        scale = np.where((theta >= 0.0) & (theta < 0.5 * np.pi), scale, np.nan)
+    return xd * scale, yd * scale
+
+
+def _evaluate_polynomial(coefficients: np.ndarray, value: np.ndarray) -> np.ndarray:
+    result = np.zeros_like(value)
+    for coefficient in coefficients[::-1]:
+        result = result * value + coefficient
+    return result
+
+
+class LensProjection:
+    """Forward and inverse projection between camera frame points and pixel coordinates for a camera lens.
+
+    The projection is defined in the ROS camera frame convention (+Z forward along the optical axis, +X right,
+    +Y down) and in pixel coordinates where (0, 0) is the top left corner of the image (pixel centers at half
+    integers). Inverse projections return rays normalized to z = 1, so that a point is recovered by scaling the
+    ray with its depth (distance to image plane).
+
+    Supported models (``omni:lensdistortion:model``):
+
+    - ``pinhole``: ideal pinhole, intrinsics computed from the focal length and apertures of the camera prim.
+    - ``opencvPinhole``: OpenCV rational polynomial model with thin prism terms (``cv2.projectPoints``).
+    - ``opencvFisheye``: OpenCV fisheye (equidistant) model (``cv2.fisheye.projectPoints``).
+    - ``ftheta``: polynomial theta = k0 + k1 r + ... + k4 r^4 mapping the distance r (in pixels of the nominal
+      resolution) from the optical center to the incidence angle theta (in radians).
+    - ``kannalaBrandtK3``: equidistant model with the [k0, k1, k2, k3] odd-power coefficients.
+    - ``radTanThinPrism``: rational polynomial model with radial [k0..k5], tangential [p0, p1] and thin prism
+      [s0..s3] coefficients.
+
+    The models without explicit focal lengths (``kannalaBrandtK3`` and ``radTanThinPrism``) use the focal length
+    given by the focal length and apertures of the camera prim, and all the nominal resolution based models are
+    scaled to the rendered resolution.
+
+    Undistortion lookup tables (a normalized ray per pixel) are computed on first use for the full image
+    and cached per backend and device, so that unprojecting a depth image is a single broadcast multiplication.
+
+    Args:
+        model (str): Lens distortion model, one of SUPPORTED_PROJECTION_MODELS.
+        resolution (Tuple[int, int]): Rendered resolution (width, height) in pixels.
+        focal_length (Tuple[float, float]): Focal lengths (fx, fy) in pixels of the rendered resolution.
+        principal_point (Tuple[float, float]): Principal point (cx, cy) in pixels of the rendered resolution.
+        coefficients (Optional[Sequence[float]], optional): Distortion coefficients in the order of the model's
+            attribute map. Missing or None coefficients default to 0.0. Defaults to None.
+        nominal_width (Optional[float], optional): Width of the calibrated sensor in pixels (``ftheta`` only),
+            defaults to the rendered width.
+        max_fov (Optional[float], optional): Maximum field of view in degrees, points outside of it are invalid.
+            Defaults to None (unbounded).
+    """
+
+    def __init__(
+        self,
+        model: str,
+        resolution: Tuple[int, int],
+        focal_length: Tuple[float, float],
+        principal_point: Tuple[float, float],
+        coefficients: Optional[Sequence[float]] = None,
+        nominal_width: Optional[float] = None,
+        max_fov: Optional[float] = None,
+    ):
+        if model not in SUPPORTED_PROJECTION_MODELS:
+            raise ValueError(
+                f"Unsupported lens distortion model '{model}' for projection, supported models are {SUPPORTED_PROJECTION_MODELS}"
+            )
+        self._model = model
+        self._resolution = (int(resolution[0]), int(resolution[1]))
+        self._focal_length = np.array(focal_length, dtype=np.float64)
+        self._principal_point = np.array(principal_point, dtype=np.float64)
+        self._nominal_scale = self._resolution[0] / nominal_width if nominal_width else 1.0
+        self._max_theta = np.radians(max_fov) * 0.5 if max_fov else None
+        if model == "opencvPinhole":
+            self._coefficients = _coefficients(coefficients, 12)
+        elif model == "radTanThinPrism":
+            # [k0..k5, p0, p1, s0..s3] -> OpenCV order [k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4]
+            k = _coefficients(coefficients, 12)
+            self._coefficients = np.concatenate((k[0:2], k[6:8], k[2:6], k[8:12]))
+        elif model in ("opencvFisheye", "kannalaBrandtK3"):
+            self._coefficients = _coefficients(coefficients, 4)
+        elif model == "ftheta":
+            self._coefficients = _coefficients(coefficients, 5)
+        else:
+            self._coefficients = np.zeros(0, dtype=np.float64)
+        self._key = (
+            model,
+            self._resolution,
+            tuple(self._focal_length.tolist()),
+            tuple(self._principal_point.tolist()),
+            tuple(self._coefficients.tolist()),
+            self._nominal_scale,
+            self._max_theta,
+        )
+        self._ray_lut = None
+        self._backend_ray_luts = {}
+        self._backend_intrinsics = {}
+
+    @property
+    def model(self) -> str:
+        """Lens distortion model of the projection."""
+        return self._model
+
+    @property
+    def resolution(self) -> Tuple[int, int]:
+        """Rendered resolution (width, height) of the projection."""
+        return self._resolution
+
+    @property
+    def key(self) -> tuple:
+        """Hashable tuple of all the projection parameters, equal keys mean equal projections."""
+        return self._key
+
+    def project(self, points: np.ndarray) -> np.ndarray:
+        """Project camera frame points to pixel coordinates.
+
+        Args:
+            points (np.ndarray): (n, 3) points (X, Y, Z) in the camera frame (ROS convention).
+
+        Returns:
+            np.ndarray: (n, 2) pixel coordinates (u, v). Points behind the camera or outside the field of view are NaN.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        x, y, z = points[:, 0], points[:, 1], points[:, 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self._model == "ftheta":
+                r = np.sqrt(x * x + y * y)
+                theta = np.arctan2(r, z)
+                radius = self._ftheta_radius(theta)
+                scale = np.where(r > 1e-12, radius / np.maximum(r, 1e-12), 0.0)
+                u = x * scale + self._principal_point[0]
+                v = y * scale + self._principal_point[1]
+            else:
+                theta = np.arctan2(np.sqrt(x * x + y * y), z)
+                xn, yn = x / z, y / z
+                if self._model in ("opencvPinhole", "radTanThinPrism"):
+                    xn, yn = distort_rational_polynomial(xn, yn, self._coefficients)
+                elif self._model in ("opencvFisheye", "kannalaBrandtK3"):
+                    xn, yn = distort_equidistant(xn, yn, self._coefficients)
+                u = xn * self._focal_length[0] + self._principal_point[0]
+                v = yn * self._focal_length[1] + self._principal_point[1]
+                theta = np.where(z > 0.0, theta, np.nan)
+        valid = self._is_valid_angle(theta)
+        return np.where(valid[:, None], np.stack((u, v), axis=1), np.nan)
+
+    def unproject(self, points_2d: np.ndarray) -> np.ndarray:
+        """Unproject pixel coordinates to rays in the camera frame normalized to z = 1.
+
+        Args:
+            points_2d (np.ndarray): (n, 2) pixel coordinates (u, v).
+
+        Returns:
+            np.ndarray: (n, 3) rays (X / Z, Y / Z, 1) in the camera frame (ROS convention). Pixels whose ray is
+                outside the field of view (or at 90 degrees or more from the optical axis) are NaN.
+        """
+        points_2d = np.asarray(points_2d, dtype=np.float64).reshape(-1, 2)
+        du = points_2d[:, 0] - self._principal_point[0]
+        dv = points_2d[:, 1] - self._principal_point[1]
+        if self._model == "ftheta":
+            r = np.sqrt(du * du + dv * dv)
+            theta = _evaluate_polynomial(self._coefficients, r / self._nominal_scale)
+            with np.errstate(invalid="ignore"):
+                scale = np.where(r > 1e-12, np.tan(theta) / np.maximum(r, 1e-12), 0.0)
+            theta = np.where((theta >= 0.0) & (theta < 0.5 * np.pi), theta, np.nan)
+            x, y = du * scale, dv * scale
+        else:
+            x, y = du / self._focal_length[0], dv / self._focal_length[1]
+            if self._model in ("opencvPinhole", "radTanThinPrism"):
+                x, y = undistort_rational_polynomial(x, y, self._coefficients)
+            elif self._model in ("opencvFisheye", "kannalaBrandtK3"):
+                x, y = undistort_equidistant(x, y, self._coefficients)
+            theta = np.arctan(np.sqrt(x * x + y * y))
+        rays = np.stack((x, y, np.ones_like(x)), axis=1)
+        valid = self._is_valid_angle(theta) & np.isfinite(x) & np.isfinite(y)
+        return np.where(valid[:, None], rays, np.nan)
+
+    def get_ray_lut(self, backend_utils=None, device: str = None):
+        """Get the undistortion lookup table of the full image: the normalized ray of every pixel center.
+
+        The table is computed once and cached per backend and device.
+
+        Args:
+            backend_utils (optional): Backend utilities module (np_utils or torch_utils) of the returned table.
+                Defaults to None (NumPy array).
+            device (str, optional): Device of the returned table. Defaults to None.
+
+        Returns:
+            np.ndarray | torch.Tensor: (height * width, 3) float32 rays in row-major pixel order.
+        """
+        if self._ray_lut is None:
+            width, height = self._resolution
+            xmap, ymap = np.meshgrid(np.arange(width) + 0.5, np.arange(height) + 0.5, indexing="xy")
+            self._ray_lut = self.unproject(np.column_stack((xmap.ravel(), ymap.ravel()))).astype(np.float32)
+        if backend_utils is None:
+            return self._ray_lut
+        cache_key = (backend_utils.__name__, str(device))
+        ray_lut = self._backend_ray_luts.get(cache_key)
+        if ray_lut is None:
+            ray_lut = backend_utils.convert(self._ray_lut, device=device, dtype="float32")
+            self._backend_ray_luts[cache_key] = ray_lut
+        return ray_lut
+
+    def unproject_depth(self, depth, backend_utils, device: str = None):
+        """Unproject a full depth (distance to image plane) image to camera frame points in a single batched op.
+
+        Args:
+            depth (np.ndarray | torch.Tensor): (height, width) depth image of the projection resolution.
+            backend_utils: Backend utilities module (np_utils or torch_utils) of the depth image.
+            device (str, optional): Device of the depth image. Defaults to None.
+
+        Returns:
+            np.ndarray | torch.Tensor: (height * width, 3) points (X, Y, Z) in the camera frame (ROS convention).
+        """
+        if tuple(depth.shape[:2]) != (self._resolution[1], self._resolution[0]):
+            raise ValueError(
+                f"Depth image shape {tuple(depth.shape[:2])} does not match the projection resolution {self._resolution}"
+            )
+        ray_lut = self.get_ray_lut(backend_utils, device)
+        return ray_lut * backend_utils.expand_dims(depth.flatten(), 1)
+
+    def unproject_points(self, points_2d, depth, backend_utils, device: str = None):
+        """Unproject pixel coordinates with their depth (distance to image plane) to camera frame points.
+
+        The ideal pinhole model is computed directly on the backend, the distortion models are undistorted
+        with NumPy and the rays moved to the backend.
+
+        Args:
+            points_2d (np.ndarray | torch.Tensor): (n, 2) pixel coordinates (u, v).
+            depth (np.ndarray | torch.Tensor): (n,) depth of each pixel coordinate.
+            backend_utils: Backend utilities module (np_utils or torch_utils) of the inputs.
+            device (str, optional): Device of the inputs. Defaults to None.
+
+        Returns:
+            np.ndarray | torch.Tensor: (n, 3) points (X, Y, Z) in the camera frame (ROS convention).
+        """
+        if self._model == "pinhole":
+            cache_key = (backend_utils.__name__, str(device))
+            intrinsics = self._backend_intrinsics.get(cache_key)
+            if intrinsics is None:
+                intrinsics = (
+                    backend_utils.convert(self._principal_point, device=device, dtype="float32"),
+                    backend_utils.convert(self._focal_length, device=device, dtype="float32"),
+                )
+                self._backend_intrinsics[cache_key] = intrinsics
+            principal_point, focal_length = intrinsics
+            rays = backend_utils.pad((points_2d - principal_point) / focal_length, ((0, 0), (0, 1)), value=1.0)
+        else:
+            rays = backend_utils.convert(
+                self.unproject(backend_utils.to_numpy(points_2d)), device=device, dtype="float32"
+            )
+        return rays * backend_utils.expand_dims(depth, 1)
+
+    def _ftheta_radius(self, theta: np.ndarray) -> np.ndarray:
+        """Invert the f-theta polynomial (Newton iterations) to get the pixel distance of incidence angles."""
+        k0, k1, k2, k3, k4 = self._coefficients
+        radius = np.where(abs(k1) > 1e-12, (theta - k0) / (k1 if abs(k1) > 1e-12 else 1.0), theta)
+        for _ in range(UNDISTORTION_ITERATIONS):
+            value = _evaluate_polynomial(self._coefficients, radius) - theta
+            derivative = k1 + radius * (2.0 * k2 + radius * (3.0 * k3 + radius * 4.0 * k4))
+            radius = radius - value / np.where(np.abs(derivative) > 1e-12, derivative, 1e-12)
+        return radius * self._nominal_scale
+
+    def _is_valid_angle(self, theta: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            valid = np.isfinite(theta)
+            if self._max_theta is not None:
+                valid &= theta <= self._max_theta
+        return valid
@@ -16,6 +16,7 @@
 import asyncio
 import math
 
+import isaacsim.core.utils.numpy as np_utils
 import isaacsim.core.utils.numpy.rotations as rot_utils
 import numpy as np
 import omni.kit.test
@@ -131,6 +132,59 @@ class TestCameraSensor(omni.kit.test.AsyncTestCase):
         self.assertTrue(np.allclose(points_3d[1], [5, 3, 0.1], atol=0.05), f"points_3d[1]: {points_3d[1]}")
         return
 
+    async def test_lens_projection(self):
+        """Test the forward and inverse projection of the lens distortion models."""
+        world_points = np.array([self.cube_3.get_world_pose()[0], self.cube_2.get_world_pose()[0]])
+        depths = np.array([24.94, 24.9])
+        # Without distortion the projection matches the pinhole projection
+        self.camera.set_lens_distortion_model("pinhole")
+        pinhole_points_2d = self.camera.get_image_coords_from_world_points(world_points)
+        fx = self.camera.get_intrinsics_matrix()[0, 0]
+        self.camera.set_opencv_pinhole_properties(cx=128.0, cy=128.0, fx=fx, fy=fx, pinhole=[0.0] * 12)
+        points_2d = self.camera.get_image_coords_from_world_points(world_points)
+        self.assertTrue(np.allclose(points_2d, pinhole_points_2d, atol=1e-3), f"points_2d: {points_2d}")
+        # Projecting and unprojecting with distortion gives back the same points
+        for model, set_properties in (
+            ("opencvPinhole", lambda: self.camera.set_opencv_pinhole_properties(pinhole=[0.1, -0.05, 0.001, 0.002])),
+            ("opencvFisheye", lambda: self.camera.set_opencv_fisheye_properties(fisheye=[0.05, 0.01, -0.003, -0.0005])),
+            (
+                "kannalaBrandtK3",
+                lambda: self.camera.set_kannala_brandt_k3_properties(distortion_coefficients=[0.05, 0.01]),
+            ),
+            (
+                "radTanThinPrism",
+                lambda: self.camera.set_rad_tan_thin_prism_properties(distortion_coefficients=[0.1, 0.2, 0.3]),
+            ),
+        ):
+            set_properties()
+            self.assertEqual(self.camera.get_lens_projection().model, model)
+            points_2d = self.camera.get_image_coords_from_world_points(world_points)
+            self.assertFalse(np.allclose(points_2d, pinhole_points_2d, atol=1e-3), f"{model} points_2d: {points_2d}")
+            points_3d = self.camera.get_world_points_from_image_coords(points_2d, depths)
+            self.assertTrue(np.allclose(points_3d, world_points, atol=0.05), f"{model} points_3d: {points_3d}")
+        # The ray lookup table is cached while the lens parameters are unchanged
+        projection = self.camera.get_lens_projection()
+        ray_lut = projection.get_ray_lut()
+        self.assertEqual(ray_lut.shape, (256 * 256, 3))
+        self.assertIs(self.camera.get_lens_projection(), projection)
+        self.assertIs(self.camera.get_lens_projection().get_ray_lut(), ray_lut)
+        # Authoring a lens attribute directly on the prim rebuilds the projection
+        attribute = self.camera.prim.GetAttribute("omni:lensdistortion:radTanThinPrism:k0")
+        attribute.Set(attribute.Get() + 0.1)
+        self.assertIsNot(self.camera.get_lens_projection(), projection)
+        attribute.Set(attribute.Get() - 0.1)
+        projection = self.camera.get_lens_projection()
+        # Unprojecting a full depth image matches unprojecting its pixel coordinates
+        depth = np.full((256, 256), 10.0, dtype=np.float32)
+        points = projection.unproject_depth(depth, backend_utils=np_utils)
+        xmap, ymap = np.meshgrid(np.arange(256) + 0.5, np.arange(256) + 0.5, indexing="xy")
+        expected = self.camera.get_camera_points_from_image_coords(
+            np.column_stack((xmap.ravel(), ymap.ravel())), depth.ravel()
+        )
+        self.assertTrue(np.allclose(points, expected, atol=1e-4, equal_nan=True))
+        self.camera.set_lens_distortion_model("pinhole")
+        return
+
     async def test_data_acquisition(self):
         await omni.syntheticdata.sensors.next_render_simulation_async(self.camera.get_render_product_path(), 1)
         self.camera.resume()
@@ -153,6 +207,28 @@ class TestCameraSensor(omni.kit.test.AsyncTestCase):
         self.camera.set_focal_length(5.0)
         self.assertAlmostEqual(self.camera.get_focal_length(), 5.0)
 
+    async def test_parameter_snapshot(self):
+        """Test that the cached camera parameters are invalidated by USD changes."""
+        snapshot = self.camera.get_parameter_snapshot()
+        self.assertIs(self.camera.get_parameter_snapshot(), snapshot)
+        intrinsics_matrix = self.camera.get_intrinsics_matrix()
+        view_matrix = self.camera.get_view_matrix_ros()
+        self.assertTrue(np.allclose(snapshot.intrinsics_matrices[0], intrinsics_matrix))
+        # Authoring the attributes directly on the prim invalidates the cached intrinsics
+        self.camera.prim.GetAttribute("focalLength").Set(self.camera.prim.GetAttribute("focalLength").Get() * 2.0)
+        self.assertTrue(np.allclose(self.camera.get_intrinsics_matrix()[:2, :2], intrinsics_matrix[:2, :2] * 2.0))
+        self.camera.prim.GetAttribute("clippingRange").Set((0.5, 500.0))
+        self.assertTrue(np.allclose(self.camera.get_clipping_range(), (0.5, 500.0)))
+        # Moving an ancestor of the camera invalidates the cached extrinsics
+        self.assertTrue(np.allclose(self.camera.get_view_matrix_ros(), view_matrix))
+        self.xform.set_world_pose(position=np.array([5.0, 0.0, 10.0]))
+        new_view_matrix = self.camera.get_view_matrix_ros()
+        self.assertFalse(np.allclose(new_view_matrix, view_matrix))
+        self.assertTrue(np.allclose(new_view_matrix[:3, :3], view_matrix[:3, :3], atol=1e-5))
+        # Changing the resolution recomputes the intrinsics
+        self.camera.set_resolution((512, 256))
+        self.assertTrue(np.allclose(self.camera.get_intrinsics_matrix()[:2, 2], [256.0, 128.0]))
+
     async def test_focus_distance(self):
         """Test setting and getting focus distance."""
         self.camera.set_focus_distance(0.01)
@@ -21,6 +21,7 @@ import omni.kit.app
 import omni.kit.test
 from isaacsim.core.api import World
 from isaacsim.core.api.objects import FixedCuboid
+from isaacsim.core.utils.point_cloud import PointCloudProcessor
 from isaacsim.core.utils.semantics import add_labels
 from isaacsim.core.utils.stage import create_new_stage_async
 from isaacsim.sensors.camera import Camera
@@ -289,3 +290,31 @@ class TestCameraSensorPointcloud(omni.kit.test.AsyncTestCase):
         await self.compare_pointcloud_data_resolution(
             resolution=(211, 99), save_golden_data=SAVE_GOLDEN_DATA, save_debug_imgs=SAVE_DEBUG_IMGS
         )
+
+    async def test_processed_pointcloud(self):
+        self.assertIsNone(self.camera.get_processed_pointcloud())
+        self.camera.set_resolution((64, 64))
+        self.camera.add_distance_to_image_plane_to_frame()
+        await omni.syntheticdata.sensors.next_render_simulation_async(self.camera.get_render_product_path(), 5)
+        points = np.asarray(self.camera.get_pointcloud(world_frame=False))
+
+        # the range limits drop the points without depth (no hit)
+        processor = PointCloudProcessor(voxel_size=0.2, range_limits=(0.0, 20.0))
+        self.camera.set_point_cloud_processor(processor)
+        self.assertIs(self.camera.get_point_cloud_processor(), processor)
+        output = self.camera.get_processed_pointcloud()
+        expected = PointCloudProcessor(voxel_size=0.2, range_limits=(0.0, 20.0)).process(points)
+        np.testing.assert_array_equal(output["indices"], expected["indices"])
+        np.testing.assert_allclose(output["points"], expected["points"])
+        self.assertGreater(output["points"].shape[0], 0)
+        self.assertLess(output["points"].shape[0], points.shape[0])
+        self.assertEqual(processor.stats["input_points"], points.shape[0])
+        self.assertEqual(processor.stats["output_points"], output["points"].shape[0])
+
+        # processed in world frame
+        output = self.camera.get_processed_pointcloud(world_frame=True)
+        world_points = np.asarray(self.camera.get_pointcloud(world_frame=True))
+        np.testing.assert_allclose(output["points"], world_points[output["indices"]])
+
+        self.camera.set_point_cloud_processor(None)
+        self.assertIsNone(self.camera.get_processed_pointcloud())
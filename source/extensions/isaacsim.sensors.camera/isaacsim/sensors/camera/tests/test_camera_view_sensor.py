@@ -326,6 +326,32 @@ class TestCameraViewSensor(omni.kit.test.AsyncTestCase):
                 f"{annotator_type} data/out mean: {np.mean(data - out)}, std: {np.std(data - out)}",
             )
 
+    async def test_history(self):
+        history = self.camera_view.enable_history("depth", capacity=3)
+        self.assertIs(self.camera_view.get_history(), history)
+        for _ in range(6):
+            await update_stage_async()
+        self.assertEqual(len(history), 3)
+        window = history.get_window()
+        self.assertEqual(tuple(window["depth"].shape), (3, self.num_cameras, *self.resolution, 1))
+        self.assertTrue(np.all(np.diff(window["time"]) > 0))
+        # the latest recorded frame matches the current data
+        data, _ = self.camera_view.get_data("depth")
+        self.assertTrue(np.allclose(window["depth"][-1].cpu().numpy(), data.numpy()))
+        with self.assertRaises(ValueError):
+            self.camera_view.enable_history("unknown", capacity=3)
+        # changing the resolution replaces the history with one at the new resolution
+        self.camera_view.set_resolutions((128, 128))
+        resized_history = self.camera_view.get_history()
+        self.assertIsNot(resized_history, history)
+        self.assertEqual(resized_history.capacity, 3)
+        for _ in range(2):
+            await update_stage_async()
+        self.assertGreater(len(resized_history), 0)
+        self.assertEqual(tuple(resized_history.get_window(1)["depth"].shape), (1, self.num_cameras, 128, 128, 1))
+        self.camera_view.disable_history()
+        self.assertIsNone(self.camera_view.get_history())
+
     async def test_properties(self):
         self.assertTrue(self.num_cameras == len(self.camera_view.prims))
         self.camera_view.set_focal_lengths([5.0] * 4)
@@ -18,7 +18,9 @@ import carb
 import numpy as np
 import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
 import omni.kit.commands
+import omni.physx
 from isaacsim.core.api.sensors.base_sensor import BaseSensor
+from isaacsim.core.api.sensors.sensor_history import SensorHistory
 from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
 from isaacsim.core.utils.prims import get_prim_at_path, is_prim_path_valid
 from isaacsim.core.utils.stage import traverse_stage
@@ -97,6 +99,8 @@ class ContactSensor(BaseSensor):
         self._current_frame["time"] = 0
         self._current_frame["physics_step"] = 0
         self._core_nodes = _isaacsim_core_nodes.acquire_interface()
+        self._history = None
+        self._history_callback = None
         return
 
     def initialize(self, physics_sim_view=None) -> None:
@@ -184,6 +188,38 @@ class ContactSensor(BaseSensor):
         self._isaac_sensor_prim.GetSensorPeriodAttr().Set(value)
         return
 
+    def enable_history(self, capacity: int) -> SensorHistory:
+        """Record the sensor readings in a ring buffer (see :class:`SensorHistory`), timestamped with the sensor time.
+
+        The sensor is read at every physics step, and a reading is added whenever a new sensor period starts.
+
+        Args:
+            capacity (int): Number of readings kept.
+
+        Returns:
+            SensorHistory: The history of the sensor, with the ``force`` and ``in_contact`` fields.
+        """
+        self._history = SensorHistory(capacity, {"force": ((), np.float32), "in_contact": ((), bool)})
+        if self._history_callback is None:
+            self._history_callback = omni.physx.get_physx_interface().subscribe_physics_step_events(
+                self._record_history
+            )
+        return self._history
+
+    def disable_history(self) -> None:
+        """Stop recording the sensor readings and release the history."""
+        self._history_callback = None
+        self._history = None
+
+    def get_history(self) -> Optional[SensorHistory]:
+        """Get the history of the sensor (None if :meth:`enable_history` was not called)."""
+        return self._history
+
+    def _record_history(self, step_size: float) -> None:
+        reading = self._contact_sensor_interface.get_sensor_reading(self.prim_path)
+        if reading.is_valid:
+            self._history.append(float(reading.time), force=reading.value, in_contact=bool(reading.in_contact))
+
     def get_radius(self) -> float:
         return self.prim.GetAttribute("radius").Get()
 
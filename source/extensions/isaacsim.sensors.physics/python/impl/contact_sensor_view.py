@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import numpy as np
+import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
+from isaacsim.sensors.physics import _sensor
+
+from .sensor_view import SensorView
+
+
+class ContactSensorView(SensorView):
+    """View over many contact sensor prims, read into (N,) arrays.
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): Path expression(s) of the contact sensor prims
+            (e.g.: ``/World/envs/env_.*/Robot/.*_foot/Contact_Sensor``).
+
+    Example:
+
+    .. code-block:: python
+
+        >>> feet = ContactSensorView("/World/envs/env_.*/Robot/.*_foot/Contact_Sensor")
+        >>> frame = feet.get_current_frame()
+        >>> frame["in_contact"].shape
+        (num_envs * num_feet,)
+    """
+
+    def __init__(self, prim_paths_expr: Union[str, List[str]]) -> None:
+        SensorView.__init__(self, prim_paths_expr, IsaacSensorSchema.IsaacContactSensor)
+        self._contact_sensor_interface = _sensor.acquire_contact_sensor_interface()
+        self._force = np.zeros(self.count, dtype=np.float32)
+        self._in_contact = np.zeros(self.count, dtype=bool)
+        return
+
+    def update(self) -> None:
+        """Query the sensors whose period elapsed since their last reading (called by the getters)."""
+        for i in self._get_due_indices(()):
+            reading = self._contact_sensor_interface.get_sensor_reading(self._prim_paths[i])
+            self._read_once[i] = True
+            self._is_valid[i] = reading.is_valid
+            if reading.is_valid:
+                self._times[i] = reading.time
+                self._force[i] = reading.value
+                self._in_contact[i] = reading.in_contact
+
+    def get_forces(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the (N,) contact force magnitudes, optionally written into ``out``."""
+        self.update()
+        return self._output(self._force, out)
+
+    def get_in_contact(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the (N,) flags of the sensors registering a contact, optionally written into ``out``."""
+        self.update()
+        return self._output(self._in_contact, out)
+
+    def _get_history_fields(self) -> dict:
+        return {"force": ((self.count,), np.float32), "in_contact": ((self.count,), bool)}
+
+    def get_current_frame(self) -> dict:
+        """Get the readings of all the sensors.
+
+        The returned arrays are the internal buffers of the view, updated in place by the next call.
+        Sensors without a valid reading keep their last values.
+
+        Returns:
+            dict: ``time`` (N,), ``physics_step``, ``force`` (N,), ``in_contact`` (N,) and ``is_valid`` (N,).
+        """
+        self.update()
+        return {
+            "time": self._times,
+            "physics_step": self._physics_step,
+            "force": self._force,
+            "in_contact": self._in_contact,
+            "is_valid": self._is_valid,
+        }
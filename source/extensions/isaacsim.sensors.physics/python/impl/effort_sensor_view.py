@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Callable, List, Optional, Tuple
+
+import carb
+import numpy as np
+import omni.physx
+import omni.timeline
+import omni.usd
+from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
+from isaacsim.core.prims import Articulation
+
+
+class EffortSensorView:
+    """Effort sensors for many joints across many (identical) articulations.
+
+    Each sensor is given by the path of its joint, ``<articulation body path>/<joint name>`` as for
+    :class:`EffortSensor`. Instead of one articulation wrapper and one physics callback per sensor, the view
+    reads the efforts of all the sensors with a single tensor query per physics step into a preallocated
+    ring buffer of shape (buffer size, number of sensors), and applies the sensor period decimation and the
+    interpolation as array operations.
+
+    Args:
+        prim_paths (List[str]): Paths of the joints to sense, ``<articulation body path>/<joint name>``.
+        sensor_period (float, optional): Period of the sensors, in seconds. A period shorter than the physics step
+            reads the latest data on every step. Defaults to -1.
+        use_latest_data (bool, optional): Always return the latest data instead of the interpolated reading.
+            Defaults to False.
+        enabled (bool, optional): Whether the sensors acquire data. Defaults to True.
+        buffer_size (int, optional): Number of physics steps kept in the ring buffer. Defaults to 10.
+        name (str, optional): Name of the underlying articulation view. Defaults to "effort_sensor_view".
+    """
+
+    def __init__(
+        self,
+        prim_paths: List[str],
+        sensor_period: float = -1,
+        use_latest_data: bool = False,
+        enabled: bool = True,
+        buffer_size: int = 10,
+        name: str = "effort_sensor_view",
+    ) -> None:
+        if len(prim_paths) == 0:
+            raise ValueError("EffortSensorView requires at least one joint path")
+        self.sensor_period = sensor_period
+        self.use_latest_data = use_latest_data
+        self.enabled = enabled
+        self.current_time = 0
+        self.sensor_time = 0
+        self.step_size = 0
+        self.physics_num_steps = 0
+        self.is_initialized = False
+        self._core_nodes = _isaacsim_core_nodes.acquire_interface()
+
+        self._prim_paths = list(prim_paths)
+        body_prim_paths = ["/".join(prim_path.split("/")[:-1]) for prim_path in self._prim_paths]
+        self._dof_names = [prim_path.split("/")[-1] for prim_path in self._prim_paths]
+        self._body_prim_paths = list(dict.fromkeys(body_prim_paths))
+        body_indices = {body_prim_path: i for i, body_prim_path in enumerate(self._body_prim_paths)}
+        self._articulation_indices = np.array([body_indices[path] for path in body_prim_paths], dtype=np.int64)
+        self._dof_indices = np.zeros(len(self._prim_paths), dtype=np.int64)
+        self._dof_valid = np.zeros(len(self._prim_paths), dtype=bool)
+        self._articulation_view = Articulation(prim_paths_expr=self._body_prim_paths, name=name)
+        if self._articulation_view.count != len(self._body_prim_paths):
+            raise ValueError(
+                f"EffortSensorView expected {len(self._body_prim_paths)} articulations, "
+                f"found {self._articulation_view.count}"
+            )
+
+        self._allocate_buffers(buffer_size)
+        self.initialize_callbacks()
+
+    @property
+    def count(self) -> int:
+        """Number of sensors in the view."""
+        return len(self._prim_paths)
+
+    @property
+    def prim_paths(self) -> List[str]:
+        """Joint paths of the sensors."""
+        return self._prim_paths
+
+    @property
+    def data_buffer_size(self) -> int:
+        """Number of physics steps kept in the ring buffer."""
+        return self._values.shape[0]
+
+    def initialize_callbacks(self) -> None:
+        self._acquisition_callback = omni.physx.get_physx_interface().subscribe_physics_step_events(
+            self._data_acquisition_callback
+        )
+        self._stage_open_callback = (
+            omni.usd.get_context()
+            .get_stage_event_stream()
+            .create_subscription_to_pop_by_type(int(omni.usd.StageEventType.OPENED), self._stage_open_callback_fn)
+        )
+        timeline = omni.timeline.get_timeline_interface()
+        self._timer_reset_callback = timeline.get_timeline_event_stream().create_subscription_to_pop(
+            self._timeline_timer_callback_fn
+        )
+
+    def destroy(self) -> None:
+        """Release the physics step, stage and timeline subscriptions."""
+        self._stage_open_callback_fn()
+
+    def change_buffer_size(self, new_buffer_size: int) -> None:
+        """Resize the ring buffer, the buffered readings are cleared."""
+        self._allocate_buffers(new_buffer_size)
+
+    def update_dof_names(self, dof_names: List[str]) -> None:
+        """Change the sensed joint of every sensor (joints that are not found are reported as invalid)."""
+        if len(dof_names) != self.count:
+            raise ValueError("Length of dof_names must match the number of sensors")
+        self._dof_names = list(dof_names)
+        if self.is_initialized:
+            self._resolve_dof_indices()
+
+    def get_sensor_readings(
+        self, interpolation_function: Optional[Callable] = None, use_latest_data: bool = False
+    ) -> dict:
+        """Get the readings of all the sensors.
+
+        Args:
+            interpolation_function (Optional[Callable], optional): Function called with the (2, N) values and (2,)
+                times of the interpolation pair (newest first) and the sensor time, returning the (N,) values.
+                Defaults to None (linear interpolation).
+            use_latest_data (bool, optional): Return the latest data instead of the interpolated reading.
+                Defaults to False.
+
+        Returns:
+            dict: ``time`` (float) of the readings, ``values`` (N,) efforts and ``is_valid`` (N,) flags.
+        """
+        values = np.zeros(self.count, dtype=np.float32)
+        is_valid = np.zeros(self.count, dtype=bool)
+        time = 0.0
+        if self.enabled:
+            latest, previous = self._head, (self._head - 1) % self.data_buffer_size
+            out_of_sync = self.sensor_time + self.sensor_period < self._times[previous]
+            # case 1: get latest reading when sensor freq is higher, latest data is requested or out of sync
+            if self.sensor_period <= self.step_size or self.use_latest_data or use_latest_data or out_of_sync:
+                is_valid[:] = self._valid[latest]
+                values[is_valid] = self._values[latest, is_valid]
+                time = float(self._times[latest])
+                if (
+                    out_of_sync
+                    and self.sensor_period > self.step_size
+                    and not (self.use_latest_data or use_latest_data)
+                ):
+                    carb.log_warn("sensor time out of sync, using latest data")
+            # case 2: use interpolated data
+            else:
+                time = float(self.sensor_time)
+                both_valid = self._valid[latest] & self._valid[previous]
+                if interpolation_function is not None:
+                    values[:] = interpolation_function(self._interpolation_values, self._interpolation_times, time)
+                else:
+                    start_time, end_time = self._interpolation_times[1], self._interpolation_times[0]
+                    duration = (end_time - start_time) if end_time != start_time else self.step_size
+                    alpha = (time - start_time) / duration if duration else 0.0
+                    start, end = self._interpolation_values[1], self._interpolation_values[0]
+                    values[:] = start + (end - start) * alpha
+                # if only the most recent reading is valid, use it
+                latest_only = ~both_valid & self._valid[latest]
+                values[latest_only] = self._values[latest, latest_only]
+                is_valid[:] = both_valid | latest_only
+                values[~is_valid] = 0.0
+        return {"time": time, "values": values, "is_valid": is_valid}
+
+    def get_sensor_history(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the buffered readings of all the sensors, newest first.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (T,) times, (T, N) efforts and (T, N) validity flags.
+        """
+        order = (self._head - np.arange(self.data_buffer_size)) % self.data_buffer_size
+        return self._times[order], self._values[order], self._valid[order]
+
+    def _allocate_buffers(self, buffer_size: int) -> None:
+        buffer_size = max(int(buffer_size), 2)
+        self._values = np.zeros((buffer_size, self.count), dtype=np.float32)
+        self._valid = np.zeros((buffer_size, self.count), dtype=bool)
+        self._times = np.zeros(buffer_size, dtype=np.float64)
+        self._head = 0
+        self._interpolation_values = np.zeros((2, self.count), dtype=np.float32)
+        self._interpolation_times = np.zeros(2, dtype=np.float64)
+
+    def _resolve_dof_indices(self) -> None:
+        dof_names = self._articulation_view.dof_names
+        for i, dof_name in enumerate(self._dof_names):
+            self._dof_valid[i] = dof_name in dof_names
+            self._dof_indices[i] = dof_names.index(dof_name) if self._dof_valid[i] else 0
+            if not self._dof_valid[i]:
+                carb.log_warn(f"Effort sensor error, no effort found for path: {self._prim_paths[i]}")
+
+    def _stage_open_callback_fn(self, event=None) -> None:
+        self._acquisition_callback = None
+        self._timer_reset_callback = None
+        self._stage_open_callback = None
+        return
+
+    def _timeline_timer_callback_fn(self, event) -> None:
+        if event.type == int(omni.timeline.TimelineEventType.STOP):
+            self.current_time = 0
+            self.sensor_time = 0
+            self.physics_num_steps = 0
+            self._allocate_buffers(self.data_buffer_size)
+        elif event.type == int(omni.timeline.TimelineEventType.PLAY):
+            self.is_initialized = False
+        return
+
+    def _data_acquisition_callback(self, step_size: float) -> None:
+        self.step_size = step_size
+        self.current_time = float(self._core_nodes.get_sim_time())
+        self.physics_num_steps = float(self._core_nodes.get_physics_num_steps())
+        if self.physics_num_steps <= 2:
+            return
+        elif not self.is_initialized:
+            self._articulation_view.initialize()
+            self._resolve_dof_indices()
+            self.is_initialized = True
+
+        if not self.enabled:
+            return
+        # single tensor query for all the sensors
+        efforts = self._articulation_view.get_measured_joint_efforts(clone=False)
+        self._head = (self._head + 1) % self.data_buffer_size
+        self._times[self._head] = self.current_time
+        if efforts is None:
+            self._values[self._head] = 0.0
+            self._valid[self._head] = False
+        else:
+            if not isinstance(efforts, np.ndarray):
+                efforts = efforts.cpu().numpy() if hasattr(efforts, "cpu") else efforts.numpy()
+            self._values[self._head] = np.where(
+                self._dof_valid, efforts[self._articulation_indices, self._dof_indices], 0.0
+            )
+            self._valid[self._head] = self._dof_valid
+
+        if self.sensor_period <= self.step_size:
+            self.sensor_time = self.current_time
+        elif self.sensor_time + self.sensor_period <= self.current_time:
+            # keep the readings around the sensor time for the interpolation
+            previous = (self._head - 1) % self.data_buffer_size
+            self._interpolation_values[0] = self._values[self._head]
+            self._interpolation_values[1] = self._values[previous]
+            self._interpolation_times[0] = self._times[self._head]
+            self._interpolation_times[1] = self._times[previous]
+            self.sensor_time += self.sensor_period
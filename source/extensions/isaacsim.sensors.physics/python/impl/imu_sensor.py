@@ -18,7 +18,9 @@ import carb
 import numpy as np
 import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
 import omni.kit.commands
+import omni.physx
 from isaacsim.core.api.sensors.base_sensor import BaseSensor
+from isaacsim.core.api.sensors.sensor_history import SensorHistory
 from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
 from isaacsim.core.utils.prims import get_prim_at_path, is_prim_path_valid
 from isaacsim.core.utils.stage import traverse_stage
@@ -110,6 +112,9 @@ class IMUSensor(BaseSensor):
             shape=[4], dtype="float32", device=self._device
         )
         self._current_frame["orientation"][0] = 1
+        self._history = None
+        self._history_callback = None
+        self._history_read_gravity = True
         return
 
     def initialize(self, physics_sim_view=None) -> None:
@@ -176,3 +181,47 @@ class IMUSensor(BaseSensor):
     def set_dt(self, value: float) -> None:
         self._isaac_sensor_prim.GetSensorPeriodAttr().Set(value)
         return
+
+    def enable_history(self, capacity: int, read_gravity: bool = True) -> SensorHistory:
+        """Record the sensor readings in a ring buffer (see :class:`SensorHistory`), timestamped with the sensor time.
+
+        The sensor is read at every physics step, and a reading is added whenever a new sensor period starts.
+
+        Args:
+            capacity (int): Number of readings kept.
+            read_gravity (bool, optional): Whether the recorded linear accelerations include gravity. Defaults to True.
+
+        Returns:
+            SensorHistory: The history of the sensor, with the ``lin_acc``, ``ang_vel`` and ``orientation`` fields.
+        """
+        self._history_read_gravity = read_gravity
+        self._history = SensorHistory(
+            capacity,
+            {"lin_acc": ((3,), np.float32), "ang_vel": ((3,), np.float32), "orientation": ((4,), np.float32)},
+            quaternion_fields=["orientation"],
+        )
+        if self._history_callback is None:
+            self._history_callback = omni.physx.get_physx_interface().subscribe_physics_step_events(
+                self._record_history
+            )
+        return self._history
+
+    def disable_history(self) -> None:
+        """Stop recording the sensor readings and release the history."""
+        self._history_callback = None
+        self._history = None
+
+    def get_history(self) -> Optional[SensorHistory]:
+        """Get the history of the sensor (None if :meth:`enable_history` was not called)."""
+        return self._history
+
+    def _record_history(self, step_size: float) -> None:
+        reading = self._imu_sensor_interface.get_sensor_reading(self.prim_path, read_gravity=self._history_read_gravity)
+        if reading.is_valid:
+            orientation = reading.orientation
+            self._history.append(
+                float(reading.time),
+                lin_acc=(reading.lin_acc_x, reading.lin_acc_y, reading.lin_acc_z),
+                ang_vel=(reading.ang_vel_x, reading.ang_vel_y, reading.ang_vel_z),
+                orientation=(orientation[3], orientation[0], orientation[1], orientation[2]),
+            )
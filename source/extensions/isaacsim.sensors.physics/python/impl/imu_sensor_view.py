@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import numpy as np
+import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
+from isaacsim.sensors.physics import _sensor
+
+from .sensor_view import SensorView
+
+
+class IMUSensorView(SensorView):
+    """View over many IMU sensor prims, read into (N, k) arrays.
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): Path expression(s) of the IMU sensor prims
+            (e.g.: ``/World/envs/env_.*/Robot/base/Imu_Sensor``).
+        read_gravity (bool, optional): Whether the linear accelerations include gravity. Defaults to True.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> imus = IMUSensorView("/World/envs/env_.*/Robot/base/Imu_Sensor")
+        >>> frame = imus.get_current_frame()
+        >>> frame["lin_acc"].shape
+        (num_envs, 3)
+    """
+
+    def __init__(self, prim_paths_expr: Union[str, List[str]], read_gravity: bool = True) -> None:
+        SensorView.__init__(self, prim_paths_expr, IsaacSensorSchema.IsaacImuSensor)
+        self._imu_sensor_interface = _sensor.acquire_imu_sensor_interface()
+        self.read_gravity = read_gravity
+        self._lin_acc = np.zeros((self.count, 3), dtype=np.float32)
+        self._ang_vel = np.zeros((self.count, 3), dtype=np.float32)
+        # (w, x, y, z) as IMUSensor
+        self._orientation = np.zeros((self.count, 4), dtype=np.float32)
+        self._orientation[:, 0] = 1
+        return
+
+    def update(self) -> None:
+        """Query the sensors whose period elapsed since their last reading (called by the getters)."""
+        for i in self._get_due_indices((self.read_gravity,)):
+            reading = self._imu_sensor_interface.get_sensor_reading(self._prim_paths[i], read_gravity=self.read_gravity)
+            self._read_once[i] = True
+            self._is_valid[i] = reading.is_valid
+            if reading.is_valid:
+                self._times[i] = reading.time
+                self._lin_acc[i] = (reading.lin_acc_x, reading.lin_acc_y, reading.lin_acc_z)
+                self._ang_vel[i] = (reading.ang_vel_x, reading.ang_vel_y, reading.ang_vel_z)
+                orientation = reading.orientation
+                self._orientation[i] = (orientation[3], orientation[0], orientation[1], orientation[2])
+
+    def get_linear_accelerations(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the (N, 3) linear accelerations, in m/s^2, optionally written into ``out``."""
+        self.update()
+        return self._output(self._lin_acc, out)
+
+    def get_angular_velocities(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the (N, 3) angular velocities, in rad/s, optionally written into ``out``."""
+        self.update()
+        return self._output(self._ang_vel, out)
+
+    def get_orientations(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the (N, 4) orientations as (w, x, y, z) quaternions, optionally written into ``out``."""
+        self.update()
+        return self._output(self._orientation, out)
+
+    def _get_history_fields(self) -> dict:
+        return {
+            "lin_acc": ((self.count, 3), np.float32),
+            "ang_vel": ((self.count, 3), np.float32),
+            "orientation": ((self.count, 4), np.float32),
+        }
+
+    def _get_history_quaternion_fields(self) -> list:
+        return ["orientation"]
+
+    def get_current_frame(self) -> dict:
+        """Get the readings of all the sensors.
+
+        The returned arrays are the internal buffers of the view, updated in place by the next call.
+        Sensors without a valid reading keep their last values.
+
+        Returns:
+            dict: ``time`` (N,), ``physics_step``, ``lin_acc`` (N, 3), ``ang_vel`` (N, 3),
+            ``orientation`` (N, 4) and ``is_valid`` (N,).
+        """
+        self.update()
+        return {
+            "time": self._times,
+            "physics_step": self._physics_step,
+            "lin_acc": self._lin_acc,
+            "ang_vel": self._ang_vel,
+            "orientation": self._orientation,
+            "is_valid": self._is_valid,
+        }
@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import omni.physx
+from isaacsim.core.api.sensors.sensor_history import SensorHistory
+from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
+from isaacsim.core.utils.prims import find_matching_prim_paths, get_prim_at_path
+from pxr import Sdf
+
+# tolerance on the sensor time when deciding whether a new sensor period started
+PERIOD_TOLERANCE = 1e-6
+
+
+class SensorView:
+    """Base class of the views over many Isaac sensor prims (e.g.: one sensor per environment).
+
+    The sensor prims are resolved once from the path expressions, and their sensor periods are cached in a (N,)
+    array. Reading the view only queries the sensors whose period elapsed since their last reading (the sensor
+    plugin returns the same reading until then), the other sensors keep their last values.
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): Path expression(s) of the sensor prims (e.g.: ``/World/env_.*/Imu``).
+        schema_type: Schema class of the sensor prims.
+    """
+
+    def __init__(self, prim_paths_expr: Union[str, List[str]], schema_type) -> None:
+        if isinstance(prim_paths_expr, str):
+            prim_paths_expr = [prim_paths_expr]
+        self._prim_paths = []
+        for expression in prim_paths_expr:
+            self._prim_paths.extend(find_matching_prim_paths(expression))
+        if len(self._prim_paths) == 0:
+            raise Exception(f"No sensor prims found matching {prim_paths_expr}")
+        self._sensor_prims = [schema_type(get_prim_at_path(prim_path)) for prim_path in self._prim_paths]
+        self._core_nodes = _isaacsim_core_nodes.acquire_interface()
+        self._times = np.zeros(self.count, dtype=np.float64)
+        self._is_valid = np.zeros(self.count, dtype=bool)
+        self._periods = np.zeros(self.count, dtype=np.float64)
+        self._read_once = np.zeros(self.count, dtype=bool)
+        self._last_sim_time = 0.0
+        self._last_physics_step = -1
+        self._last_read_args = None
+        self._physics_step = 0.0
+        self._history = None
+        self._history_callback = None
+        self.refresh_periods()
+
+    @property
+    def count(self) -> int:
+        """Number of sensors in the view."""
+        return len(self._prim_paths)
+
+    @property
+    def prim_paths(self) -> List[str]:
+        """Paths of the sensor prims."""
+        return self._prim_paths
+
+    def refresh_periods(self) -> None:
+        """Read the sensor periods from USD again (e.g.: after authoring the ``sensorPeriod`` attributes directly)."""
+        for i, sensor_prim in enumerate(self._sensor_prims):
+            period = sensor_prim.GetSensorPeriodAttr().Get()
+            self._periods[i] = period if period is not None else 0.0
+        self._read_once[:] = False
+
+    def get_dts(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Get the (N,) sensor periods, in seconds."""
+        return self._periods[self._resolve_indices(indices)].copy()
+
+    def set_dts(self, values: Union[float, Sequence[float]], indices: Optional[Sequence[int]] = None) -> None:
+        """Set the sensor periods, in seconds (authored in a single change block)."""
+        indices = self._resolve_indices(indices)
+        self._periods[indices] = values
+        with Sdf.ChangeBlock():
+            for i in indices:
+                self._sensor_prims[i].GetSensorPeriodAttr().Set(float(self._periods[i]))
+        self._read_once[indices] = False
+
+    def get_frequencies(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Get the (N,) sensor frequencies, in Hz."""
+        with np.errstate(divide="ignore"):
+            return 1.0 / self.get_dts(indices)
+
+    def set_frequencies(self, values: Union[float, Sequence[float]], indices: Optional[Sequence[int]] = None) -> None:
+        """Set the sensor frequencies, in Hz."""
+        self.set_dts(1.0 / np.asarray(values, dtype=np.float64), indices)
+
+    def pause(self, indices: Optional[Sequence[int]] = None) -> None:
+        """Disable the sensors (authored in a single change block)."""
+        self._set_enabled(False, indices)
+
+    def resume(self, indices: Optional[Sequence[int]] = None) -> None:
+        """Enable the sensors (authored in a single change block)."""
+        self._set_enabled(True, indices)
+
+    def is_paused(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Get the (N,) flags of the disabled sensors."""
+        return np.array(
+            [not self._sensor_prims[i].GetEnabledAttr().Get() for i in self._resolve_indices(indices)], dtype=bool
+        )
+
+    def enable_history(self, capacity: int) -> SensorHistory:
+        """Record the readings of all the sensors at every physics step in a ring buffer (see :class:`SensorHistory`).
+
+        Each entry holds the (N,) sensor times and validity flags along with the (N, k) readings of the view, and is
+        timestamped with the simulation time of the physics step.
+
+        Args:
+            capacity (int): Number of physics steps kept.
+
+        Returns:
+            SensorHistory: The history of the view.
+        """
+        fields = {"sensor_time": ((self.count,), np.float64), "is_valid": ((self.count,), bool)}
+        fields.update(self._get_history_fields())
+        self._history = SensorHistory(capacity, fields, quaternion_fields=self._get_history_quaternion_fields())
+        if self._history_callback is None:
+            self._history_callback = omni.physx.get_physx_interface().subscribe_physics_step_events(
+                self._record_history
+            )
+        return self._history
+
+    def disable_history(self) -> None:
+        """Stop recording the readings and release the history."""
+        self._history_callback = None
+        self._history = None
+
+    def get_history(self) -> Optional[SensorHistory]:
+        """Get the history of the view (None if :meth:`enable_history` was not called)."""
+        return self._history
+
+    def _get_history_fields(self) -> dict:
+        """Get the shape and dtype of the readings recorded in the history, keyed by field."""
+        raise NotImplementedError
+
+    def _get_history_quaternion_fields(self) -> list:
+        """Get the fields of the history holding quaternions (interpolated along the shortest arc)."""
+        return []
+
+    def _record_history(self, step_size: float) -> None:
+        frame = self.get_current_frame()
+        self._history.append(
+            float(self._core_nodes.get_sim_time()),
+            sensor_time=frame["time"],
+            **{name: frame[name] for name in self._history.fields if name != "sensor_time"},
+        )
+
+    def _set_enabled(self, enabled: bool, indices: Optional[Sequence[int]]) -> None:
+        with Sdf.ChangeBlock():
+            for i in self._resolve_indices(indices):
+                self._sensor_prims[i].GetEnabledAttr().Set(enabled)
+
+    def _resolve_indices(self, indices: Optional[Sequence[int]]) -> np.ndarray:
+        if indices is None:
+            return np.arange(self.count)
+        return np.asarray(indices, dtype=np.int64).reshape(-1)
+
+    def _get_due_indices(self, read_args: tuple) -> np.ndarray:
+        """Get the indices of the sensors to query, updating the bookkeeping of the current physics step."""
+        sim_time = float(self._core_nodes.get_sim_time())
+        physics_step = int(self._core_nodes.get_physics_num_steps())
+        if sim_time < self._last_sim_time or read_args != self._last_read_args:
+            # simulation was reset or the reading options changed
+            self._read_once[:] = False
+        elif physics_step == self._last_physics_step and self._read_once.all():
+            # already read during this physics step
+            return np.empty(0, dtype=np.int64)
+        self._last_sim_time = sim_time
+        self._last_physics_step = physics_step
+        self._last_read_args = read_args
+        self._physics_step = float(physics_step)
+        due = ~self._read_once | ~self._is_valid | (self._times + self._periods <= sim_time + PERIOD_TOLERANCE)
+        return np.flatnonzero(due)
+
+    @staticmethod
+    def _output(buffer: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        if out is None:
+            return buffer.copy()
+        out[...] = buffer
+        return out
@@ -22,7 +22,7 @@ from isaacsim.core.api import World
 from isaacsim.core.api.objects import DynamicCuboid
 from isaacsim.core.prims import SingleArticulation
 from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage_async, update_stage_async
-from isaacsim.sensors.physics import ContactSensor
+from isaacsim.sensors.physics import ContactSensor, ContactSensorView
 from isaacsim.storage.native import get_assets_root_path
 
 
@@ -128,3 +128,50 @@ class TestContactSensorWrapper(omni.kit.test.AsyncTestCase):
         self._contact_sensor.set_max_threshold(100000)
         self.assertTrue(math.isclose(100000, self._contact_sensor.get_max_threshold(), abs_tol=0.01))
         return
+
+    async def test_sensor_view(self):
+        contact_sensors = ContactSensorView("/World/new_cube_.*/contact_sensor")
+        self.assertEqual(contact_sensors.count, 1)
+        for i in range(60):
+            await update_stage_async()
+        data = contact_sensors.get_current_frame()
+        for key in ["time", "physics_step", "in_contact", "force", "is_valid"]:
+            self.assertTrue(key in data.keys())
+        frame = self._contact_sensor.get_current_frame()
+        self.assertTrue(data["is_valid"][0])
+        self.assertEqual(bool(data["in_contact"][0]), frame["in_contact"])
+        self.assertAlmostEqual(float(data["force"][0]), frame["force"], 3)
+        forces = np.zeros(1, dtype=np.float32)
+        self.assertIs(contact_sensors.get_forces(out=forces), forces)
+        self.assertAlmostEqual(float(forces[0]), float(data["force"][0]), 5)
+        contact_sensors.set_frequencies(20)
+        self.assertTrue(math.isclose(0.05, self._contact_sensor.get_dt(), abs_tol=0.001))
+        contact_sensors.pause()
+        self.assertTrue(self._contact_sensor.is_paused())
+        self.assertTrue(contact_sensors.is_paused()[0])
+        contact_sensors.resume()
+        self.assertFalse(self._contact_sensor.is_paused())
+        return
+
+    async def test_history(self):
+        history = self._contact_sensor.enable_history(8)
+        contact_sensors = ContactSensorView("/World/new_cube_.*/contact_sensor")
+        view_history = contact_sensors.enable_history(8)
+        for i in range(60):
+            await update_stage_async()
+        self.assertEqual(len(history), 8)
+        window = history.get_window()
+        self.assertTrue(np.all(np.diff(window["time"]) > 0))
+        frame = self._contact_sensor.get_current_frame()
+        self.assertEqual(window["time"][-1], frame["time"])
+        self.assertEqual(bool(window["in_contact"][-1]), frame["in_contact"])
+        self.assertAlmostEqual(float(window["force"][-1]), frame["force"], 3)
+        self.assertEqual(len(view_history), 8)
+        self.assertEqual(view_history.get_window()["force"].shape, (8, 1))
+        # simulation reset clears the histories
+        await self.my_world.reset_async()
+        await update_stage_async()
+        self.assertLess(len(history), 8)
+        self._contact_sensor.disable_history()
+        contact_sensors.disable_history()
+        return
@@ -28,6 +28,7 @@ from isaacsim.core.api.objects import DynamicCuboid
 from isaacsim.core.api.objects.ground_plane import GroundPlane
 from isaacsim.core.utils.prims import get_prim_at_path
 from isaacsim.sensors.physics.impl.effort_sensor import EffortSensor, EsSensorReading
+from isaacsim.sensors.physics.impl.effort_sensor_view import EffortSensorView
 from isaacsim.storage.native import get_assets_root_path_async
 from pxr import UsdPhysics
 
@@ -265,3 +266,31 @@ class TestEffortSensor(omni.kit.test.AsyncTestCase):
         self.assertEqual(self.effort_sensor.data_buffer_size, 5)
         self.assertEqual(len(self.effort_sensor.interpolation_buffer), 5)
         self.assertEqual(len(self.effort_sensor.sensor_reading_buffer), 5)
+
+    async def test_sensor_view(self):
+        await self.createSimpleArticulation()
+
+        self.effort_sensor = EffortSensorView(
+            ["/Articulation/Arm/RevoluteJoint", "/Articulation/Arm/RevoluteJoint_doesnt_exist"], buffer_size=5
+        )
+        self.my_world.play()
+        # let physics warm up
+        for i in range(4):
+            await omni.kit.app.get_app().next_update_async()
+
+        readings = self.effort_sensor.get_sensor_readings()
+        self.assertNotEqual(readings["time"], 0)
+        self.assertEqual(readings["values"].shape, (2,))
+        self.assertTrue(readings["is_valid"][0])
+        self.assertFalse(readings["is_valid"][1])
+        # arm only, 2kg with C of G 1m away from the joint
+        self.assertAlmostEqual(float(readings["values"][0]), float(-2 * 9.81), 1)
+        self.assertEqual(readings["values"][1], 0)
+
+        times, values, is_valid = self.effort_sensor.get_sensor_history()
+        self.assertEqual(values.shape, (5, 2))
+        self.assertEqual(times[0], readings["time"])
+        self.assertGreater(times[0], times[1])
+
+        self.effort_sensor.change_buffer_size(20)
+        self.assertEqual(self.effort_sensor.data_buffer_size, 20)
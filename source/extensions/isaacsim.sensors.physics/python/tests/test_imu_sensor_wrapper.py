@@ -22,7 +22,7 @@ from isaacsim.core.api import World
 from isaacsim.core.api.objects import DynamicCuboid
 from isaacsim.core.prims import SingleArticulation
 from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage_async, update_stage_async
-from isaacsim.sensors.physics import IMUSensor
+from isaacsim.sensors.physics import IMUSensor, IMUSensorView
 from isaacsim.storage.native import get_assets_root_path_async
 
 
@@ -116,3 +116,61 @@ class TestIMU(omni.kit.test.AsyncTestCase):
         self._imu.set_dt(0.2)
         self.assertTrue(math.isclose(0.2, self._imu.get_dt(), abs_tol=0.01))
         return
+
+    async def test_sensor_view(self):
+        imu_sensors = IMUSensorView("/World/Carter/chassis_link/Imu_.*")
+        self.assertEqual(imu_sensors.count, 1)
+        await update_stage_async()
+        await update_stage_async()
+        data = imu_sensors.get_current_frame()
+        for key in ["time", "physics_step", "lin_acc", "ang_vel", "orientation", "is_valid"]:
+            self.assertTrue(key in data.keys())
+        self.assertEqual(data["lin_acc"].shape, (1, 3))
+        self.assertEqual(data["orientation"].shape, (1, 4))
+        frame = self._imu.get_current_frame()
+        self.assertTrue(data["is_valid"][0])
+        self.assertEqual(data["time"][0], frame["time"])
+        self.assertTrue(np.allclose(data["lin_acc"][0], frame["lin_acc"], atol=1e-4))
+        self.assertTrue(np.allclose(data["orientation"][0], frame["orientation"], atol=1e-4))
+        ang_vel = np.zeros((1, 3), dtype=np.float32)
+        self.assertIs(imu_sensors.get_angular_velocities(out=ang_vel), ang_vel)
+        self.assertTrue(np.allclose(ang_vel[0], frame["ang_vel"], atol=1e-4))
+        imu_sensors.set_dts(0.2)
+        self.assertTrue(math.isclose(0.2, self._imu.get_dt(), abs_tol=0.01))
+        self.assertTrue(np.allclose(imu_sensors.get_frequencies(), 5))
+        return
+
+    async def test_history(self):
+        history = self._imu.enable_history(4)
+        self.assertIs(self._imu.get_history(), history)
+        for i in range(10):
+            await update_stage_async()
+        self.assertEqual(len(history), 4)
+        window = history.get_window()
+        self.assertTrue(np.all(np.diff(window["time"]) > 0))
+        frame = self._imu.get_current_frame()
+        self.assertEqual(window["time"][-1], frame["time"])
+        self.assertTrue(np.allclose(window["lin_acc"][-1], frame["lin_acc"], atol=1e-4))
+        interpolated = history.interpolate(window["time"][-2:].mean(), fields=["ang_vel"])
+        self.assertEqual(interpolated["ang_vel"].shape, (1, 3))
+        # orientations are interpolated as unit quaternions
+        interpolated = history.interpolate(window["time"][-2:].mean(), fields=["orientation"])
+        self.assertTrue(np.allclose(np.linalg.norm(interpolated["orientation"], axis=-1), 1.0, atol=1e-5))
+
+        imu_sensors = IMUSensorView("/World/Carter/chassis_link/Imu_.*")
+        view_history = imu_sensors.enable_history(3)
+        for i in range(5):
+            await update_stage_async()
+        self.assertEqual(len(view_history), 3)
+        window = view_history.get_window()
+        self.assertEqual(window["lin_acc"].shape, (3, 1, 3))
+        self.assertEqual(window["sensor_time"].shape, (3, 1))
+        self.assertTrue(window["is_valid"].all())
+        interpolated = view_history.interpolate(window["time"][-2:].mean(), fields=["orientation"])
+        self.assertTrue(np.allclose(np.linalg.norm(interpolated["orientation"], axis=-1), 1.0, atol=1e-5))
+
+        self._imu.disable_history()
+        imu_sensors.disable_history()
+        self.assertIsNone(self._imu.get_history())
+        self.assertIsNone(imu_sensors.get_history())
+        return
@@ -15,6 +15,7 @@
 
 from .commands import *
 from .extension import *
+from .lidar_frames import LIDAR_POINT_DTYPE, LidarPointBuffer, LidarSweepAccumulator
 from .lidar_rtx import LidarRtx
 from .nonvisual_materials import *
 from .supported_lidar_configs import *
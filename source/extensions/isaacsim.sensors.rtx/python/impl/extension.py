@@ -222,6 +222,36 @@ class Extension(omni.ext.IExt):
         )
         self.registered_annotators.append(annotator_name)
 
+        annotator_name = "IsaacProcessRTXSensorPointCloud"
+
+        def _on_attach_process_point_cloud(node: og.Node):
+            # Repeat annotator name definition in callback to avoid scope issues
+            annotator_name = "IsaacProcessRTXSensorPointCloud"
+
+            return self._on_attach_callback_base(
+                annotator_name=annotator_name,
+                connections=[
+                    (
+                        "omni.syntheticdata.SdOnNewRenderProductFrame",
+                        "renderProductPath",
+                        node.get_prim_path(),
+                        "renderProductPath",
+                    ),
+                ],
+                node=node,
+            )
+
+        # Point cloud processed by the processor of the render product (see LidarRtx.set_point_cloud_processor)
+        register_annotator_from_node_with_telemetry(
+            name=annotator_name,
+            input_rendervars=["IsaacExtractRTXSensorPointCloudNoAccumulator"],
+            node_type_id="isaacsim.core.nodes.IsaacProcessPointCloud",
+            output_data_type=np.float32,
+            output_channels=3,
+            on_attach_callback=_on_attach_process_point_cloud,
+        )
+        self.registered_annotators.append(annotator_name)
+
         # RTX Lidar Debug Draw Writer
         register_node_writer_with_telemetry(
             name="RtxLidar" + "DebugDrawPointCloud",
@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Structured point layout of the Lidar point frames and sweeps
+LIDAR_POINT_DTYPE = np.dtype(
+    [
+        ("xyz", np.float32, (3,)),
+        ("intensity", np.float32),
+        ("azimuth", np.float32),
+        ("elevation", np.float32),
+        ("timestamp", np.uint64),
+    ]
+)
+
+# Annotator output keys of the structured fields (other than xyz, stored in "data")
+ANNOTATOR_FIELDS = ("intensity", "azimuth", "elevation", "timestamp")
+
+# Rotation (in degrees) of the unwrapped azimuth from the first return after which the scan direction is known
+AZIMUTH_DIRECTION_THRESHOLD = 90.0
+
+
+def _grow(buffer: np.ndarray, count: int, required: int) -> np.ndarray:
+    """Reallocate the buffer (keeping its first `count` points) if it cannot hold `required` points."""
+    if required <= buffer.shape[0]:
+        return buffer
+    grown = np.zeros(max(required, 2 * buffer.shape[0]), dtype=LIDAR_POINT_DTYPE)
+    grown[:count] = buffer[:count]
+    return grown
+
+
+def fill_points(points: np.ndarray, data: dict) -> Tuple[str, ...]:
+    """Fill a structured point array from the output of a point cloud annotator.
+
+    Args:
+        points (np.ndarray): Structured array of `LIDAR_POINT_DTYPE` with as many points as the annotator output.
+        data (dict): Annotator output, the xyz coordinates in ``data`` and the optional per-point
+            ``intensity``, ``azimuth``, ``elevation`` and ``timestamp`` arrays (missing fields are zeroed).
+
+    Returns:
+        Tuple[str, ...]: Names of the fields (other than xyz) filled from the annotator output.
+    """
+    count = points.shape[0]
+    points["xyz"] = np.asarray(data["data"]).reshape(count, 3)
+    fields = []
+    for field in ANNOTATOR_FIELDS:
+        values = data.get(field)
+        if values is not None and np.size(values) == count:
+            points[field] = np.asarray(values).reshape(count)
+            fields.append(field)
+        else:
+            points[field] = 0
+    return tuple(fields)
+
+
+class LidarPointBuffer:
+    """Double-buffered structured array holding the points of the latest Lidar frame.
+
+    Each write fills the back buffer and swaps it with the front one, so the view returned by :attr:`points` stays
+    valid (and unchanged) until the second next write. Buffers are preallocated and only grow when a frame has more
+    points than their capacity.
+
+    Args:
+        capacity (int, optional): Initial number of points of each buffer. Defaults to 0.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._buffers = [np.zeros(capacity, dtype=LIDAR_POINT_DTYPE) for _ in range(2)]
+        self._counts = [0, 0]
+        self._front = 0
+        self.time = 0.0
+        # fields (other than xyz) present in the annotator output of the latest frame
+        self.fields: Tuple[str, ...] = ()
+
+    @property
+    def points(self) -> np.ndarray:
+        """Structured view of the points of the latest frame."""
+        return self._buffers[self._front][: self._counts[self._front]]
+
+    def write(self, data: dict, time: float) -> np.ndarray:
+        """Write the output of a point cloud annotator as the latest frame.
+
+        Args:
+            data (dict): Annotator output (see :func:`fill_points`).
+            time (float): Simulation time of the frame, in seconds.
+
+        Returns:
+            np.ndarray: Structured view of the points of the frame.
+        """
+        back = 1 - self._front
+        count = int(np.size(data["data"]) // 3)
+        self._buffers[back] = _grow(self._buffers[back], 0, count)
+        self.fields = fill_points(self._buffers[back][:count], data)
+        self._counts[back] = count
+        self._front = back
+        self.time = time
+        return self.points
+
+    def reset(self) -> None:
+        """Discard the stored frames (the buffers are kept)."""
+        self._counts = [0, 0]
+        self.time = 0.0
+
+
+class LidarSweepAccumulator:
+    """Accumulate the partial scans of a rotary Lidar into complete rotations (sweeps).
+
+    Points are appended to a preallocated back buffer, and a sweep is completed when the scan crosses the azimuth seam
+    (+/-180 degrees) in its direction of rotation. The azimuth is unwrapped and its progress along the scan direction
+    is made monotonic, so returns interleaved around the seam (several emitters, out of order returns) belong to the
+    rotation reached by the leading returns instead of starting spurious sweeps. The back buffer then becomes the
+    front buffer returned by :attr:`sweep`, which stays valid for the whole next rotation. The first (partial)
+    rotation after a reset, and the returns before the scan direction is known, are discarded.
+
+    Args:
+        capacity (int, optional): Initial number of points of each buffer. Defaults to 0.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._buffers = [np.zeros(capacity, dtype=LIDAR_POINT_DTYPE) for _ in range(2)]
+        self._counts = [0, 0]
+        self._front = 0
+        self._started = False
+        self._reset_azimuth()
+        self.sweep_count = 0
+        self.time = 0.0
+
+    @property
+    def sweep(self) -> np.ndarray:
+        """Structured view of the points of the latest complete sweep (empty until the first one)."""
+        return self._buffers[self._front][: self._counts[self._front]]
+
+    def add(self, points: np.ndarray, time: float) -> bool:
+        """Append the points of a partial scan.
+
+        Args:
+            points (np.ndarray): Structured array of `LIDAR_POINT_DTYPE`, ordered by firing time.
+            time (float): Simulation time of the partial scan, in seconds.
+
+        Returns:
+            bool: True if at least one sweep was completed by these points.
+        """
+        if points.shape[0] == 0:
+            return False
+        azimuth = points["azimuth"].astype(np.float64)
+        if self._last_azimuth is None:
+            self._last_azimuth = self._unwrapped = self._origin = float(azimuth[0])
+        # unwrap the azimuth (steps of less than half a turn between consecutive returns)
+        steps = np.diff(azimuth, prepend=self._last_azimuth)
+        unwrapped = self._unwrapped + np.cumsum((steps + 180.0) % 360.0 - 180.0)
+        self._last_azimuth = float(azimuth[-1])
+        self._unwrapped = float(unwrapped[-1])
+        if not self._direction:
+            moved = np.flatnonzero(np.abs(unwrapped - self._origin) >= AZIMUTH_DIRECTION_THRESHOLD)
+            if moved.size:
+                self._direction = 1.0 if unwrapped[moved[0]] > self._origin else -1.0
+                self._progress = self._direction * self._origin
+                self._rotation = np.floor((self._progress - 180.0) / 360.0)
+        # index of the first point of each new rotation within the partial scan
+        wraps = []
+        if self._direction:
+            # monotonic progress along the scan direction, the seam is at 180 degrees (modulo a turn) of progress
+            progress = np.maximum.accumulate(np.maximum(self._direction * unwrapped, self._progress))
+            rotations = np.floor((progress - 180.0) / 360.0)
+            wraps = list(np.flatnonzero(np.diff(rotations, prepend=self._rotation) > 0))
+            self._progress = float(progress[-1])
+            self._rotation = float(rotations[-1])
+        completed = False
+        start = 0
+        for end in wraps + [points.shape[0]]:
+            self._append(points[start:end])
+            if end < points.shape[0]:
+                completed |= self._complete(time)
+            start = end
+        return completed
+
+    def reset(self) -> None:
+        """Discard the accumulated points and sweeps (the buffers are kept)."""
+        self._counts = [0, 0]
+        self._started = False
+        self._reset_azimuth()
+        self.sweep_count = 0
+        self.time = 0.0
+
+    def _reset_azimuth(self) -> None:
+        self._last_azimuth: Optional[float] = None
+        self._unwrapped = 0.0
+        self._origin = 0.0
+        self._direction = 0.0
+        self._progress = 0.0
+        self._rotation = 0.0
+
+    def _append(self, points: np.ndarray) -> None:
+        back = 1 - self._front
+        count = self._counts[back]
+        self._buffers[back] = _grow(self._buffers[back], count, count + points.shape[0])
+        self._buffers[back][count : count + points.shape[0]] = points
+        self._counts[back] = count + points.shape[0]
+
+    def _complete(self, time: float) -> bool:
+        back = 1 - self._front
+        if not self._started:
+            # the points accumulated so far are not a complete rotation
+            self._started = True
+            self._counts[back] = 0
+            return False
+        self._front = back
+        self._counts[1 - back] = 0
+        self.sweep_count += 1
+        self.time = time
+        return True
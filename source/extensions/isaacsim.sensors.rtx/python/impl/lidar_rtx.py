@@ -22,9 +22,21 @@ import omni.graph.core as og
 import omni.replicator.core as rep
 from isaacsim.core.api.sensors.base_sensor import BaseSensor
 from isaacsim.core.simulation_manager import _simulation_manager
+from isaacsim.core.utils.point_cloud import PointCloudProcessor, set_render_product_point_cloud_processor
 from isaacsim.core.utils.prims import get_prim_at_path, get_prim_type_name, is_prim_path_valid
 from pxr import Gf
 
+from .lidar_frames import ANNOTATOR_FIELDS, LidarPointBuffer, LidarSweepAccumulator
+
+
+def _copy_annotator_output(value):
+    """Copy an annotator output read without copy (arrays, possibly nested in dictionaries)."""
+    if isinstance(value, dict):
+        return {key: _copy_annotator_output(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
 
 class LidarRtx(BaseSensor):
     """RTX-based Lidar sensor implementation.
@@ -150,9 +162,20 @@ class LidarRtx(BaseSensor):
         self._current_frame["rendering_time"] = 0
         self._current_frame["rendering_frame"] = 0
 
+        # Structured point frames and sweeps, see enable_point_frames
+        self._point_buffer = None
+        self._sweep_accumulator = None
+        # Annotator outputs (other than the points) of the latest point frame, until its current frame entry is built
+        self._point_frame_outputs = None
+        self._point_cloud_processor = None
+        # Point cloud of the latest frame (and its attributes), until processed by get_current_frame
+        self._pending_point_cloud = None
+
         return
 
     def __del__(self):
+        if self._point_cloud_processor is not None:
+            set_render_product_point_cloud_processor(self._render_product_path, None)
         self.detach_all_writers()
         self.detach_all_annotators()
         if self._render_product:
@@ -173,6 +196,23 @@ class LidarRtx(BaseSensor):
             dict: Dictionary containing the current frame data including rendering time,
                 frame number, and any attached annotator data.
         """
+        if self._point_frame_outputs is not None:
+            # point frames are written straight from the annotator: build its entry on request only
+            points = self._point_buffer.points
+            point_cloud_data = {"data": points["xyz"].copy()}
+            for field in self._point_buffer.fields:
+                point_cloud_data[field] = points[field].copy()
+            point_cloud_data.update(self._point_frame_outputs)
+            self._current_frame["IsaacExtractRTXSensorPointCloudNoAccumulator"] = point_cloud_data
+            self._point_frame_outputs = None
+        if self._pending_point_cloud is not None:
+            # the point cloud of the frame is only processed when requested
+            xyz, attributes = self._pending_point_cloud
+            # the processed points must not alias the (reused) point frame buffers
+            self._current_frame["processed_point_cloud"] = self._point_cloud_processor.process(
+                np.ascontiguousarray(xyz), attributes
+            )
+            self._pending_point_cloud = None
         return self._current_frame
 
     def get_annotators(self) -> dict:
@@ -278,6 +318,103 @@ class LidarRtx(BaseSensor):
         self._writers.clear()
         return
 
+    def enable_point_frames(self, accumulate_sweeps: bool = False, capacity: int = 0) -> None:
+        """Enable the structured point frame output of the Lidar sensor.
+
+        Attaches the IsaacExtractRTXSensorPointCloudNoAccumulator annotator (with intensity, azimuth, elevation and
+        timestamp outputs) if needed, and writes its output on every frame into preallocated, double-buffered
+        structured arrays of `LIDAR_POINT_DTYPE` returned by `get_point_frame`. If the annotator is already attached
+        without these outputs, the corresponding fields are zero.
+
+        The annotator output is read without copy and written once into the structured arrays: its entry in
+        `get_current_frame` is only built (copied from the structured arrays) when the current frame is requested.
+
+        Args:
+            param accumulate_sweeps (bool): Also accumulate the partial scans into complete rotations,
+                returned by `get_sweep`.
+            param capacity (int): Initial number of points of the buffers, they grow as needed.
+        """
+        if "IsaacExtractRTXSensorPointCloudNoAccumulator" not in self._annotators:
+            self.attach_annotator(
+                "IsaacExtractRTXSensorPointCloudNoAccumulator",
+                outputIntensity=True,
+                outputAzimuth=True,
+                outputElevation=True,
+                outputTimestamp=True,
+            )
+        if self._point_buffer is None:
+            self._point_buffer = LidarPointBuffer(capacity)
+        if accumulate_sweeps and self._sweep_accumulator is None:
+            self._sweep_accumulator = LidarSweepAccumulator(capacity)
+        elif not accumulate_sweeps:
+            self._sweep_accumulator = None
+        return
+
+    def disable_point_frames(self) -> None:
+        """Disable the structured point frame output and release its buffers (the annotator stays attached)."""
+        self.get_current_frame()
+        self._point_buffer = None
+        self._sweep_accumulator = None
+        return
+
+    def get_point_frame(self) -> Optional[np.ndarray]:
+        """Get the points of the latest frame as a structured array.
+
+        The returned array is a view into an internal double buffer: it is valid until the second next frame, copy it
+        to keep it longer.
+
+        Returns:
+            Optional[np.ndarray]: Structured array of `LIDAR_POINT_DTYPE` (fields xyz, intensity, azimuth, elevation
+                and timestamp), or None if point frames are not enabled.
+        """
+        if self._point_buffer is None:
+            return None
+        return self._point_buffer.points
+
+    def get_sweep(self) -> Optional[np.ndarray]:
+        """Get the points of the latest complete rotation as a structured array.
+
+        The returned array is a view into an internal double buffer: it is valid until the next rotation completes.
+
+        Returns:
+            Optional[np.ndarray]: Structured array of `LIDAR_POINT_DTYPE` (empty until the first complete rotation),
+                or None if sweep accumulation is not enabled.
+        """
+        if self._sweep_accumulator is None:
+            return None
+        return self._sweep_accumulator.sweep
+
+    def set_point_cloud_processor(self, processor: Optional[PointCloudProcessor]) -> None:
+        """Set the processing stage (cropping, downsampling, encoding) applied to the point cloud of each frame.
+
+        The output of the IsaacExtractRTXSensorPointCloudNoAccumulator annotator (which must be attached, see
+        `enable_point_frames`), along with its per-point intensity, azimuth, elevation and timestamp outputs, is
+        added to the current frame as "processed_point_cloud". It is only processed when the current frame is
+        requested (see `get_current_frame`).
+
+        The processor is also registered for the render product of the Lidar, to process the point clouds consumed
+        by writers: the IsaacProcessRTXSensorPointCloud annotator and the RtxLidarROS2PublishProcessedPointCloud
+        writers (see `attach_writer`, also selected by the ROS 2 RTX Lidar Helper node if the processor is set before
+        it runs) output the processed point clouds, decoded to float points if the processor encodes them.
+
+        Args:
+            param processor (Optional[PointCloudProcessor]): Point cloud processor, or None to remove it.
+        """
+        self._point_cloud_processor = processor
+        set_render_product_point_cloud_processor(self._render_product_path, processor)
+        if processor is None:
+            self._current_frame.pop("processed_point_cloud", None)
+            self._pending_point_cloud = None
+        return
+
+    def get_point_cloud_processor(self) -> Optional[PointCloudProcessor]:
+        """Get the point cloud processor of the Lidar sensor.
+
+        Returns:
+            Optional[PointCloudProcessor]: Point cloud processor, or None if not set.
+        """
+        return self._point_cloud_processor
+
     def _create_point_cloud_graph_node(self):
         """Create a point cloud graph node for the Lidar sensor.
 
@@ -344,6 +481,13 @@ class LidarRtx(BaseSensor):
             omni.timeline.TimelineEventType.STOP
         ):
             self.pause()
+            if event.type == int(omni.timeline.TimelineEventType.STOP):
+                if self._point_buffer is not None:
+                    # keep the current frame entry of the last point frame
+                    self.get_current_frame()
+                    self._point_buffer.reset()
+                if self._sweep_accumulator is not None:
+                    self._sweep_accumulator.reset()
         elif event.type == int(omni.timeline.TimelineEventType.PLAY):
             self.resume()
         return
@@ -405,17 +549,64 @@ class LidarRtx(BaseSensor):
                 self._current_frame["rendering_frame"]
             )
 
+        point_frame_written = False
         for annotator_name, annotator in self._annotators.items():
-            self._current_frame[annotator_name] = annotator.get_data()
+            if annotator_name == "IsaacExtractRTXSensorPointCloudNoAccumulator" and self._point_buffer is not None:
+                point_frame_written = self._write_point_frame(annotator.get_data(do_array_copy=False))
+            else:
+                self._current_frame[annotator_name] = annotator.get_data()
+
+        self._current_frame.pop("processed_point_cloud", None)
+        self._pending_point_cloud = None
+        if self._point_cloud_processor is not None:
+            # keep references only: the point cloud is processed by get_current_frame, if requested
+            if point_frame_written:
+                points = self._point_buffer.points
+                self._pending_point_cloud = (points["xyz"], {name: points[name] for name in self._point_buffer.fields})
+            else:
+                point_cloud_data = self._current_frame.get("IsaacExtractRTXSensorPointCloudNoAccumulator")
+                if point_cloud_data and point_cloud_data.get("data") is not None:
+                    xyz = np.asarray(point_cloud_data["data"]).reshape(-1, 3)
+                    attributes = {
+                        name: point_cloud_data[name]
+                        for name in ANNOTATOR_FIELDS
+                        if point_cloud_data.get(name) is not None and np.size(point_cloud_data[name]) == xyz.shape[0]
+                    }
+                    self._pending_point_cloud = (xyz, attributes)
 
         if "IsaacComputeRTXLidarFlatScan" in self._annotators:
-            flat_scan_data = self._annotators["IsaacComputeRTXLidarFlatScan"].get_data()
+            flat_scan_data = self._current_frame["IsaacComputeRTXLidarFlatScan"]
             self._current_frame["linear_depth_data"] = flat_scan_data["linearDepthData"]
             self._current_frame["intensities_data"] = flat_scan_data["intensitiesData"]
             self._current_frame["azimuth_range"] = flat_scan_data["azimuthRange"]
             self._current_frame["horizontal_resolution"] = flat_scan_data["horizontalResolution"]
         return
 
+    def _write_point_frame(self, data: dict) -> bool:
+        """Write the (not copied) output of the point cloud annotator into the point frame buffers.
+
+        Args:
+            param data (dict): Output of the IsaacExtractRTXSensorPointCloudNoAccumulator annotator.
+
+        Returns:
+            True if a point frame was written.
+        """
+        self._current_frame.pop("IsaacExtractRTXSensorPointCloudNoAccumulator", None)
+        self._point_frame_outputs = None
+        if not data or data.get("data") is None:
+            self._current_frame["IsaacExtractRTXSensorPointCloudNoAccumulator"] = _copy_annotator_output(data)
+            return False
+        points = self._point_buffer.write(data, self._current_frame["rendering_time"])
+        # the other outputs (e.g.: info) are views into the annotator buffers too
+        self._point_frame_outputs = {
+            name: _copy_annotator_output(value)
+            for name, value in data.items()
+            if name != "data" and name not in self._point_buffer.fields
+        }
+        if self._sweep_accumulator is not None:
+            self._sweep_accumulator.add(points, self._current_frame["rendering_time"])
+        return True
+
     def get_horizontal_resolution(self) -> float:
         """Get the horizontal resolution of the Lidar sensor.
 
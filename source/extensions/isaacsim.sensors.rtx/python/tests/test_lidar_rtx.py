@@ -17,11 +17,13 @@ import asyncio
 
 import numpy as np
 import omni.kit.test
+import omni.replicator.core as rep
 import omni.timeline
 import omni.usd
 from isaacsim.core.api import World
+from isaacsim.core.utils.point_cloud import PointCloudProcessor
 from isaacsim.core.utils.stage import create_new_stage_async, update_stage_async
-from isaacsim.sensors.rtx import LidarRtx
+from isaacsim.sensors.rtx import LIDAR_POINT_DTYPE, LidarRtx, LidarSweepAccumulator
 from pxr import Gf, UsdGeom
 
 
@@ -582,3 +584,87 @@ class TestLidarRtx(omni.kit.test.AsyncTestCase):
         self.assertIsNone(lidar.get_rotation_frequency())
         self.assertIsNone(lidar.get_depth_range())
         self.assertIsNone(lidar.get_azimuth_range())
+
+    async def test_point_frames(self):
+        """Test the structured point frame and sweep outputs"""
+        lidar = LidarRtx(
+            prim_path="/World/point_frames_test_lidar", name="point_frames_test", config_file_name="Example_Rotary"
+        )
+        lidar.initialize()
+        self.assertIsNone(lidar.get_point_frame())
+        self.assertIsNone(lidar.get_sweep())
+
+        lidar.enable_point_frames(accumulate_sweeps=True)
+        self.verify_annotators_added(lidar, ["IsaacExtractRTXSensorPointCloudNoAccumulator"])
+
+        self._timeline.play()
+        await self.advance_frames(lidar.get_render_product_path(), 10)
+
+        points = lidar.get_point_frame()
+        self.assertEqual(points.dtype, LIDAR_POINT_DTYPE)
+        point_cloud_data = lidar.get_current_frame()["IsaacExtractRTXSensorPointCloudNoAccumulator"]["data"]
+        np.testing.assert_array_equal(points["xyz"], point_cloud_data.reshape(-1, 3))
+        self.assertEqual(lidar.get_sweep().dtype, LIDAR_POINT_DTYPE)
+
+        processor = PointCloudProcessor(voxel_size=0.5, quantize=True)
+        lidar.set_point_cloud_processor(processor)
+        await self.advance_frames(lidar.get_render_product_path(), 3)
+        # the point cloud is only processed when the current frame is requested
+        self.assertEqual(processor.stats["processed_count"], 0)
+        processed_point_cloud = lidar.get_current_frame()["processed_point_cloud"]
+        self.assertEqual(processor.stats["processed_count"], 1)
+        self.assertEqual(processed_point_cloud["points"].dtype, np.int16)
+        self.assertEqual(processed_point_cloud["intensity"].shape[0], processed_point_cloud["points"].shape[0])
+        self.assertGreaterEqual(lidar.get_point_cloud_processor().stats["compression_ratio"], 1.0)
+        # the processing annotator (used by the processed point cloud writers) applies the processor too
+        annotator = rep.AnnotatorRegistry.get_annotator("IsaacProcessRTXSensorPointCloud")
+        annotator.attach([lidar.get_render_product_path()])
+        await self.advance_frames(lidar.get_render_product_path(), 3)
+        self.assertGreater(processor.stats["processed_count"], 1)
+        self.assertLessEqual(processor.stats["output_points"], processor.stats["input_points"])
+        annotator.detach()
+        lidar.set_point_cloud_processor(None)
+        self.assertNotIn("processed_point_cloud", lidar.get_current_frame())
+
+        lidar.disable_point_frames()
+        self.assertIsNone(lidar.get_point_frame())
+        self._timeline.stop()
+
+    async def test_sweep_accumulator(self):
+        """Test the accumulation of partial scans into complete rotations"""
+        accumulator = LidarSweepAccumulator()
+        # a partial rotation followed by two complete rotations, split in partial scans
+        azimuths = np.concatenate([np.arange(90, 180), np.arange(-180, 180), np.arange(-180, 180), [-180, -179]])
+        points = np.zeros(azimuths.size, dtype=LIDAR_POINT_DTYPE)
+        points["azimuth"] = azimuths
+        points["timestamp"] = np.arange(azimuths.size)
+        completed = [accumulator.add(scan, i) for i, scan in enumerate(np.array_split(points, 11))]
+        self.assertEqual(sum(completed), 2)
+        self.assertEqual(accumulator.sweep_count, 2)
+        sweep = accumulator.sweep
+        self.assertEqual(sweep.shape[0], 360)
+        np.testing.assert_array_equal(sweep["timestamp"], np.arange(450, 810))
+        accumulator.reset()
+        self.assertEqual(accumulator.sweep.shape[0], 0)
+
+    async def test_sweep_accumulator_interleaved_returns(self):
+        """Test that returns interleaved around the azimuth seam do not start spurious sweeps"""
+        # two emitters 3 degrees apart, fired alternately over three turns: consecutive returns around the seam
+        # alternate between both sides of +/-180 degrees
+        base = np.arange(100.0, 100.0 + 3 * 360.0, 0.5)
+        azimuths = np.stack([base - 1.5, base + 1.5], axis=1).ravel()
+        azimuths = (azimuths + 180.0) % 360.0 - 180.0
+        points = np.zeros(azimuths.size, dtype=LIDAR_POINT_DTYPE)
+        points["azimuth"] = azimuths
+        points["timestamp"] = np.arange(azimuths.size)
+        for sign in (1.0, -1.0):
+            # both directions of rotation
+            points["azimuth"] = sign * azimuths
+            accumulator = LidarSweepAccumulator()
+            completed = [accumulator.add(scan, i) for i, scan in enumerate(np.array_split(points, 37))]
+            self.assertEqual(sum(completed), 2)
+            self.assertEqual(accumulator.sweep_count, 2)
+            # each sweep holds a whole turn of both emitters, and is contiguous in firing order
+            sweep = accumulator.sweep
+            self.assertEqual(sweep.shape[0], 2 * 720)
+            np.testing.assert_array_equal(np.diff(sweep["timestamp"]), 1)
@@ -15,8 +15,27 @@
 from typing import List
 
 import carb
+import numpy as np
 import omni
-from pxr import Gf, Sdf, Usd, UsdGeom, UsdShade
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdShade, Vt
+
+# minimum vector length used by Gf when normalizing vectors (GF_MIN_VECTOR_LENGTH)
+_MIN_VECTOR_LENGTH = 1e-10
+
+
+def _as_array(value, dtype, width=None):
+    """Get a NumPy array (zero-copy view when possible) from a Vt array value, or an empty array if not authored"""
+    if not value:
+        return np.zeros((0, width) if width else (0,), dtype=dtype)
+    array = np.asarray(value, dtype=dtype)
+    return array.reshape(-1, width) if width else array
+
+
+def _concatenate(arrays, dtype, width=None):
+    """Concatenate a list of arrays, returning an empty array if the list is empty"""
+    if not arrays:
+        return np.zeros((0, width) if width else (0,), dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
 
 
 class MeshMerger(object):
@@ -199,34 +218,36 @@ class MeshMerger(object):
             if prim:
                 usdMesh = UsdGeom.Mesh(prim)
                 mesh = {}
-                mesh["points"] = usdMesh.GetPointsAttr().Get()
                 world_mtx = omni.usd.get_world_transform_matrix(prim, Usd.TimeCode.Default())
                 if self.clear_parent_xform:
                     world_mtx = world_mtx
                 else:
                     world_mtx = world_mtx * prim_transform.GetInverse()
-                world_rot = world_mtx.ExtractRotation()
-                mesh["points"][:] = [world_mtx.TransformAffine(x) for x in mesh["points"]]
-                mesh["normals"] = usdMesh.GetNormalsAttr().Get()
-                mesh["attr_normals"] = usdMesh.GetPrim().GetAttribute("primvars:normals").Get()
-                mesh["attr_normals_indices"] = usdMesh.GetPrim().GetAttribute("primvars:normals:indices").Get()
-                if not mesh["attr_normals"]:
-                    mesh["attr_normals"] = []
-                if not mesh["attr_normals_indices"]:
-                    mesh["attr_normals_indices"] = []
-                if mesh["normals"]:
-                    mesh["normals"][:] = [world_rot.TransformDir(x).GetNormalized() for x in mesh["normals"]]
+                # Gf matrices use the row-vector convention (p' = p * M)
+                world_rot = np.array(Gf.Matrix3d(world_mtx.ExtractRotation()), dtype=np.float64)
+                world_mtx = np.array(world_mtx, dtype=np.float64)
+                points = _as_array(usdMesh.GetPointsAttr().Get(), np.float32, 3)
+                mesh["points"] = (points @ world_mtx[:3, :3] + world_mtx[3, :3]).astype(np.float32)
+                normals = _as_array(usdMesh.GetNormalsAttr().Get(), np.float32, 3)
+                mesh["attr_normals"] = _as_array(
+                    usdMesh.GetPrim().GetAttribute("primvars:normals").Get(), np.float32, 3
+                )
+                mesh["attr_normals_indices"] = _as_array(
+                    usdMesh.GetPrim().GetAttribute("primvars:normals:indices").Get(), np.int32
+                )
+                if len(normals):
+                    normals = (normals @ world_rot).astype(np.float32)
+                    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+                    mesh["normals"] = normals / np.maximum(lengths, np.float32(_MIN_VECTOR_LENGTH))
                 else:
-                    mesh["normals"] = []
+                    mesh["normals"] = normals
                     carb.log_warn(f"mesh doesn't contain normals: ({prim.GetName()})")
-                if mesh["attr_normals"]:
-                    mesh["attr_normals"][:] = [world_rot.TransformDir(x) for x in mesh["attr_normals"]]
-                mesh["vertex_counts"] = usdMesh.GetFaceVertexCountsAttr().Get()
-                mesh["vertex_indices"] = usdMesh.GetFaceVertexIndicesAttr().Get()
+                if len(mesh["attr_normals"]):
+                    mesh["attr_normals"] = (mesh["attr_normals"] @ world_rot).astype(np.float32)
+                mesh["vertex_counts"] = _as_array(usdMesh.GetFaceVertexCountsAttr().Get(), np.int32)
+                mesh["vertex_indices"] = _as_array(usdMesh.GetFaceVertexIndicesAttr().Get(), np.int32)
                 mesh["name"] = prim.GetName()
-                mesh["st"] = usdMesh.GetPrim().GetAttribute("primvars:st").Get()
-                if not mesh["st"]:
-                    mesh["st"] = []
+                mesh["st"] = _as_array(usdMesh.GetPrim().GetAttribute("primvars:st").Get(), np.float32, 2)
                 mat, rel = UsdShade.MaterialBindingAPI(usdMesh).ComputeBoundMaterial()
                 if mat and rel:
                     mat_path = str(mat.GetPath())
@@ -264,49 +285,44 @@ class MeshMerger(object):
                             mat_path = _mat_path
                         if not rel:
                             mat_path = "/None"
-                        mesh["subset"].append((mat_path, s.GetIndicesAttr().Get()))
+                        mesh["subset"].append((mat_path, _as_array(s.GetIndicesAttr().Get(), np.int32)))
                 meshes.append(mesh)
 
         carb.log_info(f"Merging: {self._total_meshes} meshes")
-        all_points = []
-        all_normals = []
-        all_normals_attr = []
-        all_normals_indices = []
-        all_vertex_counts = []
-        all_vertex_indices = []
         all_mats = {}
-        all_st = []
         index_offset = 0
         normals_offset = 0
-        index = 0
         range_offset = 0
         for mesh in meshes:
-            all_points.extend(mesh["points"])
-            all_normals.extend(mesh["normals"])
-            all_normals_attr.extend(mesh["attr_normals"])
-            mesh["attr_normals_indices"][:] = [x + normals_offset for x in mesh["attr_normals_indices"]]
-            all_normals_indices.extend(mesh["attr_normals_indices"])
-            if mesh["normals"]:
-                mesh["normals"][:] = [world_rot.TransformDir(x).GetNormalized() for x in mesh["normals"]]
-            all_vertex_counts.extend(mesh["vertex_counts"])
-            mesh["vertex_indices"][:] = [x + index_offset for x in mesh["vertex_indices"]]
-            all_vertex_indices.extend(mesh["vertex_indices"])
-            all_st.extend(mesh["st"])
-            index_offset = index_offset + len(meshes[index]["points"])
+            # offset the indices of each mesh to address the concatenated arrays
+            mesh["attr_normals_indices"] = mesh["attr_normals_indices"] + normals_offset
+            mesh["vertex_indices"] = mesh["vertex_indices"] + index_offset
+            index_offset = index_offset + len(mesh["points"])
             normals_offset = normals_offset + len(mesh["attr_normals_indices"])
-            # print("Offset", index_offset)
-            index = index + 1
             # create the material entry
             if len(mesh["subset"]) == 0:
                 if mesh["mat"] not in all_mats:
                     all_mats[mesh["mat"]] = []
-                all_mats[mesh["mat"]].extend([*range(range_offset, range_offset + len(mesh["vertex_counts"]), 1)])
+                all_mats[mesh["mat"]].append(
+                    np.arange(range_offset, range_offset + len(mesh["vertex_counts"]), dtype=np.int32)
+                )
             else:
                 for subset in mesh["subset"]:
                     if subset[0] not in all_mats:
                         all_mats[subset[0]] = []
-                    all_mats[subset[0]].extend([*(x + range_offset for x in subset[1])])
+                    all_mats[subset[0]].append(subset[1] + range_offset)
             range_offset = range_offset + len(mesh["vertex_counts"])
+        all_points = Vt.Vec3fArray.FromNumpy(_concatenate([mesh["points"] for mesh in meshes], np.float32, 3))
+        all_normals = Vt.Vec3fArray.FromNumpy(_concatenate([mesh["normals"] for mesh in meshes], np.float32, 3))
+        all_normals_attr = Vt.Vec3fArray.FromNumpy(
+            _concatenate([mesh["attr_normals"] for mesh in meshes], np.float32, 3)
+        )
+        all_normals_indices = Vt.IntArray.FromNumpy(
+            _concatenate([mesh["attr_normals_indices"] for mesh in meshes], np.int32)
+        )
+        all_vertex_counts = Vt.IntArray.FromNumpy(_concatenate([mesh["vertex_counts"] for mesh in meshes], np.int32))
+        all_vertex_indices = Vt.IntArray.FromNumpy(_concatenate([mesh["vertex_indices"] for mesh in meshes], np.int32))
+        all_st = Vt.Vec2fArray.FromNumpy(_concatenate([mesh["st"] for mesh in meshes], np.float32, 2))
         curr_prim = self._stage.GetPrimAtPath(self.selected_objects[0])
         merged_path = "/Merged/" + str(curr_prim.GetName())
         merged_path = omni.usd.get_stage_next_free_path(self._stage, merged_path, False)
@@ -355,7 +371,7 @@ class MeshMerger(object):
             geomSubset.CreateElementTypeAttr("face")
             geomSubset.CreateFamilyNameAttr("materialBind")
             # print(mesh["vertex_indices"])
-            geomSubset.CreateIndicesAttr(counts)
+            geomSubset.CreateIndicesAttr(Vt.IntArray.FromNumpy(_concatenate(counts, np.int32)))
             if name != "/None":
                 material = UsdShade.Material.Get(self._stage, name)
                 binding_api = UsdShade.MaterialBindingAPI(geomSubset)
@@ -17,7 +17,7 @@
 #   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
 #   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
 import omni.kit.test
-from pxr import Sdf, UsdGeom, UsdShade
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdShade
 
 from ..mesh_merger import MeshMerger
 
@@ -140,6 +140,54 @@ class TestMergeMesh(omni.kit.test.AsyncTestCase):
 
         pass
 
+    async def test_merged_geometry(self):
+        # move and rotate the source cubes to exercise the world-space transform
+        for i, path in enumerate(self.cubes_list):
+            xformable = UsdGeom.Xformable(self._stage.GetPrimAtPath(path))
+            xformable.ClearXformOpOrder()
+            xformable.AddTranslateOp().Set(Gf.Vec3d(100.0 * i, -50.0 * i, 25.0))
+            xformable.AddRotateXYZOp().Set(Gf.Vec3f(15.0 * i, 30.0, -45.0 * i))
+        await omni.kit.app.get_app().next_update_async()
+
+        # compute the expected geometry
+        expected_points, expected_normals, expected_indices, expected_counts = [], [], [], []
+        for path in self.cubes_list:
+            prim = self._stage.GetPrimAtPath(path)
+            mesh = UsdGeom.Mesh(prim)
+            world_mtx = omni.usd.get_world_transform_matrix(prim, Usd.TimeCode.Default())
+            world_rot = world_mtx.ExtractRotation()
+            expected_indices.extend([x + len(expected_points) for x in mesh.GetFaceVertexIndicesAttr().Get()])
+            expected_counts.extend(mesh.GetFaceVertexCountsAttr().Get())
+            expected_points.extend([world_mtx.TransformAffine(x) for x in mesh.GetPointsAttr().Get()])
+            expected_normals.extend([world_rot.TransformDir(x).GetNormalized() for x in mesh.GetNormalsAttr().Get()])
+
+        mesh_merger = MeshMerger(self._stage)
+        mesh_merger.clear_parent_xform = True
+        mesh_merger.deactivate_source = False
+        mesh_merger.combine_materials = False
+        mesh_merger.materials_destination = ""
+        mesh_merger.update_selection(selection=self.cubes_list, stage=self._stage)
+        mesh_merger.output_mesh = "/Merged/" + str(self._stage.GetPrimAtPath(self.cubes_list[0]).GetName())
+        mesh_merger.merge_meshes()
+
+        merged = UsdGeom.Mesh(self._stage.GetPrimAtPath(mesh_merger.output_mesh))
+        self.assertListEqual(list(merged.GetFaceVertexIndicesAttr().Get()), expected_indices)
+        self.assertListEqual(list(merged.GetFaceVertexCountsAttr().Get()), expected_counts)
+        points = merged.GetPointsAttr().Get()
+        normals = merged.GetNormalsAttr().Get()
+        self.assertEqual(len(points), len(expected_points))
+        self.assertEqual(len(normals), len(expected_normals))
+        for point, expected_point in zip(points, expected_points):
+            self.assertTrue(Gf.IsClose(point, expected_point, 1e-4))
+        for normal, expected_normal in zip(normals, expected_normals):
+            self.assertTrue(Gf.IsClose(normal, expected_normal, 1e-6))
+        # each material subset must address the faces of its source mesh
+        subsets = UsdGeom.Subset.GetAllGeomSubsets(merged)
+        self.assertEqual(len(subsets), 3)
+        num_faces = len(expected_counts) // 3
+        for i, subset in enumerate(sorted(subsets, key=lambda x: min(x.GetIndicesAttr().Get()))):
+            self.assertListEqual(list(subset.GetIndicesAttr().Get()), list(range(i * num_faces, (i + 1) * num_faces)))
+
     async def test_merge_command(self):
         result, prim = omni.kit.commands.execute(
             "MergeMeshesCommand",
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-envs", type=int, default=1024, help="Number of environments to clone.")
+parser.add_argument(
+    "--filter-mode",
+    default="groups",
+    choices=["groups", "buckets", "env_ids"],
+    help="Collision filtering mode of the clones.",
+)
+parser.add_argument("--num-steps", type=int, default=100, help="Number of physics steps to run.")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+n_envs = args.num_envs
+filter_mode = args.filter_mode
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+
+import numpy as np
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics import measurements
+from isaacsim.core.api import World
+from isaacsim.core.api.objects import DynamicCuboid
+from isaacsim.core.cloner import GridCloner
+from isaacsim.core.utils.prims import define_prim
+from isaacsim.core.utils.stage import get_current_stage
+
+ENV_SPACING = 2.0
+COLLISION_ROOT_PATH = "/World/collisions"
+
+
+def define_environment():
+    define_prim(prim_path="/World/envs/env_0", prim_type="Xform")
+    for i in range(3):
+        DynamicCuboid(
+            prim_path=f"/World/envs/env_0/cube_{i}",
+            name=f"cube_{i}",
+            position=np.array([0.0, 0.0, 0.5 + 0.6 * i]),
+            size=0.5,
+        )
+
+
+# Create the benchmark
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_cloner_collision_filtering",
+    workflow_metadata={"metadata": [{"name": "filter_mode", "data": filter_mode}]},
+    backend_type=args.backend_type,
+)
+
+my_world = World(stage_units_in_meters=1.0)
+my_world.scene.add_default_ground_plane()
+define_environment()
+
+cloner = GridCloner(spacing=ENV_SPACING)
+cloner.define_base_env("/World/envs")
+prim_paths = cloner.generate_paths("/World/envs/env", n_envs)
+
+benchmark.set_phase("env_cloning", start_recording_frametime=False, start_recording_runtime=True)
+positions = cloner.clone(
+    source_prim_path="/World/envs/env_0",
+    prim_paths=prim_paths,
+    replicate_physics=True,
+    enable_env_ids=filter_mode == "env_ids",
+)
+benchmark.store_measurements()
+
+benchmark.set_phase("collision_filtering", start_recording_frametime=False, start_recording_runtime=True)
+cloner.filter_collisions(
+    physicsscene_path=my_world.get_physics_context().prim_path,
+    collision_root_path=COLLISION_ROOT_PATH,
+    prim_paths=prim_paths,
+    global_paths=["/World/defaultGroundPlane"],
+    mode=filter_mode,
+    positions=positions,
+    # the cubes of neighbouring environments can't touch each other beyond one and a half spacing
+    separation=1.5 * ENV_SPACING,
+)
+benchmark.store_measurements()
+collision_root = get_current_stage().GetPrimAtPath(COLLISION_ROOT_PATH)
+num_groups = len(collision_root.GetChildren()) if collision_root.IsValid() else 0
+benchmark.store_custom_measurement(
+    "collision_filtering", measurements.SingleMeasurement(name="Collision Groups", value=num_groups, unit="")
+)
+
+benchmark.set_phase("world_resetting", start_recording_frametime=False, start_recording_runtime=True)
+my_world.reset()
+benchmark.store_measurements()
+
+benchmark.set_phase("world_step_no_render", start_recording_frametime=True, start_recording_runtime=False)
+for i in range(args.num_steps):
+    my_world.step(render=False)
+benchmark.store_measurements()
+
+benchmark.stop()
+simulation_app.close()
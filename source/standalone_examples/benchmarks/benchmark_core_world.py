@@ -42,6 +42,7 @@ import sys
 import carb
 import numpy as np
 from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics import measurements
 from isaacsim.core.api import World
 from isaacsim.core.api.objects import DynamicCuboid, VisualCuboid
 from isaacsim.core.cloner import GridCloner
@@ -177,10 +178,19 @@ for i in range(100):
 benchmark.store_measurements()
 
 benchmark.set_phase("world_step_no_render", start_recording_frametime=True, start_recording_runtime=False)
+step_profiler = my_world.enable_step_profiling(capacity=100)
 for i in range(100):
     articulation_view_1.set_joint_position_targets(positions=np.random.randn(n_envs, 9))
     my_world.step(render=False)
 benchmark.store_measurements()
+# per-phase breakdown of the world steps
+for phase, stats in step_profiler.get_summary(percentiles=[50, 99]).items():
+    for stat in ["mean", "p50", "p99"]:
+        benchmark.store_custom_measurement(
+            "world_step_no_render",
+            measurements.SingleMeasurement(name=f"{phase} {stat}", value=stats[stat], unit="ms"),
+        )
+my_world.disable_step_profiling()
 
 benchmark.set_phase("get_world_pose_articulation_w_sim", start_recording_frametime=False, start_recording_runtime=True)
 articulation_view_1.get_world_poses()